@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from artlink import Artifact
 from ccflow import BaseModel
+from pydantic import PrivateAttr, model_validator
 
 from dau_build.packaging import ArtifactManifestError, artifact_modules, artifact_path, load_artifact_manifest
 
@@ -33,34 +35,90 @@ class ArtifactBundleEntry(BaseModel):
     manifest_path: Path | None = None
 
 
+class _ArtifactBundleIndex:
+    """Every lookup a bundle answers, built in one pass over its entries."""
+
+    def __init__(self, entries: tuple[ArtifactBundleEntry, ...]) -> None:
+        by_kind: dict[str, list[ArtifactBundleEntry]] = {}
+        by_role: dict[str, list[ArtifactBundleEntry]] = {}
+        by_language: dict[str, list[ArtifactBundleEntry]] = {}
+        by_module: dict[str, list[ArtifactBundleEntry]] = {}
+        by_path: dict[Path, list[ArtifactBundleEntry]] = {}
+        hdl_sources: list[ArtifactBundleEntry] = []
+        for entry in entries:
+            artifact = entry.artifact
+            by_kind.setdefault(artifact.kind, []).append(entry)
+            by_role.setdefault(artifact.role, []).append(entry)
+            if artifact.language:
+                by_language.setdefault(artifact.language, []).append(entry)
+            if artifact.path is not None:
+                by_path.setdefault(artifact.path, []).append(entry)
+            if artifact.kind != "source":
+                continue
+            for module in artifact_modules(artifact):
+                by_module.setdefault(module, []).append(entry)
+            if is_hdl_source_artifact(artifact):
+                hdl_sources.append(entry)
+        self.by_kind = {key: tuple(value) for key, value in by_kind.items()}
+        self.by_role = {key: tuple(value) for key, value in by_role.items()}
+        self.by_language = {key: tuple(value) for key, value in by_language.items()}
+        self.by_module = {key: tuple(value) for key, value in by_module.items()}
+        self.by_path = {key: tuple(value) for key, value in by_path.items()}
+        self.hdl_sources = tuple(hdl_sources)
+
+    def __eq__(self, other: object) -> bool:
+        # derived from the entries, which the bundle compares itself
+        return isinstance(other, _ArtifactBundleIndex)
+
+    __hash__ = None
+
+
 class ArtifactBundle(BaseModel):
     name: str
     entries: tuple[ArtifactBundleEntry, ...]
     manifest_paths: tuple[Path, ...] = ()
 
+    _index: _ArtifactBundleIndex = PrivateAttr()
+
+    @model_validator(mode="after")
+    def _build_index(self) -> ArtifactBundle:
+        # runs again on a validated assignment, so the index follows entries
+        self._index = _ArtifactBundleIndex(self.entries)
+        return self
+
     @property
     def artifacts(self) -> tuple[Artifact, ...]:
         return tuple(entry.artifact for entry in self.entries)
 
     def entries_for_kind(self, kind: str) -> tuple[ArtifactBundleEntry, ...]:
-        return tuple(entry for entry in self.entries if entry.artifact.kind == kind)
+        return self._index.by_kind.get(kind, ())
 
     def entries_for_role(self, role: str) -> tuple[ArtifactBundleEntry, ...]:
-        return tuple(entry for entry in self.entries if entry.artifact.role == role)
+        return self._index.by_role.get(role, ())
+
+    def entries_for_language(self, language: str) -> tuple[ArtifactBundleEntry, ...]:
+        return self._index.by_language.get(language, ())
+
+    def entries_for_path(self, path: Path) -> tuple[ArtifactBundleEntry, ...]:
+        return self._index.by_path.get(Path(path), ())
+
+    def module_providers(self, module: str) -> tuple[ArtifactBundleEntry, ...]:
+        """The source entries declaring ``module`` (more than one is a
+        duplicate-provider error at validation)."""
+        return self._index.by_module.get(module, ())
 
     def hdl_source_entries(self) -> tuple[ArtifactBundleEntry, ...]:
-        return tuple(entry for entry in self.entries_for_kind("source") if is_hdl_source_artifact(entry.artifact))
+        return self._index.hdl_sources
 
     def validate(self, *, required_roles: tuple[str, ...] = (), require_hdl_sources: bool = False) -> ArtifactBundle:
         errors: list[str] = []
-        roles = {entry.artifact.role for entry in self.entries}
-        missing_roles = tuple(role for role in required_roles if role not in roles)
+        missing_roles = tuple(role for role in required_roles if role not in self._index.by_role)
         if missing_roles:
             errors.append(f"missing required artifact role(s): {', '.join(missing_roles)} in {_origin_summary(self)}")
         if require_hdl_sources and not self.hdl_source_entries():
             errors.append(f"artifact bundle does not provide HDL source artifacts: {_origin_summary(self)}")
-        errors.extend(_unsupported_source_language_errors(self.entries))
-        errors.extend(_duplicate_module_provider_errors(self.entries))
+        errors.extend(_unsupported_source_language_errors(self.entries_for_kind("source")))
+        errors.extend(_duplicate_module_provider_errors(self._index.by_module))
         if errors:
             raise ArtifactBundleError("; ".join(errors))
         return self
@@ -74,22 +132,35 @@ def load_artifact_bundle(
     required_roles: tuple[str, ...] = (),
     require_hdl_sources: bool = False,
     validate_paths: bool = True,
+    max_workers: int | None = None,
 ) -> ArtifactBundle:
-    entries: list[ArtifactBundleEntry] = []
+    """Load, check and aggregate ``manifest_paths``. Each manifest's parse,
+    validation and per-artifact path checks are independent of the others,
+    so the manifests load concurrently (``max_workers``, default the
+    thread-pool default); entries keep manifest order, and a failure reports
+    the first failing manifest in that order."""
     resolved_manifest_paths = tuple(path.resolve() for path in manifest_paths)
-    for manifest_path in resolved_manifest_paths:
+
+    def manifest_entries(manifest_path: Path) -> list[ArtifactBundleEntry]:
         try:
             manifest = load_artifact_manifest(manifest_path, validate_paths=validate_paths)
         except ArtifactManifestError as exc:
             raise ArtifactBundleError(f"{manifest_path.as_posix()}: {exc}") from exc
-        entries.extend(
+        return [
             ArtifactBundleEntry(
                 artifact=_normalized_artifact(_resolved_artifact(manifest_path.parent, artifact)),
                 origin=manifest_path.as_posix(),
                 manifest_path=manifest_path,
             )
             for artifact in manifest.artifacts
-        )
+        ]
+
+    if len(resolved_manifest_paths) <= 1 or max_workers == 1:
+        loaded = [manifest_entries(path) for path in resolved_manifest_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            loaded = list(pool.map(manifest_entries, resolved_manifest_paths))
+    entries = [entry for manifest in loaded for entry in manifest]
     entries.extend(ArtifactBundleEntry(artifact=_normalized_artifact(artifact), origin="direct", manifest_path=None) for artifact in direct_artifacts)
     return ArtifactBundle(name=name, entries=tuple(entries), manifest_paths=resolved_manifest_paths).validate(
         required_roles=required_roles,
@@ -128,13 +199,11 @@ def _normalized_artifact(artifact: Artifact) -> Artifact:
     return _copy_artifact(artifact, language=source_language_from_path(artifact.path))
 
 
-def _unsupported_source_language_errors(entries: tuple[ArtifactBundleEntry, ...]) -> tuple[str, ...]:
+def _unsupported_source_language_errors(source_entries: tuple[ArtifactBundleEntry, ...]) -> tuple[str, ...]:
     errors: list[str] = []
     supported = ", ".join(sorted(SUPPORTED_SOURCE_LANGUAGES))
-    for entry in entries:
+    for entry in source_entries:
         artifact = entry.artifact
-        if artifact.kind != "source":
-            continue
         if artifact.language not in SUPPORTED_SOURCE_LANGUAGES:
             location = artifact.location
             language = artifact.language or "unknown"
@@ -142,13 +211,7 @@ def _unsupported_source_language_errors(entries: tuple[ArtifactBundleEntry, ...]
     return tuple(errors)
 
 
-def _duplicate_module_provider_errors(entries: tuple[ArtifactBundleEntry, ...]) -> tuple[str, ...]:
-    providers_by_module: dict[str, list[ArtifactBundleEntry]] = {}
-    for entry in entries:
-        if entry.artifact.kind != "source":
-            continue
-        for module in artifact_modules(entry.artifact):
-            providers_by_module.setdefault(module, []).append(entry)
+def _duplicate_module_provider_errors(providers_by_module: dict[str, tuple[ArtifactBundleEntry, ...]]) -> tuple[str, ...]:
     return tuple(
         f"module {module} is provided by multiple artifacts: " + ", ".join(entry.artifact.location for entry in providers)
         for module, providers in providers_by_module.items()
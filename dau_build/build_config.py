@@ -26,6 +26,14 @@ class HostConfig(BaseModel):
     dau_core_root: Path | None = None
     dau_driver_root: Path | None = None
     dau_utils_root: Path | None = None
+    # Vivado launch_runs -jobs for this host; None sizes them from its CPUs
+    # and memory (vivado_runs.host_vivado_jobs)
+    vivado_synth_jobs: int | None = None
+    vivado_impl_jobs: int | None = None
+    # reuse artifact digests across builds on this host
+    # (digests.DigestCache); verify re-hashes that share of the hits
+    digest_cache: bool = False
+    digest_cache_verify: float = 0.0
 
 
 class BackendConfig(BaseModel):
@@ -7,6 +7,7 @@ from ccflow import BaseModel
 from pydantic import ConfigDict, Field, StringConstraints, ValidationError
 
 from dau_build.artifact_bundle import ArtifactBundle, ArtifactBundleError, is_hdl_source_artifact, load_artifact_bundle, source_language_from_path
+from dau_build.elaboration import elaborate_design
 from dau_build.packaging import Artifact, ArtifactManifest, ArtifactManifestError, artifact_modules, artifact_with_modules, load_artifact_manifest
 from dau_build.svparser import Design
 
@@ -155,8 +156,12 @@ class BuildSpec(BaseModel):
         )
 
 
-def generate_dau_build_artifacts(spec: DauBuildSpec, *, output_root: Path) -> DauBuildArtifacts:
-    design = Design.from_files(list(spec.sources))
+def generate_dau_build_artifacts(spec: DauBuildSpec, *, output_root: Path, design: Design | None = None) -> DauBuildArtifacts:
+    """The generated top, DAU manifest and artifact bundle for ``spec``.
+    ``design`` is the spec's sources already parsed (a watch keeps it
+    between rebuilds); they are parsed here when None."""
+    if design is None:
+        design = Design.from_files(list(spec.sources))
     missing_modules = tuple(module_name for module_name in spec.modules if module_name not in design.modules)
     if missing_modules:
         raise DauBuildSpecError(f"build spec references unknown module(s): {', '.join(missing_modules)}")
@@ -195,8 +200,8 @@ def generate_dau_build_artifacts(spec: DauBuildSpec, *, output_root: Path) -> Da
     )
 
 
-def write_dau_build_artifacts(spec: DauBuildSpec, *, output_root: Path) -> DauBuildArtifacts:
-    artifacts = generate_dau_build_artifacts(spec, output_root=output_root)
+def write_dau_build_artifacts(spec: DauBuildSpec, *, output_root: Path, design: Design | None = None) -> DauBuildArtifacts:
+    artifacts = generate_dau_build_artifacts(spec, output_root=output_root, design=design)
     artifacts.top_sv_path.parent.mkdir(parents=True, exist_ok=True)
     artifacts.manifest_path.parent.mkdir(parents=True, exist_ok=True)
     artifacts.artifact_manifest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -234,7 +239,7 @@ def dau_build_manifest_text(spec: DauBuildSpec, *, top_sv_path: Path, manifest_p
 
 
 def dau_artifact_manifest(spec: DauBuildSpec, *, design: Design, top_sv_path: Path) -> ArtifactManifest:
-    modules_by_source = _modules_by_source_path(design)
+    modules_by_source = elaborate_design(design).modules_by_source
     pathless_artifacts = tuple(_artifact_with_discovered_modules(artifact, modules_by_source) for artifact in spec.artifacts if artifact.path is None)
     artifacts_by_path = {
         _artifact_key(artifact.path): _artifact_with_discovered_modules(artifact, modules_by_source)
@@ -418,15 +423,6 @@ def _parse_manifest_text(text: str) -> dict[str, str]:
     return manifest
 
 
-def _modules_by_source_path(design: Design) -> dict[Path, tuple[str, ...]]:
-    modules_by_source: dict[Path, list[str]] = {}
-    for module_name, module in design.modules.items():
-        if module.source_path is None:
-            continue
-        modules_by_source.setdefault(module.source_path.resolve(), []).append(module_name)
-    return {source: tuple(modules) for source, modules in modules_by_source.items()}
-
-
 def _artifact_with_discovered_modules(artifact: Artifact, modules_by_source: dict[Path, tuple[str, ...]]) -> Artifact:
     if artifact.path is None:
         return artifact
@@ -1,5 +1,8 @@
+import os
 import shlex
+import time
 from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import MappingProxyType
 from typing import Any, ClassVar, Literal, TypeVar
@@ -7,9 +10,11 @@ from typing import Any, ClassVar, Literal, TypeVar
 from ccflow import BaseModel, CallableModel, Flow, NullContext, ResultBase
 from pydantic import Field, ValidationError, field_validator
 
+from dau_build.device_scheduler import DeviceLockTimeout
 from dau_build.hardware_plan import (
     HardwarePlan,
     HardwareToolchainConfig,
+    execute_fleet_plan,
     execute_plan_steps,
     format_plan_steps,
     stage_shell_plan,
@@ -19,6 +24,7 @@ from dau_build.hardware_plan import (
     validate_vivado_artifacts_step,
     vivado_overlay_build_step,
 )
+from dau_build.plan_timeline import PlanTimeline, PlanTimelineError, load_plan_timeline, summarize_plan_timeline
 from dau_build.vivado_backend import (
     VivadoBackendArtifacts,
     VivadoBackendArtifactValidation,
@@ -307,6 +313,52 @@ class ValidateTask(SpecPathModel):
         return BuildStepResult(step="validate", message=f"dau-build-spec-valid\tspec={self.spec_label}")
 
 
+class WatchTask(SpecPathModel):
+    # build, then rebuild whenever the spec file, its artifact manifests or
+    # its sources change; a spec composed through `spec=` is fixed for the
+    # run, so only its manifests and sources are watched
+    output_root: Path
+    # the check after each rebuild: the generated top against the parsed
+    # sources (svparser), yosys's read-and-check without synthesis, or none
+    elaborate: Literal["svparser", "yosys", "none"] = "svparser"
+    yosys: str = "yosys"
+    watcher: Literal["auto", "inotify", "poll"] = "auto"
+    debounce_s: float = Field(default=0.2, ge=0)
+    poll_interval_s: float = Field(default=0.5, gt=0)
+    # stop after this many rebuilds, or seconds; both None: until interrupted
+    max_rebuilds: int | None = Field(default=None, ge=0)
+    stop_after_s: float | None = Field(default=None, gt=0)
+
+    @Flow.call
+    def __call__(self, context: NullContext) -> BuildStepResult:  # noqa: ARG002 (ccflow requires the name `context`)
+        # deferred like _build_spec_api: dau_build.watch imports build_spec
+        from dau_build.watch import SpecWatchSession, watch_spec
+
+        session = SpecWatchSession(
+            self.load_spec,
+            output_root=self.output_root,
+            spec_path=self.spec_path if self.spec is None else None,
+            elaborate=self.elaborate,
+            yosys=self.yosys,
+        )
+        try:
+            watch_spec(
+                session,
+                mode=self.watcher,
+                debounce_s=self.debounce_s,
+                poll_interval_s=self.poll_interval_s,
+                max_rebuilds=self.max_rebuilds,
+                stop_after_s=self.stop_after_s,
+            )
+        except KeyboardInterrupt:
+            pass
+        failures = sum(not cycle.ok for cycle in session.cycles)
+        return BuildStepResult(
+            step="watch",
+            message=f"dau-build-watch\tspec={self.spec_label} rebuilds={max(len(session.cycles) - 1, 0)} failures={failures}",
+        )
+
+
 class Simulator(BaseModel):
     """A simulator selected from the ``simulator`` config group. Each is a
     polymorphic, hydra-configurable model (``simulator=simulators/verilator
@@ -326,53 +378,172 @@ class SvparserSimulator(Simulator):
         return task._validate_and_generate(self.name)
 
 
-class CocotbSimulator(Simulator):
-    name: str = "cocotb"
+class ProfileRun(BaseModel):
+    """One row of a multi-profile run: the profile, how it ended, and its
+    wall time (build included)."""
+
+    name: str
+    status: Literal["passed", "failed"]
+    seconds: float
+    detail: str = ""
+
+
+class ProfileSimulator(Simulator):
+    """A simulator that also runs registered profiles without a spec: one
+    (``profile``) or many (``profiles``, a list of names or ``all``). Many
+    profiles build and run concurrently on a pool of ``jobs`` workers
+    (default: one per CPU), each in its own ``_profile_work_dir``, and report
+    one consolidated pass/fail and timing table."""
+
     profile: str | None = None
     profile_manifest: tuple[Path, ...] = ()
+    profiles: tuple[str, ...] = ()
+    jobs: int | None = Field(default=None, ge=1)
 
     @field_validator("profile_manifest", mode="before")
     @classmethod
     def _split_profile_manifest_paths(cls, value):
         return _split_path_tuple(value)
 
+    @field_validator("profiles", mode="before")
+    @classmethod
+    def _split_profile_names(cls, value):
+        if value in (None, ""):
+            return ()
+        if isinstance(value, str):
+            return tuple(item for item in value.split(",") if item)
+        return value
+
+    def _runs(self, profile) -> bool:
+        """Whether ``profile`` is the kind this simulator runs."""
+        raise NotImplementedError
+
+    def _run_profile(self, profile, *, work_dir: Path) -> str:
+        """Build and run one profile in ``work_dir``; raise on failure, return
+        a detail for the report."""
+        raise NotImplementedError
+
+    def _selected_profiles(self) -> tuple:
+        from dau_build.simulation_profiles import SimulationProfileError, available_profiles, resolve_profile
+
+        try:
+            if self.profiles == ("all",):
+                every = (resolve_profile(name, profile_manifests=self.profile_manifest) for name in available_profiles(self.profile_manifest))
+                return tuple(profile for profile in every if self._runs(profile))
+            profiles = tuple(resolve_profile(name, profile_manifests=self.profile_manifest) for name in dict.fromkeys(self.profiles))
+        except SimulationProfileError as exc:
+            raise BuildStepError(str(exc)) from exc
+        foreign = [profile.name for profile in profiles if not self._runs(profile)]
+        if foreign:
+            raise BuildStepError(f"simulator={self.name} cannot run profile(s) {', '.join(foreign)}")
+        return profiles
+
+    def _timed_run(self, profile, work_dir: Path) -> ProfileRun:
+        started = time.perf_counter()
+        try:
+            detail = self._run_profile(profile, work_dir=work_dir)
+        except (Exception, SystemExit) as exc:  # noqa: BLE001  # one profile's failure is a row, not the end of its siblings' runs
+            reason = str(exc).strip().splitlines()
+            return ProfileRun(
+                name=profile.name,
+                status="failed",
+                seconds=time.perf_counter() - started,
+                detail=f"error={reason[0] if reason else type(exc).__name__}",
+            )
+        return ProfileRun(name=profile.name, status="passed", seconds=time.perf_counter() - started, detail=detail)
+
+    def run_profiles(self, *, task: "SimulateTask") -> BuildStepResult:
+        if self.profile:
+            raise BuildStepError("set simulator.profile or simulator.profiles, not both")
+        profiles = self._selected_profiles()
+        if not profiles:
+            raise BuildStepError(f"no registered {self.name} profiles to run")
+        # the work dirs are made up front so the workers never race on a parent
+        work_dirs = {profile.name: task._profile_work_dir(profile.name) for profile in profiles}
+        jobs = min(self.jobs or os.cpu_count() or 1, len(profiles))
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            runs = tuple(pool.map(lambda profile: self._timed_run(profile, work_dirs[profile.name]), profiles))
+        failed = sum(run.status == "failed" for run in runs)
+        status = "failed" if failed else "passed"
+        header = (
+            f"dau-build-simulate\ttask=simulate simulator={self.name} profiles={len(runs)} passed={len(runs) - failed} failed={failed} "
+            f"jobs={jobs} seconds={time.perf_counter() - started:.2f} status={status}"
+        )
+        message = "\n".join(
+            (
+                header,
+                *(f"profile\tname={run.name} status={run.status} seconds={run.seconds:.2f}{f' {run.detail}' if run.detail else ''}" for run in runs),
+            )
+        )
+        if failed:
+            raise BuildStepError(message)
+        return BuildStepResult(step="simulate", message=message)
+
+
+class CocotbSimulator(ProfileSimulator):
+    name: str = "cocotb"
+
     def simulate(self, *, task: "SimulateTask") -> BuildStepResult:
+        if self.profiles and task._no_spec():
+            return self.run_profiles(task=task)
         if self.profile and task._no_spec():
-            from dau_sim.integrations.cocotb import run_cocotb_testbench
-
             from dau_build.simulation_profiles import resolve_profile
 
             profile = resolve_profile(self.profile, profile_manifests=self.profile_manifest)
-            # the cocotb runner raises on any failing test
-            run_cocotb_testbench(
-                sources=profile.sources,
-                hdl_toplevel=profile.hdl_toplevel,
-                test_module=profile.test_module,
-                build_dir=task._profile_work_dir(profile.name),
-            )
+            self._run_profile(profile, work_dir=task._profile_work_dir(profile.name))
             return BuildStepResult(
                 step="simulate",
                 message=f"dau-build-simulate\ttask=simulate simulator=cocotb profile={profile.name} status=passed",
             )
         return task._validate_and_generate(self.name)
 
+    def _runs(self, profile) -> bool:
+        return hasattr(profile, "test_module")
+
+    def _run_profile(self, profile, *, work_dir: Path) -> str:
+        from cocotb_tools.runner import get_results
+        from dau_sim.integrations.cocotb import run_cocotb_testbench
+
+        # the results file goes in the profile's own work dir: the runner's
+        # default sits beside it, where two profiles of one toplevel collide
+        results_xml = run_cocotb_testbench(
+            sources=profile.sources,
+            hdl_toplevel=profile.hdl_toplevel,
+            test_module=profile.test_module,
+            build_dir=work_dir,
+            results_xml=work_dir / "results.xml",
+        )
+        # the runner only raises on a failing test under pytest
+        tests, failures = get_results(results_xml)
+        if failures:
+            raise BuildStepError(f"profile {profile.name!r} failed {failures} of {tests} cocotb tests")
+        return f"tests={tests}"
 
-class VerilatorSimulator(Simulator):
+
+class VerilatorSimulator(ProfileSimulator):
     name: str = "verilator"
-    profile: str | None = None
-    profile_manifest: tuple[Path, ...] = ()
     testbench_path: Path | None = None
     top_module: str | None = None
     expect_stdout: str | None = None
     verilator: str = "verilator"
     extra_args: str = ""
+    # a shared model cache (dau_build.verilator_cache): unset, every run
+    # compiles in its own work dir as before
+    build_cache_dir: Path | None = None
+    build_cache_max_bytes: int = Field(default=8 << 30, gt=0)
+    ccache: bool = False
 
-    @field_validator("profile_manifest", mode="before")
-    @classmethod
-    def _split_profile_manifest_paths(cls, value):
-        return _split_path_tuple(value)
+    def build_cache(self):
+        if self.build_cache_dir is None:
+            return None
+        from dau_build.verilator_cache import VerilatorBuildCache
+
+        return VerilatorBuildCache(root=self.build_cache_dir, max_bytes=self.build_cache_max_bytes, ccache=self.ccache)
 
     def simulate(self, *, task: "SimulateTask") -> BuildStepResult:
+        if self.profiles and task._no_spec():
+            return self.run_profiles(task=task)
         if self.profile and task._no_spec():
             return self._run_registered_profile(task)
         spec = task.require_spec_and_module()
@@ -389,6 +560,7 @@ class VerilatorSimulator(Simulator):
             verilator=self.verilator,
             extra_args=self.extra_args,
             work_dir=work_dir,
+            build_cache=self.build_cache(),
         )
         return BuildStepResult(
             step="simulate",
@@ -399,19 +571,29 @@ class VerilatorSimulator(Simulator):
         )
 
     def _run_registered_profile(self, task: "SimulateTask") -> BuildStepResult:
-        from dau_sim.integrations.verilator import run_verilator_testbench
-
         from dau_build.simulation_profiles import resolve_profile
 
         profile = resolve_profile(self.profile, profile_manifests=self.profile_manifest)
-        result = run_verilator_testbench(sources=profile.sources, top_module=profile.top_module, work_dir=task._profile_work_dir(profile.name))
+        detail = self._run_profile(profile, work_dir=task._profile_work_dir(profile.name))
+        return BuildStepResult(
+            step="simulate", message=f"dau-build-simulate\ttask=simulate simulator=verilator profile={profile.name} status=passed {detail}"
+        )
+
+    def _runs(self, profile) -> bool:
+        return hasattr(profile, "expect_stdout")
+
+    def _run_profile(self, profile, *, work_dir: Path) -> str:
+        from dau_sim.integrations.verilator import run_verilator_testbench
+
+        cache = self.build_cache()
+        if cache is not None:
+            result = cache.run(sources=profile.sources, top_module=profile.top_module, verilator=self.verilator)
+        else:
+            result = run_verilator_testbench(sources=profile.sources, top_module=profile.top_module, work_dir=work_dir, verilator=self.verilator)
         marker = self.expect_stdout or profile.expect_stdout
         if marker not in result.stdout:
             raise BuildStepError(f"profile {profile.name!r} did not report {marker!r}")
-        return BuildStepResult(
-            step="simulate",
-            message=f"dau-build-simulate\ttask=simulate simulator=verilator profile={profile.name} status=passed marker={marker}",
-        )
+        return f"marker={marker}"
 
 
 class SimulateTask(ModuleSelectionModel):
@@ -678,8 +860,20 @@ class BuildShellProjectTask(BuildCallableModel):
     source_paths: tuple[Path, ...] = ()
     metadata: dict[str, Any] = Field(default_factory=dict)
     platform: Any = None
+    # reuse the digests of files unchanged since the last manifest
+    # (dau_build.digests.DigestCache, in the user cache dir); verify
+    # re-hashes that share of the reused digests
+    digest_cache: bool = False
+    digest_cache_verify: float = Field(default=0.0, ge=0.0, le=1.0)
     execute: bool = False
 
+    def _digest_cache(self):
+        if not self.digest_cache:
+            return None
+        from dau_build.digests import DigestCache
+
+        return DigestCache(verify_fraction=self.digest_cache_verify)
+
     @Flow.call
     def __call__(self, context: NullContext) -> BuildStepResult:  # noqa: ARG002 (ccflow requires the name `context`)
         from dau_build.shell_build import run_shell_project_build, write_shell_build_manifest
@@ -703,6 +897,7 @@ class BuildShellProjectTask(BuildCallableModel):
             name=self.manifest_name,
             source_paths=self.source_paths,
             metadata={**self.metadata, **status.model_dump(exclude_none=True)},
+            digest_cache=self._digest_cache(),
         )
         return BuildStepResult(
             step="build-shell-project",
@@ -712,6 +907,106 @@ class BuildShellProjectTask(BuildCallableModel):
         )
 
 
+class SweepShellImplementationTask(BuildCallableModel):
+    """Re-implement a built shell project's synthesized checkpoint with
+    several directive sets in parallel (timing closure by sweep rather than
+    by hand), keep the bitstream of the run with the best worst negative
+    slack, and package it as the shell-build manifest with every run's
+    result under ``implementation_sweep``. Plan-only unless
+    ``execute=true``."""
+
+    output_root: Path
+    variants: tuple[Any, ...] = ()
+    vivado: str = "vivado"
+    manifest_name: str = "dau-shell"
+    source_paths: tuple[Path, ...] = ()
+    metadata: dict[str, Any] = Field(default_factory=dict)
+    platform: Any = None
+    # concurrent Vivado processes; None bounds them by the host's CPUs and
+    # memory (vivado_runs.host_vivado_jobs)
+    max_parallel: int | None = None
+    # reuse the digests of files unchanged since the last manifest
+    # (dau_build.digests.DigestCache, in the user cache dir); verify
+    # re-hashes that share of the reused digests
+    digest_cache: bool = False
+    digest_cache_verify: float = Field(default=0.0, ge=0.0, le=1.0)
+    execute: bool = False
+
+    def _digest_cache(self):
+        if not self.digest_cache:
+            return None
+        from dau_build.digests import DigestCache
+
+        return DigestCache(verify_fraction=self.digest_cache_verify)
+
+    def _variants(self):
+        from dau_build.shell_build import DEFAULT_IMPLEMENTATION_VARIANTS, ImplementationVariant
+
+        if not self.variants:
+            return DEFAULT_IMPLEMENTATION_VARIANTS
+        try:
+            return tuple(
+                ImplementationVariant.model_validate(dict(variant) if isinstance(variant, Mapping) else variant) for variant in self.variants
+            )
+        except ValidationError as exc:
+            raise BuildStepError(f"invalid implementation variant: {exc}") from exc
+
+    @Flow.call
+    def __call__(self, context: NullContext) -> BuildStepResult:  # noqa: ARG002 (ccflow requires the name `context`)
+        from dau_build.shell_build import (
+            ShellBuildError,
+            adopt_implementation,
+            best_implementation,
+            run_implementation_sweep,
+            write_shell_build_manifest,
+        )
+        from dau_build.vivado_runs import host_vivado_jobs
+
+        if self.execute and self.platform is not None:
+            from dau_build.platforms import require_measured
+
+            require_measured(self.platform)
+        variants = self._variants()
+        parallel = min(self.max_parallel if self.max_parallel is not None else host_vivado_jobs().impl, len(variants))
+        header = f"dau-build-shell\ttask=sweep-shell-implementation output_root={self.output_root} variants={len(variants)} parallel={parallel}"
+        if not self.execute:
+            lines = [f"{header} status=planned"]
+            lines.extend(
+                f"variant\tname={variant.name} opt={variant.opt_directive} place={variant.place_directive} "
+                f"phys_opt={variant.phys_opt_directive or '-'} route={variant.route_directive}"
+                for variant in variants
+            )
+            return BuildStepResult(step="sweep-shell-implementation", message="\n".join(lines))
+        lane_placements = tuple(self.platform.lane_placements) if self.platform is not None else ()
+        try:
+            results = run_implementation_sweep(
+                self.output_root, variants, vivado_executable=self.vivado, max_parallel=parallel, lane_placements=lane_placements
+            )
+            best = best_implementation(results)
+        except ShellBuildError as exc:
+            raise BuildStepError(str(exc)) from exc
+        adopt_implementation(self.output_root, best)
+        manifest_path = write_shell_build_manifest(
+            self.output_root,
+            name=self.manifest_name,
+            source_paths=self.source_paths,
+            metadata={
+                **self.metadata,
+                **best.status.model_dump(exclude_none=True),
+                "implementation_variant": best.variant.name,
+                "implementation_sweep": [result.manifest_record() for result in results],
+            },
+            digest_cache=self._digest_cache(),
+        )
+        lines = [f"{header} best={best.variant.name} wns={best.status.wns_ns} manifest={manifest_path} status=built"]
+        lines.extend(
+            f"variant\tname={result.variant.name} status={result.status.build_status} wns={result.status.wns_ns}"
+            + (f" stage={result.status.failed_stage}" if result.status.failed_stage else "")
+            for result in results
+        )
+        return BuildStepResult(step="sweep-shell-implementation", message="\n".join(lines))
+
+
 class StageTask(BuildCallableModel):
     task_name: ClassVar[str]
     execute: bool = False
@@ -779,6 +1074,15 @@ class VivadoOverlayStageTask(OverlayStageTask):
     vivado_log_path: Path = Path("vivado.log")
     vivado_settings: Path = Path("/opt/Xilinx/2025.1/Vivado/settings64.sh")
     overlay_definition: VivadoOverlayDefinition | None = None
+    # build against the last successful build's checkpoints (vivado_build_tcl)
+    incremental: bool = False
+    # sourced from the composed host (job counts) and platform (strategies)
+    # groups by the task config; None sizes the jobs from this host and
+    # keeps Vivado's default strategies
+    synth_jobs: int | None = None
+    impl_jobs: int | None = None
+    synth_strategy: str | None = None
+    impl_strategy: str | None = None
 
     def stage_steps(self):
         return stage_vivado_overlay_plan(
@@ -800,6 +1104,11 @@ class VivadoOverlayStageTask(OverlayStageTask):
             vivado_log_path=self.vivado_log_path,
             vivado_settings=self.vivado_settings,
             overlay_definition=self.overlay_definition,
+            incremental=self.incremental,
+            synth_jobs=self.synth_jobs,
+            impl_jobs=self.impl_jobs,
+            synth_strategy=self.synth_strategy,
+            impl_strategy=self.impl_strategy,
         )
 
     def _toolchain_config(self) -> HardwareToolchainConfig:
@@ -858,6 +1167,11 @@ class VivadoProjectStageTask(VivadoOverlayStageTask):
             vivado_settings=self.vivado_settings,
             overlay_definition=self.overlay_definition,
             stage_task_name=self.stage_task_name,
+            incremental=self.incremental,
+            synth_jobs=self.synth_jobs,
+            impl_jobs=self.impl_jobs,
+            synth_strategy=self.synth_strategy,
+            impl_strategy=self.impl_strategy,
         )
 
 
@@ -923,6 +1237,18 @@ class ValidateVivadoArtifactsTask(OverlayArtifactValidationTask):
     manifest_path: Path | None = None
     command_plan_path: Path | None = None
     project_manifest_path: Path | None = None
+    # reuse the digests of files unchanged since the last manifest
+    # (dau_build.digests.DigestCache, in the user cache dir); verify
+    # re-hashes that share of the reused digests
+    digest_cache: bool = False
+    digest_cache_verify: float = Field(default=0.0, ge=0.0, le=1.0)
+
+    def _digest_cache(self):
+        if not self.digest_cache:
+            return None
+        from dau_build.digests import DigestCache
+
+        return DigestCache(verify_fraction=self.digest_cache_verify)
 
     @Flow.call
     def __call__(self, context: NullContext) -> BuildStepResult:  # noqa: ARG002 (ccflow requires the name `context`)
@@ -947,7 +1273,9 @@ class ValidateVivadoArtifactsTask(OverlayArtifactValidationTask):
         from dau_build.shell_build import write_overlay_build_manifest
 
         resolved_manifest = manifest_path if manifest_path.is_absolute() else self.work_root / manifest_path
-        packaged = write_overlay_build_manifest(self.work_root, resolved_manifest, name=self.artifact_stem) if resolved_manifest.is_file() else None
+        packaged = None
+        if resolved_manifest.is_file():
+            packaged = write_overlay_build_manifest(self.work_root, resolved_manifest, name=self.artifact_stem, digest_cache=self._digest_cache())
         packaged_segment = f" artlink={packaged}" if packaged else ""
         return BuildStepResult(step="validate-vivado-artifacts", message=_vivado_artifact_validation_message(validation) + packaged_segment)
 
@@ -1056,24 +1384,54 @@ class HardwarePlanTask(BuildCallableModel):
     runtime_pm_patterns: tuple[str, ...] | None = None
     rescan_bdfs: tuple[str, ...] | None = None
     privilege_prefix: tuple[str, ...] | None = None
+    # a JSON-lines file each executed run appends its step timings to (see
+    # tasks/hardware/plan-timeline-summary); unset records nothing
+    timeline: Path | None = None
+    # seconds to wait for the endpoint's device lock before giving up
+    # (unset waits as long as it takes)
+    lock_timeout: float | None = None
+    # several identical boards at once: HostAccess entries (more boards of
+    # the composed platform) or PlatformDefinition entries, each programmed
+    # under its own device lock. "stop" keeps boards not yet started from
+    # starting once one fails; a started board always finishes its ladder.
+    fleet: tuple[Any, ...] = ()
+    fleet_on_failure: Literal["stop", "continue"] = "stop"
+    fleet_parallel: int | None = None
     execute: bool = False
 
     @Flow.call
     def __call__(self, context: NullContext) -> BuildStepResult:  # noqa: ARG002 (ccflow requires the name `context`)
         plan = self._plan()
+        if self.fleet:
+            return self._run_fleet(plan)
         if self.execute and self.platform is not None:
-            from dau_build.platforms import require_measured
-
-            require_measured(self.platform)
-            if self.platform.host_access is None:
-                raise BuildStepError(
-                    f"platform {self.platform.name!r} declares no host_access; add the board's measured "
-                    "access facts to its platform config (or run without platform=) before executing hardware plans"
+            _require_executable_platform(self.platform)
+        config = self._toolchain_config(self.platform)
+        plan_result = plan.compose(config)
+        if self.execute:
+            # serialize the device: the executor holds a host lock on the
+            # endpoint BDF (a board is one exclusive resource)
+            timeline = None if self.timeline is None else PlanTimeline(path=self.timeline, plan=plan.name)
+            try:
+                return_code = execute_plan_steps(
+                    plan_result, endpoint_bdf=config.endpoint_bdf, timeline=timeline, plan=plan.name, lock_timeout=self.lock_timeout
                 )
-        config = HardwareToolchainConfig.for_platform(
-            self.platform,
+            except DeviceLockTimeout as exc:
+                raise BuildStepError(f"hardware plan {plan.name!r} did not start: {exc}") from exc
+            if return_code != 0:
+                raise BuildStepError(f"hardware plan {plan.name!r} failed with exit code {return_code}")
+            return BuildStepResult(
+                step="hardware-plan",
+                message=f"dau-build-hardware-plan\ttask=hardware-plan plan={plan.name} steps={len(plan_result)} status=executed",
+            )
+        return BuildStepResult(step="hardware-plan", message=format_plan_steps(plan_result))
+
+    def _toolchain_config(self, platform, *, host_access=None) -> HardwareToolchainConfig:
+        return HardwareToolchainConfig.for_platform(
+            platform,
             work_root=self.work_root,
             programmer=self.programmer,
+            host_access=host_access,
             vivado_executable=self.vivado,
             vivado_invocation=self.vivado_invocation,
             vivado_mount_root=self.vivado_mount_root,
@@ -1089,18 +1447,66 @@ class HardwarePlanTask(BuildCallableModel):
             rescan_bdfs=self.rescan_bdfs,
             privilege_prefix=self.privilege_prefix,
         )
-        plan_result = plan.compose(config)
-        if self.execute:
-            # serialize the device: the executor holds a host lock on the
-            # endpoint BDF (a board is one exclusive resource)
-            return_code = execute_plan_steps(plan_result, endpoint_bdf=config.endpoint_bdf)
-            if return_code != 0:
-                raise BuildStepError(f"hardware plan {plan.name!r} failed with exit code {return_code}")
+
+    def _fleet_configs(self) -> dict[str, HardwareToolchainConfig]:
+        """One toolchain config per fleet board, keyed by endpoint BDF. A
+        HostAccess entry is one more board of the composed platform; a
+        PlatformDefinition entry brings its own."""
+        from dau_build.platforms import HostAccess, PlatformDefinition
+
+        if self.endpoint_bdf is not None or self.jtag_cable is not None:
+            raise BuildStepError("fleet boards carry their own endpoint_bdf and jtag_cable; drop the single-board override")
+        configs: dict[str, HardwareToolchainConfig] = {}
+        for board in self.fleet:
+            if isinstance(board, PlatformDefinition):
+                if self.execute:
+                    _require_executable_platform(board)
+                config = self._toolchain_config(board)
+            elif isinstance(board, HostAccess):
+                if self.execute and self.platform is not None:
+                    _require_executable_platform(self.platform)
+                config = self._toolchain_config(self.platform, host_access=board)
+            else:
+                raise BuildStepError(f"fleet entries are HostAccess or PlatformDefinition models, not {type(board).__name__}")
+            endpoint_bdf = config.required_host_access("endpoint_bdf")
+            if endpoint_bdf.lower() in {bdf.lower() for bdf in configs}:
+                raise BuildStepError(f"fleet lists endpoint {endpoint_bdf} twice")
+            configs[endpoint_bdf] = config
+        cables = [config.jtag_cable for config in configs.values() if config.program_method == "jtag" and config.jtag_cable is not None]
+        shared = sorted({cable for cable in cables if cables.count(cable) > 1})
+        if shared:
+            raise BuildStepError(f"fleet boards share JTAG cable(s) {shared}; programming boards at once needs one cable per board")
+        return configs
+
+    def _run_fleet(self, plan: HardwarePlan) -> BuildStepResult:
+        runs = {endpoint_bdf: plan.compose(config) for endpoint_bdf, config in self._fleet_configs().items()}
+        if not self.execute:
             return BuildStepResult(
-                step="hardware-plan",
-                message=f"dau-build-hardware-plan\ttask=hardware-plan plan={plan.name} steps={len(plan_result)} status=executed",
+                step="hardware-plan", message="\n".join(f"board\t{endpoint_bdf}\n{format_plan_steps(steps)}" for endpoint_bdf, steps in runs.items())
             )
-        return BuildStepResult(step="hardware-plan", message=format_plan_steps(plan_result))
+        results = execute_fleet_plan(
+            runs,
+            on_failure=self.fleet_on_failure,
+            max_parallel=self.fleet_parallel,
+            timeline=None if self.timeline is None else PlanTimeline(path=self.timeline, plan=plan.name),
+            plan=plan.name,
+            lock_timeout=self.lock_timeout,
+        )
+        passed = sum(result.status == "passed" for result in results)
+        lines = [
+            (
+                f"dau-build-hardware-plan\ttask=hardware-plan plan={plan.name} boards={len(results)} passed={passed} "
+                f"status={'executed' if passed == len(results) else 'failed'}"
+            ),
+            *(
+                f"board\tendpoint={result.endpoint_bdf} status={result.status} exit_code={'-' if result.returncode is None else result.returncode} "
+                f"lock_wait_s={result.lock_wait_s:.1f} duration_s={result.duration_s:.1f}"
+                for result in results
+            ),
+        ]
+        if passed != len(results):
+            raise BuildStepError("\n".join(lines))
+        return BuildStepResult(step="hardware-plan", message="\n".join(lines))
 
     def _plan(self) -> HardwarePlan:
         if isinstance(self.plan, HardwarePlan):
@@ -1108,6 +1514,42 @@ class HardwarePlanTask(BuildCallableModel):
         raise BuildStepError("task=hardware-plan requires plan=plans/<name> (see dau_build/config/plan)")
 
 
+class PlanTimelineSummaryTask(BuildCallableModel):
+    # the timeline files hardware-plan runs appended to (model.timeline=...)
+    timelines: tuple[Path, ...]
+
+    @Flow.call
+    def __call__(self, context: NullContext) -> BuildStepResult:  # noqa: ARG002 (ccflow requires the name `context`)
+        try:
+            summary = summarize_plan_timeline(*load_plan_timeline(self.timelines))
+        except (OSError, PlanTimelineError) as exc:
+            raise BuildStepError(str(exc)) from exc
+        lines = [
+            (
+                f"dau-build-plan-timeline\ttask=plan-timeline-summary runs={summary.runs} failed={summary.failed_runs} "
+                f"total_s={summary.total_s:.3f} lock_wait_s={summary.lock_wait_s:.3f} steps={len(summary.steps)}"
+            )
+        ]
+        step_total = sum(step.total_s for step in summary.steps)
+        lines.extend(
+            f"{step.step}\truns={step.runs} failures={step.failures} total_s={step.total_s:.3f} mean_s={step.mean_s:.3f} "
+            f"max_s={step.max_s:.3f} share={step.total_s / step_total if step_total else 0.0:.1%}"
+            for step in summary.steps
+        )
+        return BuildStepResult(step="plan-timeline-summary", message="\n".join(lines))
+
+
+def _require_executable_platform(platform) -> None:
+    from dau_build.platforms import require_measured
+
+    require_measured(platform)
+    if platform.host_access is None:
+        raise BuildStepError(
+            f"platform {platform.name!r} declares no host_access; add the board's measured "
+            "access facts to its platform config (or run without platform=) before executing hardware plans"
+        )
+
+
 def _model_types_from_config_group(kind: str) -> Mapping[str, type[BuildCallableModel]]:
     """A derived index of DAU-BUILD'S OWN packaged config tree: each local
     ``config/<kind>/<name>.yaml`` names its model via ``_target_``, and the
@@ -1282,22 +1724,26 @@ def _unique_paths(paths: Iterable[Path | str]) -> tuple[Path, ...]:
     return tuple(unique.keys())
 
 
-def _run_verilator_bench(spec, *, extra_sources, top_module, expect_stdout, verilator, extra_args, work_dir):
-    """Run a Verilator testbench over the spec sources plus extra sources;
-    raise BuildStepError on failure or missing expected stdout."""
+def _run_verilator_bench(spec, *, extra_sources, top_module, expect_stdout, verilator, extra_args, work_dir, build_cache=None):
+    """Run a Verilator testbench over the spec sources plus extra sources,
+    in ``build_cache``'s entry for them when one is given; raise
+    BuildStepError on failure or missing expected stdout."""
     try:
         from dau_sim.integrations.verilator import VerilatorExecutionError, VerilatorUnavailableError, run_verilator_testbench
     except ModuleNotFoundError as exc:
         raise BuildStepError("verilator simulation requires dau-sim to be importable") from exc
     all_sources = _unique_paths((*spec.sources, *extra_sources))
     try:
-        result = run_verilator_testbench(
-            sources=all_sources,
-            top_module=top_module,
-            work_dir=work_dir,
-            verilator=verilator,
-            extra_args=tuple(shlex.split(extra_args)),
-        )
+        if build_cache is not None:
+            result = build_cache.run(sources=all_sources, top_module=top_module, verilator=verilator, extra_args=tuple(shlex.split(extra_args)))
+        else:
+            result = run_verilator_testbench(
+                sources=all_sources,
+                top_module=top_module,
+                work_dir=work_dir,
+                verilator=verilator,
+                extra_args=tuple(shlex.split(extra_args)),
+            )
     except (FileNotFoundError, ValueError, VerilatorExecutionError, VerilatorUnavailableError) as exc:
         raise BuildStepError(str(exc)) from exc
     if expect_stdout and expect_stdout not in result.stdout:
@@ -0,0 +1,339 @@
+"""A compact, node-free snapshot of a parsed ``Design``.
+
+A parsed ``Module`` is a tree of pydantic models (ports, dimensions, wires,
+procedural blocks), each holding the live pyslang node it was read from:
+heavy to keep, and impossible to pickle cheaply to another process.
+``write_design_snapshot`` flattens what a design's consumers read -- each
+module's kind and source path, its parameters, its ports and its submodule
+instances with their links -- into one binary file. Every string is stored
+once in an interned table, and every table is a struct of arrays: columns of
+fixed-width integers, one row per port (or parameter, instance, link), with
+each module holding the start of its rows in each table.
+
+``DesignSnapshot`` maps the file read-only and views the columns in place,
+so parallel build workers share the page cache's one copy of a parse
+instead of reparsing or unpickling it. ``to_design`` rebuilds node-free
+``Module`` models where a consumer needs them.
+
+Module bodies (wires, assignments, procedural and generate blocks) and
+modports are not carried; no consumer of a snapshot reads them.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from dau_build.svparser import Design, Dimensions, Inout, Input, Interface, Link, Module, Output, Parameter, Port
+
+__all__ = (
+    "DESIGN_SNAPSHOT_MAGIC",
+    "DesignSnapshot",
+    "DesignSnapshotError",
+    "design_snapshot_bytes",
+    "load_design_snapshot",
+    "write_design_snapshot",
+)
+
+DESIGN_SNAPSHOT_MAGIC = b"DAUDSN02"
+
+# magic, byte order ("<" or ">"), then the row count of each table and the
+# size of the string blob
+_HEADER = struct.Struct("=8sc7xQQQQQQQ")
+
+# (column, table whose rows it holds, array typecode); a "+1" table holds
+# one more row than the table, the end of the last module's (or string's)
+# rows. A string column holds an index into the string table, -1 for none.
+_COLUMNS: tuple[tuple[str, str, str], ...] = (
+    ("string_offset", "strings+1", "q"),
+    ("module_name", "modules", "i"),
+    ("module_interface", "modules", "b"),
+    ("module_source_path", "modules", "i"),
+    ("module_port_start", "modules+1", "i"),
+    ("module_parameter_start", "modules+1", "i"),
+    ("module_instance_start", "modules+1", "i"),
+    ("port_name", "ports", "i"),
+    ("port_direction", "ports", "b"),
+    ("port_keyword", "ports", "i"),
+    ("port_dimension_count", "ports", "b"),
+    ("port_dimension_resolved", "ports", "b"),
+    ("port_dimension_left", "ports", "q"),
+    ("port_dimension_right", "ports", "q"),
+    ("parameter_name", "parameters", "i"),
+    ("parameter_value", "parameters", "q"),
+    ("instance_module", "instances", "i"),
+    ("instance_name", "instances", "i"),
+    ("instance_link_start", "instances+1", "i"),
+    ("link_name", "links", "i"),
+    ("link_connection", "links", "i"),
+    ("link_position", "links", "i"),
+    ("link_port", "links", "i"),
+)
+_TABLES = ("strings", "modules", "ports", "parameters", "instances", "links")
+
+_DIRECTIONS: tuple[type[Port], ...] = (Input, Output, Inout)
+
+
+class DesignSnapshotError(ValueError):
+    pass
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _rows(table: str, counts: dict[str, int]) -> int:
+    name, _, extra = table.partition("+")
+    return counts[name] + (1 if extra else 0)
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.columns = {name: array(typecode) for name, _, typecode in _COLUMNS}
+
+    def intern(self, value: str | None) -> int:
+        if value is None:
+            return -1
+        return self.strings.setdefault(value, len(self.strings))
+
+    def add_module(self, module: Module) -> None:
+        columns = self.columns
+        columns["module_name"].append(self.intern(module.name))
+        columns["module_interface"].append(int(isinstance(module, Interface)))
+        columns["module_source_path"].append(self.intern(module.source_path.as_posix() if module.source_path is not None else None))
+        columns["module_port_start"].append(len(columns["port_name"]))
+        columns["module_parameter_start"].append(len(columns["parameter_name"]))
+        columns["module_instance_start"].append(len(columns["instance_name"]))
+        # header order: positional links connect ports in it
+        for port in module.ports():
+            dimensions = port.dimensions.dimensions
+            if len(dimensions) > 2:
+                raise DesignSnapshotError(f"{module.name}.{port.name}: {len(dimensions)} packed dimensions cannot be snapshotted")
+            columns["port_name"].append(self.intern(port.name))
+            columns["port_direction"].append(_DIRECTIONS.index(type(port)))
+            columns["port_keyword"].append(self.intern(port.keyword))
+            columns["port_dimension_count"].append(len(dimensions))
+            columns["port_dimension_resolved"].append(int(port.dimensions.resolved))
+            columns["port_dimension_left"].append(dimensions[0] if dimensions else 0)
+            columns["port_dimension_right"].append(dimensions[1] if len(dimensions) > 1 else 0)
+        for parameter in module.parameters:
+            columns["parameter_name"].append(self.intern(parameter.name))
+            columns["parameter_value"].append(int(parameter.value))
+        for instance in module.modules:
+            columns["instance_module"].append(self.intern(instance.name))
+            columns["instance_name"].append(self.intern(instance.instance_name))
+            columns["instance_link_start"].append(len(columns["link_name"]))
+            for link in instance.links:
+                columns["link_name"].append(self.intern(link.name))
+                columns["link_connection"].append(self.intern(link.connection))
+                columns["link_position"].append(link.position)
+                columns["link_port"].append(self.intern(link.port or None))
+
+    def finish(self) -> bytes:
+        columns = self.columns
+        # the closing row of each "+1" column
+        columns["module_port_start"].append(len(columns["port_name"]))
+        columns["module_parameter_start"].append(len(columns["parameter_name"]))
+        columns["module_instance_start"].append(len(columns["instance_name"]))
+        columns["instance_link_start"].append(len(columns["link_name"]))
+        encoded = [value.encode("utf-8") for value in self.strings]
+        offset = 0
+        for value in encoded:
+            columns["string_offset"].append(offset)
+            offset += len(value)
+        columns["string_offset"].append(offset)
+        counts = {
+            "strings": len(encoded),
+            "modules": len(columns["module_name"]),
+            "ports": len(columns["port_name"]),
+            "parameters": len(columns["parameter_name"]),
+            "instances": len(columns["instance_name"]),
+            "links": len(columns["link_name"]),
+        }
+        byteorder = b"<" if sys.byteorder == "little" else b">"
+        out = bytearray(_HEADER.pack(DESIGN_SNAPSHOT_MAGIC, byteorder, *(counts[table] for table in _TABLES), offset))
+        for name, _, _ in _COLUMNS:
+            out.extend(b"\0" * (_aligned(len(out)) - len(out)))
+            out.extend(columns[name].tobytes())
+        out.extend(b"".join(encoded))
+        return bytes(out)
+
+
+def design_snapshot_bytes(design: Design) -> bytes:
+    """``design`` in the snapshot format."""
+    writer = _Writer()
+    for module in design.modules.values():
+        writer.add_module(module)
+    return writer.finish()
+
+
+def write_design_snapshot(design: Design, path: Path) -> Path:
+    """Write ``design``'s snapshot to ``path`` (through a temporary file, so
+    a reader never maps a half-written snapshot)."""
+    partial = path.with_name(path.name + ".partial")
+    partial.write_bytes(design_snapshot_bytes(design))
+    partial.replace(path)
+    return path
+
+
+class DesignSnapshot:
+    """A snapshot file mapped read-only; ``close`` (or leaving the ``with``)
+    unmaps it."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            try:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # an empty file
+                raise DesignSnapshotError(f"not a design snapshot: {self.path.as_posix()}") from exc
+        self._views: list[memoryview] = []
+        try:
+            self._open()
+        except DesignSnapshotError:
+            self.close()
+            raise
+
+    def _open(self) -> None:
+        if len(self._map) < _HEADER.size:
+            raise DesignSnapshotError(f"not a design snapshot: {self.path.as_posix()}")
+        magic, byteorder, *counted, blob_bytes = _HEADER.unpack_from(self._map)
+        if magic != DESIGN_SNAPSHOT_MAGIC:
+            raise DesignSnapshotError(f"not a design snapshot: {self.path.as_posix()}")
+        if byteorder != (b"<" if sys.byteorder == "little" else b">"):
+            raise DesignSnapshotError(f"design snapshot written on a host of the other byte order: {self.path.as_posix()}")
+        counts = dict(zip(_TABLES, counted, strict=True))
+        whole = memoryview(self._map)
+        self._views.append(whole)
+        offset = _HEADER.size
+        columns: dict[str, memoryview] = {}
+        for name, table, typecode in _COLUMNS:
+            offset = _aligned(offset)
+            length = _rows(table, counts) * array(typecode).itemsize
+            if offset + length > len(self._map):
+                raise DesignSnapshotError(f"truncated design snapshot: {self.path.as_posix()}")
+            columns[name] = whole[offset : offset + length].cast(typecode)
+            self._views.append(columns[name])
+            offset += length
+        if offset + blob_bytes != len(self._map):
+            raise DesignSnapshotError(f"truncated design snapshot: {self.path.as_posix()}")
+        self._columns = columns
+        self._blob = whole[offset:]
+        self._views.append(self._blob)
+        self._strings: list[str | None] = [None] * counts["strings"]
+        self._module_rows = {self.string(index): row for row, index in enumerate(columns["module_name"])}
+
+    def close(self) -> None:
+        # every view of the map has to go before the map can
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def string(self, index: int) -> str | None:
+        """Entry ``index`` of the string table, decoded (and interned) on
+        first use; None for -1."""
+        if index < 0:
+            return None
+        value = self._strings[index]
+        if value is None:
+            offsets = self._columns["string_offset"]
+            value = sys.intern(str(self._blob[offsets[index] : offsets[index + 1]], "utf-8"))
+            self._strings[index] = value
+        return value
+
+    @property
+    def module_names(self) -> tuple[str, ...]:
+        return tuple(self._module_rows)
+
+    def _row(self, module: str) -> int:
+        try:
+            return self._module_rows[module]
+        except KeyError:
+            raise DesignSnapshotError(f"{self.path.as_posix()} has no module {module}") from None
+
+    def _span(self, column: str, module: str) -> range:
+        row = self._row(module)
+        starts = self._columns[column]
+        return range(starts[row], starts[row + 1])
+
+    def ports(self, module: str) -> tuple[Port, ...]:
+        """``module``'s inputs, outputs and inouts, in header order."""
+        columns = self._columns
+        ports = []
+        for row in self._span("module_port_start", module):
+            count = columns["port_dimension_count"][row]
+            dimensions = [columns["port_dimension_left"][row], columns["port_dimension_right"][row]][:count]
+            ports.append(
+                _DIRECTIONS[columns["port_direction"][row]](
+                    name=self.string(columns["port_name"][row]),
+                    keyword=self.string(columns["port_keyword"][row]),
+                    dimensions=Dimensions(dimensions=dimensions, resolved=bool(columns["port_dimension_resolved"][row])),
+                )
+            )
+        return tuple(ports)
+
+    def parameters(self, module: str) -> tuple[Parameter, ...]:
+        columns = self._columns
+        return tuple(
+            Parameter(name=self.string(columns["parameter_name"][row]), value=columns["parameter_value"][row])
+            for row in self._span("module_parameter_start", module)
+        )
+
+    def instances(self, module: str) -> tuple[Module, ...]:
+        """``module``'s submodule instantiations, unresolved (name, instance
+        name and links), as the parser records them."""
+        columns = self._columns
+        instances = []
+        for row in self._span("module_instance_start", module):
+            links = [
+                Link(
+                    name=self.string(columns["link_name"][link]),
+                    connection=self.string(columns["link_connection"][link]),
+                    position=columns["link_position"][link],
+                    port=self.string(columns["link_port"][link]) or "",
+                )
+                for link in range(columns["instance_link_start"][row], columns["instance_link_start"][row + 1])
+            ]
+            instances.append(
+                Module(name=self.string(columns["instance_module"][row]), instance_name=self.string(columns["instance_name"][row]), links=links)
+            )
+        return tuple(instances)
+
+    def module(self, name: str) -> Module:
+        """A node-free ``Module`` (or ``Interface``) for ``name``."""
+        row = self._row(name)
+        ports = self.ports(name)
+        source_path = self.string(self._columns["module_source_path"][row])
+        model = Interface if self._columns["module_interface"][row] else Module
+        return model(
+            name=name,
+            parameters=list(self.parameters(name)),
+            inputs=[port for port in ports if type(port) is Input],
+            outputs=[port for port in ports if type(port) is Output],
+            inouts=[port for port in ports if type(port) is Inout],
+            port_order=[port.name for port in ports],
+            modules=list(self.instances(name)),
+            source_path=Path(source_path) if source_path is not None else None,
+        )
+
+    def to_design(self) -> Design:
+        return Design(modules={name: self.module(name) for name in self._module_rows})
+
+
+def load_design_snapshot(path: Path) -> DesignSnapshot:
+    """Map the snapshot at ``path``."""
+    try:
+        return DesignSnapshot(path)
+    except OSError as exc:
+        raise DesignSnapshotError(f"failed to read design snapshot: {Path(path).as_posix()}: {exc}") from exc
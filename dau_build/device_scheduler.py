@@ -0,0 +1,247 @@
+"""Queued, observable acquisition of the per-device plan locks.
+
+A board is one exclusive resource, serialized by an advisory ``flock`` on
+its lock file (``hardware_plan.device_lock_path``). A bare blocking flock
+leaves a second run hanging with no word on what it waits for, and serves
+waiters in whatever order the kernel wakes them. This module keeps the same
+lock files -- so any process taking them with a plain flock still
+coordinates -- and adds, in the same user-private directory:
+
+- a holder record beside each held lock (``<lock>.holder``: pid, host, plan,
+  start time), so a waiter can say who it waits on;
+- a FIFO queue (``queue/``) of tickets, one per waiting acquisition. A ticket
+  is flocked by its waiter for as long as it waits, so the ticket of a
+  process that died is recognizably stale and is swept. A waiter only tries
+  its locks once no older live ticket wants any of the same boards;
+- ``acquire_device`` over several candidate locks: the run takes whichever
+  matching board frees first, or gives up after ``timeout`` seconds.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from ccflow import BaseModel
+from pydantic import ConfigDict
+
+__all__ = (
+    "DeviceLease",
+    "DeviceLockHolder",
+    "DeviceLockTimeout",
+    "DeviceSchedulerError",
+    "acquire_device",
+    "read_device_lock_holder",
+    "try_lock_device",
+)
+
+
+class DeviceSchedulerError(ValueError):
+    pass
+
+
+class DeviceLockTimeout(DeviceSchedulerError):
+    pass
+
+
+class DeviceLockHolder(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    pid: int
+    host: str
+    plan: str | None = None
+    started: float
+
+    @property
+    def held_s(self) -> float:
+        return max(time.time() - self.started, 0.0)
+
+
+class DeviceLease:
+    """A held device lock; ``release`` (or leaving the ``with``) frees it."""
+
+    def __init__(self, lock_path: Path, fd: int, holder: DeviceLockHolder, *, wait_s: float = 0.0) -> None:
+        self.lock_path = lock_path
+        self.holder = holder
+        self.wait_s = wait_s
+        self._fd: int | None = fd
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        import fcntl
+
+        # the record goes first: once the flock drops, a new holder's
+        # record may land at the same path
+        _holder_path(self.lock_path).unlink(missing_ok=True)
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+def _holder_path(lock_path: Path) -> Path:
+    return lock_path.with_name(lock_path.name + ".holder")
+
+
+def _private_dir(directory: Path) -> Path:
+    directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+    # mkdir(mode=) is umask-masked and only applied to newly-created leaves;
+    # force 0700 on the lock dir so a permissive umask can't leave it group/
+    # world-writable (another account could then swap the lock out from under
+    # O_NOFOLLOW, which only guards the final component)
+    try:
+        directory.chmod(0o700)
+    except OSError:
+        pass  # not the owner / racing peer — flock still coordinates
+    return directory
+
+
+def _open_private(path: Path) -> int:
+    _private_dir(path.parent)
+    # O_NOFOLLOW: refuse to follow a symlink at the lock path (the dir is
+    # user-private, so this is belt-and-braces)
+    return os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+
+
+def read_device_lock_holder(lock_path: Path) -> DeviceLockHolder | None:
+    """Who holds ``lock_path``, from its holder record; None when it is free
+    or the record is gone, unreadable, or left by a process that died."""
+    try:
+        holder = DeviceLockHolder(**json.loads(_holder_path(lock_path).read_text()))
+    except (OSError, ValueError, TypeError):
+        return None
+    if holder.host == socket.gethostname() and not _pid_alive(holder.pid):
+        return None
+    return holder
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def try_lock_device(lock_path: Path, *, plan: str | None = None) -> DeviceLease | None:
+    """Take ``lock_path`` if it is free right now, without waiting or
+    queueing; None when another run holds it."""
+    import fcntl
+
+    fd = _open_private(lock_path)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    holder = DeviceLockHolder(pid=os.getpid(), host=socket.gethostname(), plan=plan, started=time.time())
+    try:
+        _holder_path(lock_path).write_text(holder.model_dump_json())
+    except OSError:
+        pass  # the record is advisory; the flock is the lock
+    return DeviceLease(lock_path, fd, holder)
+
+
+class _Ticket:
+    """This waiter's place in the queue: a file it keeps flocked."""
+
+    def __init__(self, queue: Path, lock_paths: Sequence[Path]) -> None:
+        import fcntl
+
+        name = f"{time.time_ns():020d}-{os.getpid()}-{threading.get_ident()}.ticket"
+        staging = queue / f"{name}.pending"
+        self.fd = _open_private(staging)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        os.write(self.fd, json.dumps({"locks": sorted(str(path) for path in lock_paths)}).encode())
+        # only a ticket that is already flocked ever becomes visible, so an
+        # unlocked ticket in the queue is always one whose waiter is gone
+        self.path = queue / name
+        staging.rename(self.path)
+        self.locks = {str(path) for path in lock_paths}
+
+    def is_head(self) -> bool:
+        """No older live ticket wants any of this ticket's boards."""
+        import fcntl
+
+        for other in sorted(self.path.parent.glob("*.ticket")):
+            if other.name >= self.path.name:
+                break
+            try:
+                fd = os.open(other, os.O_RDONLY | os.O_NOFOLLOW)
+            except OSError:
+                continue  # served or swept meanwhile
+            try:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    wanted = set(json.loads(os.read(fd, 1 << 16) or b"{}").get("locks", ()))
+                    if wanted & self.locks:
+                        return False
+                    continue
+                other.unlink(missing_ok=True)  # its waiter died
+            except ValueError:
+                continue  # an unreadable ticket claims nothing
+            finally:
+                os.close(fd)
+        return True
+
+    def close(self) -> None:
+        self.path.unlink(missing_ok=True)
+        os.close(self.fd)
+
+
+def acquire_device(
+    lock_paths: Sequence[Path],
+    *,
+    plan: str | None = None,
+    timeout: float | None = None,
+    poll_interval: float = 0.1,
+    on_wait: Callable[[Path, DeviceLockHolder | None], None] | None = None,
+) -> DeviceLease:
+    """Take whichever of ``lock_paths`` frees first, in FIFO order with every
+    other waiter for an overlapping set of boards. ``on_wait`` hears once
+    which lock (and holder) the run first found busy; the lease's ``wait_s``
+    is the time from the call to the acquisition. After ``timeout`` seconds
+    the wait is abandoned with ``DeviceLockTimeout``."""
+    if not lock_paths:
+        raise DeviceSchedulerError("acquire_device needs at least one device lock")
+    started = time.monotonic()
+    ticket = _Ticket(_private_dir(lock_paths[0].parent / "queue"), lock_paths)
+    reported = False
+    try:
+        while True:
+            if ticket.is_head():
+                for lock_path in lock_paths:
+                    lease = try_lock_device(lock_path, plan=plan)
+                    if lease is not None:
+                        lease.wait_s = time.monotonic() - started
+                        return lease
+            if not reported and on_wait is not None:
+                on_wait(lock_paths[0], read_device_lock_holder(lock_paths[0]))
+            reported = True
+            if timeout is not None and time.monotonic() - started >= timeout:
+                holders = ", ".join(_holder_label(path) for path in lock_paths)
+                raise DeviceLockTimeout(f"no device free after {timeout:g}s: {holders}")
+            time.sleep(poll_interval)
+    finally:
+        ticket.close()
+
+
+def _holder_label(lock_path: Path) -> str:
+    holder = read_device_lock_holder(lock_path)
+    if holder is None:
+        return f"{lock_path.name} (holder unknown)"
+    return f"{lock_path.name} held by pid {holder.pid} on {holder.host} (plan {holder.plan or '-'}) for {holder.held_s:.0f}s"
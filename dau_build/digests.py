@@ -0,0 +1,152 @@
+"""Content digests of build artifacts.
+
+Bitstreams and flash images run to hundreds of MB, and a shell build
+packages dozens of generated inputs and contributing sources beside them.
+``sha256_file`` streams a file through a fixed buffer, so digesting holds
+one chunk per worker however large the file; ``digest_files`` spreads a
+manifest's files over a thread pool (hashlib releases the GIL while it
+hashes, so the workers hash in parallel).
+
+Most of what a manifest digests -- the contributing HDL sources, the
+generated project inputs -- is unchanged from the last build. A
+``DigestCache`` keeps each file's sha256 in a small SQLite store under the
+user cache directory, keyed by its resolved path and stat signature (size,
+mtime, inode): a file whose signature is unchanged is not read at all, and
+any other is re-hashed and its entry replaced. ``verify_fraction`` re-hashes
+that share of the hits, chosen at random, to catch an entry gone stale
+behind an unchanged signature (a tool that restores mtimes, a filesystem
+with coarse timestamps).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import sqlite3
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from artlink import Digest
+from ccflow import BaseModel
+from pydantic import ConfigDict, Field
+
+__all__ = (
+    "DIGEST_CHUNK_BYTES",
+    "DigestCache",
+    "DigestCacheError",
+    "default_digest_cache_path",
+    "digest_files",
+    "sha256_file",
+)
+
+# large enough that per-read overhead vanishes against hashing, small enough
+# that a pool of workers on multi-hundred-MB images holds a few MiB
+DIGEST_CHUNK_BYTES = 1 << 20
+
+# a file modified this recently may be rewritten within the same timestamp
+# tick without its signature changing, so its digest is not stored (git's
+# "racily clean" entries); two seconds covers the coarsest common filesystem
+_RACY_WINDOW_NS = 2_000_000_000
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS digests (path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, inode INTEGER NOT NULL, sha256 TEXT NOT NULL)"
+
+
+class DigestCacheError(ValueError):
+    pass
+
+
+def default_digest_cache_path() -> Path:
+    """``$XDG_CACHE_HOME/dau-build/digests.sqlite3``, under ``~/.cache``
+    where ``XDG_CACHE_HOME`` is unset."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    return (Path(cache_home) if cache_home else Path.home() / ".cache") / "dau-build" / "digests.sqlite3"
+
+
+def sha256_file(path: Path, *, chunk_bytes: int = DIGEST_CHUNK_BYTES) -> str:
+    """The hex sha256 of ``path``'s contents, read ``chunk_bytes`` at a time."""
+    digest = hashlib.sha256()
+    buffer = bytearray(chunk_bytes)
+    view = memoryview(buffer)
+    with Path(path).open("rb", buffering=0) as handle:
+        while count := handle.readinto(buffer):
+            digest.update(view[:count])
+    return digest.hexdigest()
+
+
+def _hash_files(paths: Sequence[Path], max_workers: int | None) -> list[str]:
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return [sha256_file(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(sha256_file, paths))
+
+
+class DigestCache(BaseModel):
+    """A persistent store of file digests, keyed by stat signature."""
+
+    model_config = ConfigDict(frozen=True)
+
+    path: Path = Field(default_factory=default_digest_cache_path)
+    verify_fraction: float = Field(default=0.0, ge=0.0, le=1.0)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            connection = sqlite3.connect(self.path, timeout=30.0)
+            connection.execute(_SCHEMA)
+        except sqlite3.DatabaseError as exc:
+            raise DigestCacheError(f"unusable digest cache {self.path.as_posix()}: {exc}") from exc
+        return connection
+
+    def digest(self, paths: Sequence[Path], *, max_workers: int | None = None) -> list[str]:
+        """The hex sha256 of each of ``paths`` (distinct), from the store
+        where the file's signature matches its entry. Every file that is
+        hashed -- a miss, or a hit drawn for verification -- has its entry
+        written back."""
+        keys = [str(Path(path).resolve()) for path in paths]
+        signatures = []
+        for path in paths:
+            stat = os.stat(path)
+            signatures.append((stat.st_size, stat.st_mtime_ns, stat.st_ino))
+        connection = self._connect()
+        try:
+            stored: dict[str, tuple[int, int, int, str]] = {}
+            # bounded batches: SQLite caps the parameters of one statement
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                rows = connection.execute(
+                    f"SELECT path, size, mtime_ns, inode, sha256 FROM digests WHERE path IN ({', '.join('?' * len(batch))})", batch
+                )
+                stored.update((row[0], tuple(row[1:])) for row in rows)
+            values: list[str | None] = []
+            for key, signature in zip(keys, signatures, strict=True):
+                entry = stored.get(key)
+                hit = entry is not None and entry[:3] == signature and random.random() >= self.verify_fraction
+                values.append(entry[3] if hit else None)
+            stale = [index for index, value in enumerate(values) if value is None]
+            for index, value in zip(stale, _hash_files([paths[index] for index in stale], max_workers), strict=True):
+                values[index] = value
+            now = time.time_ns()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO digests (path, size, mtime_ns, inode, sha256) VALUES (?, ?, ?, ?, ?)",
+                    [(keys[index], *signatures[index], values[index]) for index in stale if now - signatures[index][1] >= _RACY_WINDOW_NS],
+                )
+        except sqlite3.DatabaseError as exc:
+            raise DigestCacheError(f"unusable digest cache {self.path.as_posix()}: {exc}") from exc
+        finally:
+            connection.close()
+        return values
+
+
+def digest_files(paths: Sequence[Path], *, max_workers: int | None = None, cache: DigestCache | None = None) -> tuple[Digest, ...]:
+    """The sha256 ``Digest`` of each of ``paths``, in order. A path listed
+    twice is hashed once; ``max_workers`` defaults to the CPU count. With a
+    ``cache``, files whose stat signature it has seen are not read."""
+    unique = list(dict.fromkeys(Path(path) for path in paths))
+    values = cache.digest(unique, max_workers=max_workers) if cache is not None else _hash_files(unique, max_workers)
+    by_path = {path: Digest(algorithm="sha256", value=value) for path, value in zip(unique, values, strict=True)}
+    return tuple(by_path[Path(path)] for path in paths)
@@ -0,0 +1,209 @@
+"""The instance-level elaboration graph of a parsed ``Design``.
+
+A ``Design`` holds one ``Module`` per definition, and what a module
+instantiates sits in its ``modules`` list (and its generate blocks'), so
+every hierarchy question -- where is ``fifo`` instantiated, what does this
+net drive, which files does ``top`` need -- is a walk over those lists.
+``elaborate_design`` walks them once and indexes the answers:
+
+- ``instances_of`` / ``children``: the instantiations of a definition, and
+  those inside it;
+- ``fan_in`` / ``fan_out``: the instance pins driving, and driven by, a net
+  of a definition, read from the instances' links against the child
+  definitions' ports (a named link by its port, a positional one by header
+  order);
+- ``unconnected_ports``: the child ports no link reaches;
+- ``module_closure`` / ``source_closure``: the definitions, and their source
+  files, a top transitively instantiates.
+
+The graph is over definitions -- a module instantiated from many parents is
+one node with many incoming edges -- so building and querying it follows
+the design's definitions and instantiations, never the unrolled hierarchy's
+paths, which grow as width ** depth.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from pathlib import Path
+from typing import Literal
+
+from ccflow import BaseModel
+from pydantic import ConfigDict
+
+from dau_build.svparser import Design, Inout, Input, Module, Output
+
+__all__ = (
+    "ElaborationError",
+    "ElaborationGraph",
+    "InstanceEdge",
+    "Pin",
+    "elaborate_design",
+)
+
+_DIRECTIONS = {Input: "input", Output: "output", Inout: "inout"}
+
+
+class ElaborationError(ValueError):
+    pass
+
+
+class InstanceEdge(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # the definition holding the instantiation
+    parent: str
+    instance: str
+    # the definition instantiated; it may be outside the design
+    module: str
+    # inside a generate block of ``parent``
+    generate: bool = False
+
+
+class Pin(BaseModel):
+    """One port of one instance and the net of the parent it connects to."""
+
+    model_config = ConfigDict(frozen=True)
+
+    parent: str
+    instance: str
+    module: str
+    # None where the port cannot be named: the instantiated module is not in
+    # the design, or a positional link runs past its ports
+    port: str | None
+    direction: Literal["input", "output", "inout"] | None
+    # the parent's net; empty for an unconnected port
+    net: str = ""
+
+
+def _instantiations(module: Module):
+    for instance in module.modules:
+        yield instance, False
+    for block in module.generate_blocks:
+        for instance in block.modules:
+            yield instance, True
+
+
+class ElaborationGraph:
+    """The definitions of a design and the instantiation edges between them,
+    indexed for the hierarchy queries."""
+
+    def __init__(self, design: Design) -> None:
+        self.definitions: dict[str, Module] = dict(design.modules)
+        edges: list[InstanceEdge] = []
+        self._children: dict[str, list[InstanceEdge]] = {}
+        self._instances: dict[str, list[InstanceEdge]] = {}
+        self._pins: dict[tuple[str, str], list[Pin]] = {}
+        self._unconnected: dict[str, list[Pin]] = {}
+        # each definition's ports by header position and by name, built once
+        ports = {name: module.ports() for name, module in self.definitions.items()}
+        directions = {name: {port.name: _DIRECTIONS[type(port)] for port in module_ports} for name, module_ports in ports.items()}
+        for parent, module in self.definitions.items():
+            for instance, generate in _instantiations(module):
+                edge = InstanceEdge(parent=parent, instance=instance.instance_name or "", module=instance.name, generate=generate)
+                edges.append(edge)
+                self._children.setdefault(parent, []).append(edge)
+                self._instances.setdefault(instance.name, []).append(edge)
+                child_ports = ports.get(instance.name)
+                child_directions = directions.get(instance.name, {})
+                connected = set()
+                for link in instance.links:
+                    port = link.port or None
+                    # the parser numbers positional links over the connection
+                    # list with its commas: the nth port's link is at 2n
+                    if port is None and child_ports is not None and 0 <= link.position // 2 < len(child_ports):
+                        port = child_ports[link.position // 2].name
+                    connected.add(port)
+                    pin = Pin(
+                        parent=parent,
+                        instance=edge.instance,
+                        module=edge.module,
+                        port=port,
+                        direction=child_directions.get(port),
+                        net=link.connection,
+                    )
+                    self._pins.setdefault((parent, link.connection), []).append(pin)
+                for child_port in child_ports or ():
+                    if child_port.name not in connected:
+                        self._unconnected.setdefault(parent, []).append(
+                            Pin(
+                                parent=parent,
+                                instance=edge.instance,
+                                module=edge.module,
+                                port=child_port.name,
+                                direction=child_directions[child_port.name],
+                            )
+                        )
+        self.edges: tuple[InstanceEdge, ...] = tuple(edges)
+        modules_by_source: dict[Path, list[str]] = {}
+        for name, module in self.definitions.items():
+            if module.source_path is not None:
+                modules_by_source.setdefault(module.source_path.resolve(), []).append(name)
+        # each resolved source file to the definitions parsed from it
+        self.modules_by_source: dict[Path, tuple[str, ...]] = {source: tuple(names) for source, names in modules_by_source.items()}
+
+    def _definition(self, name: str) -> Module:
+        try:
+            return self.definitions[name]
+        except KeyError:
+            raise ElaborationError(f"design has no module {name}") from None
+
+    def children(self, module: str) -> tuple[InstanceEdge, ...]:
+        """The instantiations inside ``module``."""
+        self._definition(module)
+        return tuple(self._children.get(module, ()))
+
+    def instances_of(self, module: str) -> tuple[InstanceEdge, ...]:
+        """Every instantiation of ``module`` in the design, whether or not
+        the design holds its definition."""
+        return tuple(self._instances.get(module, ()))
+
+    def connections(self, module: str, net: str) -> tuple[Pin, ...]:
+        """The instance pins on ``net`` inside ``module``."""
+        self._definition(module)
+        return tuple(self._pins.get((module, net), ()))
+
+    def fan_in(self, module: str, net: str) -> tuple[Pin, ...]:
+        """The instance pins driving ``net`` inside ``module``: outputs and
+        inouts. A net that is an input of ``module`` is driven from outside
+        it as well."""
+        return tuple(pin for pin in self.connections(module, net) if pin.direction in ("output", "inout"))
+
+    def fan_out(self, module: str, net: str) -> tuple[Pin, ...]:
+        """The instance pins ``net`` drives inside ``module``: inputs and
+        inouts."""
+        return tuple(pin for pin in self.connections(module, net) if pin.direction in ("input", "inout"))
+
+    def unconnected_ports(self, module: str | None = None) -> tuple[Pin, ...]:
+        """The ports of instances inside ``module`` (every definition when
+        None) that no link connects. Instances of modules outside the design
+        have no known ports and never appear."""
+        if module is not None:
+            self._definition(module)
+            return tuple(self._unconnected.get(module, ()))
+        return tuple(pin for pins in self._unconnected.values() for pin in pins)
+
+    def module_closure(self, top: str) -> tuple[str, ...]:
+        """``top`` and every definition it transitively instantiates,
+        breadth first. Instantiated modules outside the design are left
+        out."""
+        self._definition(top)
+        seen = {top: None}
+        queue = deque((top,))
+        while queue:
+            for edge in self._children.get(queue.popleft(), ()):
+                if edge.module in self.definitions and edge.module not in seen:
+                    seen[edge.module] = None
+                    queue.append(edge.module)
+        return tuple(seen)
+
+    def source_closure(self, top: str) -> tuple[Path, ...]:
+        """The source files of ``module_closure(top)``, each once, in closure
+        order."""
+        paths = (self.definitions[name].source_path for name in self.module_closure(top))
+        return tuple(dict.fromkeys(path for path in paths if path is not None))
+
+
+def elaborate_design(design: Design) -> ElaborationGraph:
+    """Index ``design``'s hierarchy, resolved or not."""
+    return ElaborationGraph(design)
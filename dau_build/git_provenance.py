@@ -0,0 +1,120 @@
+"""The git state of the repositories a build's sources come from.
+
+A shell build's contributing sources run to hundreds of files from a handful
+of checkouts. ``collect_git_provenance`` finds each file's repository by
+walking up to its ``.git`` (memoized per directory, no subprocess), then
+asks each repository once -- ``git describe`` for its state and one
+``git ls-files -s`` for the index blob of every source in it -- with the
+repositories queried concurrently. The cost follows the repositories, not
+the files.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ccflow import BaseModel
+from pydantic import ConfigDict, Field
+
+__all__ = (
+    "GitProvenance",
+    "RepositoryState",
+    "collect_git_provenance",
+)
+
+
+class RepositoryState(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    root: Path
+    # ``git describe --always --dirty --tags``; None when git could not say
+    describe: str | None = None
+    # index blob of each tracked source, by its path relative to ``root``
+    blobs: dict[str, str] = Field(default_factory=dict)
+
+
+class GitProvenance(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    repositories: tuple[RepositoryState, ...] = ()
+    # each source (as given) to the root of the repository holding it
+    source_roots: dict[Path, Path] = Field(default_factory=dict)
+
+    def blob(self, source: Path) -> str | None:
+        """The index blob ``git ls-files -s`` reported for ``source``; None
+        when it is outside a repository or untracked."""
+        root = self.source_roots.get(Path(source))
+        if root is None:
+            return None
+        state = {state.root: state for state in self.repositories}[root]
+        return state.blobs.get(Path(source).resolve().relative_to(root).as_posix())
+
+
+def _repository_root(directory: Path, roots: dict[Path, Path | None]) -> Path | None:
+    """The nearest ancestor of ``directory`` holding a ``.git`` (a directory,
+    or the file a worktree or submodule has), memoized in ``roots`` for every
+    directory the walk passes."""
+    walked = []
+    current = directory
+    while current not in roots:
+        walked.append(current)
+        if (current / ".git").exists():
+            root = current
+            break
+        if current.parent == current:
+            root = None
+            break
+        current = current.parent
+    else:
+        root = roots[current]
+    for path in walked:
+        roots[path] = root
+    return root
+
+
+def _git(root: Path, *args: str) -> str | None:
+    try:
+        completed = subprocess.run(["git", "-C", str(root), *args], capture_output=True, text=True, check=False)
+    except OSError:
+        return None
+    return completed.stdout if completed.returncode == 0 else None
+
+
+def _repository_state(root: Path, relative_paths: Sequence[str]) -> RepositoryState:
+    describe = (_git(root, "describe", "--always", "--dirty", "--tags") or "").strip() or None
+    blobs: dict[str, str] = {}
+    # -z: paths are NUL-terminated and never quoted; --literal-pathspecs: a
+    # source named with glob characters matches only itself
+    listing = _git(root, "--literal-pathspecs", "ls-files", "-s", "-z", "--", *relative_paths) or ""
+    for record in filter(None, listing.split("\0")):
+        # "<mode> <object> <stage>\t<path>"
+        info, _, path = record.partition("\t")
+        blobs[path] = info.split()[1]
+    return RepositoryState(root=root, describe=describe, blobs=blobs)
+
+
+def collect_git_provenance(sources: Sequence[Path], *, max_workers: int | None = None) -> GitProvenance:
+    """The repository of each of ``sources`` and the state of each
+    repository, with one ``describe`` and one ``ls-files`` per repository.
+    Sources outside any repository are left out."""
+    roots: dict[Path, Path | None] = {}
+    source_roots: dict[Path, Path] = {}
+    members: dict[Path, list[str]] = {}
+    for source in dict.fromkeys(Path(source) for source in sources):
+        resolved = source.resolve()
+        root = _repository_root(resolved.parent, roots)
+        if root is None:
+            continue
+        source_roots[source] = root
+        members.setdefault(root, []).append(resolved.relative_to(root).as_posix())
+    # the workers wait on git, not the CPU: one per repository by default
+    workers = min(max_workers or len(members), len(members))
+    if workers <= 1:
+        states = [_repository_state(root, paths) for root, paths in members.items()]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            states = list(pool.map(_repository_state, members, members.values()))
+    return GitProvenance(repositories=tuple(states), source_roots=source_roots)
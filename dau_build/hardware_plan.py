@@ -6,13 +6,16 @@ import re
 import shlex
 import shutil
 import subprocess
-from collections.abc import Sequence
+import sys
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Any, Literal
 
 from ccflow import BaseModel
 from pydantic import ConfigDict
 
+from dau_build.device_scheduler import DeviceLockHolder, DeviceLockTimeout, acquire_device
+from dau_build.plan_timeline import PlanTimeline
 from dau_build.vivado_backend import (
     VivadoBackendArtifactValidation,
     VivadoBackendRequest,
@@ -40,6 +43,9 @@ SHELL_STAGE_EXCLUDES = (
     "*.log",
     "hs_err_pid*.log",
 )
+# kept across re-staging although the seed shell never carries them: the
+# incremental build's reference checkpoints (vivado_build_tcl)
+SHELL_STAGE_PROTECTS = ("dau_reference_*.dcp",)
 
 
 class ToolStep(BaseModel):
@@ -48,6 +54,11 @@ class ToolStep(BaseModel):
     required_executable: str | None = None
     executable_override: str | None = None
     executable_requires_absolute: bool = False
+    # dependency edges, by the names of EARLIER steps (a name covers every
+    # earlier step carrying it). None is the plan's written order: the step
+    # runs after the one before it. A tuple -- empty included -- waits only
+    # on the steps it names, so the executor may run it beside its siblings.
+    after: tuple[str, ...] | None = None
 
     def __init__(
         self,
@@ -57,6 +68,7 @@ class ToolStep(BaseModel):
         required_executable: str | None = None,
         executable_override: str | None = None,
         executable_requires_absolute: bool = False,
+        after: tuple[str, ...] | None = None,
     ) -> None:
         super().__init__(
             name=name,
@@ -64,6 +76,7 @@ class ToolStep(BaseModel):
             required_executable=required_executable,
             executable_override=executable_override,
             executable_requires_absolute=executable_requires_absolute,
+            after=after,
         )
 
     @property
@@ -108,7 +121,7 @@ class HardwareToolchainConfig(BaseModel):
     programmer: Any = None
 
     @classmethod
-    def for_platform(cls, platform, *, work_root: Path, programmer=None, **overrides) -> HardwareToolchainConfig:
+    def for_platform(cls, platform, *, work_root: Path, programmer=None, host_access=None, **overrides) -> HardwareToolchainConfig:
         """Compose the toolchain config from a registered platform's
         ``host_access`` (board/host config, not code defaults) and its
         ``program_method``. Explicit keyword overrides win; with neither, the
@@ -116,8 +129,9 @@ class HardwareToolchainConfig(BaseModel):
         guidance. An explicit ``programmer`` model overrides the
         ``program_method``-selected default. ``platform`` may be ``None``
         (a platform-less compose), in which case every board fact stays
-        unset and only the explicit overrides apply."""
-        access = platform.host_access if platform is not None else None
+        unset and only the explicit overrides apply. ``host_access`` stands
+        in for the platform's own (one board of several identical ones)."""
+        access = host_access if host_access is not None else (platform.host_access if platform is not None else None)
         values: dict = {}
         if access is not None:
             values = {
@@ -220,13 +234,25 @@ def local_build_and_program_plan(
     python: str = "python3",
     vivado_settings: Path = Path("/opt/Xilinx/2025.1/Vivado/settings64.sh"),
     overlay_definition: VivadoOverlayDefinition | None = None,
+    incremental: bool = False,
+    synth_jobs: int | None = None,
+    impl_jobs: int | None = None,
+    synth_strategy: str | None = None,
+    impl_strategy: str | None = None,
 ) -> tuple[ToolStep, ...]:
     overlay_path = _work_path(config.work_root, overlay_tcl)
     build_tcl = Path("scripts/dau_build.tcl")
     build_tcl_path = _work_path(config.work_root, build_tcl)
     vivado_path_base = config.work_root.resolve(strict=False) if config.vivado_mount_root is not None else None
     overlay_source = dau_overlay_tcl(dau_core_root / "dau_core" / "hdl", vivado_path_base=vivado_path_base, overlay_definition=overlay_definition)
-    build_tcl_source = vivado_build_tcl(lane_placements=None if overlay_definition is None else overlay_definition.lane_placements)
+    build_tcl_source = vivado_build_tcl(
+        lane_placements=None if overlay_definition is None else overlay_definition.lane_placements,
+        incremental=incremental,
+        synth_jobs=synth_jobs,
+        impl_jobs=impl_jobs,
+        synth_strategy=synth_strategy,
+        impl_strategy=impl_strategy,
+    )
     stage_steps = () if source_shell_root is None else stage_shell_plan(config, source_shell_root=source_shell_root)
     return (
         *stage_steps,
@@ -265,6 +291,11 @@ def stage_vivado_overlay_plan(
     vivado_log_path: Path = Path("vivado.log"),
     vivado_settings: Path = Path("/opt/Xilinx/2025.1/Vivado/settings64.sh"),
     overlay_definition: VivadoOverlayDefinition | None = None,
+    incremental: bool = False,
+    synth_jobs: int | None = None,
+    impl_jobs: int | None = None,
+    synth_strategy: str | None = None,
+    impl_strategy: str | None = None,
 ) -> tuple[ToolStep, ...]:
     artifacts = generate_vivado_backend_artifacts(
         VivadoBackendRequest(
@@ -289,17 +320,22 @@ def stage_vivado_overlay_plan(
             vivado_invocation=config.vivado_invocation,
             vivado_mount_root=config.vivado_mount_root,
             overlay_definition=overlay_definition,
+            incremental=incremental,
+            synth_jobs=synth_jobs,
+            impl_jobs=impl_jobs,
+            synth_strategy=synth_strategy,
+            impl_strategy=impl_strategy,
         )
     )
     stage_steps = () if source_shell_root is None else stage_shell_plan(config, source_shell_root=source_shell_root)
-    return (
-        *stage_steps,
+    writes = (
         write_dau_overlay_step(overlay_path=artifacts.overlay_tcl_path, source=artifacts.overlay_tcl_text),
         write_dau_manifest_step(manifest_path=artifacts.manifest_path, source=artifacts.manifest_text),
         write_vivado_build_script_step(build_tcl_path=artifacts.build_tcl_path, source=artifacts.build_tcl_text),
         *_backend_vivado_driver_steps(artifacts),
         write_vivado_command_plan_step(command_plan_path=artifacts.command_plan_path, source=artifacts.command_plan_text),
     )
+    return (*stage_steps, *_concurrent_steps(writes, after=_step_names(stage_steps)))
 
 
 def stage_vivado_project_plan(
@@ -326,6 +362,11 @@ def stage_vivado_project_plan(
     vivado_settings: Path = Path("/opt/Xilinx/2025.1/Vivado/settings64.sh"),
     overlay_definition: VivadoOverlayDefinition | None = None,
     stage_task_name: str | None = None,
+    incremental: bool = False,
+    synth_jobs: int | None = None,
+    impl_jobs: int | None = None,
+    synth_strategy: str | None = None,
+    impl_strategy: str | None = None,
 ) -> tuple[ToolStep, ...]:
     artifacts = generate_vivado_project_generation_artifacts(
         VivadoProjectGenerationRequest(
@@ -354,12 +395,17 @@ def stage_vivado_project_plan(
             vivado_invocation=config.vivado_invocation,
             vivado_mount_root=config.vivado_mount_root,
             overlay_definition=overlay_definition,
+            incremental=incremental,
+            synth_jobs=synth_jobs,
+            impl_jobs=impl_jobs,
+            synth_strategy=synth_strategy,
+            impl_strategy=impl_strategy,
             **({} if stage_task_name is None else {"stage_task_name": stage_task_name}),
         )
     )
     backend_artifacts = artifacts.backend_artifacts
-    return (
-        *stage_shell_plan(config, source_shell_root=source_shell_root),
+    stage_steps = stage_shell_plan(config, source_shell_root=source_shell_root)
+    writes = (
         write_vivado_project_manifest_step(manifest_path=artifacts.project_manifest_path, source=artifacts.project_manifest_text),
         write_dau_overlay_step(overlay_path=backend_artifacts.overlay_tcl_path, source=backend_artifacts.overlay_tcl_text),
         write_dau_manifest_step(manifest_path=backend_artifacts.manifest_path, source=backend_artifacts.manifest_text),
@@ -367,6 +413,7 @@ def stage_vivado_project_plan(
         *_backend_vivado_driver_steps(backend_artifacts),
         write_vivado_command_plan_step(command_plan_path=backend_artifacts.command_plan_path, source=backend_artifacts.command_plan_text),
     )
+    return (*stage_steps, *_concurrent_steps(writes, after=_step_names(stage_steps)))
 
 
 def stage_shell_plan(
@@ -513,6 +560,18 @@ def _local_vivado_driver_steps(config: HardwareToolchainConfig, *, overlay_tcl:
     )
 
 
+def _step_names(steps: Sequence[ToolStep]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(step.name for step in steps))
+
+
+def _concurrent_steps(steps: Sequence[ToolStep], *, after: tuple[str, ...]) -> tuple[ToolStep, ...]:
+    """``steps`` as siblings: each waits only on ``after``, never on each
+    other. For steps that touch disjoint files and no device -- the script
+    writes a plan stages once the shell tree is in place (the staging rsync
+    runs with --delete, so nothing may be written under it before it ends)."""
+    return tuple(step.model_copy(update={"after": after}) for step in steps)
+
+
 def _write_text_step(name: str, path: Path, source: str) -> ToolStep:
     payload = base64.b64encode(source.encode("utf-8")).decode("ascii")
     script = f"mkdir -p {shlex.quote(str(path.parent))} && printf %s {shlex.quote(payload)} | base64 -d > {shlex.quote(str(path))}"
@@ -821,6 +880,8 @@ def _stage_shell_script(*, source_shell_root: Path, work_root: Path) -> str:
     argv = ["rsync", "-a", "--delete", "--delete-excluded"]
     for pattern in SHELL_STAGE_EXCLUDES:
         argv.extend(("--exclude", pattern))
+    for pattern in SHELL_STAGE_PROTECTS:
+        argv.extend(("--filter", f"P {pattern}"))
     argv.extend((_directory_argument(source_shell_root), _directory_argument(work_root)))
     return f"mkdir -p {shlex.quote(str(work_root.parent))} && {shlex.join(argv)}"
 
@@ -830,7 +891,54 @@ def _execute_steps(steps: Sequence[ToolStep]) -> int:
 
 
 def format_plan_steps(steps: Sequence[ToolStep]) -> str:
-    return "\n".join(f"{step.name}\t{step.command_line}" for step in steps)
+    """The dry-run listing: one ``name<TAB>command`` line per step, in plan
+    order. A plan with concurrent steps adds its critical path -- the
+    longest dependency chain, which bounds the run however many steps run
+    beside it."""
+    lines = [f"{step.name}\t{step.command_line}" for step in steps]
+    dependencies = plan_step_dependencies(steps)
+    if not _is_sequential(dependencies):
+        path = plan_critical_path(steps)
+        lines.append(f"critical-path\tsteps={len(path)} of {len(steps)}: {' -> '.join(step.name for step in path)}")
+    return "\n".join(lines)
+
+
+def plan_step_dependencies(steps: Sequence[ToolStep]) -> tuple[tuple[int, ...], ...]:
+    """Each step's dependencies as indices into ``steps``. Edges only ever
+    point at EARLIER steps, so plan order is already a topological order and
+    a cycle cannot be written; a name no earlier step carries is refused."""
+    dependencies: list[tuple[int, ...]] = []
+    for index, step in enumerate(steps):
+        if step.after is None:
+            dependencies.append((index - 1,) if index else ())
+            continue
+        earlier = {steps[i].name for i in range(index)}
+        missing = [name for name in step.after if name not in earlier]
+        if missing:
+            raise ValueError(f"plan step {step.name!r} runs after {missing}, but no earlier step carries that name")
+        dependencies.append(tuple(i for i in range(index) if steps[i].name in step.after))
+    return tuple(dependencies)
+
+
+def plan_critical_path(steps: Sequence[ToolStep]) -> tuple[ToolStep, ...]:
+    """The longest chain of dependent steps (earliest plan position on ties)."""
+    dependencies = plan_step_dependencies(steps)
+    depth: list[int] = []
+    via: list[int | None] = []
+    for deps in dependencies:
+        parent = max(deps, key=lambda i: (depth[i], -i), default=None)
+        depth.append(1 if parent is None else depth[parent] + 1)
+        via.append(parent)
+    if not steps:
+        return ()
+    chain = [max(range(len(steps)), key=lambda i: (depth[i], -i))]
+    while via[chain[-1]] is not None:
+        chain.append(via[chain[-1]])
+    return tuple(steps[i] for i in reversed(chain))
+
+
+def _is_sequential(dependencies: Sequence[tuple[int, ...]]) -> bool:
+    return all(deps == ((index - 1,) if index else ()) for index, deps in enumerate(dependencies))
 
 
 def device_lock_dir() -> Path:
@@ -854,19 +962,102 @@ def device_lock_path(endpoint_bdf: str) -> Path:
     return device_lock_dir() / f"dau-hw-{slug}.lock"
 
 
-def _run_plan_steps(steps: Sequence[ToolStep]) -> int:
+def _run_step(step: ToolStep, timeline: PlanTimeline | None, *, cleanup: bool = False) -> int:
+    """Run one step with the terminal as its stdout/stderr. Under a timeline
+    the output is teed instead, so the record can carry its byte counts."""
+    print(f"+ {step.command_line}", flush=True)
+    if timeline is None:
+        return subprocess.run(step.argv, check=False).returncode
+    import threading
+    import time
+
+    started = time.time()
+    clock = time.monotonic()
+    counts = {"stdout": 0, "stderr": 0}
+    with subprocess.Popen(step.argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+        pumps = [
+            threading.Thread(target=_tee, args=(process.stdout, sys.stdout, counts, "stdout"), daemon=True),
+            threading.Thread(target=_tee, args=(process.stderr, sys.stderr, counts, "stderr"), daemon=True),
+        ]
+        for pump in pumps:
+            pump.start()
+        for pump in pumps:
+            pump.join()
+        returncode = process.wait()
+    timeline.record_step(
+        step.name,
+        started=started,
+        duration_s=time.monotonic() - clock,
+        exit_code=returncode,
+        stdout_bytes=counts["stdout"],
+        stderr_bytes=counts["stderr"],
+        cleanup=cleanup,
+    )
+    return returncode
+
+
+def _tee(source, sink, counts: dict[str, int], key: str) -> None:
+    sink_buffer = getattr(sink, "buffer", None)
+    for chunk in iter(lambda: source.read1(1 << 16), b""):
+        counts[key] += len(chunk)
+        if sink_buffer is not None:
+            sink_buffer.write(chunk)
+        else:
+            sink.write(chunk.decode(errors="replace"))
+        sink.flush()
+
+
+def _run_plan_steps(steps: Sequence[ToolStep], timeline: PlanTimeline | None = None) -> int:
+    dependencies = plan_step_dependencies(steps)
+    if not _is_sequential(dependencies):
+        return _run_plan_graph(steps, dependencies, timeline)
     for index, step in enumerate(steps):
-        print(f"+ {step.command_line}", flush=True)
-        result = subprocess.run(step.argv, check=False)
-        if result.returncode != 0:
+        returncode = _run_step(step, timeline)
+        if returncode != 0:
             for cleanup_step in steps[index + 1 :]:
                 if cleanup_step.name.endswith("release"):
-                    print(f"+ {cleanup_step.command_line}", flush=True)
-                    subprocess.run(cleanup_step.argv, check=False)
-            return result.returncode
+                    _run_step(cleanup_step, timeline, cleanup=True)
+            return returncode
     return 0
 
 
+def _run_plan_graph(steps: Sequence[ToolStep], dependencies: Sequence[tuple[int, ...]], timeline: PlanTimeline | None = None) -> int:
+    """Run every step as soon as the steps it depends on have succeeded,
+    independent ones side by side. The failure contract is the sequential
+    one: the first failure stops any further step from STARTING, the steps
+    already running are waited out (a half-killed rsync or Vivado run is
+    worse than a finished one), and then every *release step that never
+    started runs as cleanup, in plan order."""
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    pending = list(range(len(steps)))
+    succeeded: set[int] = set()
+    running: dict = {}
+    failure: int | None = None
+    with ThreadPoolExecutor(max_workers=max(len(steps), 1)) as pool:
+        while True:
+            if failure is None:
+                for index in [index for index in pending if succeeded.issuperset(dependencies[index])]:
+                    pending.remove(index)
+                    running[pool.submit(_run_step, steps[index], timeline)] = index
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = running.pop(future)
+                returncode = future.result()
+                if returncode == 0:
+                    succeeded.add(index)
+                elif failure is None:
+                    failure = returncode
+    if failure is None:
+        return 0
+    for index in pending:
+        if steps[index].name.endswith("release"):
+            _run_step(steps[index], timeline, cleanup=True)
+    return failure
+
+
 def _require_step_executables(steps: Sequence[ToolStep]) -> None:
     for step in steps:
         executable = step.required_executable
@@ -884,38 +1075,152 @@ def _require_step_executables(steps: Sequence[ToolStep]) -> None:
             )
 
 
-def execute_plan_steps(steps: Sequence[ToolStep], *, endpoint_bdf: str | None = None) -> int:
+def execute_plan_steps(
+    steps: Sequence[ToolStep],
+    *,
+    endpoint_bdf: str | None = None,
+    timeline: PlanTimeline | None = None,
+    plan: str | None = None,
+    lock_timeout: float | None = None,
+) -> int:
     """Run a hardware plan's steps in order. When ``endpoint_bdf`` is given,
     the whole run is serialized under an advisory lock keyed on that device
     (a board is one exclusive resource: no two plan runs from the operator's
-    processes may remove/reset/program the same endpoint at once). Without it
-    (a device-less plan) the steps run unserialized."""
-    _require_step_executables(steps)
+    processes may remove/reset/program the same endpoint at once), taken in
+    FIFO order with other waiters and given up after ``lock_timeout``
+    seconds. Without it (a device-less plan) the steps run unserialized.
+    ``timeline`` appends each step's timing, and the run's with its lock
+    wait, as JSON lines."""
     if endpoint_bdf is None:
-        return _run_plan_steps(steps)
-    import fcntl
-
-    lock = device_lock_path(endpoint_bdf)
-    lock.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
-    # mkdir(mode=) is umask-masked and only applied to newly-created leaves;
-    # force 0700 on the lock dir so a permissive umask can't leave it group/
-    # world-writable (another account could then swap the lock out from under
-    # O_NOFOLLOW, which only guards the final component)
-    try:
-        lock.parent.chmod(0o700)
-    except OSError:
-        pass  # not the owner / racing peer — flock still coordinates
-    # O_NOFOLLOW: refuse to follow a symlink at the lock path (the dir is
-    # user-private, so this is belt-and-braces)
-    fd = os.open(lock, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
-    try:
-        fcntl.flock(fd, fcntl.LOCK_EX)
+        _require_step_executables(steps)
+        return _run_timed_plan(steps, timeline=timeline)
+    return execute_plan_on_free_device({endpoint_bdf: steps}, timeline=timeline, plan=plan, lock_timeout=lock_timeout).returncode
+
+
+class PlanDispatch(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    endpoint_bdf: str
+    returncode: int
+    lock_wait_s: float
+
+
+def execute_plan_on_free_device(
+    runs: Mapping[str, Sequence[ToolStep]],
+    *,
+    timeline: PlanTimeline | None = None,
+    plan: str | None = None,
+    lock_timeout: float | None = None,
+) -> PlanDispatch:
+    """Run ONE of ``runs`` -- the same plan composed for each matching board,
+    keyed by endpoint BDF -- on whichever board's lock frees first. Boards
+    are taken in FIFO order with every other waiter (see
+    ``dau_build.device_scheduler``); a run that finds its boards busy prints
+    who holds them, and one that waited prints how long."""
+    import time
+
+    for steps in runs.values():
+        _require_step_executables(steps)
+    lock_paths = {device_lock_path(endpoint_bdf): endpoint_bdf for endpoint_bdf in runs}
+    plan = plan if plan is not None else (timeline.plan if timeline is not None else None)
+    started = time.time()
+    lease = acquire_device(tuple(lock_paths), plan=plan, timeout=lock_timeout, on_wait=_report_device_wait)
+    with lease:
+        endpoint_bdf = lock_paths[lease.lock_path]
+        if lease.wait_s >= 0.5:
+            print(f"dau-build-device-lock\tendpoint={endpoint_bdf} wait_s={lease.wait_s:.1f} status=acquired", flush=True)
+        returncode = _run_timed_plan(runs[endpoint_bdf], timeline=timeline, endpoint_bdf=endpoint_bdf, started=started, lock_wait_s=lease.wait_s)
+    return PlanDispatch(endpoint_bdf=endpoint_bdf, returncode=returncode, lock_wait_s=lease.wait_s)
+
+
+class FleetBoardResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    endpoint_bdf: str
+    # skipped: never started, because another board failed under
+    # on_failure="stop"; timed-out: its device lock never came free
+    status: Literal["passed", "failed", "skipped", "timed-out"]
+    returncode: int | None = None
+    lock_wait_s: float = 0.0
+    duration_s: float = 0.0
+
+
+def execute_fleet_plan(
+    runs: Mapping[str, Sequence[ToolStep]],
+    *,
+    on_failure: Literal["stop", "continue"] = "stop",
+    max_parallel: int | None = None,
+    timeline: PlanTimeline | None = None,
+    plan: str | None = None,
+    lock_timeout: float | None = None,
+) -> tuple[FleetBoardResult, ...]:
+    """Run a plan composed per board -- ``runs`` keyed by endpoint BDF -- on
+    every board at once, each under its own device lock. A board's ladder,
+    once started, always runs to its own end (stopping a reprogram midway is
+    what wedges a board); ``on_failure="stop"`` only keeps boards that have
+    not started yet from starting. One result per board, in ``runs`` order."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    for steps in runs.values():
+        _require_step_executables(steps)
+    failed = threading.Event()
+
+    def run_board(index: int, endpoint_bdf: str) -> FleetBoardResult:
+        if failed.is_set() and on_failure == "stop":
+            return FleetBoardResult(endpoint_bdf=endpoint_bdf, status="skipped")
+        board_timeline = None if timeline is None else timeline.model_copy(update={"run": f"{timeline.run}-{index}"})
         try:
-            return _run_plan_steps(steps)
-        finally:
-            fcntl.flock(fd, fcntl.LOCK_UN)
+            lease = acquire_device((device_lock_path(endpoint_bdf),), plan=plan, timeout=lock_timeout, on_wait=_report_device_wait)
+        except DeviceLockTimeout:
+            failed.set()
+            return FleetBoardResult(endpoint_bdf=endpoint_bdf, status="timed-out")
+        with lease:
+            if failed.is_set() and on_failure == "stop":
+                return FleetBoardResult(endpoint_bdf=endpoint_bdf, status="skipped", lock_wait_s=lease.wait_s)
+            started = time.monotonic()
+            returncode = _run_timed_plan(runs[endpoint_bdf], timeline=board_timeline, endpoint_bdf=endpoint_bdf, lock_wait_s=lease.wait_s)
+        if returncode != 0:
+            failed.set()
+        return FleetBoardResult(
+            endpoint_bdf=endpoint_bdf,
+            status="passed" if returncode == 0 else "failed",
+            returncode=returncode,
+            lock_wait_s=lease.wait_s,
+            duration_s=time.monotonic() - started,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_parallel or max(len(runs), 1)) as pool:
+        futures = [pool.submit(run_board, index, endpoint_bdf) for index, endpoint_bdf in enumerate(runs)]
+        return tuple(future.result() for future in futures)
+
+
+def _report_device_wait(lock_path: Path, holder: DeviceLockHolder | None) -> None:
+    holder_segment = "" if holder is None else f" holder_pid={holder.pid} holder_plan={holder.plan or '-'} held_s={holder.held_s:.0f}"
+    print(f"dau-build-device-lock\tlock={lock_path.name}{holder_segment} status=waiting", flush=True)
+
+
+def _run_timed_plan(
+    steps: Sequence[ToolStep],
+    *,
+    timeline: PlanTimeline | None,
+    endpoint_bdf: str | None = None,
+    started: float | None = None,
+    lock_wait_s: float = 0.0,
+) -> int:
+    import time
+
+    started = time.time() if started is None else started
+    returncode = 1
+    try:
+        returncode = _run_plan_steps(steps, timeline)
+        return returncode
     finally:
-        os.close(fd)
+        if timeline is not None:
+            timeline.record_run(
+                endpoint_bdf=endpoint_bdf, started=started, duration_s=time.time() - started, exit_code=returncode, lock_wait_s=lock_wait_s
+            )
 
 
 class HardwarePlan(BaseModel):
@@ -1030,6 +1335,14 @@ class LocalBuildAndProgramPlan(HardwarePlan):
     python: str = "python3"
     vivado_settings: Path = Path("/opt/Xilinx/2025.1/Vivado/settings64.sh")
     overlay_definition: VivadoOverlayDefinition | None = None
+    incremental: bool = False
+    # sourced from the composed host (job counts) and platform (strategies)
+    # groups by the plan config; None sizes the jobs from this host and
+    # keeps Vivado's default strategies
+    synth_jobs: int | None = None
+    impl_jobs: int | None = None
+    synth_strategy: str | None = None
+    impl_strategy: str | None = None
 
     def compose(self, config):
         if self.dau_core_root is None:
@@ -1044,6 +1357,11 @@ class LocalBuildAndProgramPlan(HardwarePlan):
             python=self.python,
             vivado_settings=self.vivado_settings,
             overlay_definition=self.overlay_definition,
+            incremental=self.incremental,
+            synth_jobs=self.synth_jobs,
+            impl_jobs=self.impl_jobs,
+            synth_strategy=self.synth_strategy,
+            impl_strategy=self.impl_strategy,
         )
 
 
@@ -28,6 +28,7 @@ from ccflow import BaseModel
 from pydantic import ConfigDict, model_validator
 
 from dau_build.platforms import PlatformDefinition
+from dau_build.vivado_runs import resolve_vivado_jobs, run_strategy_tcl
 
 
 class MmJobShellRequest(BaseModel):
@@ -60,7 +61,12 @@ class MmJobShellRequest(BaseModel):
     register_window_offset: int = 0x0000_1000
     input_bram_bytes: int = 0x0002_0000  # 128 KiB
     output_bram_bytes: int = 0x0000_1000  # 4 KiB
-    jobs: int = 12
+    # launch_runs -jobs for both runs; None sizes synthesis and
+    # implementation separately from the host (vivado_runs.host_vivado_jobs)
+    jobs: int | None = None
+    # synthesize and implement against the last successful build's
+    # checkpoints, kept beside the script (see _build_postamble_tcl)
+    incremental: bool = False
 
     @property
     def resolved_part(self) -> str:
@@ -93,7 +99,12 @@ class MmDdrJobShellRequest(BaseModel):
     # read-only M_AXI_R plus the narrow write M_AXI_W, wired as two
     # smartconnect slaves. Mirrors the composition's data_width.
     data_width: int = 64
-    jobs: int = 12
+    # launch_runs -jobs for both runs; None sizes synthesis and
+    # implementation separately from the host (vivado_runs.host_vivado_jobs)
+    jobs: int | None = None
+    # synthesize and implement against the last successful build's
+    # checkpoints, kept beside the script (see _build_postamble_tcl)
+    incremental: bool = False
 
     @model_validator(mode="after")
     def _width_within_platform_tiers(self) -> MmDdrJobShellRequest:
@@ -360,6 +371,27 @@ puts "lane swizzle verified"
 """
 
 
+def _incremental_reference_tcl() -> tuple[str, str]:
+    """The incremental build's setup and save blocks. ``create_project
+    -force`` recreates the project every run, so the reference checkpoints
+    live in the output root; both must exist for the run to use them."""
+    setup = """set reference_synth "$origin_dir/dau_reference_synth.dcp"
+set reference_routed "$origin_dir/dau_reference_routed.dcp"
+if {[file exists $reference_synth] && [file exists $reference_routed]} {
+    set_property INCREMENTAL_CHECKPOINT $reference_synth [get_runs synth_1]
+    set_property INCREMENTAL_CHECKPOINT $reference_routed [get_runs impl_1]
+    puts "DAU_MM_JOB_INCREMENTAL reference=$reference_routed"
+} else {
+    puts "DAU_MM_JOB_INCREMENTAL reference=none"
+}
+
+"""
+    save = """file copy -force "$origin_dir/project_mm/project_mm.runs/synth_1/Top_wrapper.dcp" $reference_synth
+file copy -force "$origin_dir/project_mm/project_mm.runs/impl_1/Top_wrapper_routed.dcp" $reference_routed
+"""
+    return setup, save
+
+
 def _build_postamble_tcl(request) -> str:
     """Shared validate/synthesize/implement/verify-swizzle/bitstream tail.
     The lane-swizzle hook and its post-route verification are emitted only
@@ -372,6 +404,9 @@ def _build_postamble_tcl(request) -> str:
     # boots such a board. Driven by the platform fact, never hand-run.
     spi_block = _spi_cfgmem_tcl(request.platform)
     verify_block = _lane_swizzle_verify_tcl(placements) if placements else ""
+    incremental_setup, incremental_save = _incremental_reference_tcl() if request.incremental else ("", "")
+    jobs = resolve_vivado_jobs(synth=request.jobs, impl=request.jobs)
+    strategies = run_strategy_tcl(synth_strategy=request.platform.synth_strategy, impl_strategy=request.platform.impl_strategy)
     return f"""validate_bd_design
 save_bd_design
 
@@ -380,14 +415,14 @@ add_files -norecurse "$origin_dir/project_mm/project_mm.gen/sources_1/bd/Top/hdl
 set_property top Top_wrapper [current_fileset]
 update_compile_order -fileset sources_1
 
-launch_runs synth_1 -jobs {request.jobs}
+{incremental_setup}{strategies}launch_runs synth_1 -jobs {jobs.synth}
 wait_on_run synth_1
 if {{[get_property PROGRESS [get_runs synth_1]] != "100%"}} {{
     puts "DAU_MM_JOB_BUILD_FAILED synthesis"
     exit 1
 }}
 
-{hook_line}launch_runs impl_1 -to_step write_bitstream -jobs {request.jobs}
+{hook_line}launch_runs impl_1 -to_step write_bitstream -jobs {jobs.impl}
 wait_on_run impl_1
 if {{[get_property PROGRESS [get_runs impl_1]] != "100%"}} {{
     puts "DAU_MM_JOB_BUILD_FAILED implementation"
@@ -399,7 +434,7 @@ report_timing_summary -file "$origin_dir/timing_mm.rpt"
 
 {verify_block}set wns [get_property SLACK [get_timing_paths -max_paths 1 -nworst 1 -setup]]
 file copy -force "$origin_dir/project_mm/project_mm.runs/impl_1/Top_wrapper.bit" "$origin_dir/dau_mm_job.bit"
-{spi_block}
+{spi_block}{incremental_save}
 puts "DAU_MM_JOB_BUILD_OK wns=$wns"
 exit 0
 """
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +28,16 @@ ARTIFACT_MANIFEST_SCHEMA = ARTLINK_MANIFEST_SCHEMA
 SUPPORTED_ARTIFACT_KINDS = frozenset(("source", "metadata", "binary"))
 HDL_MODULE_CAPABILITY_KIND = "hdl-module"
 
+# libyaml's parser where PyYAML was built with it; same safe schema, several
+# times faster on a spec that pulls in dozens of provider manifests
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# validated manifests by the sha256 of their bytes: a manifest is re-read on
+# every load (so an edit is always seen) but parsed and validated once
+_VALIDATED_MANIFEST_LIMIT = 512
+_validated_manifests: OrderedDict[str, ArtifactManifest] = OrderedDict()
+_validated_manifests_lock = threading.Lock()
+
 
 class ArtifactManifestError(ManifestError):
     pass
@@ -51,9 +64,15 @@ def load_yaml_mapping(path: Path, *, description: str, error_type: type[Exceptio
     """Shared read -> safe_load -> mapping/schema-check skeleton for every
     dau-build YAML surface (manifests, build specs, simulation profiles)."""
     try:
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        text = path.read_text(encoding="utf-8")
     except OSError as exc:
         raise error_type(f"failed to read {description}: {path.as_posix()}: {exc}") from exc
+    return _yaml_mapping(text, path, description=description, error_type=error_type, schema=schema)
+
+
+def _yaml_mapping(text: str, path: Path, *, description: str, error_type: type[Exception], schema: str | None = None) -> dict[str, Any]:
+    try:
+        raw = yaml.load(text, Loader=_YAML_SAFE_LOADER)
     except yaml.YAMLError as exc:
         raise error_type(f"invalid {description} YAML: {path.as_posix()}") from exc
     if not isinstance(raw, dict):
@@ -64,8 +83,22 @@ def load_yaml_mapping(path: Path, *, description: str, error_type: type[Exceptio
 
 
 def load_artifact_manifest(path: Path, *, validate_paths: bool = False, root: Path | None = None) -> ArtifactManifest:
-    raw = load_yaml_mapping(path, description="artifact manifest", error_type=ArtifactManifestError)
-    manifest = artifact_manifest_from_mapping(raw)
+    try:
+        content = path.read_bytes()
+    except OSError as exc:
+        raise ArtifactManifestError(f"failed to read artifact manifest: {path.as_posix()}: {exc}") from exc
+    key = hashlib.sha256(content).hexdigest()
+    with _validated_manifests_lock:
+        manifest = _validated_manifests.get(key)
+        if manifest is not None:
+            _validated_manifests.move_to_end(key)
+    if manifest is None:
+        raw = _yaml_mapping(content.decode("utf-8"), path, description="artifact manifest", error_type=ArtifactManifestError)
+        manifest = artifact_manifest_from_mapping(raw)
+        with _validated_manifests_lock:
+            _validated_manifests[key] = manifest
+            while len(_validated_manifests) > _VALIDATED_MANIFEST_LIMIT:
+                _validated_manifests.popitem(last=False)
     if validate_paths:
         validate_artifact_files(manifest, root=path.parent if root is None else root)
     return manifest
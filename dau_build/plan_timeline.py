@@ -0,0 +1,202 @@
+"""JSON-lines timelines of executed hardware plans.
+
+``execute_plan_steps`` given a ``PlanTimeline`` appends one ``step`` record
+per step it runs -- name, start/end (epoch seconds), duration, exit code and
+the byte counts of what the step wrote to stdout/stderr -- and one ``run``
+record per plan run, carrying the time spent waiting on the device lock.
+Every line names its run and plan, so one file collects any number of runs
+and ``summarize_plan_timeline`` can say where bench time goes across them.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import uuid
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from ccflow import BaseModel
+from pydantic import ConfigDict, Field
+
+__all__ = (
+    "PLAN_TIMELINE_FORMAT",
+    "PlanRunTiming",
+    "PlanStepSummary",
+    "PlanStepTiming",
+    "PlanTimeline",
+    "PlanTimelineError",
+    "PlanTimelineSummary",
+    "load_plan_timeline",
+    "summarize_plan_timeline",
+)
+
+PLAN_TIMELINE_FORMAT = "dau-build-plan-timeline/1"
+
+# graph runs record from worker threads; one append lock keeps lines whole
+_APPEND_LOCK = threading.Lock()
+
+
+class PlanTimelineError(ValueError):
+    pass
+
+
+class PlanStepTiming(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    run: str
+    plan: str
+    step: str
+    started: float
+    duration_s: float
+    exit_code: int
+    stdout_bytes: int
+    stderr_bytes: int
+    # a *release step run only because an earlier step failed
+    cleanup: bool = False
+
+    @property
+    def ended(self) -> float:
+        return self.started + self.duration_s
+
+
+class PlanRunTiming(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    run: str
+    plan: str
+    endpoint_bdf: str | None = None
+    started: float
+    duration_s: float
+    exit_code: int
+    lock_wait_s: float = 0.0
+
+    @property
+    def ended(self) -> float:
+        return self.started + self.duration_s
+
+
+class PlanTimeline(BaseModel):
+    """Where one plan run appends its records."""
+
+    model_config = ConfigDict(frozen=True)
+
+    path: Path
+    plan: str
+    run: str = Field(default_factory=lambda: uuid.uuid4().hex[:12])
+
+    def record_step(
+        self, step: str, *, started: float, duration_s: float, exit_code: int, stdout_bytes: int, stderr_bytes: int, cleanup: bool = False
+    ) -> PlanStepTiming:
+        timing = PlanStepTiming(
+            run=self.run,
+            plan=self.plan,
+            step=step,
+            started=started,
+            duration_s=duration_s,
+            exit_code=exit_code,
+            stdout_bytes=stdout_bytes,
+            stderr_bytes=stderr_bytes,
+            cleanup=cleanup,
+        )
+        self._append("step", timing)
+        return timing
+
+    def record_run(self, *, endpoint_bdf: str | None, started: float, duration_s: float, exit_code: int, lock_wait_s: float) -> PlanRunTiming:
+        timing = PlanRunTiming(
+            run=self.run,
+            plan=self.plan,
+            endpoint_bdf=endpoint_bdf,
+            started=started,
+            duration_s=duration_s,
+            exit_code=exit_code,
+            lock_wait_s=lock_wait_s,
+        )
+        self._append("run", timing)
+        return timing
+
+    def _append(self, kind: str, timing: BaseModel) -> None:
+        line = json.dumps({"format": PLAN_TIMELINE_FORMAT, "kind": kind, **timing.model_dump(mode="json")}, sort_keys=True)
+        with _APPEND_LOCK:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a") as handle:
+                handle.write(line + "\n")
+
+
+def load_plan_timeline(paths: Iterable[Path | str]) -> tuple[tuple[PlanRunTiming, ...], tuple[PlanStepTiming, ...]]:
+    """The run and step records of every timeline in ``paths``, in file order."""
+    runs: list[PlanRunTiming] = []
+    steps: list[PlanStepTiming] = []
+    for path in paths:
+        for number, line in enumerate(Path(path).read_text().splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise PlanTimelineError(f"{path}:{number}: not JSON ({exc.msg})") from exc
+            if record.pop("format", None) != PLAN_TIMELINE_FORMAT:
+                raise PlanTimelineError(f"{path}:{number}: not a {PLAN_TIMELINE_FORMAT} record")
+            kind = record.pop("kind", None)
+            if kind == "run":
+                runs.append(PlanRunTiming(**record))
+            elif kind == "step":
+                steps.append(PlanStepTiming(**record))
+            else:
+                raise PlanTimelineError(f"{path}:{number}: unknown record kind {kind!r}")
+    return tuple(runs), tuple(steps)
+
+
+class PlanStepSummary(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    step: str
+    runs: int
+    failures: int
+    total_s: float
+    mean_s: float
+    max_s: float
+
+
+class PlanTimelineSummary(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    runs: int
+    failed_runs: int
+    total_s: float
+    lock_wait_s: float
+    # the most expensive step first
+    steps: tuple[PlanStepSummary, ...]
+
+
+def summarize_plan_timeline(runs: Sequence[PlanRunTiming], steps: Sequence[PlanStepTiming]) -> PlanTimelineSummary:
+    """Aggregate step time by step name across every run: a step that ran in
+    ten runs is one row with its total, mean and worst duration."""
+    durations: dict[str, list[float]] = {}
+    failures: dict[str, int] = {}
+    for timing in steps:
+        durations.setdefault(timing.step, []).append(timing.duration_s)
+        failures[timing.step] = failures.get(timing.step, 0) + (timing.exit_code != 0)
+    summaries = tuple(
+        sorted(
+            (
+                PlanStepSummary(
+                    step=step,
+                    runs=len(values),
+                    failures=failures[step],
+                    total_s=sum(values),
+                    mean_s=sum(values) / len(values),
+                    max_s=max(values),
+                )
+                for step, values in durations.items()
+            ),
+            key=lambda summary: (-summary.total_s, summary.step),
+        )
+    )
+    return PlanTimelineSummary(
+        runs=len(runs),
+        failed_runs=sum(run.exit_code != 0 for run in runs),
+        total_s=sum(run.duration_s for run in runs),
+        lock_wait_s=sum(run.lock_wait_s for run in runs),
+        steps=summaries,
+    )
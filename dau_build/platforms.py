@@ -196,6 +196,17 @@ class DdrStaging(BaseModel):
         addresses = (*self.input_addresses, self.output_address)
         return all(address % self.address_align == 0 for address in addresses)
 
+    def ping_pong_windows(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """The two (address, bytes) input regions a ping-pong shell alternates
+        between: the first two input regions, which must not overlap or the
+        host would stage the next job over the one streaming."""
+        if len(self.input_addresses) < 2:
+            raise ValueError("ping-pong input windows need two ddr staging input regions")
+        first, second = sorted(self.input_addresses[:2])
+        if second - first < self.input_bytes:
+            raise ValueError(f"ddr staging input regions 0x{first:X} and 0x{second:X} overlap at {self.input_bytes} bytes each")
+        return (self.input_addresses[0], self.input_bytes), (self.input_addresses[1], self.input_bytes)
+
 
 class HostAccess(BaseModel):
     """How the bench host reaches the board: the PCI identity/topology the
@@ -303,6 +314,12 @@ class PlatformDefinition(BaseModel):
     # Anything that needs the actual frequency (pricing against measured
     # resource points, rate models) must ask effective_job_clock_mhz().
     job_clock_mhz: int | None = None
+    # the Vivado run strategies this board's designs close timing with (e.g.
+    # "Flow_PerfOptimized_high", "Performance_Explore"); None keeps Vivado's
+    # default strategy. Applied to synth_1/impl_1 by the generated build
+    # scripts (vivado_runs.run_strategy_tcl).
+    synth_strategy: str | None = None
+    impl_strategy: str | None = None
     placeholders: tuple[str, ...] = ()
 
     @model_validator(mode="after")
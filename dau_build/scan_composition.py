@@ -20,6 +20,22 @@ changes is what happens after a free — a raw address still reads, it just
 reads whoever holds that space now, while a handle whose generation has
 moved on is refused with a defined error. The default is no table, and a
 composition without one emits byte-identically to before the table existed.
+
+A table may further declare a ``handle_batch_depth``: a staging queue the host
+fills with whole entries through ONE data register and then drains into the
+table with a single commit, so programming a batch of allocations is a stream
+of posted writes and one status read instead of a read-back per slot.
+
+A composition may also declare a ``job_queue_depth``, which puts a FIFO of
+job descriptors (input address or handle, length, per-lane output addresses)
+behind JOB_CONTROL. The shell dispatches queued jobs back-to-back and records
+each one's status and per-lane result length, so the reader and lanes no
+longer idle for a host round trip between jobs. The sim harness carries the
+same queue behind a ``submit`` port.
+
+``ping_pong_windows`` is the lighter-weight form of the same overlap: two
+input address/length register sets and a toggle, so the host stages the next
+job's window while the current one streams.
 """
 
 from __future__ import annotations
@@ -31,12 +47,16 @@ from ccflow import BaseModel
 from pydantic import ConfigDict
 
 __all__ = (
+    "HANDLE_BATCH_CLEAR_BIT",
+    "HANDLE_BATCH_COMMIT_BIT",
     "HANDLE_CONTROL_FREE_BIT",
     "HANDLE_CONTROL_INSTALL_BIT",
     "HANDLE_FAULT_BAD_ID",
     "HANDLE_FAULT_OUT_OF_BOUNDS",
     "HANDLE_FAULT_STALE",
+    "MAX_HANDLE_BATCH_DEPTH",
     "MAX_HANDLE_TABLE_CAPACITY",
+    "MAX_JOB_QUEUE_DEPTH",
     "LaneTile",
     "RegisterLayout",
     "ScanComposition",
@@ -67,6 +87,21 @@ HANDLE_CONTROL_FREE_BIT = 1
 # more likely a units mistake than an intent.
 MAX_HANDLE_TABLE_CAPACITY = 256
 
+# Which bit of the HANDLE_BATCH_CONTROL write drains the staging queue into
+# the table, and which discards it. Named for the same reason as the CONTROL
+# bits above: the host driver writes them.
+HANDLE_BATCH_COMMIT_BIT = 0
+HANDLE_BATCH_CLEAR_BIT = 1
+
+# The staging queue is flops like the table it feeds, one whole entry per
+# slot. A batch deeper than this is better spent as two commits.
+MAX_HANDLE_BATCH_DEPTH = 64
+
+# The job queue holds whole descriptors (an address, a length and one output
+# address per lane) in flops, and its status register packs both occupancy
+# counts into a byte each.
+MAX_JOB_QUEUE_DEPTH = 64
+
 
 class ScanCompositionError(ValueError):
     """The composition is not emittable (shape or interface violation)."""
@@ -152,12 +187,32 @@ class RegisterLayout(BaseModel):
     handle_control: int = 0x0E8
     job_handle_id: int = 0x0EC
     job_handle_generation: int = 0x0F0
+    # the batch-programming pair, emitted only beside a table that declares a
+    # handle_batch_depth: the last two words before the lane block.
+    handle_batch_data: int = 0x0F4
+    handle_batch_control: int = 0x0F8
+    # the job-queue block, emitted only by a composition that declares a
+    # job_queue_depth. The contract's windows below 0x100 are spoken for, so
+    # it sits high in the 4 KiB window, under the reader debug taps at 0xFC0;
+    # the lane block must end below it (checked at planning time).
+    job_queue_status: int = 0xF00
+    job_queue_result: int = 0xF04
+    job_queue_completed: int = 0xF08
+    # the second input window and its toggle, emitted only by a composition
+    # that declares ping_pong_windows; window 0 is the contract's own
+    # INPUT_ADDRESS/INPUT_LENGTH pair. Same high block, same lane-block check.
+    input1_address_low: int = 0xF10
+    input1_address_high: int = 0xF14
+    input1_length_low: int = 0xF18
+    window_select: int = 0xF1C
     lane_base: int = 0x100
     lane_stride: int = 0x20
     lane_output_address_low: int = 0x00
     lane_output_address_high: int = 0x14
     lane_result_length_low: int = 0x04
     lane_record_count_low: int = 0x08
+    # the head queued result's length for this lane (job-queue shells only)
+    lane_queued_result_length: int = 0x18
     lane_record_count_high: int = 0x0C
     lane_error: int = 0x10
 
@@ -237,6 +292,38 @@ class ScanComposition(BaseModel):
     # PLANNED number (design principle 1: capacity is refused, not discovered)
     # -- a job naming a slot the table does not have is a fault, not a resize.
     handle_table_capacity: int = 0
+    # BATCHED HANDLE PROGRAMMING, opt-in on top of the table. Zero (the
+    # default) keeps the one-slot-per-CONTROL-write path and emits
+    # byte-identically. A positive depth adds a staging queue of that many
+    # whole entries: the host streams each entry's words (the same INDEX,
+    # BASE, LENGTH, GENERATION, CONTROL sequence the single-slot registers
+    # take) into HANDLE_BATCH_DATA and commits the lot with one
+    # HANDLE_BATCH_CONTROL write. The entries drain through the table's own
+    # programming port in order, so free-outranks-install and the generation
+    # check are exactly the single-slot semantics, one entry per cycle.
+    handle_batch_depth: int = 0
+    # THE JOB QUEUE, opt-in. Zero (the default) keeps JOB_CONTROL an
+    # immediate start of the registers as written, emitted byte-identically.
+    # A positive depth turns the job registers into a STAGING set: a
+    # JOB_CONTROL write snapshots them (input address or job handle, length,
+    # every lane's output address) into a descriptor FIFO of this depth, and
+    # the shell starts each queued job as soon as the previous one closes
+    # out. Each finished job leaves a result (sequence, error, per-lane result
+    # length) in a ring of the same depth for the host to pop; dispatch
+    # stalls rather than overwrite an unread result. JOB_STATUS reads busy
+    # until the queue is empty, so a host that polls it after every job still
+    # works unchanged.
+    job_queue_depth: int = 0
+    # PING-PONG INPUT WINDOWS, opt-in. False (the default) keeps the one
+    # INPUT_ADDRESS/INPUT_LENGTH pair, emitted byte-identically. True adds a
+    # second pair and a window toggle: each JOB_CONTROL start latches the
+    # window WINDOW_SELECT names and flips WINDOW_SELECT to the other, so
+    # the host writes the next window while this one streams and the running
+    # job's address and length never move under it. Windows are raw
+    # addresses, so this is refused beside a handle table (which names the
+    # input by handle) and beside a job queue (which already stages whole
+    # descriptors).
+    ping_pong_windows: bool = False
     registers: RegisterLayout = RegisterLayout()
 
     def model_post_init(self, _context) -> None:
@@ -293,6 +380,27 @@ def _validate_composition_shape(composition: ScanComposition) -> None:
         raise ScanCompositionError(
             f"handle_table_capacity must be between 0 (no table) and {MAX_HANDLE_TABLE_CAPACITY}, got {composition.handle_table_capacity}"
         )
+    if not 0 <= composition.handle_batch_depth <= MAX_HANDLE_BATCH_DEPTH:
+        raise ScanCompositionError(
+            f"handle_batch_depth must be between 0 (no batching) and {MAX_HANDLE_BATCH_DEPTH}, got {composition.handle_batch_depth}"
+        )
+    if composition.handle_batch_depth and not composition.handle_table_capacity:
+        raise ScanCompositionError("handle_batch_depth needs a handle table to program (set handle_table_capacity)")
+    if not 0 <= composition.job_queue_depth <= MAX_JOB_QUEUE_DEPTH:
+        raise ScanCompositionError(f"job_queue_depth must be between 0 (no queue) and {MAX_JOB_QUEUE_DEPTH}, got {composition.job_queue_depth}")
+    if composition.ping_pong_windows and composition.handle_table_capacity:
+        raise ScanCompositionError("ping_pong_windows stages raw input windows; a handle-table composition names its input by handle")
+    if composition.ping_pong_windows and composition.job_queue_depth:
+        raise ScanCompositionError("ping_pong_windows and job_queue_depth both stage the next job; declare one")
+    if composition.job_queue_depth or composition.ping_pong_windows:
+        regs = composition.registers
+        lane_block_end = regs.lane_register(len(composition.lanes), 0)
+        high_block = min(regs.job_queue_status, regs.input1_address_low)
+        if lane_block_end > high_block:
+            raise ScanCompositionError(
+                f"the lane block ends at 0x{lane_block_end:03X}, past the high register block at 0x{high_block:03X}; "
+                "a job queue or ping-pong windows leave room for fewer lanes"
+            )
     if composition.wide_lane:
         if len(composition.lanes) != 1:
             raise ScanCompositionError("a wide_lane scan composition needs exactly one lane")
@@ -635,11 +743,14 @@ def _axi_lite_register_process_sv(
     tick_extra: str = "",
     write_cases_extra: str = "",
     read_cases_extra: str = "",
+    job_start: str = "job_start",
 ) -> str:
     """The AXI-Lite register process shared by every register-windowed top:
     handshake reset, the JOB_CONTROL start pulse, and the
     JOB_STATUS/LAST_ERROR status-glue readback. Callers splice in their
-    register cases; every extra carries its own trailing newline."""
+    register cases; every extra carries its own trailing newline.
+    ``job_start`` names the pulse a JOB_CONTROL write raises (a job-queue
+    top raises its submit pulse instead)."""
     return f"""    always @(posedge s_axi_aclk) begin
         if (!s_axi_aresetn) begin
             s_axi_awready <= 1'b0;
@@ -649,7 +760,7 @@ def _axi_lite_register_process_sv(
             s_axi_rdata <= 32'h0000_0000;
             s_axi_rvalid <= 1'b0;
 {reset_extra}        end else begin
-            job_start <= 1'b0;
+            {job_start} <= 1'b0;
 {tick_extra}            s_axi_awready <= write_fire;
             s_axi_wready <= write_fire;
             s_axi_arready <= read_fire;
@@ -657,7 +768,7 @@ def _axi_lite_register_process_sv(
             if (write_fire) begin
                 s_axi_bvalid <= 1'b1;
                 case (s_axi_awaddr[11:0])
-                    ADDR_JOB_CONTROL: job_start <= s_axi_wdata[0];
+                    ADDR_JOB_CONTROL: {job_start} <= s_axi_wdata[0];
 {write_cases_extra}                    default: ;  // {write_default_comment}
                 endcase
             end else if (s_axi_bvalid && s_axi_bready) begin
@@ -1426,14 +1537,17 @@ def _handle_table_sim_state_decls_sv(addr_width: int) -> str:
 """
 
 
-def _handle_table_block_sv(composition: ScanComposition, *, addr_width: int, clk: str, rst: str, start: str) -> str:
+def _handle_table_block_sv(composition: ScanComposition, *, addr_width: int, clk: str, rst: str, start: str, program: str = "handle") -> str:
     """The handle table instance and the job-start resolution handshake.
 
     The resolve costs one cycle, which is why ``handle_go`` exists: the units
     start on the cycle the table answers, not on the cycle the host wrote
     JOB_CONTROL. A fault latches into ``handle_fail`` and the units never
     start at all — refusing is the whole point, so a refused job must not read
-    a single beat from the address the stale handle used to name."""
+    a single beat from the address the stale handle used to name.
+
+    ``program`` prefixes the signals bound to the programming port: the
+    single-slot registers directly, or the batch mux in front of them."""
     if not composition.handle_table_capacity:
         return ""
     return f"""    dau_shell_handle_table #(
@@ -1443,12 +1557,12 @@ def _handle_table_block_sv(composition: ScanComposition, *, addr_width: int, clk
     ) handle_table (
         .clk({clk}),
         .rst({rst}),
-        .program_install(handle_install),
-        .program_free(handle_free),
-        .program_index(handle_index),
-        .program_base(handle_base),
-        .program_length(handle_length),
-        .program_generation(handle_generation),
+        .program_install({program}_install),
+        .program_free({program}_free),
+        .program_index({program}_index),
+        .program_base({program}_base),
+        .program_length({program}_length),
+        .program_generation({program}_generation),
         // an off-grid length already fails as 0xFE, so it never reaches the
         // table: one job, one refusal reason, decided in one place
         .resolve_request({start} && length_ok),
@@ -1487,6 +1601,124 @@ def _handle_table_block_sv(composition: ScanComposition, *, addr_width: int, clk
 """
 
 
+def _handle_batch_word_count(addr_width: int) -> int:
+    """Words per HANDLE_BATCH_DATA entry: INDEX, BASE_LOW, BASE_HIGH (wide
+    masters only), LENGTH, GENERATION, CONTROL -- the single-slot write
+    sequence, serialized onto one address."""
+    return 6 if addr_width > 32 else 5
+
+
+def _handle_batch_state_decls_sv(composition: ScanComposition, *, addr_width: int) -> str:
+    """The batch queue's state: the entry being assembled from
+    HANDLE_BATCH_DATA words, the push/commit/clear pulses the register
+    process raises, the queue itself, and the mux onto the table's
+    programming port. Empty without a ``handle_batch_depth``."""
+    depth = composition.handle_batch_depth
+    if not depth:
+        return ""
+    pointer_width = handle_table_index_width(depth)
+    count_width = depth.bit_length()
+    return f"""    reg [2:0] batch_word;
+    reg [31:0] batch_index;
+    reg [{addr_width - 1}:0] batch_base;
+    reg [31:0] batch_length;
+    reg [31:0] batch_generation;
+    reg batch_push;
+    reg batch_push_install;
+    reg batch_push_free;
+    reg batch_commit;
+    reg batch_clear;
+    reg batch_queue_install [0:{depth - 1}];
+    reg batch_queue_free [0:{depth - 1}];
+    reg [31:0] batch_queue_index [0:{depth - 1}];
+    reg [{addr_width - 1}:0] batch_queue_base [0:{depth - 1}];
+    reg [31:0] batch_queue_length [0:{depth - 1}];
+    reg [31:0] batch_queue_generation [0:{depth - 1}];
+    reg [{pointer_width - 1}:0] batch_head;
+    reg [{pointer_width - 1}:0] batch_tail;
+    reg [{count_width - 1}:0] batch_count;
+    reg batch_draining;
+    reg batch_overflow;
+    reg batch_start_held;
+    wire batch_full = batch_count == {count_width}'d{depth};
+    // a single-slot CONTROL write always lands: the queue yields the port for
+    // that cycle rather than dropping the host's direct operation
+    wire batch_pop = batch_draining && (batch_count != {count_width}'d0) && !handle_install && !handle_free;
+    // a job started mid-drain waits for the drain, so commit-then-start needs
+    // no status poll between the two writes
+    wire handle_start = (job_start || batch_start_held) && !batch_draining;
+    wire handle_program_install = batch_pop ? batch_queue_install[batch_head] : handle_install;
+    wire handle_program_free = batch_pop ? batch_queue_free[batch_head] : handle_free;
+    wire [31:0] handle_program_index = batch_pop ? batch_queue_index[batch_head] : handle_index;
+    wire [{addr_width - 1}:0] handle_program_base = batch_pop ? batch_queue_base[batch_head] : handle_base;
+    wire [31:0] handle_program_length = batch_pop ? batch_queue_length[batch_head] : handle_length;
+    wire [31:0] handle_program_generation = batch_pop ? batch_queue_generation[batch_head] : handle_generation;
+"""
+
+
+def _handle_batch_block_sv(composition: ScanComposition, *, clk: str, rst: str) -> str:
+    """The batch queue process: push an assembled entry, pop one per cycle
+    while draining, and hold a job start until the drain completes.
+
+    A push into a full queue is dropped and latches ``batch_overflow`` --
+    sticky until a CLEAR, because a batch that silently lost an install is
+    the host believing a handle is live that the table will refuse. Order is
+    preserved, so an install followed by a free of the same slot inside one
+    batch lands exactly as the two single-slot writes would."""
+    depth = composition.handle_batch_depth
+    if not depth:
+        return ""
+    pointer_width = handle_table_index_width(depth)
+    count_width = depth.bit_length()
+    last = f"{pointer_width}'d{depth - 1}"
+    zero = f"{pointer_width}'d0"
+    # the one-bit push/pop terms are zero-extended explicitly; a one-entry
+    # queue has a one-bit count and no pad (a zero-width literal is illegal)
+    pad = f"{count_width - 1}'d0, " if count_width > 1 else ""
+    return f"""    always @(posedge {clk}) begin
+        if ({rst} || batch_clear) begin
+            batch_head <= {zero};
+            batch_tail <= {zero};
+            batch_count <= {count_width}'d0;
+            batch_draining <= 1'b0;
+            batch_overflow <= 1'b0;
+        end else begin
+            if (batch_push && !batch_full) begin
+                batch_queue_install[batch_tail] <= batch_push_install;
+                batch_queue_free[batch_tail] <= batch_push_free;
+                batch_queue_index[batch_tail] <= batch_index;
+                batch_queue_base[batch_tail] <= batch_base;
+                batch_queue_length[batch_tail] <= batch_length;
+                batch_queue_generation[batch_tail] <= batch_generation;
+                batch_tail <= (batch_tail == {last}) ? {zero} : batch_tail + {pointer_width}'d1;
+            end else if (batch_push) begin
+                batch_overflow <= 1'b1;
+            end
+            if (batch_pop) begin
+                batch_head <= (batch_head == {last}) ? {zero} : batch_head + {pointer_width}'d1;
+            end
+            batch_count <= batch_count + {{{pad}batch_push && !batch_full}} - {{{pad}batch_pop}};
+            if (batch_commit) begin
+                batch_draining <= 1'b1;
+            end else if (batch_count == {count_width}'d0) begin
+                batch_draining <= 1'b0;
+            end
+        end
+    end
+
+    always @(posedge {clk}) begin
+        if ({rst}) begin
+            batch_start_held <= 1'b0;
+        end else if (job_start && batch_draining) begin
+            batch_start_held <= 1'b1;
+        end else if (handle_start) begin
+            batch_start_held <= 1'b0;
+        end
+    end
+
+"""
+
+
 def _handle_table_error_branch_sv(composition: ScanComposition, *, error: str, error_code: str) -> str:
     """The refused-handle branch of the job error mux, ranked directly below
     the length gate: both are pre-start refusals, and neither can coincide
@@ -1499,6 +1731,174 @@ def _handle_table_error_branch_sv(composition: ScanComposition, *, error: str, e
         end"""
 
 
+def _job_queue_decls_sv(composition: ScanComposition, *, addr_width: int) -> str:
+    """The job queue's state, shared by the shell top and the sim harness:
+    the descriptor FIFO, the result ring, and the status words both sides
+    read back. Empty without a ``job_queue_depth``."""
+    depth = composition.job_queue_depth
+    if not depth:
+        return ""
+    num_lanes = len(composition.lanes)
+    pointer_width = handle_table_index_width(depth)
+    count_width = depth.bit_length()
+    handle_decls = (
+        f"""    reg [31:0] queue_job_handle_id [0:{depth - 1}];
+    reg [31:0] queue_job_handle_generation [0:{depth - 1}];
+"""
+        if composition.handle_table_capacity
+        else ""
+    )
+    count_pad = f"{8 - count_width}'d0"
+    return f"""    reg [{addr_width - 1}:0] queue_input_address [0:{depth - 1}];
+    reg [31:0] queue_input_length_bytes [0:{depth - 1}];
+    reg [{num_lanes * addr_width - 1}:0] queue_lane_output_address [0:{depth - 1}];
+{handle_decls}    reg [{pointer_width - 1}:0] queue_head;
+    reg [{pointer_width - 1}:0] queue_tail;
+    reg [{count_width - 1}:0] queue_count;
+    reg queue_overflow;
+    reg queue_running;
+    reg queue_settle;
+    reg [31:0] queue_completed;
+    reg [31:0] queue_result_status [0:{depth - 1}];
+    reg [{num_lanes * 32 - 1}:0] queue_result_lengths [0:{depth - 1}];
+    reg [{pointer_width - 1}:0] queue_result_head;
+    reg [{pointer_width - 1}:0] queue_result_tail;
+    reg [{count_width - 1}:0] queue_result_count;
+    wire queue_full = queue_count == {count_width}'d{depth};
+    wire queue_pending = (queue_count != {count_width}'d0) || queue_running;
+    // one job in flight at a time, and never one with nowhere to put its
+    // result: an unread result stalls dispatch instead of being overwritten
+    wire queue_dispatch = (queue_count != {count_width}'d0) && !queue_running && (queue_result_count != {count_width}'d{depth});
+    wire [31:0] job_queue_status_word = {{14'd0, queue_overflow, queue_running, {count_pad}, queue_result_count, {count_pad}, queue_count}};
+    wire [31:0] job_queue_result_word = (queue_result_count != {count_width}'d0) ? queue_result_status[queue_result_head] : 32'd0;
+    wire [{num_lanes * 32 - 1}:0] job_queue_result_lengths_word = queue_result_lengths[queue_result_head];
+"""
+
+
+def _job_queue_block_sv(
+    composition: ScanComposition,
+    *,
+    addr_width: int,
+    clk: str,
+    rst: str,
+    submit: str,
+    start: str,
+    done: str,
+    error: str,
+    error_code: str,
+    submitted_lanes: str,
+    active_lanes: str,
+    overflow_clear: str = "",
+) -> str:
+    """The job queue process: snapshot a submitted descriptor, dispatch the
+    head into the job registers the units already read (raising ``start``
+    exactly as JOB_CONTROL would), and record each finished job's result.
+
+    A dispatched job's close-out is only trusted from the second cycle after
+    its start pulse (``queue_settle``): until the units have seen the start,
+    ``done`` still describes the PREVIOUS job, and trusting it would retire
+    the new job before it ran. A submit into a full queue is dropped and
+    latches ``queue_overflow`` -- sticky, because a host that lost a job and
+    does not know it waits forever on a result that will never come.
+
+    The result word is ``{sequence[15:0], valid, 6'd0, error, error_code}``
+    with ``sequence`` the job's position in completion order; an empty ring
+    reads zero, which the valid bit tells apart from a clean job zero."""
+    depth = composition.job_queue_depth
+    if not depth:
+        return ""
+    num_lanes = len(composition.lanes)
+    pointer_width = handle_table_index_width(depth)
+    count_width = depth.bit_length()
+    pad = f"{count_width - 1}'d0, " if count_width > 1 else ""
+
+    def advance(pointer: str) -> str:
+        return f"{pointer} <= ({pointer} == {pointer_width}'d{depth - 1}) ? {pointer_width}'d0 : {pointer} + {pointer_width}'d1;"
+
+    handle_table = composition.handle_table_capacity > 0
+    handle_reset = (
+        """            job_handle_id <= 32'd0;
+            job_handle_generation <= 32'd0;
+"""
+        if handle_table
+        else ""
+    )
+    handle_push = (
+        """                queue_job_handle_id[queue_tail] <= submit_job_handle_id;
+                queue_job_handle_generation[queue_tail] <= submit_job_handle_generation;
+"""
+        if handle_table
+        else ""
+    )
+    handle_pop = (
+        """                job_handle_id <= queue_job_handle_id[queue_head];
+                job_handle_generation <= queue_job_handle_generation[queue_head];
+"""
+        if handle_table
+        else ""
+    )
+    overflow_clear_branch = (
+        f""" else if ({overflow_clear}) begin
+                queue_overflow <= 1'b0;
+            end"""
+        if overflow_clear
+        else ""
+    )
+    lane_lengths = ", ".join(f"lane_result_length_{i}" for i in reversed(range(num_lanes)))
+    return f"""    wire queue_complete = queue_running && !{start} && !queue_settle && {done};
+
+    always @(posedge {clk}) begin
+        if ({rst}) begin
+            {start} <= 1'b0;
+            input_address <= {addr_width}'d0;
+            input_length_bytes <= 32'd0;
+            {active_lanes} <= {num_lanes * addr_width}'d0;
+{handle_reset}            queue_head <= {pointer_width}'d0;
+            queue_tail <= {pointer_width}'d0;
+            queue_count <= {count_width}'d0;
+            queue_overflow <= 1'b0;
+            queue_running <= 1'b0;
+            queue_settle <= 1'b0;
+            queue_completed <= 32'd0;
+            queue_result_head <= {pointer_width}'d0;
+            queue_result_tail <= {pointer_width}'d0;
+            queue_result_count <= {count_width}'d0;
+        end else begin
+            {start} <= 1'b0;
+            queue_settle <= {start};
+            if ({submit} && !queue_full) begin
+                queue_input_address[queue_tail] <= submit_input_address;
+                queue_input_length_bytes[queue_tail] <= submit_input_length_bytes;
+                queue_lane_output_address[queue_tail] <= {submitted_lanes};
+{handle_push}                {advance("queue_tail")}
+            end else if ({submit}) begin
+                queue_overflow <= 1'b1;
+            end{overflow_clear_branch}
+            if (queue_dispatch) begin
+                input_address <= queue_input_address[queue_head];
+                input_length_bytes <= queue_input_length_bytes[queue_head];
+                {active_lanes} <= queue_lane_output_address[queue_head];
+{handle_pop}                {start} <= 1'b1;
+                queue_running <= 1'b1;
+                {advance("queue_head")}
+            end else if (queue_complete) begin
+                queue_running <= 1'b0;
+                queue_result_status[queue_result_tail] <= {{queue_completed[15:0], 1'b1, 6'd0, {error}, {error_code}}};
+                queue_result_lengths[queue_result_tail] <= {{{lane_lengths}}};
+                queue_completed <= queue_completed + 32'd1;
+                {advance("queue_result_tail")}
+            end
+            if (queue_result_pop && (queue_result_count != {count_width}'d0)) begin
+                {advance("queue_result_head")}
+            end
+            queue_count <= queue_count + {{{pad}{submit} && !queue_full}} - {{{pad}queue_dispatch}};
+            queue_result_count <= queue_result_count + {{{pad}queue_complete}} - {{{pad}queue_result_pop && (queue_result_count != {count_width}'d0)}};
+        end
+    end
+
+"""
+
+
 def _front_unpack_wire_decls_sv(composition: ScanComposition) -> str:
     """The front unpacker's widened row stream (``feed_*``, driving the
     fan-out input at the composed ``OUT_WIDTH``), its status bundle, and the
@@ -1789,11 +2189,32 @@ def generate_scan_composition_top_sv(
             if addr_width > 32
             else ""
         )
+        + (
+            f"\n    localparam [11:0] ADDR_LANE{i}_QUEUED_RESULT_LENGTH = 12'h{regs.lane_register(i, regs.lane_queued_result_length):03X};"
+            if composition.job_queue_depth
+            else ""
+        )
         for i in lanes
     )
     uses_load_phase = _uses_load_phase(composition)
     handle_table = composition.handle_table_capacity > 0
+    handle_batch = composition.handle_batch_depth > 0
+    # With a job queue the host-facing job registers are a STAGING set
+    # (``submit_*``) that JOB_CONTROL snapshots into the queue; the names the
+    # units read stay the active job's, loaded by the dispatcher. Without one
+    # ``staged`` is empty and every register case emits byte-identically.
+    job_queue = composition.job_queue_depth > 0
+    staged = "submit_" if job_queue else ""
+    # Ping-pong windows stage only the input: window 0 keeps the contract's
+    # INPUT_* offsets behind ``window0_*`` registers, and the names the reader
+    # sees become a mux over the two windows.
+    ping_pong = composition.ping_pong_windows
+    input_staged = staged or ("window0_" if ping_pong else "")
+    start_pulse = "job_submit" if job_queue else "job_start"
+    done_net = "run_done" if job_queue else "job_done"
     lane_reg_decls = "\n".join(f"    reg [{addr_width - 1}:0] lane_output_address_{i};" for i in lanes)
+    if job_queue:
+        lane_reg_decls += "".join(f"\n    reg [{addr_width - 1}:0] submit_lane_output_address_{i};" for i in lanes)
     load_phase_decl = "    reg load_phase;\n" if uses_load_phase else ""
     lane_wire_decls = _lane_wire_decls_sv(composition)
     lane_flat_assigns = _lane_flat_assigns_sv(composition)
@@ -1820,8 +2241,20 @@ def generate_scan_composition_top_sv(
     all_writers_done = " && ".join(f"writer_done_{i}" for i in lanes)
     any_writer_busy = " || ".join(f"writer_busy_{i}" for i in lanes)
     error_priority = _writer_error_priority_sv(num_lanes, error="job_error", error_code="job_error_code")
-    handle_table_decls = _handle_table_state_decls_sv(composition, addr_width=addr_width)
-    handle_table_block = _handle_table_block_sv(composition, addr_width=addr_width, clk="s_axi_aclk", rst="!s_axi_aresetn", start="job_start")
+    handle_table_decls = _handle_table_state_decls_sv(composition, addr_width=addr_width) + _handle_batch_state_decls_sv(
+        composition, addr_width=addr_width
+    )
+    # a batch queue sits in front of the table's programming port and holds a
+    # job start until it has drained; without one the table binds the
+    # single-slot registers and resolves on JOB_CONTROL, byte-identically
+    handle_table_block = _handle_batch_block_sv(composition, clk="s_axi_aclk", rst="!s_axi_aresetn") + _handle_table_block_sv(
+        composition,
+        addr_width=addr_width,
+        clk="s_axi_aclk",
+        rst="!s_axi_aresetn",
+        start="handle_start" if handle_batch else "job_start",
+        program="handle_program" if handle_batch else "handle",
+    )
     handle_error_branch = _handle_table_error_branch_sv(composition, error="job_error", error_code="job_error_code")
     handle_table_module = (
         f"\n{generate_shell_handle_table_v(capacity=composition.handle_table_capacity, addr_width=addr_width)}" if handle_table else ""
@@ -1837,6 +2270,36 @@ def generate_scan_composition_top_sv(
     handle_busy_term = "handle_pending || " if handle_table else ""
     handle_done_term = "handle_fail || " if handle_table else ""
     handle_done_gate = "!handle_pending && " if handle_table else ""
+    # likewise a start parked behind a draining batch
+    if handle_batch:
+        handle_busy_term += "batch_start_held || "
+        handle_done_gate += "!batch_start_held && "
+    # the units' own busy/done become run_*, and the host-facing job_* fold
+    # in the queue so JOB_STATUS reads busy until every queued job has run
+    busy_net = "run_busy" if job_queue else "job_busy"
+    job_queue_status_nets = "    wire job_busy = run_busy || queue_pending;\n    wire job_done = run_done && !queue_pending;\n" if job_queue else ""
+    job_queue_decls = (
+        f"    reg job_submit;\n    reg [{addr_width - 1}:0] submit_input_address;\n    reg [31:0] submit_input_length_bytes;\n"
+        + ("    reg [31:0] submit_job_handle_id;\n    reg [31:0] submit_job_handle_generation;\n" if handle_table else "")
+        + "    reg queue_result_pop;\n    reg queue_overflow_clear;\n"
+        + _job_queue_decls_sv(composition, addr_width=addr_width)
+        if job_queue
+        else ""
+    )
+    job_queue_block = _job_queue_block_sv(
+        composition,
+        addr_width=addr_width,
+        clk="s_axi_aclk",
+        rst="!s_axi_aresetn",
+        submit="job_submit",
+        start="job_start",
+        done="run_done",
+        error="job_error",
+        error_code="job_error_code",
+        submitted_lanes="{" + ", ".join(f"submit_lane_output_address_{i}" for i in reversed(lanes)) + "}",
+        active_lanes="{" + ", ".join(f"lane_output_address_{i}" for i in reversed(lanes)) + "}",
+        overflow_clear="queue_overflow_clear",
+    )
     # the register survives so the map does not shift under a host that decodes
     # it, but it drives nothing: naming a raw address is the thing the table
     # exists to take away, so leaving it wired would leave the hole open.
@@ -1849,28 +2312,35 @@ def generate_scan_composition_top_sv(
     def lane_high_read(i: int) -> str:
         if addr_width <= 32:
             return ""
-        return f"\n                    ADDR_LANE{i}_OUTPUT_ADDRESS_HIGH: s_axi_rdata <= lane_output_address_{i}[{addr_width - 1}:32];"
+        return f"\n                    ADDR_LANE{i}_OUTPUT_ADDRESS_HIGH: s_axi_rdata <= {staged}lane_output_address_{i}[{addr_width - 1}:32];"
+
+    def lane_queued_read(i: int) -> str:
+        if not job_queue:
+            return ""
+        return f"\n                    ADDR_LANE{i}_QUEUED_RESULT_LENGTH: s_axi_rdata <= job_queue_result_lengths_word[{32 * i + 31}:{32 * i}];"
 
     # the lane write address takes the same low/high treatment as the job read
     # address: a bare 32-bit write into a wider register leaves the top bits
     # unreachable, so a lane could only ever write below 4 GiB
     if addr_width > 32:
         write_case_items = "\n".join(
-            f"                    ADDR_LANE{i}_OUTPUT_ADDRESS: lane_output_address_{i}[31:0] <= s_axi_wdata;\n"
-            f"                    ADDR_LANE{i}_OUTPUT_ADDRESS_HIGH: lane_output_address_{i}[{addr_width - 1}:32] <= s_axi_wdata[{addr_width - 33}:0];"
+            f"                    ADDR_LANE{i}_OUTPUT_ADDRESS: {staged}lane_output_address_{i}[31:0] <= s_axi_wdata;\n"
+            f"                    ADDR_LANE{i}_OUTPUT_ADDRESS_HIGH: {staged}lane_output_address_{i}[{addr_width - 1}:32] <= s_axi_wdata[{addr_width - 33}:0];"
             for i in lanes
         )
     else:
-        write_case_items = "\n".join(f"                    ADDR_LANE{i}_OUTPUT_ADDRESS: lane_output_address_{i} <= s_axi_wdata;" for i in lanes)
+        write_case_items = "\n".join(
+            f"                    ADDR_LANE{i}_OUTPUT_ADDRESS: {staged}lane_output_address_{i} <= s_axi_wdata;" for i in lanes
+        )
     read_case_items = "\n".join(
-        f"""                    ADDR_LANE{i}_OUTPUT_ADDRESS: s_axi_rdata <= lane_output_address_{i}[31:0];
+        f"""                    ADDR_LANE{i}_OUTPUT_ADDRESS: s_axi_rdata <= {staged}lane_output_address_{i}[31:0];
                     ADDR_LANE{i}_RESULT_LENGTH: s_axi_rdata <= lane_result_length_{i};
                     ADDR_LANE{i}_RECORD_COUNT_LOW: s_axi_rdata <= lane_bar_count_{i}[31:0];
                     ADDR_LANE{i}_RECORD_COUNT_HIGH: s_axi_rdata <= lane_bar_count_{i}[63:32];
-                    ADDR_LANE{i}_ERROR: s_axi_rdata <= {{24'd0, writer_error_code_{i}}};{lane_high_read(i)}"""
+                    ADDR_LANE{i}_ERROR: s_axi_rdata <= {{24'd0, writer_error_code_{i}}};{lane_high_read(i)}{lane_queued_read(i)}"""
         for i in lanes
     )
-    lane_reset_items = "\n".join(f"            lane_output_address_{i} <= {addr_width}'d0;" for i in lanes)
+    lane_reset_items = "\n".join(f"            {staged}lane_output_address_{i} <= {addr_width}'d0;" for i in lanes)
     lane_count_clear_items = "\n".join(f"                lane_bar_count_{i} <= 64'd0;" for i in lanes)
     lane_count_latch_items = "\n".join(
         f"""            if (tile_status_valid_{i} && tile_status_ready_{i}) begin
@@ -1880,12 +2350,12 @@ def generate_scan_composition_top_sv(
     )
     wide_address = addr_width > 32
     input_address_low_write = (
-        "                    ADDR_INPUT_ADDRESS_LOW: input_address[31:0] <= s_axi_wdata;\n"
+        f"                    ADDR_INPUT_ADDRESS_LOW: {input_staged}input_address[31:0] <= s_axi_wdata;\n"
         if wide_address
-        else f"                    ADDR_INPUT_ADDRESS_LOW: input_address <= s_axi_wdata[{addr_width - 1}:0];\n"
+        else f"                    ADDR_INPUT_ADDRESS_LOW: {input_staged}input_address <= s_axi_wdata[{addr_width - 1}:0];\n"
     )
     input_address_high_write = (
-        f"                    ADDR_INPUT_ADDRESS_HIGH: input_address[{addr_width - 1}:32] <= s_axi_wdata[{addr_width - 33}:0];\n"
+        f"                    ADDR_INPUT_ADDRESS_HIGH: {input_staged}input_address[{addr_width - 1}:32] <= s_axi_wdata[{addr_width - 33}:0];\n"
         if wide_address
         else ""
     )
@@ -1893,7 +2363,7 @@ def generate_scan_composition_top_sv(
     # data, so no concatenation is needed (and a 64-bit master's high half is
     # exactly 32 bits, where a pad would be zero-width and illegal)
     input_address_high_read = (
-        f"\n                    ADDR_INPUT_ADDRESS_HIGH: s_axi_rdata <= input_address[{addr_width - 1}:32];" if wide_address else ""
+        f"\n                    ADDR_INPUT_ADDRESS_HIGH: s_axi_rdata <= {input_staged}input_address[{addr_width - 1}:32];" if wide_address else ""
     )
     register_names: tuple[tuple[str, int], ...] = (
         ("LAST_ERROR", regs.last_error),
@@ -1918,6 +2388,25 @@ def generate_scan_composition_top_sv(
         )
         if wide_address:
             register_names = register_names + (("HANDLE_BASE_HIGH", regs.handle_base_high),)
+    if handle_batch:
+        register_names = register_names + (
+            ("HANDLE_BATCH_DATA", regs.handle_batch_data),
+            ("HANDLE_BATCH_CONTROL", regs.handle_batch_control),
+        )
+    if job_queue:
+        register_names = register_names + (
+            ("JOB_QUEUE_STATUS", regs.job_queue_status),
+            ("JOB_QUEUE_RESULT", regs.job_queue_result),
+            ("JOB_QUEUE_COMPLETED", regs.job_queue_completed),
+        )
+    if ping_pong:
+        register_names = register_names + (
+            ("INPUT1_ADDRESS_LOW", regs.input1_address_low),
+            ("INPUT1_LENGTH_LOW", regs.input1_length_low),
+            ("WINDOW_SELECT", regs.window_select),
+        )
+        if wide_address:
+            register_names = register_names + (("INPUT1_ADDRESS_HIGH", regs.input1_address_high),)
     localparams = _register_localparams_sv(register_names)
     load_phase_reset = "            load_phase <= 1'b0;\n" if uses_load_phase else ""
     load_phase_write = "                    ADDR_LOAD_PHASE: load_phase <= s_axi_wdata[0];\n" if uses_load_phase else ""
@@ -1944,8 +2433,8 @@ def generate_scan_composition_top_sv(
             handle_generation <= 32'd0;
             handle_install <= 1'b0;
             handle_free <= 1'b0;
-            job_handle_id <= 32'd0;
-            job_handle_generation <= 32'd0;
+            {staged}job_handle_id <= 32'd0;
+            {staged}job_handle_generation <= 32'd0;
 """
         handle_tick = """            handle_install <= 1'b0;
             handle_free <= 1'b0;
@@ -1957,8 +2446,8 @@ def generate_scan_composition_top_sv(
                         handle_install <= s_axi_wdata[{HANDLE_CONTROL_INSTALL_BIT}];
                         handle_free <= s_axi_wdata[{HANDLE_CONTROL_FREE_BIT}];
                     end
-                    ADDR_JOB_HANDLE_ID: job_handle_id <= s_axi_wdata;
-                    ADDR_JOB_HANDLE_GENERATION: job_handle_generation <= s_axi_wdata;
+                    ADDR_JOB_HANDLE_ID: {staged}job_handle_id <= s_axi_wdata;
+                    ADDR_JOB_HANDLE_GENERATION: {staged}job_handle_generation <= s_axi_wdata;
 """
         # CONTROL reads back the resolution state rather than the write bits
         # (which are pulses and would always read zero): a host that sees a
@@ -1969,10 +2458,133 @@ def generate_scan_composition_top_sv(
                     ADDR_HANDLE_LENGTH: s_axi_rdata <= handle_length;
                     ADDR_HANDLE_GENERATION: s_axi_rdata <= handle_generation;
                     ADDR_HANDLE_CONTROL: s_axi_rdata <= {{30'd0, handle_fail, handle_pending}};
-                    ADDR_JOB_HANDLE_ID: s_axi_rdata <= job_handle_id;
-                    ADDR_JOB_HANDLE_GENERATION: s_axi_rdata <= job_handle_generation;"""
+                    ADDR_JOB_HANDLE_ID: s_axi_rdata <= {staged}job_handle_id;
+                    ADDR_JOB_HANDLE_GENERATION: s_axi_rdata <= {staged}job_handle_generation;"""
     else:
         handle_reset = handle_tick = handle_write_cases = handle_read_cases = ""
+    # the batch aperture. HANDLE_BATCH_DATA takes one entry as the same word
+    # sequence the single-slot registers take, and the CONTROL word closes the
+    # entry and pushes it; batch_word counts where in the sequence the host
+    # is, and reads back so a driver that lost its place can tell. CONTROL
+    # commits (drains the queue into the table) or clears (drops the queue
+    # and any half-written entry), and reads back the queue state.
+    if handle_batch:
+        word_count = _handle_batch_word_count(addr_width)
+        batch_base_words = (
+            f"                            3'd1: batch_base[31:0] <= s_axi_wdata;\n"
+            f"                            3'd2: batch_base[{addr_width - 1}:32] <= s_axi_wdata[{addr_width - 33}:0];\n"
+            if wide_address
+            else f"                            3'd1: batch_base <= s_axi_wdata[{addr_width - 1}:0];\n"
+        )
+        count_width = composition.handle_batch_depth.bit_length()
+        handle_reset += f"""            batch_word <= 3'd0;
+            batch_index <= 32'd0;
+            batch_base <= {addr_width}'d0;
+            batch_length <= 32'd0;
+            batch_generation <= 32'd0;
+            batch_push <= 1'b0;
+            batch_push_install <= 1'b0;
+            batch_push_free <= 1'b0;
+            batch_commit <= 1'b0;
+            batch_clear <= 1'b0;
+"""
+        handle_tick += """            batch_push <= 1'b0;
+            batch_commit <= 1'b0;
+            batch_clear <= 1'b0;
+"""
+        handle_write_cases += f"""                    ADDR_HANDLE_BATCH_DATA: begin
+                        case (batch_word)
+                            3'd0: batch_index <= s_axi_wdata;
+{batch_base_words}                            3'd{word_count - 3}: batch_length <= s_axi_wdata;
+                            3'd{word_count - 2}: batch_generation <= s_axi_wdata;
+                            3'd{word_count - 1}: begin
+                                batch_push_install <= s_axi_wdata[{HANDLE_CONTROL_INSTALL_BIT}];
+                                batch_push_free <= s_axi_wdata[{HANDLE_CONTROL_FREE_BIT}];
+                                batch_push <= 1'b1;
+                            end
+                            default: ;
+                        endcase
+                        batch_word <= (batch_word == 3'd{word_count - 1}) ? 3'd0 : batch_word + 3'd1;
+                    end
+                    ADDR_HANDLE_BATCH_CONTROL: begin
+                        batch_commit <= s_axi_wdata[{HANDLE_BATCH_COMMIT_BIT}];
+                        batch_clear <= s_axi_wdata[{HANDLE_BATCH_CLEAR_BIT}];
+                        if (s_axi_wdata[{HANDLE_BATCH_CLEAR_BIT}]) begin
+                            batch_word <= 3'd0;
+                        end
+                    end
+"""
+        handle_read_cases += f"""
+                    ADDR_HANDLE_BATCH_DATA: s_axi_rdata <= {{29'd0, batch_word}};
+                    ADDR_HANDLE_BATCH_CONTROL: s_axi_rdata <= {{{16 - count_width}'d0, batch_count, 13'd0, batch_start_held, batch_overflow, batch_draining}};"""
+    # the job-queue block. STATUS reads both occupancies, the in-flight bit
+    # and the sticky overflow, and any write clears the overflow; RESULT reads
+    # the oldest unread result and any write pops it; COMPLETED counts every
+    # job the queue has retired since reset.
+    if job_queue:
+        job_queue_reset = """            queue_result_pop <= 1'b0;
+            queue_overflow_clear <= 1'b0;
+"""
+        job_queue_tick = job_queue_reset
+        job_queue_write_cases = """                    ADDR_JOB_QUEUE_STATUS: queue_overflow_clear <= 1'b1;
+                    ADDR_JOB_QUEUE_RESULT: queue_result_pop <= 1'b1;
+"""
+        job_queue_read_cases = """
+                    ADDR_JOB_QUEUE_STATUS: s_axi_rdata <= job_queue_status_word;
+                    ADDR_JOB_QUEUE_RESULT: s_axi_rdata <= job_queue_result_word;
+                    ADDR_JOB_QUEUE_COMPLETED: s_axi_rdata <= queue_completed;"""
+    else:
+        job_queue_reset = job_queue_tick = job_queue_write_cases = job_queue_read_cases = ""
+    # the second window mirrors the first; WINDOW_SELECT reads the window the
+    # next start takes (bit 0) and the one the running job holds (bit 1), and
+    # a write forces the next one. A start latches and flips it in the tick.
+    if ping_pong:
+        ping_pong_reset = f"""            window1_input_address <= {addr_width}'d0;
+            window1_input_length_bytes <= 32'd0;
+            window_select <= 1'b0;
+            window_active <= 1'b0;
+"""
+        window_flip = """                window_active <= window_select;
+                window_select <= !window_select;
+"""
+        ping_pong_write_cases = (
+            (
+                "                    ADDR_INPUT1_ADDRESS_LOW: window1_input_address[31:0] <= s_axi_wdata;\n"
+                f"                    ADDR_INPUT1_ADDRESS_HIGH: window1_input_address[{addr_width - 1}:32] <= s_axi_wdata[{addr_width - 33}:0];\n"
+                if wide_address
+                else f"                    ADDR_INPUT1_ADDRESS_LOW: window1_input_address <= s_axi_wdata[{addr_width - 1}:0];\n"
+            )
+            + """                    ADDR_INPUT1_LENGTH_LOW: window1_input_length_bytes <= s_axi_wdata;
+                    ADDR_WINDOW_SELECT: window_select <= s_axi_wdata[0];
+"""
+        )
+        ping_pong_read_cases = (
+            "\n                    ADDR_INPUT1_ADDRESS_LOW: s_axi_rdata <= window1_input_address[31:0];"
+            + (f"\n                    ADDR_INPUT1_ADDRESS_HIGH: s_axi_rdata <= window1_input_address[{addr_width - 1}:32];" if wide_address else "")
+            + "\n                    ADDR_INPUT1_LENGTH_LOW: s_axi_rdata <= window1_input_length_bytes;"
+            + "\n                    ADDR_WINDOW_SELECT: s_axi_rdata <= {30'd0, window_active, window_select};"
+        )
+        input_decls = f"""    reg [{addr_width - 1}:0] window0_input_address;
+    reg [31:0] window0_input_length_bytes;
+    reg job_start;
+    // PING-PONG INPUT WINDOWS: the host stages one window while the other
+    // streams. The start cycle reads the window WINDOW_SELECT names; from
+    // then on the job holds it in window_active, so the next window's
+    // registers can be rewritten under a running job.
+    reg [{addr_width - 1}:0] window1_input_address;
+    reg [31:0] window1_input_length_bytes;
+    reg window_select;
+    reg window_active;
+    wire window_current = job_start ? window_select : window_active;
+    wire [{addr_width - 1}:0] input_address = window_current ? window1_input_address : window0_input_address;
+    wire [31:0] input_length_bytes = window_current ? window1_input_length_bytes : window0_input_length_bytes;
+"""
+    else:
+        ping_pong_reset = window_flip = ping_pong_write_cases = ping_pong_read_cases = ""
+        input_decls = f"""{input_address_note}    reg [{addr_width - 1}:0] input_address;
+    reg [31:0] input_length_bytes;
+    reg job_start;
+"""
     # THE HIGH HALF OF THE JOB ADDRESS. AXI-Lite carries 32 bits per access,
     # so a job master wider than 32 bits needs a second register or its top
     # bits are unreachable — which is exactly why a build could only ever
@@ -1980,28 +2592,28 @@ def generate_scan_composition_top_sv(
     # a 32-bit design's register block stays byte-identical.
     register_process = _axi_lite_register_process_sv(
         write_default_comment="other job fields accepted and ignored",
-        reset_extra=f"""            input_address <= {addr_width}'d0;
-            input_length_bytes <= 32'd0;
-            job_start <= 1'b0;
+        reset_extra=f"""            {input_staged}input_address <= {addr_width}'d0;
+            {input_staged}input_length_bytes <= 32'd0;
+            {start_pulse} <= 1'b0;
             length_fail <= 1'b0;
-{load_phase_reset}{handle_reset}{front_stage_error_reset}            prev_done <= 1'b1;
+{ping_pong_reset}{load_phase_reset}{handle_reset}{job_queue_reset}{front_stage_error_reset}            prev_done <= 1'b1;
             pipeline_error_reset <= 1'b0;
 {lane_reset_items}
 {lane_count_clear_items.replace("                ", "            ")}
 """,
-        tick_extra=f"""{handle_tick}            prev_done <= job_done;
-            pipeline_error_reset <= job_done && !prev_done && job_error;
+        tick_extra=f"""{handle_tick}{job_queue_tick}            prev_done <= {done_net};
+            pipeline_error_reset <= {done_net} && !prev_done && job_error;
             if (job_start) begin
                 length_fail <= !length_ok;
-{lane_count_clear_items}
+{window_flip}{lane_count_clear_items}
             end
 {front_stage_error_latch}{lane_count_latch_items}
 """,
-        write_cases_extra=f"""{input_address_low_write}{input_address_high_write}                    ADDR_INPUT_LENGTH_LOW: input_length_bytes <= s_axi_wdata;
-{load_phase_write}{handle_write_cases}{write_case_items}
+        write_cases_extra=f"""{input_address_low_write}{input_address_high_write}                    ADDR_INPUT_LENGTH_LOW: {input_staged}input_length_bytes <= s_axi_wdata;
+{ping_pong_write_cases}{load_phase_write}{handle_write_cases}{job_queue_write_cases}{write_case_items}
 """,
-        read_cases_extra=f"""                    ADDR_INPUT_ADDRESS_LOW: s_axi_rdata <= input_address[31:0];{input_address_high_read}
-                    ADDR_INPUT_LENGTH_LOW: s_axi_rdata <= input_length_bytes;{load_phase_read}{handle_read_cases}
+        read_cases_extra=f"""                    ADDR_INPUT_ADDRESS_LOW: s_axi_rdata <= {input_staged}input_address[31:0];{input_address_high_read}
+                    ADDR_INPUT_LENGTH_LOW: s_axi_rdata <= {input_staged}input_length_bytes;{ping_pong_read_cases}{load_phase_read}{handle_read_cases}{job_queue_read_cases}
                     12'hFC0: s_axi_rdata <= dbg_first_stream_word[31:0];
                     12'hFC4: s_axi_rdata <= dbg_first_stream_word[63:32];
                     12'hFC8: s_axi_rdata <= dbg_first_araddr;
@@ -2009,6 +2621,7 @@ def generate_scan_composition_top_sv(
                     12'hFD0: s_axi_rdata <= dbg_final_fifo_count;
 {read_case_items}
 """,
+        job_start=start_pulse,
     )
 
     return f"""`default_nettype none
@@ -2042,11 +2655,8 @@ module {module_name} #(
 
 {_axi_lite_decode_wires_sv()}
 
-{input_address_note}    reg [{addr_width - 1}:0] input_address;
-    reg [31:0] input_length_bytes;
-    reg job_start;
-{load_phase_decl}{handle_table_decls}{lane_reg_decls}
-
+{input_decls}{load_phase_decl}{handle_table_decls}{lane_reg_decls}
+{job_queue_decls}
     wire reader_busy;
     wire reader_done;
     wire reader_error;
@@ -2069,9 +2679,9 @@ module {module_name} #(
     wire length_ok = (input_length_bytes != 32'd0) && ({length_ok_check});
     wire unit_start = {unit_start_expr};
 
-    wire job_busy = reader_busy || {handle_busy_term}{any_writer_busy};
-    wire job_done = length_fail || {handle_done_term}({handle_done_gate}reader_done && {all_writers_done});
-    reg job_error;
+    wire {busy_net} = reader_busy || {handle_busy_term}{any_writer_busy};
+    wire {done_net} = length_fail || {handle_done_term}({handle_done_gate}reader_done && {all_writers_done});
+{job_queue_status_nets}    reg job_error;
     reg [7:0] job_error_code;
     reg prev_done;
     reg pipeline_error_reset;
@@ -2097,7 +2707,7 @@ module {module_name} #(
 
 {_identity_registers_instance_sv()}
 
-{handle_table_block}    dau_axi_burst_reader #(
+{job_queue_block}{handle_table_block}    dau_axi_burst_reader #(
         .ADDR_WIDTH({addr_width}),
         .BURST_BEATS({burst_beats}),
 {reader_data_width_param}        .LENGTH_ALIGN_BITS({length_align_bits})
@@ -2179,6 +2789,9 @@ endmodule
 
 
 _DEFAULT_GENERATED_BY_SIM = "dau_build.scan_composition.generate_scan_composition_sim_sv"
+# the storage array inside dau_axi_ram_sim that the bulk backdoor's
+# $readmemh/$writememh reach into
+_SIM_RAM_ARRAY = "mem"
 
 
 def generate_scan_composition_sim_sv(
@@ -2190,6 +2803,7 @@ def generate_scan_composition_sim_sv(
     config_inputs: dict[str, int] | None = None,
     sources: Sequence[Path | str] | None = None,
     generated_by: str = _DEFAULT_GENERATED_BY_SIM,
+    bulk_backdoor: bool = False,
 ) -> str:
     """Walk the same ``ScanComposition`` into its JOB-level simulation
     harness: the pipeline the shell top wires (burst reader -> fan-out ->
@@ -2206,7 +2820,15 @@ def generate_scan_composition_sim_sv(
     literals. ``module_name`` defaults to the composition's shell module
     name with a ``_sim`` suffix; ``mem_words``/``read_latency`` parameterize
     the backdoor RAM. ``sources`` arms the same slang-backed interface
-    validation as the shell walker."""
+    validation as the shell walker.
+
+    ``bulk_backdoor`` adds whole-memory backdoor access beside the
+    word-per-clock ``bd_*`` port: the RAM is preloaded at time zero from the
+    ``+dau_mem_load=<file>`` ``$readmemh`` image, reloaded from it on a
+    ``bd_load`` pulse, and written whole to ``+dau_mem_dump=<file>`` on a
+    ``bd_dump`` pulse (``dau_build.sim_memory`` writes and reads those
+    files from NumPy arrays). It reaches the RAM's storage hierarchically,
+    as ``ram.mem``."""
     _validate_composition_shape(composition)  # model_copy skips model_post_init
     if sources is not None:
         _validate_against_sources(composition, sources)
@@ -2255,6 +2877,62 @@ def generate_scan_composition_sim_sv(
     # and job-handle registers surface as testbench-driven ports — the same
     # treatment LOAD_PHASE already gets
     handle_table = composition.handle_table_capacity > 0
+    # a job queue turns the job inputs into a submit surface: the ports take
+    # a submit_ prefix and a submit pulse, and the names the pipeline reads
+    # become the active job's registers, loaded by the same dispatcher the
+    # shell top runs
+    job_queue = composition.job_queue_depth > 0
+    staged = "submit_" if job_queue else ""
+    done_net = "run_done" if job_queue else "done"
+    # ping-pong windows surface both windows as ports and the toggle as
+    # outputs (which window the next start takes, which one the running job
+    # holds); the flip on start is the same one the shell top's tick makes
+    # the bulk backdoor is testbench plumbing around the RAM, not pipeline:
+    # two pulse inputs and the $readmemh/$writememh block beside the RAM
+    if bulk_backdoor:
+        bulk_ports = """,
+    input wire bd_load,
+    input wire bd_dump"""
+        bulk_block = f"""
+    // bulk backdoor: +dau_mem_load=<file> preloads the RAM at time zero and
+    // reloads it on a bd_load pulse; a bd_dump pulse writes the whole RAM to
+    // +dau_mem_dump=<file>
+    reg [8*1024-1:0] bd_load_path;
+    reg [8*1024-1:0] bd_dump_path;
+    reg bd_load_armed;
+    reg bd_dump_armed;
+    initial begin
+        bd_load_armed = $value$plusargs("dau_mem_load=%s", bd_load_path);
+        bd_dump_armed = $value$plusargs("dau_mem_dump=%s", bd_dump_path);
+        if (bd_load_armed) $readmemh(bd_load_path, ram.{_SIM_RAM_ARRAY});
+    end
+    always @(posedge clk) begin
+        if (bd_load && bd_load_armed) $readmemh(bd_load_path, ram.{_SIM_RAM_ARRAY});
+        if (bd_dump && bd_dump_armed) $writememh(bd_dump_path, ram.{_SIM_RAM_ARRAY});
+    end
+"""
+    else:
+        bulk_ports = bulk_block = ""
+    ping_pong = composition.ping_pong_windows
+    if ping_pong:
+        input_ports = f"""    input wire [{addr_width - 1}:0] window0_input_address,
+    input wire [31:0] window0_input_length_bytes,
+    input wire [{addr_width - 1}:0] window1_input_address,
+    input wire [31:0] window1_input_length_bytes,
+    output reg window_select,
+    output reg window_active,
+"""
+        ping_pong_decls = f"""    wire window_current = start ? window_select : window_active;
+    wire [{addr_width - 1}:0] input_address = window_current ? window1_input_address : window0_input_address;
+    wire [31:0] input_length_bytes = window_current ? window1_input_length_bytes : window0_input_length_bytes;
+"""
+        ping_pong_reset = "            window_select <= 1'b0;\n            window_active <= 1'b0;\n"
+        window_flip = "                window_active <= window_select;\n                window_select <= !window_select;\n"
+    else:
+        input_ports = f"""    input wire [{addr_width - 1}:0] {staged}input_address,
+    input wire [31:0] {staged}input_length_bytes,
+"""
+        ping_pong_decls = ping_pong_reset = window_flip = ""
     handle_ports = (
         f"""    input wire handle_install,
     input wire handle_free,
@@ -2262,13 +2940,55 @@ def generate_scan_composition_sim_sv(
     input wire [{addr_width - 1}:0] handle_base,
     input wire [31:0] handle_length,
     input wire [31:0] handle_generation,
-    input wire [31:0] job_handle_id,
-    input wire [31:0] job_handle_generation,
+    input wire [31:0] {staged}job_handle_id,
+    input wire [31:0] {staged}job_handle_generation,
 """
         if handle_table
         else ""
     )
+    job_queue_ports = (
+        f"""    input wire queue_result_pop,
+    output wire [31:0] job_queue_status,
+    output wire [31:0] job_queue_result,
+    output wire [{num_lanes * 32 - 1}:0] job_queue_result_lengths,
+    output wire [31:0] job_queue_completed,
+"""
+        if job_queue
+        else ""
+    )
+    job_queue_decls = (
+        f"""    reg start;
+    reg [{addr_width - 1}:0] input_address;
+    reg [31:0] input_length_bytes;
+    reg [{num_lanes * addr_width - 1}:0] lane_output_address;
+"""
+        + ("    reg [31:0] job_handle_id;\n    reg [31:0] job_handle_generation;\n" if handle_table else "")
+        + _job_queue_decls_sv(composition, addr_width=addr_width)
+        + """    assign job_queue_status = job_queue_status_word;
+    assign job_queue_result = job_queue_result_word;
+    assign job_queue_result_lengths = job_queue_result_lengths_word;
+    assign job_queue_completed = queue_completed;
+"""
+        if job_queue
+        else ""
+    )
+    job_queue_block = _job_queue_block_sv(
+        composition,
+        addr_width=addr_width,
+        clk="clk",
+        rst="rst",
+        submit="submit",
+        start="start",
+        done="run_done",
+        error="error",
+        error_code="error_code",
+        submitted_lanes="submit_lane_output_address",
+        active_lanes="lane_output_address",
+    )
+
     handle_table_decls = _handle_table_sim_state_decls_sv(addr_width) if handle_table else ""
+    # a handle_batch_depth is an aperture feature: the harness already drives
+    # the programming port directly, so it has no queue to model
     handle_table_block = _handle_table_block_sv(composition, addr_width=addr_width, clk="clk", rst="rst", start="start")
     handle_error_branch = _handle_table_error_branch_sv(composition, error="error", error_code="error_code")
     handle_table_module = (
@@ -2282,6 +3002,17 @@ def generate_scan_composition_sim_sv(
     lane_instances = _lane_units_sv(composition, clk="clk", writer_rst="rst", start="start")
     all_writers_done = " && ".join(f"writer_done_{i}" for i in lanes)
     any_writer_busy = " || ".join(f"writer_busy_{i}" for i in lanes)
+    run_busy_expr = f"reader_busy || {handle_busy_term}{any_writer_busy}"
+    run_done_expr = f"length_fail || {handle_done_term}({handle_done_gate}reader_done && {all_writers_done})"
+    busy_done_assigns = (
+        f"""    wire run_busy = {run_busy_expr};
+    wire run_done = {run_done_expr};
+    assign busy = run_busy || queue_pending;
+    assign done = run_done && !queue_pending;"""
+        if job_queue
+        else f"""    assign busy = {run_busy_expr};
+    assign done = {run_done_expr};"""
+    )
     error_priority = _writer_error_priority_sv(num_lanes, error="error", error_code="error_code")
     lane_count_clears = "\n".join(f"            lane_bar_count_{i} <= 64'd0;" for i in lanes)
     lane_count_start_clears = "\n".join(f"                lane_bar_count_{i} <= 64'd0;" for i in lanes)
@@ -2303,11 +3034,9 @@ module {name} (
     input wire clk,
     input wire rst,
 
-    input wire start,
-    input wire [{addr_width - 1}:0] input_address,
-    input wire [31:0] input_length_bytes,
-{config_input_ports}{handle_ports}    input wire [{num_lanes * addr_width - 1}:0] lane_output_address,
-    output wire busy,
+    input wire {"submit" if job_queue else "start"},
+{input_ports}{config_input_ports}{handle_ports}    input wire [{num_lanes * addr_width - 1}:0] {staged}lane_output_address,
+{job_queue_ports}    output wire busy,
     output wire done,
     output reg error,
     output reg [7:0] error_code,
@@ -2317,9 +3046,9 @@ module {name} (
     input wire bd_write,
     input wire [31:0] bd_index,
     input wire [63:0] bd_wdata,
-    output wire [63:0] bd_rdata
+    output wire [63:0] bd_rdata{bulk_ports}
 );
-    wire reader_busy;
+{job_queue_decls}{ping_pong_decls}    wire reader_busy;
     wire reader_done;
     wire reader_error;
     wire [7:0] reader_error_code;
@@ -2369,8 +3098,7 @@ module {name} (
     wire length_ok = (input_length_bytes != 32'd0) && ({length_ok_check});
     wire unit_start = {unit_start_expr};
 
-{handle_table_decls}    assign busy = reader_busy || {handle_busy_term}{any_writer_busy};
-    assign done = length_fail || {handle_done_term}({handle_done_gate}reader_done && {all_writers_done});
+{handle_table_decls}{busy_done_assigns}
 
     always @(*) begin
         if (length_fail) begin
@@ -2388,7 +3116,7 @@ module {name} (
         end
     end
 
-{handle_table_block}    dau_axi_burst_reader #(
+{job_queue_block}{handle_table_block}    dau_axi_burst_reader #(
         .ADDR_WIDTH({addr_width}),
         .BURST_BEATS({burst_beats}),
         .LENGTH_ALIGN_BITS({length_align_bits})
@@ -2500,19 +3228,19 @@ module {name} (
         .bd_wdata(bd_wdata),
         .bd_rdata(bd_rdata)
     );
-
+{bulk_block}
     always @(posedge clk) begin
         if (rst) begin
             prev_done <= 1'b1;
             pipeline_error_reset <= 1'b0;
             length_fail <= 1'b0;
-{front_stage_error_reset}{lane_count_clears}
+{ping_pong_reset}{front_stage_error_reset}{lane_count_clears}
         end else begin
-            prev_done <= done;
-            pipeline_error_reset <= done && !prev_done && error;
+            prev_done <= {done_net};
+            pipeline_error_reset <= {done_net} && !prev_done && error;
             if (start) begin
                 length_fail <= !length_ok;
-{lane_count_start_clears}
+{window_flip}{lane_count_start_clears}
             end
 {front_stage_error_latch}{lane_count_latches}
         end
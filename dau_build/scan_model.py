@@ -0,0 +1,286 @@
+"""A vectorized functional model of a ``ScanComposition``, for golden results.
+
+Checking a composition's output against the Verilog sim harness costs
+seconds to minutes per case; this model reads the SAME ``ScanComposition``
+and computes what the shell should leave in memory with NumPy, fast enough
+to produce goldens for millions of rows in milliseconds.
+
+What the model knows is the shell's own structure, read from the
+composition exactly as the generators read it:
+
+- the reader's length gate (``_length_align_bits``): a zero or off-grid
+  length closes the job out with 0xFE before any unit starts;
+- the handle table: a job naming a handle resolves it or faults with the
+  table's codes, in the table's order (bad id, stale, out of bounds);
+- the fan-out: broadcast (every lane sees every row, filtered by its own
+  optional ``partition``) or a shared ``partitioner`` routing each row to
+  exactly one lane, in stream order;
+- each lane's ``chain`` into its terminal tile, and the record writer that
+  lands the terminal tile's words at the lane's output address and reports
+  their length;
+- the shell's error priority: the length gate, then the handle fault, then
+  the lowest-numbered failing lane.
+
+What it does NOT know is what a tile computes -- that is the tile's
+semantics, and this public model carries no registry. Callers plug in a
+reference per module name (``references``): tiles and chain stages map an
+array of rows to rows or words, a lane partition filter maps rows to a keep
+mask, and a shared partitioner maps rows to lane indices. A front stage is
+modelled the same way; a front gearbox with no reference is the reframing it
+is, and needs none.
+
+Rows are ``uint64`` arrays of shape ``(n, input_row_bytes // 8)`` -- one
+packed 64-bit word per row ahead of a ``front_unpack`` -- so a reference is a
+NumPy expression over whole columns, never a per-row loop.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Mapping, Sequence
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from dau_build.scan_composition import (
+    HANDLE_FAULT_BAD_ID,
+    HANDLE_FAULT_OUT_OF_BOUNDS,
+    HANDLE_FAULT_STALE,
+    LaneTile,
+    ScanComposition,
+    TileInstance,
+    _length_align_bits,
+    _validate_composition_shape,
+)
+
+__all__ = (
+    "LENGTH_FAULT",
+    "HandleEntry",
+    "LaneModelResult",
+    "ScanModelError",
+    "ScanModelResult",
+    "TileOutput",
+    "config_int",
+    "run_scan_model",
+)
+
+# the shell's own code for an input length that is zero or off the row grid
+LENGTH_FAULT = 0xFE
+
+_SV_INT = re.compile(r"^(?:(\d+)?'([sS]?)([dDhHbBoO]))?([0-9a-fA-F_]+)$")
+_SV_BASES = {"d": 10, "h": 16, "b": 2, "o": 8}
+
+
+class ScanModelError(ValueError):
+    """The model cannot run this composition or job as asked."""
+
+
+class TileOutput(BaseModel):
+    """What a tile reference may return in place of a bare array: its output,
+    the value its count port reports, and its status error code (0 for a
+    success close-out)."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    data: np.ndarray
+    count: int | None = None
+    error_code: int = 0
+
+
+class HandleEntry(BaseModel):
+    """One live handle-table slot: the granted region and its generation."""
+
+    model_config = ConfigDict(frozen=True)
+
+    base: int
+    length: int
+    generation: int
+
+
+class LaneModelResult(BaseModel):
+    """One lane's close-out: the words its writer landed, their length, the
+    terminal tile's count, and the lane's error code."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    words: np.ndarray
+    record_count: int = 0
+    error_code: int = 0
+
+    @property
+    def result_length_bytes(self) -> int:
+        return int(self.words.size) * 8
+
+
+class ScanModelResult(BaseModel):
+    """A job's modelled close-out: the job error code (0 on success) and one
+    result per lane."""
+
+    model_config = ConfigDict(frozen=True)
+
+    error_code: int
+    lanes: tuple[LaneModelResult, ...]
+
+    def write_into(self, memory: np.ndarray, lane_output_addresses: Sequence[int]) -> np.ndarray:
+        """A copy of the word-addressed ``memory`` image with every lane's
+        words landed at its output byte address -- the state the shell
+        leaves behind, to diff against a sim dump or a device read-back."""
+        if len(lane_output_addresses) != len(self.lanes):
+            raise ScanModelError(f"{len(self.lanes)} lane(s) but {len(lane_output_addresses)} output address(es)")
+        image = np.array(memory, dtype=np.uint64, copy=True)
+        for lane, address in zip(self.lanes, lane_output_addresses, strict=True):
+            start = _word_index(address)
+            image[start : start + lane.words.size] = lane.words
+        return image
+
+
+def config_int(tile: TileInstance, port: str) -> int:
+    """A config binding as an integer, for references that read their tile's
+    configuration: a plain or sized SystemVerilog literal (``64'd1000``,
+    ``32'hFF``, ``1_000``). An expression over the top's signals has no value
+    the model can know, and is refused."""
+    try:
+        value = tile.config[port]
+    except KeyError as exc:
+        raise ScanModelError(f"tile {tile.module!r} binds no config port {port!r}") from exc
+    match = _SV_INT.match(value.strip())
+    if match is None:
+        raise ScanModelError(f"tile {tile.module!r} binds {port}={value!r}, which is not a literal the model can evaluate")
+    base = _SV_BASES[match.group(3).lower()] if match.group(3) else 10
+    return int(match.group(4).replace("_", ""), base)
+
+
+def _word_index(byte_address: int) -> int:
+    if byte_address % 8:
+        raise ScanModelError(f"address 0x{byte_address:X} is not 8-byte aligned")
+    return byte_address // 8
+
+
+def _reference(references: Mapping[str, Callable], tile: TileInstance, role: str) -> Callable:
+    try:
+        return references[tile.module]
+    except KeyError:
+        raise ScanModelError(f"no reference for {role} {tile.module!r}; pass references={{{tile.module!r}: ...}}") from None
+
+
+def _as_output(value, *, rows_in: int) -> TileOutput:
+    if isinstance(value, TileOutput):
+        return value if value.count is not None else value.model_copy(update={"count": rows_in})
+    return TileOutput(data=np.asarray(value, dtype=np.uint64), count=rows_in)
+
+
+def _as_rows(data: np.ndarray, row_words: int) -> np.ndarray:
+    data = np.asarray(data, dtype=np.uint64)
+    return data if data.ndim == 2 else data.reshape(-1, row_words)
+
+
+def _handle_fault(handle: tuple[int, int], table: Mapping[int, HandleEntry], *, capacity: int, length: int) -> tuple[int, int]:
+    """The table's resolve, in its order: (fault code, resolved base)."""
+    handle_id, generation = handle
+    if not 0 <= handle_id < capacity:
+        return HANDLE_FAULT_BAD_ID, 0
+    entry = table.get(handle_id)
+    if entry is None or entry.generation != generation:
+        return HANDLE_FAULT_STALE, 0
+    if length > entry.length:
+        return HANDLE_FAULT_OUT_OF_BOUNDS, 0
+    return 0, entry.base
+
+
+def _run_lane(lane: LaneTile, rows: np.ndarray, references: Mapping[str, Callable], row_words: int) -> LaneModelResult:
+    """A lane's chain into its terminal tile. A failing stage closes the lane
+    out with its code (upstream first, as the lane status mux orders them)
+    and nothing downstream of it reaches the writer."""
+    for stage in lane.chain:
+        output = _as_output(_reference(references, stage, "chain stage")(rows, stage), rows_in=len(rows))
+        if output.error_code:
+            return LaneModelResult(words=np.empty(0, dtype=np.uint64), error_code=output.error_code)
+        rows = _as_rows(output.data, row_words)
+    output = _as_output(_reference(references, lane, "lane tile")(rows, lane), rows_in=len(rows))
+    return LaneModelResult(
+        words=np.ascontiguousarray(output.data, dtype=np.uint64).reshape(-1), record_count=output.count, error_code=output.error_code
+    )
+
+
+def run_scan_model(
+    composition: ScanComposition,
+    memory: np.ndarray,
+    *,
+    input_length_bytes: int,
+    references: Mapping[str, Callable],
+    input_address: int = 0,
+    handle: tuple[int, int] | None = None,
+    handle_table: Mapping[int, HandleEntry] | None = None,
+) -> ScanModelResult:
+    """Model one job of ``composition`` over the word-addressed ``memory``
+    image (``uint64``, as the sim harness's backdoor RAM holds it).
+
+    A raw-address composition reads from ``input_address``; a handle-table
+    composition names its input by ``handle`` (id, generation) and resolves
+    it against ``handle_table`` (live slots only)."""
+    _validate_composition_shape(composition)
+    num_lanes = len(composition.lanes)
+    failed = ScanModelResult(error_code=0, lanes=())
+
+    def refused(code: int) -> ScanModelResult:
+        return failed.model_copy(
+            update={"error_code": code, "lanes": tuple(LaneModelResult(words=np.empty(0, dtype=np.uint64)) for _ in range(num_lanes))}
+        )
+
+    grid = 1 << _length_align_bits(composition)
+    if input_length_bytes <= 0 or input_length_bytes % grid:
+        return refused(LENGTH_FAULT)
+    if composition.handle_table_capacity:
+        if handle is None:
+            raise ScanModelError("a handle-table composition names its input by handle; pass handle=(id, generation)")
+        fault, input_address = _handle_fault(handle, handle_table or {}, capacity=composition.handle_table_capacity, length=input_length_bytes)
+        if fault:
+            return refused(fault)
+    elif handle is not None:
+        raise ScanModelError("handle= needs a composition with a handle table")
+
+    start = _word_index(input_address)
+    words = np.asarray(memory, dtype=np.uint64)[start : start + input_length_bytes // 8]
+    if words.size * 8 != input_length_bytes:
+        raise ScanModelError(f"the input window [0x{input_address:X}, +{input_length_bytes}) runs past the {len(memory)}-word memory image")
+
+    row_words = composition.input_row_bytes // 8
+    if composition.front_unpack is not None:
+        front = composition.front_unpack
+        output = _as_output(_reference(references, front, "front_unpack")(words.reshape(-1, 1), front), rows_in=words.size)
+        if output.error_code:
+            return refused(output.error_code)
+        rows = _as_rows(output.data, row_words)
+    else:
+        if composition.front_gearbox is not None and composition.front_gearbox.module in references:
+            front = composition.front_gearbox
+            words = np.asarray(references[front.module](words, front), dtype=np.uint64).reshape(-1)
+        if words.size % row_words:
+            raise ScanModelError(
+                f"{input_length_bytes} bytes passes the length gate but tears a {composition.input_row_bytes}-byte record; "
+                "that is the head tile's ERR_STREAM close-out, whose code the model cannot know"
+            )
+        rows = words.reshape(-1, row_words)
+
+    if composition.partitioner is not None:
+        lanes_of = np.asarray(_reference(references, composition.partitioner, "partitioner")(rows, composition.partitioner, num_lanes))
+        if lanes_of.shape != (len(rows),):
+            raise ScanModelError(f"the partitioner reference returned shape {lanes_of.shape} for {len(rows)} rows")
+        if lanes_of.size and (lanes_of.min() < 0 or lanes_of.max() >= num_lanes):
+            raise ScanModelError(f"the partitioner reference routed a row outside lanes 0..{num_lanes - 1}")
+        # one stable sort buckets every lane's rows in stream order at once
+        order = np.argsort(lanes_of, kind="stable")
+        bounds = np.searchsorted(lanes_of[order], np.arange(num_lanes + 1))
+        lane_rows = [rows[order[bounds[i] : bounds[i + 1]]] for i in range(num_lanes)]
+    else:
+        lane_rows = []
+        for lane in composition.lanes:
+            if lane.partition is None:
+                lane_rows.append(rows)
+                continue
+            keep = np.asarray(_reference(references, lane.partition, "partition filter")(rows, lane.partition), dtype=bool)
+            lane_rows.append(rows[keep])
+
+    lanes = tuple(_run_lane(lane, lane_input, references, row_words) for lane, lane_input in zip(composition.lanes, lane_rows, strict=True))
+    error_code = next((lane.error_code for lane in lanes if lane.error_code), 0)
+    return ScanModelResult(error_code=error_code, lanes=lanes)
@@ -0,0 +1,167 @@
+"""Throughput results for generated scan-composition sim harnesses.
+
+The cocotb benches prove a harness correct on a handful of rows; this module
+is the bookkeeping side of measuring one over many. A sweep is a grid of
+``ThroughputPoint`` s -- the harness parameters that move sustained
+performance (``burst_beats``, the sim RAM's ``read_latency``, the lane count
+and ``input_row_bytes``) plus the row count driven through it -- and each
+point measured on the sim yields a ``ThroughputMeasurement``:
+
+- ``rows_per_cycle``: 64-bit rows streamed per clock, start to done;
+- ``reader_utilization``: the fraction of those clocks the read channel
+  moved a beat;
+- ``writer_contention``: lane-cycles a record writer spent holding its
+  write address while another lane owned the write mux, per clock.
+
+Results land in a JSON file (``write_throughput_results``) stamped with the
+revision they were measured at, and ``compare_throughput`` diffs two such
+files point by point. Run as a module it is the regression gate between
+commits::
+
+    python -m dau_build.scan_throughput baseline.json current.json --tolerance 0.05
+
+which prints one line per shared point and exits 1 when any point's
+``rows_per_cycle`` fell by more than the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = (
+    "ThroughputMeasurement",
+    "ThroughputPoint",
+    "ThroughputRegression",
+    "compare_throughput",
+    "load_throughput_results",
+    "throughput_sweep",
+    "write_throughput_results",
+)
+
+_RESULTS_FORMAT = "dau-build-throughput/1"
+
+
+class ThroughputPoint(BaseModel):
+    """One harness configuration of a sweep."""
+
+    model_config = ConfigDict(frozen=True)
+
+    burst_beats: int = Field(ge=1, le=256)
+    read_latency: int = Field(ge=0)
+    lanes: int = Field(ge=1)
+    input_row_bytes: int = Field(ge=8, multiple_of=8)
+    rows: int = Field(ge=1)
+
+    @property
+    def key(self) -> str:
+        """The point's identity across results files."""
+        return f"burst_beats={self.burst_beats} read_latency={self.read_latency} lanes={self.lanes} input_row_bytes={self.input_row_bytes} rows={self.rows}"
+
+
+class ThroughputMeasurement(BaseModel):
+    """What one point measured on the sim."""
+
+    model_config = ConfigDict(frozen=True)
+
+    point: ThroughputPoint
+    cycles: int = Field(ge=1)
+    rows_per_cycle: float
+    reader_utilization: float
+    writer_contention: float
+
+
+class ThroughputRegression(BaseModel):
+    """A point whose throughput fell by more than the tolerance."""
+
+    model_config = ConfigDict(frozen=True)
+
+    point: ThroughputPoint
+    baseline_rows_per_cycle: float
+    current_rows_per_cycle: float
+
+    @property
+    def change(self) -> float:
+        return self.current_rows_per_cycle / self.baseline_rows_per_cycle - 1.0
+
+
+def throughput_sweep(
+    *,
+    burst_beats: Iterable[int] = (1, 4, 16),
+    read_latency: Iterable[int] = (0, 4, 16),
+    lanes: Iterable[int] = (1, 2, 4),
+    input_row_bytes: Iterable[int] = (8, 16),
+    rows: int = 4096,
+) -> tuple[ThroughputPoint, ...]:
+    """The full grid over the given axes, in a stable order."""
+    return tuple(
+        ThroughputPoint(burst_beats=beats, read_latency=latency, lanes=lane_count, input_row_bytes=row_bytes, rows=rows)
+        for beats, latency, lane_count, row_bytes in itertools.product(burst_beats, read_latency, lanes, input_row_bytes)
+    )
+
+
+def write_throughput_results(path: Path | str, measurements: Sequence[ThroughputMeasurement], *, revision: str | None = None) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "format": _RESULTS_FORMAT,
+        "revision": revision,
+        "results": [measurement.model_dump(mode="json") for measurement in measurements],
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def load_throughput_results(path: Path | str) -> tuple[ThroughputMeasurement, ...]:
+    document = json.loads(Path(path).read_text())
+    if document.get("format") != _RESULTS_FORMAT:
+        raise ValueError(f"{path} is not a {_RESULTS_FORMAT} results file (format={document.get('format')!r})")
+    return tuple(ThroughputMeasurement.model_validate(entry) for entry in document["results"])
+
+
+def compare_throughput(
+    baseline: Sequence[ThroughputMeasurement], current: Sequence[ThroughputMeasurement], *, tolerance: float = 0.05
+) -> tuple[ThroughputRegression, ...]:
+    """Every point present in both runs whose ``rows_per_cycle`` fell below
+    ``(1 - tolerance)`` of the baseline. Points only one run measured are
+    not comparisons, and are skipped."""
+    if not 0 <= tolerance < 1:
+        raise ValueError(f"tolerance must be in [0, 1), got {tolerance}")
+    before = {measurement.point.key: measurement for measurement in baseline}
+    return tuple(
+        ThroughputRegression(
+            point=after.point, baseline_rows_per_cycle=before[after.point.key].rows_per_cycle, current_rows_per_cycle=after.rows_per_cycle
+        )
+        for after in current
+        if after.point.key in before and after.rows_per_cycle < before[after.point.key].rows_per_cycle * (1 - tolerance)
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m dau_build.scan_throughput", description="Flag throughput regressions between two results files.")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.05, help="allowed fractional drop in rows/cycle (default 0.05)")
+    args = parser.parse_args(argv)
+
+    baseline = load_throughput_results(args.baseline)
+    current = load_throughput_results(args.current)
+    regressions = {regression.point.key: regression for regression in compare_throughput(baseline, current, tolerance=args.tolerance)}
+    before = {measurement.point.key: measurement for measurement in baseline}
+    for measurement in current:
+        key = measurement.point.key
+        if key not in before:
+            continue
+        status = "regressed" if key in regressions else "ok"
+        print(f"dau-build-throughput\t{key} baseline={before[key].rows_per_cycle:.4f} current={measurement.rows_per_cycle:.4f} status={status}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
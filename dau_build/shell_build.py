@@ -11,22 +11,34 @@ filename.
 
 from __future__ import annotations
 
-import hashlib
 import re
+import shutil
 import subprocess
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, Literal
 
-from artlink import Artifact, Digest
+from artlink import Artifact
 from ccflow import BaseModel
+from pydantic import ConfigDict, field_validator
 
+from .digests import DigestCache, digest_files
+from .git_provenance import collect_git_provenance
 from .packaging import ArtifactManifest
 
 __all__ = (
+    "DEFAULT_IMPLEMENTATION_VARIANTS",
+    "IMPLEMENTATION_SWEEP_DIR",
     "SHELL_BUILD_MANIFEST_NAME",
+    "ImplementationSweepResult",
+    "ImplementationVariant",
     "ShellBuildError",
     "ShellBuildStatus",
+    "adopt_implementation",
+    "best_implementation",
+    "implementation_sweep_tcl",
     "parse_shell_build_console",
+    "run_implementation_sweep",
     "run_shell_project_build",
     "shell_build_manifest",
     "write_shell_build_manifest",
@@ -35,6 +47,7 @@ __all__ = (
 SHELL_BUILD_MANIFEST_NAME = "shell-build.artifacts.yaml"
 _BUILD_OK_PATTERN = re.compile(r"^DAU_MM_JOB_BUILD_OK wns=(?P<wns>[-0-9.]+)\s*$", re.MULTILINE)
 _BUILD_FAILED_PATTERN = re.compile(r"^DAU_MM_JOB_BUILD_FAILED (?P<stage>.+?)\s*$", re.MULTILINE)
+_INCREMENTAL_PATTERN = re.compile(r"^DAU_MM_JOB_INCREMENTAL reference=(?P<reference>.+?)\s*$", re.MULTILINE)
 
 
 class ShellBuildError(ValueError):
@@ -48,6 +61,9 @@ class ShellBuildStatus(BaseModel):
     wns_ns: float | None = None
     failed_stage: str | None = None
     return_code: int | None = None
+    # an incremental build's reference checkpoint, or "none" when it ran
+    # from scratch; unset for a non-incremental build
+    incremental_reference: str | None = None
 
 
 def run_shell_project_build(
@@ -64,52 +80,193 @@ def run_shell_project_build(
     if not script_path.is_file():
         raise ShellBuildError(f"shell project script does not exist: {script_path.as_posix()}")
     log_path = output_root / console_log
+    status = _run_vivado_batch(output_root, script=script, vivado_executable=vivado_executable, log_path=log_path)
+    if status.return_code != 0 or status.build_status != "built":
+        raise ShellBuildError(f"shell build failed ({_failure_label(status)}): see {log_path.as_posix()}")
+    return status
+
+
+def _run_vivado_batch(cwd: Path, *, script: str, vivado_executable: str, log_path: Path) -> ShellBuildStatus:
     with log_path.open("w", encoding="utf-8") as log:
         completed = subprocess.run(
             [vivado_executable, "-mode", "batch", "-source", script],
-            cwd=output_root,
+            cwd=cwd,
             stdout=log,
             stderr=subprocess.STDOUT,
             check=False,
         )
     status = parse_shell_build_console(log_path.read_text(encoding="utf-8"))
     status.return_code = completed.returncode
-    if completed.returncode != 0 or status.build_status != "built":
-        raise ShellBuildError(
-            f"shell build failed (exit {completed.returncode}, status {status.build_status}"
-            + (f", stage {status.failed_stage}" if status.failed_stage else "")
-            + f"): see {log_path.as_posix()}"
-        )
     return status
 
 
+def _failure_label(status: ShellBuildStatus) -> str:
+    return f"exit {status.return_code}, status {status.build_status}" + (f", stage {status.failed_stage}" if status.failed_stage else "")
+
+
 def parse_shell_build_console(console_text: str) -> ShellBuildStatus:
     """Extract the build outcome the generated scripts print: the
-    DAU_MM_JOB_BUILD_OK/FAILED marker and the routed worst negative slack."""
+    DAU_MM_JOB_BUILD_OK/FAILED marker, the routed worst negative slack and,
+    for an incremental build, the reference checkpoint it ran against."""
+    incremental = _INCREMENTAL_PATTERN.search(console_text)
+    reference = incremental.group("reference") if incremental else None
     ok = _BUILD_OK_PATTERN.search(console_text)
     if ok:
-        return ShellBuildStatus(build_status="built", wns_ns=float(ok.group("wns")))
+        return ShellBuildStatus(build_status="built", wns_ns=float(ok.group("wns")), incremental_reference=reference)
     failed = _BUILD_FAILED_PATTERN.search(console_text)
     if failed:
-        return ShellBuildStatus(build_status="failed", failed_stage=failed.group("stage"))
-    return ShellBuildStatus(build_status="unknown")
-
+        return ShellBuildStatus(build_status="failed", failed_stage=failed.group("stage"), incremental_reference=reference)
+    return ShellBuildStatus(build_status="unknown", incremental_reference=reference)
+
+
+class ImplementationVariant(BaseModel):
+    """One implementation run of a strategy sweep: the directive each
+    implementation step runs with (``phys_opt_directive`` None skips
+    physical optimization)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    opt_directive: str = "Default"
+    place_directive: str = "Default"
+    phys_opt_directive: str | None = None
+    route_directive: str = "Default"
+
+    @field_validator("name")
+    @classmethod
+    def _plain_name(cls, value: str) -> str:
+        # the name is a directory under sweep/
+        if not re.fullmatch(r"[A-Za-z0-9_.-]+", value) or value in (".", ".."):
+            raise ValueError(f"variant name must be a plain directory name: {value!r}")
+        return value
+
+
+# the directive sets a hand-run timing-closure pass tries first: the
+# default flow, the exploratory directives, and the two placer directives
+# that trade wirelength for slack on congested and on long-net designs
+DEFAULT_IMPLEMENTATION_VARIANTS = (
+    ImplementationVariant(name="default"),
+    ImplementationVariant(
+        name="explore", opt_directive="Explore", place_directive="Explore", phys_opt_directive="Explore", route_directive="Explore"
+    ),
+    ImplementationVariant(
+        name="extra-net-delay", place_directive="ExtraNetDelay_high", phys_opt_directive="AggressiveExplore", route_directive="NoTimingRelaxation"
+    ),
+    ImplementationVariant(name="spread-logic", place_directive="AltSpreadLogic_high", phys_opt_directive="Explore", route_directive="Explore"),
+    ImplementationVariant(name="extra-timing-opt", place_directive="ExtraTimingOpt", phys_opt_directive="Explore", route_directive="Explore"),
+)
 
-def _digest(path: Path) -> Digest:
-    return Digest(algorithm="sha256", value=hashlib.sha256(path.read_bytes()).hexdigest())
+# where the sweep runs live, one directory per variant, under the output root
+IMPLEMENTATION_SWEEP_DIR = "sweep"
+_SWEEP_SCRIPT = "impl_sweep.tcl"
+_SYNTH_CHECKPOINT = Path("project_mm/project_mm.runs/synth_1/Top_wrapper.dcp")
+
+
+class ImplementationSweepResult(BaseModel):
+    variant: ImplementationVariant
+    status: ShellBuildStatus
+    output_root: Path
+
+    def manifest_record(self) -> dict[str, Any]:
+        return {**self.variant.model_dump(exclude_none=True), **self.status.model_dump(exclude_none=True)}
+
+
+def implementation_sweep_tcl(variant: ImplementationVariant, *, lane_placements: tuple[tuple[int, str], ...] = ()) -> str:
+    """Non-project implementation of the shell's synthesized checkpoint
+    with ``variant``'s directives. Each run writes its reports and bitstream
+    into its own directory and prints the same console markers as the
+    project build. The lane swizzle hook is sourced before ``opt_design``
+    when the shell has one; with ``lane_placements`` the routed design is
+    checked against them."""
+    from dau_build.mm_shell import _lane_swizzle_verify_tcl
+
+    phys_opt = f"dau_sweep_step phys_opt {{phys_opt_design -directive {variant.phys_opt_directive}}}\n" if variant.phys_opt_directive else ""
+    verify = _lane_swizzle_verify_tcl(lane_placements) if lane_placements else ""
+    return f"""# Generated by dau-build: implementation sweep variant {variant.name}.
+set origin_dir [file dirname [file normalize [info script]]]
+set shell_dir [file normalize "$origin_dir/../.."]
+
+proc dau_sweep_step {{stage script}} {{
+    if {{[catch {{uplevel 1 $script}}]}} {{
+        puts "DAU_MM_JOB_BUILD_FAILED $stage"
+        exit 1
+    }}
+}}
+
+dau_sweep_step open_checkpoint {{open_checkpoint "$shell_dir/{_SYNTH_CHECKPOINT.as_posix()}"}}
+if {{[file exists "$shell_dir/gt_lane_swizzle.tcl"]}} {{
+    dau_sweep_step lane_swizzle {{source "$shell_dir/gt_lane_swizzle.tcl"}}
+}}
+dau_sweep_step opt {{opt_design -directive {variant.opt_directive}}}
+dau_sweep_step place {{place_design -directive {variant.place_directive}}}
+{phys_opt}dau_sweep_step route {{route_design -directive {variant.route_directive}}}
+report_utilization -file "$origin_dir/utilization_mm.rpt"
+report_timing_summary -file "$origin_dir/timing_mm.rpt"
+
+{verify}set wns [get_property SLACK [get_timing_paths -max_paths 1 -nworst 1 -setup]]
+dau_sweep_step bitstream {{write_bitstream -force "$origin_dir/dau_mm_job.bit"}}
+puts "DAU_MM_JOB_BUILD_OK wns=$wns"
+exit 0
+"""
 
 
-def _git_describe(path: Path) -> str | None:
-    try:
-        completed = subprocess.run(
-            ["git", "-C", str(path), "describe", "--always", "--dirty", "--tags"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except OSError:
-        return None
-    return completed.stdout.strip() or None
+def run_implementation_sweep(
+    output_root: Path,
+    variants: Sequence[ImplementationVariant] = DEFAULT_IMPLEMENTATION_VARIANTS,
+    *,
+    vivado_executable: str = "vivado",
+    max_parallel: int | None = None,
+    lane_placements: tuple[tuple[int, str], ...] = (),
+) -> tuple[ImplementationSweepResult, ...]:
+    """Implement the shell project's synthesized checkpoint once per
+    variant, ``max_parallel`` Vivado processes at a time (default: as many
+    implementation runs as the host's CPUs and memory hold,
+    ``vivado_runs.host_vivado_jobs``). Every run's outcome is returned, in
+    variant order; a failed run does not stop the others."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from dau_build.vivado_runs import host_vivado_jobs
+
+    if not variants:
+        raise ShellBuildError("an implementation sweep needs at least one variant")
+    names = [variant.name for variant in variants]
+    if len(names) != len(set(names)):
+        raise ShellBuildError(f"duplicate implementation variant names: {names}")
+    checkpoint = output_root / _SYNTH_CHECKPOINT
+    if not checkpoint.is_file():
+        raise ShellBuildError(f"no synthesized checkpoint to implement (build the shell project first): {checkpoint.as_posix()}")
+
+    def run(variant: ImplementationVariant) -> ImplementationSweepResult:
+        run_root = output_root / IMPLEMENTATION_SWEEP_DIR / variant.name
+        run_root.mkdir(parents=True, exist_ok=True)
+        (run_root / _SWEEP_SCRIPT).write_text(implementation_sweep_tcl(variant, lane_placements=lane_placements), encoding="utf-8")
+        status = _run_vivado_batch(run_root, script=_SWEEP_SCRIPT, vivado_executable=vivado_executable, log_path=run_root / "console.log")
+        if status.return_code != 0 and status.build_status == "built":
+            status.build_status = "failed"
+        return ImplementationSweepResult(variant=variant, status=status, output_root=run_root)
+
+    workers = max_parallel if max_parallel is not None else host_vivado_jobs().impl
+    with ThreadPoolExecutor(max_workers=max(min(workers, len(variants)), 1)) as pool:
+        return tuple(pool.map(run, variants))
+
+
+def best_implementation(results: Sequence[ImplementationSweepResult]) -> ImplementationSweepResult:
+    """The built run with the largest worst negative slack (the earliest
+    variant on a tie)."""
+    built = [result for result in results if result.status.build_status == "built" and result.status.wns_ns is not None]
+    if not built:
+        failures = "; ".join(f"{result.variant.name}: {_failure_label(result.status)}" for result in results)
+        raise ShellBuildError(f"no implementation variant built ({failures})")
+    return max(built, key=lambda result: result.status.wns_ns)
+
+
+def adopt_implementation(output_root: Path, result: ImplementationSweepResult) -> None:
+    """Make ``result`` the shell build's output: its bitstream and reports
+    replace the ones in the output root."""
+    for name in ("dau_mm_job.bit", "utilization_mm.rpt", "timing_mm.rpt"):
+        source = result.output_root / name
+        if source.is_file():
+            shutil.copyfile(source, output_root / name)
 
 
 def shell_build_manifest(
@@ -121,45 +278,49 @@ def shell_build_manifest(
     console_log: str = "console.log",
     source_paths: tuple[Path, ...] = (),
     metadata: dict[str, Any] | None = None,
+    digest_cache: DigestCache | None = None,
 ) -> ArtifactManifest:
     """Package a completed shell build: the bitstream (digested), reports,
     console log, the generated project inputs found in the output root, and
-    the contributing HDL sources (digested, with the git state of each
-    containing repository recorded in the manifest metadata)."""
+    the contributing HDL sources (digested, each with its git index blob,
+    and the state of each containing repository recorded in the manifest
+    metadata by repository root). A
+    ``digest_cache`` skips re-reading files unchanged since it last saw
+    them."""
     bitstream_path = output_root / bitstream
     if not bitstream_path.is_file():
         raise ShellBuildError(f"bitstream does not exist: {bitstream_path.as_posix()}")
 
-    artifacts: list[Artifact] = [
-        Artifact(path=bitstream_path, kind="binary", role="bitstream", digest=_digest(bitstream_path)),
-    ]
+    # (path, kind, role, digested): every digest is taken in one parallel
+    # pass once the artifact list is known
+    entries: list[tuple[Path, str, str, bool]] = [(bitstream_path, "binary", "bitstream", True)]
     for report in reports:
         report_path = output_root / report
         if report_path.is_file():
-            artifacts.append(Artifact(path=report_path, kind="metadata", role="report"))
+            entries.append((report_path, "metadata", "report", False))
     log_path = output_root / console_log
     if log_path.is_file():
-        artifacts.append(Artifact(path=log_path, kind="metadata", role="build-log"))
+        entries.append((log_path, "metadata", "build-log", False))
     for generated in sorted(output_root.iterdir()):
         if generated.suffix in (".tcl", ".xdc", ".prj", ".v", ".sv") and generated.is_file():
-            artifacts.append(
-                Artifact(
-                    path=generated,
-                    kind="source",
-                    role="generated-project-input",
-                    digest=_digest(generated),
-                )
-            )
-
-    source_repos: dict[str, str] = {}
+            entries.append((generated, "source", "generated-project-input", True))
+
     for source in source_paths:
         source_path = Path(source)
         if not source_path.is_file():
             raise ShellBuildError(f"contributing source does not exist: {source_path.as_posix()}")
-        artifacts.append(Artifact(path=source_path, kind="source", role="hdl-source", digest=_digest(source_path)))
-        describe = _git_describe(source_path.parent)
-        if describe:
-            source_repos.setdefault(source_path.parent.as_posix(), describe)
+        entries.append((source_path, "source", "hdl-source", True))
+    provenance = collect_git_provenance([Path(source) for source in source_paths])
+    source_repos = {state.root.as_posix(): state.describe for state in provenance.repositories if state.describe}
+
+    digests = iter(digest_files([path for path, _, _, digested in entries if digested], cache=digest_cache))
+    artifacts = []
+    for path, kind, role, digested in entries:
+        fields: dict[str, Any] = {"digest": next(digests)} if digested else {}
+        blob = provenance.blob(path) if role == "hdl-source" else None
+        if blob is not None:
+            fields["metadata"] = {"git_blob": blob}
+        artifacts.append(Artifact(path=path, kind=kind, role=role, **fields))
 
     manifest_metadata: dict[str, Any] = {"source_repositories": source_repos}
     if metadata:
@@ -174,6 +335,7 @@ def write_shell_build_manifest(
     source_paths: tuple[Path, ...] = (),
     metadata: dict[str, Any] | None = None,
     bitstream: str = "dau_mm_job.bit",
+    digest_cache: DigestCache | None = None,
 ) -> Path:
     """Build and write the shell-build manifest into the output root."""
     import yaml
@@ -184,13 +346,16 @@ def write_shell_build_manifest(
         bitstream=bitstream,
         source_paths=source_paths,
         metadata=metadata,
+        digest_cache=digest_cache,
     )
     manifest_path = output_root / SHELL_BUILD_MANIFEST_NAME
     manifest_path.write_text(yaml.safe_dump(manifest.model_dump(mode="json", exclude_defaults=True), sort_keys=False), encoding="utf-8")
     return manifest_path
 
 
-def write_overlay_build_manifest(work_root: Path, key_value_manifest_path: Path, *, name: str) -> Path | None:
+def write_overlay_build_manifest(
+    work_root: Path, key_value_manifest_path: Path, *, name: str, digest_cache: DigestCache | None = None
+) -> Path | None:
     """Package a *built* overlay backend run as an artlink manifest beside
     its key=value handoff (the Tcl-side format stays as the in-band
     mechanism; provenance converges on artlink). Returns None when the
@@ -216,7 +381,8 @@ def write_overlay_build_manifest(work_root: Path, key_value_manifest_path: Path,
     if bitstream_path is None or not bitstream_path.is_file():
         raise ShellBuildError(f"built manifest names no existing bitstream: {key_value_manifest_path.as_posix()}")
 
-    artifacts: list[Artifact] = [Artifact(path=bitstream_path, kind="binary", role="bitstream", digest=_digest(bitstream_path))]
+    (bitstream_digest,) = digest_files([bitstream_path], cache=digest_cache)
+    artifacts: list[Artifact] = [Artifact(path=bitstream_path, kind="binary", role="bitstream", digest=bitstream_digest)]
     for key, role in (
         ("resource_summary", "report"),
         ("timing_summary", "report"),
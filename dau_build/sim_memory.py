@@ -0,0 +1,125 @@
+"""Bulk load and dump of the sim harness RAM from NumPy arrays.
+
+The sim harness's ``bd_*`` backdoor moves one 64-bit word per clock, so a
+bench that fills a multi-megabyte dataset through it spends longer loading
+than running the job under test. A harness generated with
+``bulk_backdoor=True`` instead reads and writes its whole RAM as a
+``$readmemh`` hex image, named by plusargs at sim start:
+
+- ``+dau_mem_load=<file>``: preloaded at time zero, reloaded on ``bd_load``;
+- ``+dau_mem_dump=<file>``: the whole RAM written there on ``bd_dump``.
+
+``SimMemory`` owns that pair of files: ``plusargs`` for the runner,
+``preload`` before the sim starts, and ``load``/``dump`` from inside a cocotb
+test, each one clock however large the image. ``write_memh``/``read_memh``
+are the file format underneath -- one 64-bit hex word per line, with
+``@<word>`` address records so a sparse image writes only what it sets.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+__all__ = ("SimMemory", "read_memh", "write_memh")
+
+
+def _segments(image: np.ndarray | Mapping[int, np.ndarray]) -> dict[int, np.ndarray]:
+    if isinstance(image, Mapping):
+        return {int(word): np.asarray(words, dtype=np.uint64).reshape(-1) for word, words in image.items()}
+    return {0: np.asarray(image, dtype=np.uint64).reshape(-1)}
+
+
+def write_memh(path: Path | str, image: np.ndarray | Mapping[int, np.ndarray]) -> Path:
+    """Write ``image`` -- an array landing at word 0, or a mapping of word
+    index to array -- as a ``$readmemh`` file. Words the image does not set
+    keep whatever the RAM held."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        for word, words in sorted(_segments(image).items()):
+            if word < 0:
+                raise ValueError(f"word index {word} is negative")
+            handle.write(f"@{word:x}\n".encode())
+            if words.size:
+                # big-endian bytes hex-encode to the words' own digits; a
+                # fixed-width view splits them into lines without a loop
+                digits = np.frombuffer(words.astype(">u8").tobytes().hex().encode(), dtype="S16")
+                handle.write(b"\n".join(digits.tolist()) + b"\n")
+    return path
+
+
+def _hex_word(value: str) -> int:
+    try:
+        return int(value, 16)
+    except ValueError:
+        # X/Z digits: a word the RAM never held a value for reads as zero
+        return 0
+
+
+def read_memh(path: Path | str, *, mem_words: int | None = None) -> np.ndarray:
+    """A ``$readmemh``/``$writememh`` file as a ``uint64`` array, honouring
+    ``@`` address records and ``//`` comments. ``mem_words`` sizes the
+    result (unset words read zero); by default it ends at the last word the
+    file sets."""
+    addresses: list[int] = []
+    values: list[str] = []
+    word = 0
+    for line in Path(path).read_text().splitlines():
+        for token in line.split("//", 1)[0].split():
+            if token.startswith("@"):
+                word = int(token[1:], 16)
+                continue
+            addresses.append(word)
+            values.append(token.replace("_", ""))
+            word += 1
+    size = mem_words if mem_words is not None else (max(addresses) + 1 if addresses else 0)
+    memory = np.zeros(size, dtype=np.uint64)
+    if addresses:
+        if max(addresses) >= size:
+            raise ValueError(f"{path} sets word {max(addresses)}, past the {size}-word memory")
+        memory[np.asarray(addresses)] = [_hex_word(value) for value in values]
+    return memory
+
+
+class SimMemory(BaseModel):
+    """The load/dump image pair of one bulk-backdoor sim run."""
+
+    model_config = ConfigDict(frozen=True)
+
+    load_path: Path
+    dump_path: Path
+    mem_words: int
+
+    @property
+    def plusargs(self) -> list[str]:
+        """The plusargs naming the images, for the runner's ``test``."""
+        return [f"+dau_mem_load={self.load_path}", f"+dau_mem_dump={self.dump_path}"]
+
+    def preload(self, image: np.ndarray | Mapping[int, np.ndarray]) -> None:
+        """Stage the image the RAM loads at time zero; call before the sim
+        starts."""
+        write_memh(self.load_path, image)
+
+    async def load(self, dut, image: np.ndarray | Mapping[int, np.ndarray]) -> None:
+        """Load ``image`` into the running sim's RAM in one clock."""
+        from cocotb.triggers import RisingEdge
+
+        write_memh(self.load_path, image)
+        dut.bd_load.value = 1
+        await RisingEdge(dut.clk)
+        dut.bd_load.value = 0
+        await RisingEdge(dut.clk)
+
+    async def dump(self, dut) -> np.ndarray:
+        """The running sim's whole RAM, read back in one clock."""
+        from cocotb.triggers import RisingEdge
+
+        dut.bd_dump.value = 1
+        await RisingEdge(dut.clk)
+        dut.bd_dump.value = 0
+        await RisingEdge(dut.clk)
+        return read_memh(self.dump_path, mem_words=self.mem_words)
@@ -57,10 +57,7 @@ def resolve_profile(name: str, profile_manifests: Iterable[Path] = ()) -> Verila
     """The single profile resolution chain: dau-sim's registered profiles
     first, then manifest-registered ones. Every dau-build simulate entrypoint
     resolves through here so a profile name means the same thing everywhere."""
-    from dau_sim.integrations.verilator_profiles import (
-        available_verilator_profiles as registered_names,
-        resolve_verilator_profile as resolve_registered,
-    )
+    from dau_sim.integrations.verilator_profiles import resolve_verilator_profile as resolve_registered
 
     try:
         return resolve_registered(name)
@@ -69,10 +66,19 @@ def resolve_profile(name: str, profile_manifests: Iterable[Path] = ()) -> Verila
     try:
         return resolve_verilator_profile(name, profile_manifests=profile_manifests)
     except SimulationProfileError:
-        known = ", ".join(sorted({*registered_names(), *available_verilator_profiles(profile_manifests)}))
+        known = ", ".join(available_profiles(profile_manifests))
         raise SimulationProfileError(f"unknown DAU Verilator profile {name!r}; expected one of: {known}") from None
 
 
+def available_profiles(profile_manifests: Iterable[Path] = ()) -> tuple[str, ...]:
+    """Every name ``resolve_profile`` answers for: dau-sim's registered
+    profiles and the manifest-registered ones, sorted. What ``profiles=all``
+    expands to."""
+    from dau_sim.integrations.verilator_profiles import available_verilator_profiles as registered_names
+
+    return tuple(sorted({*registered_names(), *available_verilator_profiles(profile_manifests)}))
+
+
 def load_verilator_profiles_from_manifest(manifest_path: Path) -> dict[str, VerilatorProfile]:
     try:
         manifest = load_artifact_manifest(manifest_path, validate_paths=False)
@@ -59,6 +59,7 @@ __all__ = (
     "Design",
     "Dimensions",
     "GenerateBlock",
+    "HierarchyCycleError",
     "Inout",
     "Input",
     "Interface",
@@ -144,6 +145,10 @@ def _translate_ternaries(text: str) -> str:
     return "".join(parts)
 
 
+class HierarchyCycleError(ValueError):
+    pass
+
+
 class Size(BaseModel):
     width: int
 
@@ -305,6 +310,8 @@ class Link(_Base):
     # for positional links
     connection: str = Field(default="")
     position: int = Field(default=-1)
+    # for named links, the submodule port: .port(connection)
+    port: str = Field(default="")
 
     # for modport links
     modport: Modport | None = Field(default=None)
@@ -323,6 +330,7 @@ class Module(_Base):
     inputs: list[Input] = Field(default_factory=list)
     outputs: list[Output] = Field(default_factory=list)
     inouts: list[Inout] = Field(default_factory=list)
+    port_order: list[str] = Field(default_factory=list, description="Port names in header order, for positional links")
 
     modports: list[Modport] = Field(default_factory=list, description="Modport inputs/outputs")
     modules: list[Module] = Field(default_factory=list, description="Sub module instantiations")
@@ -342,6 +350,15 @@ class Module(_Base):
 
     source_path: Path | None = Field(default=None, description="Path to source SV file")
 
+    def ports(self) -> list[Port]:
+        """Inputs, outputs and inouts in header order (where the parse
+        recorded it), the order positional links connect them in."""
+        ports = [*self.inputs, *self.outputs, *self.inouts]
+        if not self.port_order:
+            return ports
+        by_name = {port.name: port for port in ports}
+        return [by_name[name] for name in self.port_order if name in by_name]
+
     def instance(self) -> Instance:
         """Return an Amaranth `Instance` type correctly specified for the underlying systemverilog code
 
@@ -432,11 +449,25 @@ class Module(_Base):
     def __repr__(self):
         return self.__str__()
 
-    def resolve(self, root: Path = Path(".")) -> Module:
-        for i, module in enumerate(self.modules):
-            self.modules[i] = Module.from_module(module.name, root=root).resolve(root=root)
+    def resolve(self, root: Path = Path("."), *, definitions: dict[str, Module] | None = None) -> Module:
+        """Replace each submodule instantiation with a view of its parsed
+        definition (``<name>.sv`` under ``root``), recursively.
+
+        Each definition is parsed and resolved once per ``definitions`` cache
+        (one per call unless shared), however many instances of it the
+        hierarchy holds; every instance is a shallow view of that one
+        definition carrying its own instance name and links. A module that
+        instantiates itself, directly or further down, raises
+        ``HierarchyCycleError``."""
+        _resolve_hierarchy(self, lambda name: Module.from_module(name, root=root), {} if definitions is None else definitions, (self.name,))
         return self
 
+    def instance_view(self, instance: Module) -> Module:
+        """This definition as ``instance``: a shallow copy that shares the
+        definition's ports, parameters and submodules and carries the
+        instance's name and links."""
+        return self.model_copy(update={"instance_name": instance.instance_name, "links": instance.links})
+
     @model_validator(mode="after")
     def _parse_structure(self) -> Self:
         # Skip parsing if not parseable
@@ -559,6 +590,7 @@ class Module(_Base):
                             keyword = port.header.dataType.keyword.valueText
                         declarator = port.declarator.name.value
                         dimensions = self._parse_dimensions(port.header.dataType)
+                        self.port_order.append(declarator)
                         if direction == "input":
                             self.inputs.append(
                                 Input(
@@ -611,13 +643,14 @@ class Module(_Base):
 
         for i, connection in enumerate(member.instances[0].connections):
             if isinstance(connection, (OrderedPortConnectionSyntax, NamedPortConnectionSyntax)):
+                port = connection.name.valueText if isinstance(connection, NamedPortConnectionSyntax) else ""
                 if isinstance(connection.expr[0][0], ScopedNameSyntax):
                     val = connection.expr[0][0].__str__().strip()
-                    link = Link(name=val, connection=val, position=i)
+                    link = Link(name=val, connection=val, position=i, port=port)
                     mod.links.append(link)
                 elif isinstance(connection.expr[0][0], IdentifierNameSyntax):
                     val = connection.expr[0][0].identifier.value
-                    link = Link(name=val, connection=val, position=i)
+                    link = Link(name=val, connection=val, position=i, port=port)
                     mod.links.append(link)
                 else:
                     # TODO
@@ -744,7 +777,8 @@ class Module(_Base):
                             val = connection.expr[0][0].identifier.value
                         else:
                             val = str(connection.expr[0][0]).strip()
-                        link = Link(name=val, connection=val, position=i)
+                        port = connection.name.valueText if isinstance(connection, NamedPortConnectionSyntax) else ""
+                        link = Link(name=val, connection=val, position=i, port=port)
                         mod.links.append(link)
                     except Exception:  # noqa: BLE001, S110  # skip connections whose expr shape we can't read
                         pass
@@ -853,15 +887,16 @@ class Design(BaseModel):
         return design
 
     def resolve(self) -> Design:
-        """Resolve all submodule references within the design."""
-        for mod in self.modules.values():
-            for i, sub in enumerate(mod.modules):
-                if sub.name in self.modules:
-                    resolved = self.modules[sub.name]
-                    resolved_copy = resolved.model_copy()
-                    resolved_copy.instance_name = sub.instance_name
-                    resolved_copy.links = sub.links
-                    mod.modules[i] = resolved_copy
+        """Resolve all submodule references within the design: each
+        instantiation of a module the design holds becomes a view of that
+        one definition (``Module.instance_view``); instantiations of modules
+        outside the design are left as parsed. A hierarchy cycle raises
+        ``HierarchyCycleError``."""
+        definitions: dict[str, Module] = {}
+        for name, mod in self.modules.items():
+            if name not in definitions:
+                _resolve_hierarchy(mod, self.modules.get, definitions, (name,))
+                definitions[name] = mod
         return self
 
     def generate_top_sv(
@@ -1183,6 +1218,23 @@ class Design(BaseModel):
         return "\n".join(parts)
 
 
+def _resolve_hierarchy(module: Module, load, definitions: dict[str, Module], path: tuple[str, ...]) -> None:
+    """Resolve ``module``'s instantiations in place against ``definitions``,
+    filling it from ``load`` (None: leave the instantiation as parsed).
+    ``path`` is the chain of definitions being resolved, for cycles."""
+    for index, instance in enumerate(module.modules):
+        if instance.name in path:
+            raise HierarchyCycleError("module hierarchy cycle: " + " -> ".join((*path[path.index(instance.name) :], instance.name)))
+        definition = definitions.get(instance.name)
+        if definition is None:
+            definition = load(instance.name)
+            if definition is None:
+                continue
+            _resolve_hierarchy(definition, load, definitions, (*path, instance.name))
+            definitions[instance.name] = definition
+        module.modules[index] = definition.instance_view(instance)
+
+
 _DAU_STREAM_INPUT_CONNECTIONS = {
     "input_valid": "stream_input_valid",
     "input_data": "stream_input_data",
@@ -1,9 +1,10 @@
 `default_nettype none
 
 // Test-only behavioral double of the dau-core AXI burst reader: same
-// module name, parameters, and ports. Fetches one 64-bit word per AXI
-// read burst (arlen = 0) and streams it out — slow but sufficient to
-// bench generated scan-composition harness wiring.
+// module name, parameters, and ports. Fetches the window in AXI read
+// bursts of up to BURST_BEATS 64-bit words and streams each word out
+// through a one-word holding register, so a burst's beats flow at the
+// stream's own pace and only the next burst's address costs a gap.
 module dau_axi_burst_reader #(
     parameter int unsigned ADDR_WIDTH = 32,
     parameter int unsigned BURST_BEATS = 16,
@@ -45,21 +46,25 @@ module dau_axi_burst_reader #(
     localparam logic [1:0] S_IDLE = 2'd0;
     localparam logic [1:0] S_ADDR = 2'd1;
     localparam logic [1:0] S_DATA = 2'd2;
-    localparam logic [1:0] S_EMIT = 2'd3;
 
     logic [1:0] state;
     logic [ADDR_WIDTH-1:0] beat_address;
     logic [31:0] words_left;
+    logic [31:0] request_left;
+    logic [31:0] burst_words;
     logic [63:0] beat;
+    logic beat_valid;
+
+    assign burst_words = (request_left > BURST_BEATS) ? BURST_BEATS : request_left;
 
     assign m_axi_araddr = beat_address;
-    assign m_axi_arlen = 8'd0;
+    assign m_axi_arlen = 8'(burst_words - 32'd1);
     assign m_axi_arsize = 3'd3;
     assign m_axi_arburst = 2'b01;
     assign m_axi_arvalid = (state == S_ADDR);
-    assign m_axi_rready = (state == S_DATA);
+    assign m_axi_rready = (state == S_DATA) && (!beat_valid || stream_ready);
 
-    assign stream_valid = (state == S_EMIT);
+    assign stream_valid = beat_valid;
     assign stream_data = beat;
     assign stream_last = (words_left == 32'd1);
 
@@ -75,7 +80,17 @@ module dau_axi_burst_reader #(
             done <= 1'b0;
             error <= 1'b0;
             error_code <= 8'd0;
+            beat_valid <= 1'b0;
         end else begin
+            if (stream_valid && stream_ready) begin
+                beat_valid <= 1'b0;
+                words_left <= words_left - 32'd1;
+                if (words_left == 32'd1) begin
+                    done <= 1'b1;
+                    busy <= 1'b0;
+                    state <= S_IDLE;
+                end
+            end
             case (state)
                 S_IDLE: begin
                     if (start) begin
@@ -85,38 +100,32 @@ module dau_axi_burst_reader #(
                         error_code <= 8'd0;
                         beat_address <= read_address;
                         words_left <= read_length_bytes >> 3;
+                        request_left <= read_length_bytes >> 3;
                         state <= S_ADDR;
                     end
                 end
                 S_ADDR: begin
                     if (m_axi_arready) begin
+                        beat_address <= beat_address + (burst_words << 3);
+                        request_left <= request_left - burst_words;
                         state <= S_DATA;
                     end
                 end
                 S_DATA: begin
-                    if (m_axi_rvalid) begin
+                    if (m_axi_rvalid && m_axi_rready) begin
                         if (m_axi_rresp != 2'b00) begin
                             error <= 1'b1;
                             error_code <= 8'h02;
                             done <= 1'b1;
                             busy <= 1'b0;
+                            beat_valid <= 1'b0;
                             state <= S_IDLE;
                         end else begin
                             beat <= m_axi_rdata;
-                            state <= S_EMIT;
-                        end
-                    end
-                end
-                S_EMIT: begin
-                    if (stream_ready) begin
-                        beat_address <= beat_address + 8;
-                        words_left <= words_left - 32'd1;
-                        if (words_left == 32'd1) begin
-                            done <= 1'b1;
-                            busy <= 1'b0;
-                            state <= S_IDLE;
-                        end else begin
-                            state <= S_ADDR;
+                            beat_valid <= 1'b1;
+                            if (m_axi_rlast && request_left != 32'd0) begin
+                                state <= S_ADDR;
+                            end
                         end
                     end
                 end
@@ -3,8 +3,9 @@
 // Test-only behavioral double of the dau-core backdoor AXI RAM: same
 // module name, parameters, and ports so generated scan-composition sim
 // harnesses can be benched inside dau-build without shipping dau-core
-// HDL. Single outstanding read burst and write burst; READ_LATENCY is
-// accepted for signature parity only.
+// HDL. Single outstanding read burst and write burst; each read burst
+// waits READ_LATENCY cycles after its address before the first beat, then
+// streams back-to-back.
 module dau_axi_ram_sim #(
     parameter int unsigned ADDR_WIDTH = 32,
     parameter int unsigned MEM_WORDS = 65536,
@@ -51,6 +52,7 @@ module dau_axi_ram_sim #(
     logic [WORD_BITS-1:0] read_word;
     logic [8:0]           read_left;
     logic                 read_busy;
+    logic [31:0]          read_wait;
 
     assign s_axi_arready = !read_busy;
     assign s_axi_rresp = 2'b00;
@@ -67,7 +69,10 @@ module dau_axi_ram_sim #(
                     read_busy <= 1'b0;
                 end
             end
-            if (read_busy && read_left != 9'd0 && (!s_axi_rvalid || (s_axi_rready && !s_axi_rlast))) begin
+            if (read_busy && read_wait != 32'd0) begin
+                read_wait <= read_wait - 32'd1;
+            end
+            if (read_busy && read_wait == 32'd0 && read_left != 9'd0 && (!s_axi_rvalid || (s_axi_rready && !s_axi_rlast))) begin
                 s_axi_rdata <= mem[read_word];
                 s_axi_rvalid <= 1'b1;
                 s_axi_rlast <= (read_left == 9'd1);
@@ -78,6 +83,7 @@ module dau_axi_ram_sim #(
                 read_busy <= 1'b1;
                 read_word <= s_axi_araddr[WORD_BITS+2:3];
                 read_left <= {1'b0, s_axi_arlen} + 9'd1;
+                read_wait <= READ_LATENCY;
             end
         end
     end
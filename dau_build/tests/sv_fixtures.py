@@ -0,0 +1,30 @@
+"""Synthetic SystemVerilog hierarchies for the resolution and elaboration
+tests and benchmarks."""
+
+from pathlib import Path
+
+
+def layer_module(level: int, index: int) -> str:
+    return f"layer{level}_{index}"
+
+
+def write_layered_hierarchy(root: Path, *, depth: int, width: int) -> Path:
+    """``depth`` layers of ``width`` modules, each instantiating every module
+    of the layer below (a stack of diamonds: the number of root-to-leaf
+    paths is ``width ** (depth - 1)``), under a ``top`` that instantiates the
+    first layer. Returns the directory of ``<module>.sv`` files."""
+    root.mkdir(parents=True, exist_ok=True)
+    for level in range(depth):
+        for index in range(width):
+            body = [f"module {layer_module(level, index)} (input logic clk, input logic [7:0] d, output logic [7:0] q);"]
+            if level + 1 < depth:
+                body.extend(f"  {layer_module(level + 1, child)} u{child} (clk, d, q);" for child in range(width))
+            else:
+                body.append("  assign q = d;")
+            body.append("endmodule")
+            (root / f"{layer_module(level, index)}.sv").write_text("\n".join(body) + "\n")
+    top = ["module top (input logic clk, input logic [7:0] d, output logic [7:0] q);"]
+    top.extend(f"  {layer_module(0, child)} u{child} (clk, d, q);" for child in range(width))
+    top.append("endmodule")
+    (root / "top.sv").write_text("\n".join(top) + "\n")
+    return root
@@ -70,3 +70,85 @@ def test_artifact_bundle_rejects_missing_hdl_sources_when_required(tmp_path: Pat
 
     assert "does not provide HDL source artifacts" in str(exc_info.value)
     assert manifest_path.as_posix() in str(exc_info.value)
+
+
+def test_artifact_bundle_lookups_come_from_its_index(tmp_path: Path, monkeypatch) -> None:
+    from artlink import Artifact, Capability
+
+    from dau_build import artifact_bundle
+    from dau_build.artifact_bundle import ArtifactBundle, ArtifactBundleEntry, source_language_from_path
+
+    def entry(name: str, *, kind: str = "source", role: str = "hdl-source", module: str | None = None) -> ArtifactBundleEntry:
+        provides = (Capability(kind="hdl-module", name=module),) if module else ()
+        language = source_language_from_path(Path(name))
+        return ArtifactBundleEntry(
+            artifact=Artifact(path=tmp_path / name, kind=kind, role=role, language=language, provides=provides), origin="direct"
+        )
+
+    entries = (
+        entry("lane.sv", module="lane"),
+        entry("top.sv", role="generated-top", module="top"),
+        entry("timing.rpt", kind="metadata", role="report"),
+        entry("model.py", role="python-source"),
+    )
+    bundle = ArtifactBundle(name="indexed", entries=entries)
+    # the index is built once: lookups never rescan (or re-read) the entries
+    monkeypatch.setattr(artifact_bundle, "artifact_modules", lambda artifact: pytest.fail("lookup rescanned the entries"))
+    assert bundle.entries_for_kind("source") == (entries[0], entries[1], entries[3])
+    assert bundle.entries_for_role("generated-top") == (entries[1],)
+    assert bundle.entries_for_language("systemverilog") == (entries[0], entries[1])
+    assert bundle.entries_for_language("python") == (entries[3],)
+    assert bundle.entries_for_path(tmp_path / "timing.rpt") == (entries[2],)
+    assert bundle.module_providers("lane") == (entries[0],) and bundle.module_providers("missing") == ()
+    assert bundle.hdl_source_entries() == (entries[0], entries[1])
+    assert bundle.entries_for_kind("binary") == ()
+    monkeypatch.undo()
+
+    # a validated assignment re-indexes, and duplicates surface from the index
+    bundle.entries = (*entries, entry("lane_copy.sv", module="lane"))
+    assert len(bundle.module_providers("lane")) == 2
+    with pytest.raises(ArtifactBundleError, match="module lane is provided by multiple artifacts"):
+        bundle.validate()
+    assert ArtifactBundle(name="indexed", entries=entries) == ArtifactBundle(name="indexed", entries=entries)
+
+
+def test_artifact_bundle_loads_manifests_concurrently_in_order_and_parses_each_content_once(tmp_path: Path, monkeypatch) -> None:
+    from dau_build import packaging
+
+    manifests = []
+    for index in range(12):
+        package = tmp_path / f"core_{index}"
+        (package / "rtl").mkdir(parents=True)
+        (package / "rtl" / f"core_{index}.sv").write_text(f"module core_{index}; endmodule\n", encoding="utf-8")
+        manifest_path = package / "package.artifacts.yaml"
+        manifest_path.write_text(
+            f"schema: artlink.manifest/v0\nname: core-{index}\nartifacts:\n  - path: rtl/core_{index}.sv\n    kind: source\n    role: hdl-source\n"
+            f"    language: systemverilog\n    provides:\n      - kind: hdl-module\n        name: core_{index}\n",
+            encoding="utf-8",
+        )
+        manifests.append(manifest_path)
+
+    parsed: list[str] = []
+    from_mapping = packaging.artifact_manifest_from_mapping
+
+    def counting_from_mapping(raw):
+        parsed.append(raw["name"])
+        return from_mapping(raw)
+
+    monkeypatch.setattr(packaging, "artifact_manifest_from_mapping", counting_from_mapping)
+    monkeypatch.setattr(packaging, "_validated_manifests", type(packaging._validated_manifests)())
+    bundle = load_artifact_bundle(tuple(manifests), max_workers=4)
+    assert [entry.artifact.path.name for entry in bundle.entries] == [f"core_{index}.sv" for index in range(12)]
+    assert bundle.manifest_paths == tuple(path.resolve() for path in manifests)
+    assert sorted(parsed) == sorted(f"core-{index}" for index in range(12))
+
+    # unchanged content is served validated; the path checks still run
+    parsed.clear()
+    assert load_artifact_bundle(tuple(manifests), max_workers=4) == bundle
+    assert parsed == []
+    manifests[3].write_text(manifests[3].read_text(encoding="utf-8").replace("name: core-3\n", "name: core-3-edited\n"), encoding="utf-8")
+    (manifests[7].parent / "rtl" / "core_7.sv").unlink()
+    (manifests[9].parent / "rtl" / "core_9.sv").unlink()
+    with pytest.raises(ArtifactBundleError, match=r"core_7/package\.artifacts\.yaml: missing artifact file\(s\): .*core_7\.sv$"):
+        load_artifact_bundle(tuple(manifests), max_workers=4)
+    assert parsed == ["core-3-edited"]
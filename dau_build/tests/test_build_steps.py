@@ -37,15 +37,18 @@ def test_build_step_and_task_dispatch_uses_ccflow_callable_models() -> None:
         "tasks/build/build-vivado-artifacts",
         "tasks/build/overlay-build",
         "tasks/build/render-cores",
+        "tasks/build/sweep-shell-implementation",
         "tasks/build/synthesize",
         "tasks/build/synthesize-cores",
         "tasks/flash/flash",
         "tasks/flash/smoke-test",
         "tasks/hardware/hardware-plan",
+        "tasks/hardware/plan-timeline-summary",
         "tasks/sim/simulate",
         "tasks/spec/build",
         "tasks/spec/inspect",
         "tasks/spec/validate",
+        "tasks/spec/watch",
         "tasks/stage/stage-shell",
         "tasks/stage/stage-vivado-overlay",
         "tasks/stage/stage-vivado-project",
@@ -322,11 +322,13 @@ def test_execute_override_task_accepts_stage_vivado_overlay_surface() -> None:
 
     lines = result.message.splitlines()
     assert result.step == "stage-vivado-overlay"
-    assert len(lines) == 4
+    assert len(lines) == 5
     assert lines[0].startswith("write-dau-overlay\tsh -c ")
     assert lines[1].startswith("write-dau-manifest\tsh -c ")
     assert lines[2].startswith("write-vivado-build-script\tsh -c ")
     assert lines[3].startswith("write-vivado-command-plan\tsh -c ")
+    # with no shell to stage first, every write is independent
+    assert lines[4] == "critical-path\tsteps=1 of 4: write-dau-overlay"
 
 
 def test_execute_override_task_accepts_stage_vivado_project_surface() -> None:
@@ -344,12 +346,13 @@ def test_execute_override_task_accepts_stage_vivado_project_surface() -> None:
 
     lines = result.message.splitlines()
     assert result.step == "stage-vivado-project"
-    assert len(lines) == 6
+    assert len(lines) == 7
     assert lines[0].startswith("stage-shell\tsh -c ")
     assert lines[1].startswith("write-vivado-project-manifest\tsh -c ")
     assert "dau-ci.project" in lines[1]
     assert lines[2].startswith("write-dau-overlay\tsh -c ")
     assert lines[5].startswith("write-vivado-command-plan\tsh -c ")
+    assert lines[6] == "critical-path\tsteps=2 of 6: stage-shell -> write-vivado-project-manifest"
 
 
 def test_execute_override_task_accepts_build_vivado_artifacts_surface() -> None:
@@ -680,6 +683,42 @@ def test_host_group_supplies_checkout_roots(tmp_path: Path) -> None:
         bare.stage_steps()
 
 
+def test_host_and_platform_groups_size_and_steer_the_vivado_runs(tmp_path: Path) -> None:
+    import base64
+    import shlex
+
+    from hydra.utils import instantiate
+
+    from dau_build.config import compose_config
+    from dau_build.hardware_plan import HardwareToolchainConfig
+
+    overlay = tmp_path / "user-configs"
+    (overlay / "host" / "hosts").mkdir(parents=True)
+    (overlay / "host" / "hosts" / "bench.yaml").write_text(
+        "# @package host\n"
+        "_target_: dau_build.build_config.HostConfig\n"
+        "name: bench\n"
+        "dau_core_root: /repo/dau-core\n"
+        "vivado_synth_jobs: 16\n"
+        "vivado_impl_jobs: 4\n"
+    )
+    plan_cfg = compose_config(
+        ["plan=plans/local-build-and-program", "host=hosts/bench", "platform=platforms/example/probe", "+platform.impl_strategy=Performance_Explore"],
+        config_dir=str(overlay),
+    )
+    plan = instantiate(plan_cfg.cfg.plan)
+    assert (plan.synth_jobs, plan.impl_jobs, plan.synth_strategy, plan.impl_strategy) == (16, 4, None, "Performance_Explore")
+
+    steps = plan.compose(HardwareToolchainConfig.for_platform(instantiate(plan_cfg.cfg.platform), work_root=Path("/repo/outputs/vivado")))
+    (write,) = (step for step in steps if step.name == "write-vivado-build-script")
+    payload = shlex.split(write.argv[2])[shlex.split(write.argv[2]).index("printf") + 2]
+    build_tcl = base64.b64decode(payload).decode()
+    assert "launch_runs synth_1 -jobs 16\n" in build_tcl
+    assert "launch_runs impl_1 -jobs 4 -to_step write_bitstream" in build_tcl
+    assert "set_property strategy {Performance_Explore} [get_runs impl_1]" in build_tcl
+    assert "[get_runs synth_1]" not in build_tcl.split("reset_run synth_1")[0]
+
+
 def test_hardware_plan_task_refuses_execution_without_host_access() -> None:
     from dau_build.build_steps import HardwarePlanTask
     from dau_build.hardware_plan import RecoveryPlan
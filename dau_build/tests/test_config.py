@@ -122,14 +122,17 @@ def _task_overrides(name: str, tmp_path: Path) -> tuple[str, ...]:
     base = {
         "build-shell-project": (f"model.output_root={tmp_path / 'shell'}",),
         "build-vivado-artifacts": (f"model.work_root={tmp_path / 'work'}",),
+        "sweep-shell-implementation": (f"model.output_root={tmp_path / 'shell'}",),
         "flash": (),
         "hardware-plan": ("model.plan=thunderbolt-release", f"model.work_root={tmp_path / 'work'}"),
         "overlay-build": (f"model.work_root={tmp_path / 'work'}",),
+        "plan-timeline-summary": (f"model.timelines=[{tmp_path / 'timeline.jsonl'}]",),
         "simulate": ("model.spec_path=placeholder.yaml", "model.module=dau_identity_top"),
         "smoke-test": ("model.test=identity",),
         "inspect": (),
         "build": (f"model.output_root={tmp_path / 'artifacts'}",),
         "validate": (),
+        "watch": (f"model.output_root={tmp_path / 'watch'}",),
         "stage-shell": (f"model.work_root={tmp_path / 'work'}", f"model.source_shell_root={tmp_path / 'shell'}"),
         "stage-vivado-overlay": (f"model.work_root={tmp_path / 'work'}", f"model.dau_core_root={tmp_path / 'dau-core'}"),
         "stage-vivado-project": (
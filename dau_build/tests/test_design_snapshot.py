@@ -0,0 +1,68 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from dau_build.design_snapshot import DesignSnapshotError, design_snapshot_bytes, load_design_snapshot, write_design_snapshot
+from dau_build.svparser import Design, Interface
+
+_SV_DIR = (Path(__file__).parent / ".." / "sv").resolve()
+
+
+def _surface(design: Design) -> dict:
+    return {
+        name: (
+            type(module).__name__,
+            module.source_path,
+            [(parameter.name, parameter.value) for parameter in module.parameters],
+            [(type(port).__name__, port.name, port.keyword, port.dimensions.dimensions, port.dimensions.resolved) for port in module.ports()],
+            [(sub.name, sub.instance_name, [(link.name, link.connection, link.position, link.port) for link in sub.links]) for sub in module.modules],
+        )
+        for name, module in design.modules.items()
+    }
+
+
+def test_a_snapshot_carries_the_design_surface_without_nodes(tmp_path: Path) -> None:
+    design = Design.from_directory(_SV_DIR)
+    path = write_design_snapshot(design, tmp_path / "design.snapshot")
+    with load_design_snapshot(path) as snapshot:
+        assert snapshot.module_names == tuple(design.modules)
+        restored = snapshot.to_design()
+        # every name (clk, a keyword, a module name) is stored once, however
+        # many ports and links repeat it
+        assert snapshot._strings.count("clk") == 1 and len(set(snapshot._strings)) == len(snapshot._strings)
+        assert [port.name for port in snapshot.ports("ff")] == design.modules["ff"].port_order
+        with pytest.raises(DesignSnapshotError, match="has no module missing"):
+            snapshot.ports("missing")
+    assert _surface(restored) == _surface(design)
+    assert isinstance(restored.modules["cam_ifc"], Interface)
+    assert all(module.node is None for module in restored.modules.values())
+    assert len(design_snapshot_bytes(design)) == path.stat().st_size
+
+
+def test_another_process_maps_the_snapshot_instead_of_reparsing(tmp_path: Path) -> None:
+    design = Design.from_directory(_SV_DIR)
+    path = write_design_snapshot(design, tmp_path / "design.snapshot")
+    script = (
+        "import sys\n"
+        "from dau_build.design_snapshot import load_design_snapshot\n"
+        "with load_design_snapshot(sys.argv[1]) as snapshot:\n"
+        "    cam = snapshot.module('cam')\n"
+        "    print(len(snapshot.module_names), len(cam.inputs), len(cam.modules))\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script, str(path)], capture_output=True, text=True, check=True)
+    cam = design.modules["cam"]
+    assert completed.stdout.split() == [str(len(design.modules)), str(len(cam.inputs)), str(len(cam.modules))]
+
+
+def test_other_files_are_refused(tmp_path: Path) -> None:
+    (tmp_path / "empty").write_bytes(b"")
+    (tmp_path / "other").write_bytes(b"not a snapshot at all, but long enough for a header" * 2)
+    for name in ("empty", "other"):
+        with pytest.raises(DesignSnapshotError, match="not a design snapshot"):
+            load_design_snapshot(tmp_path / name)
+    data = design_snapshot_bytes(Design.from_directory(_SV_DIR))
+    (tmp_path / "truncated").write_bytes(data[: len(data) // 2])
+    with pytest.raises(DesignSnapshotError, match="truncated design snapshot"):
+        load_design_snapshot(tmp_path / "truncated")
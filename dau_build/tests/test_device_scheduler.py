@@ -0,0 +1,80 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from dau_build.device_scheduler import DeviceLockTimeout, acquire_device, read_device_lock_holder, try_lock_device
+from dau_build.hardware_plan import ToolStep, device_lock_path, execute_plan_on_free_device, execute_plan_steps
+
+
+@pytest.fixture(autouse=True)
+def _private_runtime_dir(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "runtime"))
+
+
+def test_try_lock_does_not_wait_and_names_its_holder() -> None:
+    lock = device_lock_path("0000:01:00.0")
+    lease = try_lock_device(lock, plan="sram-program")
+    assert lease is not None
+    assert try_lock_device(lock) is None
+    holder = read_device_lock_holder(lock)
+    assert (holder.pid, holder.plan) == (os.getpid(), "sram-program")
+    lease.release()
+    assert read_device_lock_holder(lock) is None
+    with try_lock_device(lock) as again:
+        assert again is not None
+
+
+def test_waiters_are_served_in_arrival_order() -> None:
+    lock = device_lock_path("0000:01:00.0")
+    order: list[str] = []
+
+    def wait(name: str) -> None:
+        with acquire_device((lock,), plan=name, poll_interval=0.01):
+            order.append(name)
+            time.sleep(0.05)
+
+    holder = try_lock_device(lock)
+    waiters = []
+    for name in ("first", "second", "third"):
+        waiters.append(threading.Thread(target=wait, args=(name,)))
+        waiters[-1].start()
+        time.sleep(0.1)  # each has queued before the next arrives
+    holder.release()
+    for waiter in waiters:
+        waiter.join()
+    assert order == ["first", "second", "third"]
+    assert not list((lock.parent / "queue").iterdir()), "served tickets leave the queue"
+
+
+def test_a_wait_times_out_naming_the_holder_and_skips_dead_tickets() -> None:
+    lock = device_lock_path("0000:01:00.0")
+    # a ticket left by a waiter that died: nothing holds it, so it is swept
+    # rather than blocking the queue forever
+    queue = lock.parent / "queue"
+    queue.mkdir(parents=True)
+    (queue / f"{0:020d}-1-1.ticket").write_text(f'{{"locks": ["{lock}"]}}')
+    with try_lock_device(lock, plan="flash"), pytest.raises(DeviceLockTimeout, match=rf"held by pid {os.getpid()} .*\(plan flash\)"):
+        acquire_device((lock,), timeout=0.2, poll_interval=0.01)
+    assert not list(queue.iterdir())
+    with acquire_device((lock,), timeout=1.0) as lease:
+        assert lease.wait_s < 1.0
+
+
+def test_a_run_goes_to_whichever_matching_board_is_free(tmp_path: Path, capsys) -> None:
+    runs = {bdf: (ToolStep("program", ("sh", "-c", f"echo {bdf} > {tmp_path / 'programmed'}")),) for bdf in ("0000:01:00.0", "0000:02:00.0")}
+    with try_lock_device(device_lock_path("0000:01:00.0"), plan="other-run"):
+        dispatch = execute_plan_on_free_device(runs, plan="sram-program")
+    assert dispatch.endpoint_bdf == "0000:02:00.0" and dispatch.returncode == 0
+    assert (tmp_path / "programmed").read_text().strip() == "0000:02:00.0"
+
+    # one board, busy: the run says who it waits on, then reports the wait
+    lock = device_lock_path("0000:01:00.0")
+    holder = try_lock_device(lock, plan="other-run")
+    threading.Timer(0.6, holder.release).start()
+    assert execute_plan_steps(runs["0000:01:00.0"], endpoint_bdf="0000:01:00.0", plan="sram-program") == 0
+    out = capsys.readouterr().out
+    assert f"dau-build-device-lock\tlock={lock.name} holder_pid={os.getpid()} holder_plan=other-run" in out
+    assert "dau-build-device-lock\tendpoint=0000:01:00.0 wait_s=" in out
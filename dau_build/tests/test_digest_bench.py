@@ -0,0 +1,74 @@
+"""Digest throughput over bitstream-sized artifacts: the whole-file
+``hashlib.sha256(path.read_bytes())`` the manifests used to take, against
+the streamed, thread-pooled ``digest_files``.
+
+The pytest wrapper runs a small smoke set by default and only checks that
+both ways agree. The environment widens it:
+
+- ``DAU_BUILD_DIGEST_BENCH=full``: a shell build's worth of realistic images
+  (a 7-series bitstream, its flash images, an UltraScale+ bitstream and a
+  spread of generated inputs) -- several hundred MB written to the tmp dir;
+- ``DAU_BUILD_DIGEST_RESULTS=<path>``: where the JSON timings land.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from dau_build.digests import digest_files
+
+_MIB = 1 << 20
+# (name, size): the artifact mix of one shell build
+_SMOKE_SET = (("dau_mm_job.bit", 4 * _MIB), ("dau_mm_job.bin", 4 * _MIB), *((f"input-{index}.tcl", 64 << 10) for index in range(8)))
+_FULL_SET = (
+    ("dau_mm_job.bit", 11 * _MIB),
+    ("dau_mm_job_spi.bit", 11 * _MIB),
+    ("dau_mm_job.mcs", 32 * _MIB),
+    ("dau_mm_job.bin", 16 * _MIB),
+    ("vu9p_shell.bit", 230 * _MIB),
+    ("vu9p_shell.bin", 230 * _MIB),
+    *((f"input-{index}.sv", 256 << 10) for index in range(64)),
+)
+
+
+def _write_images(root: Path, artifact_set) -> list[Path]:
+    paths = []
+    block = os.urandom(_MIB)
+    for name, size in artifact_set:
+        path = root / name
+        with path.open("wb") as handle:
+            remaining = size
+            while remaining:
+                handle.write(block[: min(remaining, _MIB)])
+                remaining -= min(remaining, _MIB)
+        paths.append(path)
+    return paths
+
+
+def test_digest_bench(tmp_path: Path) -> None:
+    artifact_set = _FULL_SET if os.environ.get("DAU_BUILD_DIGEST_BENCH") == "full" else _SMOKE_SET
+    paths = _write_images(tmp_path, artifact_set)
+
+    started = time.perf_counter()
+    whole_file = [hashlib.sha256(path.read_bytes()).hexdigest() for path in paths]
+    whole_file_s = time.perf_counter() - started
+    started = time.perf_counter()
+    streamed = [digest.value for digest in digest_files(paths)]
+    streamed_s = time.perf_counter() - started
+    assert streamed == whole_file
+
+    total_bytes = sum(size for _, size in artifact_set)
+    results = {
+        "files": len(paths),
+        "total_bytes": total_bytes,
+        "workers": os.cpu_count(),
+        "whole_file_s": whole_file_s,
+        "streamed_parallel_s": streamed_s,
+        "whole_file_mib_per_s": total_bytes / _MIB / whole_file_s,
+        "streamed_parallel_mib_per_s": total_bytes / _MIB / streamed_s,
+    }
+    destination = os.environ.get("DAU_BUILD_DIGEST_RESULTS")
+    if destination:
+        Path(destination).write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,90 @@
+import hashlib
+import os
+import tracemalloc
+from pathlib import Path
+
+from dau_build import digests
+from dau_build.digests import DIGEST_CHUNK_BYTES, DigestCache, default_digest_cache_path, digest_files, sha256_file
+
+
+def test_streamed_digests_match_whole_file_hashing(tmp_path: Path) -> None:
+    sizes = (0, 1, DIGEST_CHUNK_BYTES - 1, DIGEST_CHUNK_BYTES, 3 * DIGEST_CHUNK_BYTES + 17)
+    paths = []
+    for index, size in enumerate(sizes):
+        path = tmp_path / f"image-{index}.bit"
+        path.write_bytes(bytes((index * 7 + offset) & 0xFF for offset in range(size)))
+        paths.append(path)
+    expected = [hashlib.sha256(path.read_bytes()).hexdigest() for path in paths]
+    assert [sha256_file(path) for path in paths] == expected
+    assert [sha256_file(path, chunk_bytes=4096) for path in paths] == expected
+    # in order, a repeated path hashed once and reported twice
+    digests = digest_files([*paths, paths[0]], max_workers=3)
+    assert [digest.value for digest in digests] == [*expected, expected[0]]
+    assert {digest.algorithm for digest in digests} == {"sha256"}
+
+
+def test_digesting_holds_a_chunk_per_worker_not_the_file(tmp_path: Path) -> None:
+    images = []
+    for index in range(4):
+        image = tmp_path / f"image-{index}.bin"
+        with image.open("wb") as handle:
+            for _ in range(16):
+                handle.write(bytes([index]) * DIGEST_CHUNK_BYTES)
+        images.append(image)
+    tracemalloc.start()
+    try:
+        digest_files(images, max_workers=4)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # 64 MiB hashed; one buffer per worker plus bookkeeping
+    assert peak < 6 * DIGEST_CHUNK_BYTES
+
+
+def test_the_digest_cache_reads_only_files_whose_signature_changed(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    hashed: list[Path] = []
+
+    def counting_sha256_file(path: Path) -> str:
+        hashed.append(Path(path))
+        return sha256_file(path)
+
+    monkeypatch.setattr(digests, "_hash_files", lambda paths, max_workers: [counting_sha256_file(path) for path in paths])
+    sources = []
+    for name in ("top.sv", "fifo.sv", "build.tcl"):
+        source = tmp_path / name
+        source.write_text(f"// {name}\n")
+        os.utime(source, ns=(1_000_000_000, 1_000_000_000))  # long since written
+        sources.append(source)
+    expected = [hashlib.sha256(source.read_bytes()).hexdigest() for source in sources]
+
+    cache = DigestCache()
+    assert cache.path == default_digest_cache_path() == tmp_path / "cache" / "dau-build" / "digests.sqlite3"
+    assert [digest.value for digest in digest_files(sources, cache=cache)] == expected
+    assert len(hashed) == 3
+    hashed.clear()
+    assert [digest.value for digest in digest_files(sources, cache=cache)] == expected
+    assert hashed == [], "an unchanged signature is answered from the store"
+
+    # an edit moves the signature: that file alone is re-read
+    sources[1].write_text("// fifo.sv, deeper\n")
+    os.utime(sources[1], ns=(2_000_000_000, 2_000_000_000))
+    expected[1] = hashlib.sha256(sources[1].read_bytes()).hexdigest()
+    assert [digest.value for digest in digest_files(sources, cache=cache)] == expected
+    assert hashed == [sources[1]]
+
+    # same size, mtime put back: the signature cannot see it, verification can
+    sources[0].write_text("// top.sv\n".upper())
+    os.utime(sources[0], ns=(1_000_000_000, 1_000_000_000))
+    assert digest_files(sources[:1], cache=cache)[0].value == expected[0]
+    expected[0] = hashlib.sha256(sources[0].read_bytes()).hexdigest()
+    assert digest_files(sources[:1], cache=DigestCache(verify_fraction=1.0))[0].value == expected[0]
+    assert digest_files(sources[:1], cache=cache)[0].value == expected[0], "the stale entry was replaced"
+
+    # a file written just now may change again within its timestamp tick
+    fresh = tmp_path / "fresh.sv"
+    fresh.write_text("// fresh\n")
+    hashed.clear()
+    digest_files([fresh], cache=cache)
+    digest_files([fresh], cache=cache)
+    assert hashed == [fresh, fresh]
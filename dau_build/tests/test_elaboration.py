@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from dau_build.design_snapshot import load_design_snapshot, write_design_snapshot
+from dau_build.elaboration import ElaborationError, elaborate_design
+from dau_build.svparser import Design
+from dau_build.tests.sv_fixtures import layer_module, write_layered_hierarchy
+
+_SV_DIR = (Path(__file__).parent / ".." / "sv").resolve()
+
+
+def test_the_graph_indexes_instances_connectivity_and_closures() -> None:
+    graph = elaborate_design(Design.from_directory(_SV_DIR))
+    assert [(edge.parent, edge.instance) for edge in graph.instances_of("mux")] == [("cam", "read_data_mux"), ("cam", "read_valid_mux")]
+    # the register array sits in a generate loop
+    (register,) = graph.instances_of("register_")
+    assert register.parent == "cam" and register.generate
+    # named links name their ports: cam_found runs from the equality checker
+    # into the priority encoder
+    assert [(pin.instance, pin.port) for pin in graph.fan_in("cam", "cam_found")] == [("eq_check_search", "out_o")]
+    assert [(pin.instance, pin.port) for pin in graph.fan_out("cam", "cam_found")] == [("search_priorityenc", "inp_i")]
+    assert [(pin.instance, pin.port) for pin in graph.fan_out("cam", "read_index_i")] == [
+        ("read_data_mux", "selector_i"),
+        ("read_valid_mux", "selector_i"),
+    ]
+    assert graph.module_closure("cam") == ("cam", "decoder", "mux", "equality_checker", "priorityencoder", "register_", "ceff")
+    assert graph.source_closure("register_") == (_SV_DIR / "register_.sv", _SV_DIR / "ceff.sv")
+    assert graph.modules_by_source[_SV_DIR / "cam.sv"] == ("cam",)
+    with pytest.raises(ElaborationError, match="design has no module missing"):
+        graph.module_closure("missing")
+
+
+def test_positional_links_connect_in_header_order_and_survive_a_snapshot(tmp_path: Path) -> None:
+    rtl = tmp_path / "rtl"
+    rtl.mkdir()
+    # header order interleaves directions: position, not direction, decides
+    (rtl / "leaf.sv").write_text("module leaf (input logic clk, output logic q, input logic d, input logic en);\n  assign q = d;\nendmodule\n")
+    (rtl / "top.sv").write_text(
+        "module top (input logic clk, input logic d, output logic q, output logic r);\n"
+        "  leaf u_pos (clk, q, d);\n"
+        "  leaf u_named (.d(q), .q(r), .clk(clk));\n"
+        "  missing u_far (clk);\n"
+        "endmodule\n"
+    )
+    design = Design.from_directory(rtl)
+    with load_design_snapshot(write_design_snapshot(design, tmp_path / "design.snapshot")) as snapshot:
+        restored = snapshot.to_design()
+    for graph in (elaborate_design(design), elaborate_design(restored)):
+        assert [(pin.instance, pin.port) for pin in graph.fan_in("top", "q")] == [("u_pos", "q")]
+        assert [(pin.instance, pin.port) for pin in graph.fan_out("top", "q")] == [("u_named", "d")]
+        assert [(pin.instance, pin.port) for pin in graph.connections("top", "clk")] == [("u_pos", "clk"), ("u_named", "clk"), ("u_far", None)]
+        assert [(pin.instance, pin.port, pin.direction) for pin in graph.unconnected_ports("top")] == [
+            ("u_pos", "en", "input"),
+            ("u_named", "en", "input"),
+        ]
+        assert [edge.module for edge in graph.instances_of("missing")] == ["missing"]
+        assert graph.module_closure("top") == ("top", "leaf")
+
+
+def test_a_wide_deep_hierarchy_indexes_definitions_not_paths(tmp_path: Path) -> None:
+    root = write_layered_hierarchy(tmp_path / "rtl", depth=12, width=4)
+    design = Design.from_directory(root).resolve()
+    graph = elaborate_design(design)
+    # 4 ** 12 root-to-leaf paths; 4 + 11 * 16 instantiations
+    assert len(graph.edges) == 4 + 11 * 16
+    assert len(graph.instances_of(layer_module(11, 0))) == 4
+    assert len(graph.module_closure("top")) == 1 + 12 * 4
+    assert graph.unconnected_ports() == ()
+    assert [pin.instance for pin in graph.fan_out(layer_module(3, 2), "d")] == ["u0", "u1", "u2", "u3"]
+    expected = (layer_module(10, 1), *(layer_module(11, index) for index in range(4)))
+    assert graph.source_closure(layer_module(10, 1)) == tuple(root / f"{name}.sv" for name in expected)
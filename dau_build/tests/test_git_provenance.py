@@ -0,0 +1,64 @@
+import subprocess
+from pathlib import Path
+
+from dau_build import git_provenance
+from dau_build.git_provenance import collect_git_provenance
+from dau_build.shell_build import shell_build_manifest
+
+
+def _repository(root: Path, files: dict[str, str], *, tag: str) -> list[Path]:
+    root.mkdir()
+    paths = []
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        paths.append(path)
+    git = ("git", "-C", str(root), "-c", "user.name=dau", "-c", "user.email=dau@example.invalid")
+    subprocess.run((*git, "init", "-q"), check=True)
+    subprocess.run((*git, "add", "."), check=True)
+    subprocess.run((*git, "commit", "-q", "-m", "sources"), check=True)
+    subprocess.run((*git, "tag", tag), check=True)
+    return paths
+
+
+def _blob(path: Path) -> str:
+    return subprocess.run(("git", "hash-object", str(path)), capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_provenance_asks_each_repository_once(tmp_path: Path, monkeypatch) -> None:
+    core = _repository(tmp_path / "dau-core", {f"rtl/lane_{index}.sv": f"module lane_{index}; endmodule\n" for index in range(6)}, tag="v1.2")
+    shell = _repository(tmp_path / "shell", {"top.sv": "module top; endmodule\n", "ip/[x].v": "module x; endmodule\n"}, tag="s3")
+    loose = tmp_path / "loose.sv"
+    loose.write_text("module loose; endmodule\n")
+    (tmp_path / "dau-core" / "rtl" / "lane_0.sv").write_text("// edited\n")
+
+    calls: list[tuple[str, ...]] = []
+    run = subprocess.run
+
+    def counting_run(argv, **kwargs):
+        calls.append(tuple(argv))
+        return run(argv, **kwargs)
+
+    monkeypatch.setattr(git_provenance.subprocess, "run", counting_run)
+    provenance = collect_git_provenance([*core, *shell, loose, core[1]])
+    # a describe and an ls-files per repository, however many files
+    assert len(calls) == 4
+    states = {state.root: state for state in provenance.repositories}
+    assert states[tmp_path / "dau-core"].describe == "v1.2-dirty"
+    assert states[tmp_path / "shell"].describe == "s3"
+    # the index blob: the committed content, not the edit
+    assert provenance.blob(core[0]) != _blob(core[0])
+    assert [provenance.blob(path) for path in (*core[1:], *shell)] == [_blob(path) for path in (*core[1:], *shell)]
+    assert provenance.blob(loose) is None
+
+
+def test_the_manifest_records_repository_state_and_source_blobs(tmp_path: Path) -> None:
+    (source,) = _repository(tmp_path / "dau-core", {"rtl/top.sv": "module top; endmodule\n"}, tag="v2.0")
+    output_root = tmp_path / "shell"
+    output_root.mkdir()
+    (output_root / "dau_mm_job.bit").write_bytes(b"\x00bit")
+    manifest = shell_build_manifest(output_root, name="dau-shell", source_paths=(source,))
+    assert manifest.metadata["source_repositories"] == {(tmp_path / "dau-core").as_posix(): "v2.0"}
+    (hdl,) = (artifact for artifact in manifest.artifacts if artifact.role == "hdl-source")
+    assert hdl.metadata == {"git_blob": _blob(source)}
@@ -643,6 +643,74 @@ def test_validate_structured_project_artifact_bundle_reports_backend_manifest_mi
     assert "project backend manifest mismatch: wrong.manifest != dau-ci.manifest" in validation.errors
 
 
+def test_validate_structured_project_artifact_bundle_reports_each_command_and_overlay_rule(tmp_path: Path) -> None:
+    bundle_root = tmp_path / "dau-bundle"
+    (bundle_root / "rtl").mkdir(parents=True)
+    lines = ["schema: artlink.manifest/v0", "name: dau-wide", "artifacts:"]
+    for name, role in (("dau_wide_top", "generated-top"), ("lane_0", "hdl-source"), ("lane_1", "hdl-source"), ("lane_2", "hdl-source")):
+        (bundle_root / "rtl" / f"{name}.sv").write_text(f"module {name}; endmodule\n", encoding="utf-8")
+        lines.extend((f"  - path: rtl/{name}.sv", "    kind: source", f"    role: {role}", "    language: systemverilog"))
+    bundle_path = bundle_root / "dau-wide.artifacts.yaml"
+    bundle_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    artifacts = _write_project_artifacts(
+        VivadoProjectGenerationRequest(
+            source_shell_root=Path("/repo/projects/vivado-shell"),
+            work_root=tmp_path / "vivado",
+            dau_core_root=Path("/repo/dau-core"),
+            dau_driver_root=Path("/repo/dau-driver"),
+            artifact_stem="dau-ci",
+            dau_artifact_bundle_path=bundle_path,
+        )
+    )
+    overlay_tcl_path = artifacts.backend_artifacts.overlay_tcl_path
+    lane_0, lane_1 = ((bundle_root / "rtl" / f"lane_{index}.sv").resolve().as_posix() for index in (0, 1))
+    # lane_0 is consumed only inside a longer word, which still satisfies the
+    # contract's substring rule; lane_1 is not consumed at all
+    overlay_tcl_path.write_text(
+        overlay_tcl_path.read_text(encoding="utf-8")
+        .replace(lane_0, f"{lane_0}.orig")
+        .replace(lane_1, "/elsewhere/lane_1.sv")
+        .replace('"vivado_log=vivado.log"', '"vivado_log=other.log"'),
+        encoding="utf-8",
+    )
+    project_manifest = artifacts.project_manifest_text.splitlines()
+    for index, line in enumerate(project_manifest):
+        key, _, command = line.partition("=")
+        if key == "stage_command":
+            command = command.replace(" vivado=vivado", "").replace(f"work_root={tmp_path / 'vivado'}", "work_root=/elsewhere")
+            project_manifest[index] = f"{key}={command}"
+        elif key == "build_command":
+            # the flag form older plans recorded
+            project_manifest[index] = (
+                f"{key}=dau-build-plan build-vivado-artifacts --work-root {tmp_path / 'vivado'} --manifest-path dau-ci.plan --vivado"
+            )
+        elif key == "validate_command":
+            project_manifest[index] = f"{key}=dau-build 'task=validate-vivado-artifacts"
+    artifacts.project_manifest_path.write_text("\n".join(project_manifest) + "\n", encoding="utf-8")
+
+    validation = validate_vivado_project_artifact_bundle(
+        tmp_path / "vivado",
+        project_manifest_path=Path("dau-ci.project"),
+        manifest_path=Path("dau-ci.manifest"),
+        command_plan_path=Path("dau-ci.plan"),
+    )
+
+    work_root = (tmp_path / "vivado").as_posix()
+    assert validation.errors == (
+        "overlay Tcl does not write manifest field: vivado_log=vivado.log",
+        f"overlay Tcl does not consume DAU bundle source: {lane_1}",
+        f"project stage_command option --work-root mismatch: /elsewhere != {work_root}",
+        "project stage_command missing option: --vivado",
+        "project build_command missing option: --overlay-tcl",
+        "project build_command option --manifest-path mismatch: dau-ci.plan != dau-ci.manifest",
+        "project build_command missing option: --command-plan-path",
+        "project build_command missing option: --project-manifest-path",
+        "project build_command missing option: --vivado-settings",
+        "project build_command option --vivado mismatch:  != vivado",
+        "project validate_command cannot be parsed: No closing quotation",
+    )
+
+
 def test_validate_structured_backend_artifact_bundle_reports_missing_overlay(tmp_path: Path) -> None:
     artifacts = _write_backend_artifacts(
         VivadoBackendRequest(
@@ -672,6 +740,22 @@ def test_backend_build_tcl_guards_legacy_xdma_lane_cells() -> None:
     assert "reset_property LOC [get_cells" not in build_tcl
 
 
+def test_an_incremental_build_tcl_reuses_and_then_replaces_its_reference_checkpoints() -> None:
+    plain = vivado_backend.vivado_build_tcl()
+    assert "INCREMENTAL_CHECKPOINT" not in plain and "incremental_reference" not in plain
+
+    build_tcl = vivado_backend.vivado_build_tcl(incremental=True)
+    # both references or neither: a run without them falls back to a full build
+    setup = build_tcl.index("if {[file exists $reference_synth] && [file exists $reference_routed]} {")
+    assert setup < build_tcl.index("reset_run synth_1")
+    assert "reset_property INCREMENTAL_CHECKPOINT [get_runs impl_1]" in build_tcl
+    # the references are refreshed only once the bitstream exists, outside
+    # project.runs (which reset_run and re-staging clear)
+    save = build_tcl.index('file copy -force [file normalize "project.runs/impl_1/Top_wrapper_routed.dcp"] $reference_routed')
+    assert build_tcl.index("expected Vivado bitstream was not produced") < save
+    assert 'puts $manifest_file "incremental_reference=$incremental_reference"' in build_tcl
+
+
 def test_hardware_toolchain_defaults_point_at_existing_vivado_project_layout() -> None:
     config = HardwareToolchainConfig(work_root=Path("/repo/projects/vivado-shell"))
 
@@ -694,6 +778,7 @@ def test_stage_shell_plan_copies_seed_to_generated_workdir() -> None:
     assert "--exclude .Xil" in steps[0].argv[2]
     assert "--exclude project.gen" in steps[0].argv[2]
     assert "--exclude project.runs" in steps[0].argv[2]
+    assert "--filter 'P dau_reference_*.dcp'" in steps[0].argv[2]
     assert "/repo/reference/vivado-shell/ /repo/dau-build/outputs/vivado/" in steps[0].argv[2]
 
 
@@ -1750,6 +1835,70 @@ def test_deadman_stays_armed_when_a_step_fails(tmp_path: Path) -> None:
     assert not disarm_marker.exists()  # the deadman stays armed
 
 
+def test_independent_steps_run_side_by_side(tmp_path: Path) -> None:
+    """Three one-second sleeps declared independent of each other finish in
+    about one second, and the step after them waits for all three."""
+    import time
+
+    from dau_build.hardware_plan import ToolStep, execute_plan_steps
+
+    done = tmp_path / "done"
+    steps = (
+        ToolStep("stage", ("true",)),
+        *(ToolStep(f"sleep-{index}", ("sh", "-c", f"sleep 1 && touch {tmp_path / str(index)}"), after=("stage",)) for index in range(3)),
+        ToolStep(
+            "collect",
+            ("sh", "-c", f"test -e {tmp_path / '0'} && test -e {tmp_path / '1'} && test -e {tmp_path / '2'} && touch {done}"),
+            after=("sleep-0", "sleep-1", "sleep-2"),
+        ),
+    )
+    started = time.monotonic()
+    assert execute_plan_steps(steps) == 0
+    assert time.monotonic() - started < 2.5
+    assert done.exists()
+
+
+def test_a_failing_concurrent_step_still_releases(tmp_path: Path) -> None:
+    """The sequential failure contract holds for a graph: nothing new starts
+    after the failure, a sibling already running finishes, and only the
+    *release steps that never started run as cleanup."""
+    from dau_build.hardware_plan import ToolStep, execute_plan_steps
+
+    steps = (
+        ToolStep("thunderbolt-hold", ("true",)),
+        ToolStep("write-slow", ("sh", "-c", f"sleep 0.5 && touch {tmp_path / 'slow'}"), after=("thunderbolt-hold",)),
+        ToolStep("write-broken", ("false",), after=("thunderbolt-hold",)),
+        ToolStep("vivado-overlay-build", ("sh", "-c", f"touch {tmp_path / 'built'}"), after=("write-slow", "write-broken")),
+        ToolStep("thunderbolt-release", ("sh", "-c", f"touch {tmp_path / 'released'}")),
+        ToolStep("deadman-disarm", ("sh", "-c", f"touch {tmp_path / 'disarmed'}")),
+    )
+    assert execute_plan_steps(steps) == 1
+    assert (tmp_path / "slow").exists()
+    assert not (tmp_path / "built").exists()
+    assert (tmp_path / "released").exists()
+    assert not (tmp_path / "disarmed").exists()
+
+
+def test_the_dry_run_names_the_critical_path() -> None:
+    from dau_build.hardware_plan import ToolStep, format_plan_steps, plan_critical_path, plan_step_dependencies
+
+    steps = (
+        ToolStep("stage", ("true",)),
+        ToolStep("write-a", ("true",), after=("stage",)),
+        ToolStep("write-b", ("true",), after=("stage",)),
+        ToolStep("build", ("true",), after=("write-b",)),
+        ToolStep("report", ("true",), after=()),
+    )
+    assert plan_step_dependencies(steps) == ((), (0,), (0,), (2,), ())
+    assert [step.name for step in plan_critical_path(steps)] == ["stage", "write-b", "build"]
+    assert format_plan_steps(steps).splitlines()[-1] == "critical-path\tsteps=3 of 5: stage -> write-b -> build"
+    # a plain sequential plan dry-runs exactly as it always has
+    assert format_plan_steps(steps[:1]) == "stage\ttrue"
+
+    with pytest.raises(ValueError, match="no earlier step carries that name"):
+        plan_step_dependencies((ToolStep("a", ("true",), after=("b",)), ToolStep("b", ("true",))))
+
+
 def test_sram_program_plan_composes_from_the_config_group(tmp_path: Path) -> None:
     result = run_request_config(
         "task",
@@ -1964,3 +2113,51 @@ def test_execute_without_a_device_runs_unserialized(tmp_path) -> None:
     marker = tmp_path / "ran"
     code = execute_plan_steps((ToolStep("t", ("sh", "-c", f"touch {marker}")),))
     assert code == 0 and marker.exists()
+
+
+def _fleet_board(index: int, *, jtag_cable: str | None = None) -> dict:
+    return {
+        "_target_": "dau_build.platforms.HostAccess",
+        "pci_id": "10ee:9034",
+        "endpoint_bdf": f"0000:0{index}:00.0",
+        "reset_bridge_bdf": f"0000:00:1c.{index}",
+        "rescan_bdfs": [f"0000:00:1c.{index}"],
+        "runtime_pm_patterns": ["10ee:9034"],
+        "jtag_cable": jtag_cable or f"digilent_hs2:{index}",
+    }
+
+
+def test_a_fleet_composes_the_plan_once_per_board() -> None:
+    result = _run_plan("sram-program", work_root="/w", bitstream="/tmp/design.bit", fleet=[_fleet_board(1), _fleet_board(2)])
+    boards = result.message.split("board\t")[1:]
+    assert [board.splitlines()[0] for board in boards] == ["0000:01:00.0", "0000:02:00.0"]
+    assert "-c digilent_hs2:2 /tmp/design.bit" in boards[1] and "digilent_hs2:1" not in boards[1]
+
+    with pytest.raises(BuildStepError, match=r"share JTAG cable\(s\) \['hs2'\]"):
+        _run_plan("sram-program", work_root="/w", fleet=[_fleet_board(1, jtag_cable="hs2"), _fleet_board(2, jtag_cable="hs2")])
+    with pytest.raises(BuildStepError, match="drop the single-board override"):
+        _run_plan("sram-program", work_root="/w", endpoint_bdf="0000:09:00.0", fleet=[_fleet_board(1)])
+
+
+def test_fleet_boards_run_at_once_and_stop_or_continue_on_failure(tmp_path: Path, monkeypatch) -> None:
+    import time
+
+    from dau_build.hardware_plan import ToolStep, execute_fleet_plan
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "runtime"))
+
+    def board_steps(bdf: str, *, fails: bool = False) -> tuple[ToolStep, ...]:
+        marker = tmp_path / bdf.replace(":", "-")
+        return (ToolStep("program-volatile", ("sh", "-c", f"sleep 0.5; touch {marker}; exit {int(fails)}")),)
+
+    runs = {bdf: board_steps(bdf) for bdf in ("0000:01:00.0", "0000:02:00.0", "0000:03:00.0")}
+    started = time.monotonic()
+    results = execute_fleet_plan(runs)
+    assert time.monotonic() - started < 1.4
+    assert [result.status for result in results] == ["passed"] * 3
+
+    runs["0000:01:00.0"] = board_steps("0000:01:00.0", fails=True)
+    stopped = execute_fleet_plan(runs, on_failure="stop", max_parallel=1)
+    assert [(result.status, result.returncode) for result in stopped] == [("failed", 1), ("skipped", None), ("skipped", None)]
+    continued = execute_fleet_plan(runs, on_failure="continue", max_parallel=1)
+    assert [result.status for result in continued] == ["failed", "passed", "passed"]
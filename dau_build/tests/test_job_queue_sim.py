@@ -0,0 +1,229 @@
+"""Bench for the scan-composition job queue, driven through the generated sim
+harness: the same two-lane offset-tile pipeline the plain sim bench runs, but
+with jobs submitted into the descriptor FIFO instead of started one at a time.
+
+The point under test is THROUGHPUT. Without a queue the reader and lanes sit
+idle from one job's close-out until the host has seen it and started the next
+-- a full host round trip per job. With a queue the next descriptor is
+already in the shell, so the only gap between jobs is the dispatcher's own
+handful of cycles, and every job still leaves its own result behind.
+"""
+
+from pathlib import Path
+from shutil import which
+
+import cocotb
+import pytest
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+from cocotb_tools.runner import get_runner
+
+from dau_build.scan_composition import LaneTile, ScanComposition, generate_scan_composition_sim_sv
+
+_SCAN_SIM_SV = Path(__file__).resolve().parent / "sv" / "scan_sim"
+_MASK64 = (1 << 64) - 1
+
+_DEPTH = 4
+_OFFSETS = (1, 1000)
+_ROWS_PER_JOB = 8
+_JOBS = 4
+_INPUT_WORD = 16  # job j reads rows from _INPUT_WORD + j * _ROWS_PER_JOB
+_LANE_WORDS = (512, 1024)  # lane l writes job j at _LANE_WORDS[l] + j * _ROWS_PER_JOB
+# the most cycles the dispatcher may leave the pipeline idle between two
+# queued jobs: the close-out is trusted two cycles after the start pulse,
+# and the next start is raised the cycle after the retirement
+_MAX_GAP_CYCLES = 4
+# a status read plus the next JOB_CONTROL write over a Thunderbolt-attached
+# PCIe link, in 250 MHz shell cycles -- for the log line only
+_HOST_ROUND_TRIP_CYCLES = 500
+
+
+def _bench_composition() -> ScanComposition:
+    return ScanComposition(
+        name="job-queue-bench",
+        module_name="dau_job_queue_bench_job",
+        burst_beats=16,
+        lanes=tuple(LaneTile(module="dau_test_offset_tile", config={"cfg_offset": f"64'd{offset}"}, count_port="row_count") for offset in _OFFSETS),
+        job_queue_depth=_DEPTH,
+    )
+
+
+def _row(job: int, j: int) -> int:
+    return (job << 32) | (j * 3 + 1)
+
+
+async def _reset(dut):
+    dut.rst.value = 1
+    dut.submit.value = 0
+    dut.submit_input_address.value = 0
+    dut.submit_input_length_bytes.value = 0
+    dut.submit_lane_output_address.value = 0
+    dut.queue_result_pop.value = 0
+    dut.bd_write.value = 0
+    dut.bd_index.value = 0
+    dut.bd_wdata.value = 0
+    for _ in range(5):
+        await RisingEdge(dut.clk)
+    dut.rst.value = 0
+    await RisingEdge(dut.clk)
+
+
+async def _start(dut):
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start(start_high=False))
+    await _reset(dut)
+    for job in range(_JOBS):
+        for j in range(_ROWS_PER_JOB):
+            dut.bd_write.value = 1
+            dut.bd_index.value = _INPUT_WORD + job * _ROWS_PER_JOB + j
+            dut.bd_wdata.value = _row(job, j)
+            await RisingEdge(dut.clk)
+    dut.bd_write.value = 0
+
+
+async def _bd_read(dut, index: int) -> int:
+    dut.bd_index.value = index
+    await RisingEdge(dut.clk)
+    return int(dut.bd_rdata.value)
+
+
+async def _submit(dut, job: int, *, length_bytes: int = _ROWS_PER_JOB * 8):
+    dut.submit_input_address.value = (_INPUT_WORD + job * _ROWS_PER_JOB) * 8
+    dut.submit_input_length_bytes.value = length_bytes
+    lane_words = [base + job * _ROWS_PER_JOB for base in _LANE_WORDS]
+    dut.submit_lane_output_address.value = ((lane_words[1] * 8) << 32) | (lane_words[0] * 8)
+    dut.submit.value = 1
+    await RisingEdge(dut.clk)
+    dut.submit.value = 0
+
+
+async def _wait_idle(dut) -> tuple[int, int]:
+    """Cycles until the whole queue has drained; also counts the cycles the
+    pipeline sat idle between two queued jobs."""
+    idle_between = 0
+    started = False
+    for cycle in range(20000):
+        await RisingEdge(dut.clk)
+        running = int(dut.queue_running.value)
+        started = started or bool(running)
+        if started and not running and int(dut.busy.value):
+            idle_between += 1
+        if started and dut.done.value:
+            return cycle, idle_between
+    raise AssertionError("the queue did not drain")
+
+
+async def _pop_result(dut) -> tuple[int, list[int]]:
+    word = int(dut.job_queue_result.value)
+    lengths = int(dut.job_queue_result_lengths.value)
+    dut.queue_result_pop.value = 1
+    await RisingEdge(dut.clk)
+    dut.queue_result_pop.value = 0
+    await RisingEdge(dut.clk)
+    return word, [(lengths >> (32 * lane)) & 0xFFFFFFFF for lane in range(len(_OFFSETS))]
+
+
+@cocotb.test()
+async def queued_jobs_run_back_to_back(dut):
+    """Every queued job runs, lands in its own output regions, and leaves its
+    own result; the pipeline is never idle for more than the dispatcher's
+    own gap between them."""
+    await _start(dut)
+    for job in range(_JOBS):
+        await _submit(dut, job)
+    _, idle_between = await _wait_idle(dut)
+    assert idle_between <= _MAX_GAP_CYCLES * (_JOBS - 1), f"pipeline idled {idle_between} cycles between {_JOBS} queued jobs"
+    assert int(dut.job_queue_completed.value) == _JOBS
+    status = int(dut.job_queue_status.value)
+    assert status & 0xFF == 0, "descriptors left in the queue"
+    assert (status >> 8) & 0xFF == _JOBS, "one result per job"
+
+    for job in range(_JOBS):
+        word, lengths = await _pop_result(dut)
+        assert word >> 16 == job, f"result {job} out of order: {word:#010x}"
+        assert word & 0x8000, "a queued result reads valid"
+        assert word & 0x1FF == 0, f"job {job} failed: {word:#010x}"
+        assert lengths == [_ROWS_PER_JOB * 8] * len(_OFFSETS)
+        for lane, (base, offset) in enumerate(zip(_LANE_WORDS, _OFFSETS)):
+            for j in range(_ROWS_PER_JOB):
+                got = await _bd_read(dut, base + job * _ROWS_PER_JOB + j)
+                assert got == (_row(job, j) + offset) & _MASK64, f"job {job} lane {lane} row {j}: {got:#x}"
+    assert int(dut.job_queue_result.value) == 0, "an empty result ring reads zero"
+
+
+@cocotb.test()
+async def the_queue_hides_the_host_round_trip(dut):
+    """The throughput claim, measured. Issued one at a time -- each job
+    submitted only after the previous one has closed out -- the jobs cost
+    their own run time plus a host round trip apiece. Queued, the whole run
+    costs no more than the run times alone: the round trips are gone, and the
+    dispatcher's own gap is no worse than a zero-latency host's."""
+    await _start(dut)
+    serial = 0
+    for job in range(_JOBS):
+        await _submit(dut, job)
+        cycles, _ = await _wait_idle(dut)
+        serial += cycles + 1
+        await _pop_result(dut)
+    for job in range(_JOBS):
+        await _submit(dut, job)
+    queued, _ = await _wait_idle(dut)
+    queued += _JOBS
+    with_host = serial + (_JOBS - 1) * _HOST_ROUND_TRIP_CYCLES
+    dut._log.info("%d jobs: %d cycles queued, %d run back-to-back by hand, %d behind a host round trip", _JOBS, queued, serial, with_host)
+    assert queued <= serial
+
+
+@cocotb.test()
+async def a_failed_job_is_recorded_and_the_queue_moves_on(dut):
+    """A job refused at the length gate closes out with its own 0xFE result;
+    the jobs queued behind it still run."""
+    await _start(dut)
+    await _submit(dut, 0, length_bytes=_ROWS_PER_JOB * 8 - 4)
+    await _submit(dut, 1)
+    await _wait_idle(dut)
+    word, _ = await _pop_result(dut)
+    assert word & 0x1FF == 0x1FE, f"the off-grid job reads {word:#010x}"
+    word, lengths = await _pop_result(dut)
+    assert word & 0x1FF == 0, f"the job behind it reads {word:#010x}"
+    assert lengths == [_ROWS_PER_JOB * 8] * len(_OFFSETS)
+
+
+@cocotb.test()
+async def a_full_queue_drops_and_latches_overflow(dut):
+    """Results are never overwritten: with the ring full of unread results
+    dispatch stalls, the descriptor queue fills, and the next submit is
+    dropped with the sticky overflow bit set instead of silently lost."""
+    await _start(dut)
+    for job in range(_DEPTH):
+        await _submit(dut, job % _JOBS)
+    await _wait_idle(dut)
+    for job in range(_DEPTH + 1):
+        await _submit(dut, job % _JOBS)
+    for _ in range(50):
+        await RisingEdge(dut.clk)
+    status = int(dut.job_queue_status.value)
+    assert status & 0xFF == _DEPTH, "dispatch stalls behind the unread results"
+    assert status & (1 << 17), "the dropped submit is latched"
+    assert dut.busy.value == 1
+
+
+@pytest.mark.skipif(which("verilator") is None, reason="verilator not found")
+def test_job_queue_sim_bench(tmp_path: Path):
+    harness = generate_scan_composition_sim_sv(
+        _bench_composition(),
+        module_name="dau_job_queue_bench_sim",
+        mem_words=4096,
+        sources=(_SCAN_SIM_SV / "dau_test_offset_tile.sv",),
+    )
+    top = tmp_path / "dau_job_queue_bench_sim.v"
+    top.write_text(harness)
+
+    runner = get_runner("verilator")
+    build_dir = tmp_path / "sim_build"
+    runner.build(
+        sources=[top, *sorted(_SCAN_SIM_SV.glob("*.sv"))],
+        hdl_toplevel="dau_job_queue_bench_sim",
+        always=True,
+        build_dir=build_dir,
+    )
+    runner.test(hdl_toplevel="dau_job_queue_bench_sim", test_module="dau_build.tests.test_job_queue_sim", build_dir=build_dir)
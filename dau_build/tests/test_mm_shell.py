@@ -407,6 +407,7 @@ def test_project_tcl_matches_pre_fragment_goldens() -> None:
         hdl_sources=(Path("/src/tile.sv"), Path("/src/identity.v")),
         generated_sources=(("my_top.v", "module my_top; endmodule\n"),),
         top_module="my_top",
+        jobs=12,
     )
     ddr = MmDdrJobShellRequest(
         platform=_test_platform(),
@@ -415,6 +416,7 @@ def test_project_tcl_matches_pre_fragment_goldens() -> None:
         generated_sources=(("my_ddr_top.v", "module my_ddr_top; endmodule\n"),),
         top_module="my_ddr_top",
         mig_prj=Path("/src/mig.prj"),
+        jobs=12,
     )
     assert mm_job_shell_project_tcl(mm) == (fixtures / "mm_job_project.tcl").read_text()
     assert mm_ddr_job_shell_project_tcl(ddr) == (fixtures / "mm_ddr_job_project.tcl").read_text()
@@ -509,3 +511,38 @@ def test_a_header_beside_a_source_is_added_to_the_project(tmp_path: Path) -> Non
     assert f'set_property is_global_include true [get_files "{header.as_posix()}"]' in tcl
     # and it must NOT be typed as a SystemVerilog module
     assert f'set_property file_type SystemVerilog [get_files "{header.as_posix()}"]' not in tcl
+
+
+def test_an_incremental_build_runs_against_the_last_builds_checkpoints(tmp_path: Path) -> None:
+    plain = mm_job_shell_project_tcl(_request(tmp_path))
+    assert "INCREMENTAL_CHECKPOINT" not in plain and "DAU_MM_JOB_INCREMENTAL" not in plain
+
+    for text in (
+        mm_job_shell_project_tcl(_request(tmp_path).model_copy(update={"incremental": True})),
+        mm_ddr_job_shell_project_tcl(_ddr_request(tmp_path).model_copy(update={"incremental": True})),
+    ):
+        # the references are set before either run launches, and only a
+        # build that got as far as its bitstream replaces them
+        setup = text.index("set_property INCREMENTAL_CHECKPOINT $reference_routed [get_runs impl_1]")
+        assert setup < text.index("launch_runs synth_1")
+        assert 'puts "DAU_MM_JOB_INCREMENTAL reference=none"' in text
+        save = text.index('file copy -force "$origin_dir/project_mm/project_mm.runs/impl_1/Top_wrapper_routed.dcp" $reference_routed')
+        assert text.index('"$origin_dir/dau_mm_job.bit"') < save < text.index("DAU_MM_JOB_BUILD_OK")
+
+
+def test_job_counts_follow_the_host_and_strategies_the_platform(tmp_path: Path, monkeypatch) -> None:
+    from dau_build import vivado_runs
+
+    monkeypatch.setattr(vivado_runs, "host_cpu_count", lambda: 32)
+    monkeypatch.setattr(vivado_runs, "host_memory_bytes", lambda: 32 << 30)
+    text = mm_job_shell_project_tcl(_request(tmp_path))
+    # 30 GiB to spare: ten synthesis runs fit beside each other, five implementations
+    assert "launch_runs synth_1 -jobs 10\n" in text
+    assert "launch_runs impl_1 -to_step write_bitstream -jobs 5\n" in text
+    assert "set_property strategy" not in text
+
+    platform = _test_platform().model_copy(update={"synth_strategy": "Flow_PerfOptimized_high", "impl_strategy": "Performance_Explore"})
+    steered = mm_job_shell_project_tcl(_request(tmp_path).model_copy(update={"platform": platform, "jobs": 3}))
+    assert steered.index("set_property strategy {Flow_PerfOptimized_high} [get_runs synth_1]") < steered.index("launch_runs synth_1 -jobs 3")
+    assert "set_property strategy {Performance_Explore} [get_runs impl_1]" in steered
+    assert "launch_runs impl_1 -to_step write_bitstream -jobs 3" in steered
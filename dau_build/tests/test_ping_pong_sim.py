@@ -0,0 +1,222 @@
+"""Bench for ping-pong input windows, driven through the generated sim
+harness: the same two-lane offset-tile pipeline the job-queue bench runs, but
+with two input windows the host alternates between.
+
+The point under test is OVERLAP. With one window the host can only stage the
+next job's input once the current job has closed out, so every job pays its
+staging writes on top of its run. With two, the host stages window N+1 while
+window N streams, and the next start follows the close-out directly -- while
+the job already running keeps the window it latched at its start.
+"""
+
+from pathlib import Path
+from shutil import which
+
+import cocotb
+import numpy as np
+import pytest
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+from cocotb.utils import get_sim_time
+from cocotb_tools.runner import get_runner
+
+from dau_build.scan_composition import LaneTile, ScanComposition, generate_scan_composition_sim_sv
+from dau_build.scan_model import TileOutput, config_int, run_scan_model
+
+_SCAN_SIM_SV = Path(__file__).resolve().parent / "sv" / "scan_sim"
+
+_OFFSETS = (1, 1000)
+_ROWS_PER_JOB = 8
+_JOBS = 4
+_INPUT_WORD = 16  # job j reads rows from _INPUT_WORD + j * _ROWS_PER_JOB
+_LANE_WORDS = (512, 1024)  # lane l writes job j at _LANE_WORDS[l] + j * _ROWS_PER_JOB
+# one AXI-Lite register write over a Thunderbolt-attached PCIe link, in 250
+# MHz shell cycles; staging a window is two of them (address, then length)
+_HOST_WRITE_CYCLES = 20
+
+
+def _bench_composition() -> ScanComposition:
+    return ScanComposition(
+        name="ping-pong-bench",
+        module_name="dau_ping_pong_bench_job",
+        burst_beats=16,
+        lanes=tuple(LaneTile(module="dau_test_offset_tile", config={"cfg_offset": f"64'd{offset}"}, count_port="row_count") for offset in _OFFSETS),
+        ping_pong_windows=True,
+    )
+
+
+def _row(job: int, j: int) -> int:
+    return (job << 32) | (j * 3 + 1)
+
+
+async def _reset(dut):
+    dut.rst.value = 1
+    dut.start.value = 0
+    for window in (0, 1):
+        getattr(dut, f"window{window}_input_address").value = 0
+        getattr(dut, f"window{window}_input_length_bytes").value = 0
+    dut.lane_output_address.value = 0
+    dut.bd_write.value = 0
+    dut.bd_index.value = 0
+    dut.bd_wdata.value = 0
+    for _ in range(5):
+        await RisingEdge(dut.clk)
+    dut.rst.value = 0
+    await RisingEdge(dut.clk)
+
+
+async def _start(dut):
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start(start_high=False))
+    await _reset(dut)
+    for job in range(_JOBS):
+        for j in range(_ROWS_PER_JOB):
+            dut.bd_write.value = 1
+            dut.bd_index.value = _INPUT_WORD + job * _ROWS_PER_JOB + j
+            dut.bd_wdata.value = _row(job, j)
+            await RisingEdge(dut.clk)
+    dut.bd_write.value = 0
+
+
+async def _bd_read(dut, index: int) -> int:
+    dut.bd_index.value = index
+    await RisingEdge(dut.clk)
+    return int(dut.bd_rdata.value)
+
+
+async def _stage(dut, window: int, job: int, *, length_bytes: int = _ROWS_PER_JOB * 8):
+    """Write one job's input into a window at host speed: the address, then
+    the length, each one register write apart."""
+    getattr(dut, f"window{window}_input_address").value = (_INPUT_WORD + job * _ROWS_PER_JOB) * 8
+    for _ in range(_HOST_WRITE_CYCLES):
+        await RisingEdge(dut.clk)
+    getattr(dut, f"window{window}_input_length_bytes").value = length_bytes
+    for _ in range(_HOST_WRITE_CYCLES):
+        await RisingEdge(dut.clk)
+
+
+async def _go(dut, job: int):
+    lane_words = [base + job * _ROWS_PER_JOB for base in _LANE_WORDS]
+    dut.lane_output_address.value = ((lane_words[1] * 8) << 32) | (lane_words[0] * 8)
+    dut.start.value = 1
+    await RisingEdge(dut.clk)
+    dut.start.value = 0
+    await RisingEdge(dut.clk)
+
+
+async def _wait_done(dut) -> None:
+    for _ in range(20000):
+        await RisingEdge(dut.clk)
+        if dut.done.value:
+            return
+    raise AssertionError("the job did not close out")
+
+
+def _offset_reference(rows: np.ndarray, tile) -> TileOutput:
+    return TileOutput(data=rows + np.uint64(config_int(tile, "cfg_offset")), count=rows.size)
+
+
+async def _check_outputs(dut, job: int) -> None:
+    """The sim's close-out against the functional model's golden."""
+    memory = np.zeros(_INPUT_WORD + _JOBS * _ROWS_PER_JOB, dtype=np.uint64)
+    memory[_INPUT_WORD:] = [_row(j // _ROWS_PER_JOB, j % _ROWS_PER_JOB) for j in range(_JOBS * _ROWS_PER_JOB)]
+    golden = run_scan_model(
+        _bench_composition(),
+        memory,
+        input_address=(_INPUT_WORD + job * _ROWS_PER_JOB) * 8,
+        input_length_bytes=_ROWS_PER_JOB * 8,
+        references={"dau_test_offset_tile": _offset_reference},
+    )
+    lengths = int(dut.lane_result_length_bytes.value)
+    assert [(lengths >> (32 * lane)) & 0xFFFFFFFF for lane in range(len(_OFFSETS))] == [lane.result_length_bytes for lane in golden.lanes]
+    for lane, (base, expected) in enumerate(zip(_LANE_WORDS, golden.lanes)):
+        for j, want in enumerate(expected.words.tolist()):
+            got = await _bd_read(dut, base + job * _ROWS_PER_JOB + j)
+            assert got == want, f"job {job} lane {lane} row {j}: {got:#x}"
+
+
+@cocotb.test()
+async def each_start_takes_the_next_window_and_flips_the_toggle(dut):
+    """A start latches the window the toggle names and points the toggle at
+    the other one, so back-to-back jobs alternate windows without the host
+    ever naming one."""
+    await _start(dut)
+    assert (int(dut.window_select.value), int(dut.window_active.value)) == (0, 0)
+    await _stage(dut, 0, 0)
+    await _stage(dut, 1, 1)
+    for job in range(2):
+        await _go(dut, job)
+        assert (int(dut.window_select.value), int(dut.window_active.value)) == (1 - job, job)
+        await _wait_done(dut)
+        assert dut.error.value == 0
+        await _check_outputs(dut, job)
+
+
+@cocotb.test()
+async def staging_under_a_running_job_leaves_it_untouched(dut):
+    """The host stages window N+1 while window N streams: the writes land
+    while the pipeline is still busy, and the running job reads only its own
+    window."""
+    await _start(dut)
+    await _stage(dut, 0, 0)
+    for job in range(_JOBS):
+        await _go(dut, job)
+        if job + 1 < _JOBS:
+            # even a staging write that would fail the length gate does not
+            # reach the job already running
+            await _stage(dut, (job + 1) % 2, job + 1, length_bytes=4)
+            await _stage(dut, (job + 1) % 2, job + 1)
+        await _wait_done(dut)
+        assert dut.error.value == 0, f"job {job} read the window being staged"
+        await _check_outputs(dut, job)
+
+
+@cocotb.test()
+async def two_windows_hide_the_staging_writes(dut):
+    """The throughput claim, measured. With one window each job's staging
+    writes wait for the previous close-out; with two they overlap the run,
+    and the whole sequence costs the run times plus one staging."""
+    await _start(dut)
+    serial_start = get_sim_time(unit="ns")
+    for job in range(_JOBS):
+        await _stage(dut, job % 2, job)
+        await _go(dut, job)
+        await _wait_done(dut)
+    serial = int((get_sim_time(unit="ns") - serial_start) // 10)
+
+    overlapped_start = get_sim_time(unit="ns")
+    await _stage(dut, _JOBS % 2, 0)
+    overlap_busy = 0
+    for job in range(_JOBS):
+        await _go(dut, job)
+        if job + 1 < _JOBS:
+            await _stage(dut, (_JOBS + job + 1) % 2, job + 1)
+            overlap_busy += int(dut.busy.value)
+        await _wait_done(dut)
+    overlapped = int((get_sim_time(unit="ns") - overlapped_start) // 10)
+    dut._log.info("%d jobs: %d cycles staging behind each close-out, %d cycles staging under the run", _JOBS, serial, overlapped)
+    # every successor finished staging while its predecessor still ran, so
+    # each of those stagings came off the critical path
+    assert overlap_busy == _JOBS - 1
+    assert overlapped <= serial - (_JOBS - 1) * 2 * _HOST_WRITE_CYCLES
+
+
+@pytest.mark.skipif(which("verilator") is None, reason="verilator not found")
+def test_ping_pong_sim_bench(tmp_path: Path):
+    harness = generate_scan_composition_sim_sv(
+        _bench_composition(),
+        module_name="dau_ping_pong_bench_sim",
+        mem_words=4096,
+        sources=(_SCAN_SIM_SV / "dau_test_offset_tile.sv",),
+    )
+    top = tmp_path / "dau_ping_pong_bench_sim.v"
+    top.write_text(harness)
+
+    runner = get_runner("verilator")
+    build_dir = tmp_path / "sim_build"
+    runner.build(
+        sources=[top, *sorted(_SCAN_SIM_SV.glob("*.sv"))],
+        hdl_toplevel="dau_ping_pong_bench_sim",
+        always=True,
+        build_dir=build_dir,
+    )
+    runner.test(hdl_toplevel="dau_ping_pong_bench_sim", test_module="dau_build.tests.test_ping_pong_sim", build_dir=build_dir)
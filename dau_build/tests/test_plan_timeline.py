@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from dau_build.build_steps import BuildStepError
+from dau_build.config import run_request_config
+from dau_build.hardware_plan import ToolStep, execute_plan_steps
+from dau_build.plan_timeline import (
+    PLAN_TIMELINE_FORMAT,
+    PlanTimeline,
+    PlanTimelineError,
+    load_plan_timeline,
+    summarize_plan_timeline,
+)
+
+
+def test_an_executed_plan_records_every_step_and_its_lock_wait(tmp_path: Path, monkeypatch, capfd) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "runtime"))
+    timeline = PlanTimeline(path=tmp_path / "timeline.jsonl", plan="sram-program")
+    steps = (
+        ToolStep("thunderbolt-hold", ("sh", "-c", "printf 12345")),
+        ToolStep("program-volatile", ("sh", "-c", "printf ab >&2; exit 3")),
+        ToolStep("driver-hardware-smoke", ("true",)),
+        ToolStep("thunderbolt-release", ("true",)),
+    )
+    assert execute_plan_steps(steps, endpoint_bdf="0000:01:00.0", timeline=timeline) == 3
+    # the output still reaches the terminal while it is counted
+    captured = capfd.readouterr()
+    assert "12345" in captured.out and "ab" in captured.err
+
+    lines = [json.loads(line) for line in timeline.path.read_text().splitlines()]
+    assert {line["format"] for line in lines} == {PLAN_TIMELINE_FORMAT}
+    assert {line["run"] for line in lines} == {timeline.run}
+    runs, records = load_plan_timeline([timeline.path])
+    assert [(record.step, record.exit_code, record.stdout_bytes, record.stderr_bytes, record.cleanup) for record in records] == [
+        ("thunderbolt-hold", 0, 5, 0, False),
+        ("program-volatile", 3, 0, 2, False),
+        # the smoke step never ran; the release ran as failure cleanup
+        ("thunderbolt-release", 0, 0, 0, True),
+    ]
+    assert all(record.ended >= record.started for record in records)
+    (run,) = runs
+    assert run.exit_code == 3 and run.endpoint_bdf == "0000:01:00.0"
+    assert 0.0 <= run.lock_wait_s <= run.duration_s
+
+
+def test_the_summary_ranks_steps_by_where_the_time_went(tmp_path: Path) -> None:
+    path = tmp_path / "timeline.jsonl"
+    for run, build_s in (("a", 30.0), ("b", 50.0)):
+        timeline = PlanTimeline(path=path, plan="local-build-and-program", run=run)
+        timeline.record_step("stage-shell", started=0.0, duration_s=2.0, exit_code=0, stdout_bytes=0, stderr_bytes=0)
+        timeline.record_step("vivado-overlay-build", started=2.0, duration_s=build_s, exit_code=int(run == "b"), stdout_bytes=10, stderr_bytes=0)
+        timeline.record_run(endpoint_bdf=None, started=0.0, duration_s=2.0 + build_s, exit_code=int(run == "b"), lock_wait_s=1.5)
+
+    summary = summarize_plan_timeline(*load_plan_timeline([path]))
+    assert (summary.runs, summary.failed_runs, summary.total_s, summary.lock_wait_s) == (2, 1, 84.0, 3.0)
+    build, stage = summary.steps
+    assert (build.step, build.runs, build.failures, build.total_s, build.mean_s, build.max_s) == ("vivado-overlay-build", 2, 1, 80.0, 40.0, 50.0)
+    assert stage.step == "stage-shell" and stage.total_s == 4.0
+
+    result = run_request_config("task", "tasks/hardware/plan-timeline-summary", model_values={"timelines": [str(path)]})
+    lines = result.message.splitlines()
+    assert lines[0] == "dau-build-plan-timeline\ttask=plan-timeline-summary runs=2 failed=1 total_s=84.000 lock_wait_s=3.000 steps=2"
+    assert lines[1] == "vivado-overlay-build\truns=2 failures=1 total_s=80.000 mean_s=40.000 max_s=50.000 share=95.2%"
+
+
+def test_other_files_are_refused(tmp_path: Path) -> None:
+    (tmp_path / "other.jsonl").write_text('{"kind": "step"}\n')
+    with pytest.raises(PlanTimelineError, match="not a dau-build-plan-timeline/1 record"):
+        load_plan_timeline([tmp_path / "other.jsonl"])
+    with pytest.raises(BuildStepError, match="No such file"):
+        run_request_config("task", "tasks/hardware/plan-timeline-summary", model_values={"timelines": [str(tmp_path / "missing.jsonl")]})
@@ -6,6 +6,7 @@ import pytest
 from pydantic import ValidationError
 
 from dau_build.platforms import (
+    DdrStaging,
     HostLink,
     PlaceholderPlatformError,
     PlatformDefinition,
@@ -292,3 +293,17 @@ def test_bram_tier_capacity_coheres_with_the_budget() -> None:
     platform = probe_platform()
     bram = next(t for t in platform.storage_tiers if t.technology == "bram")
     assert bram.capacity_bytes <= platform.budget.bram36 * 4608
+
+
+def test_ddr_staging_ping_pong_windows_are_the_two_input_regions() -> None:
+    staging = probe_platform().ddr_staging
+    assert staging is not None
+    assert staging.ping_pong_windows() == ((0x00000000, 0x18000000), (0x18000000, 0x18000000))
+
+    single = DdrStaging(input_addresses=(0,), input_bytes=0x1000, output_address=0x10000, output_bytes=0x1000, address_align=4096)
+    with pytest.raises(ValueError, match="two ddr staging input regions"):
+        single.ping_pong_windows()
+    adjacent = single.model_copy(update={"input_addresses": (0x1000, 0x0)})
+    assert adjacent.ping_pong_windows() == ((0x1000, 0x1000), (0x0, 0x1000))
+    with pytest.raises(ValueError, match="overlap"):
+        adjacent.model_copy(update={"input_bytes": 0x1001}).ping_pong_windows()
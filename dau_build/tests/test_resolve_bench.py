@@ -0,0 +1,63 @@
+"""Hierarchy resolution over wide, deep synthetic designs: every module of
+one layer instantiates every module of the next, so the root-to-leaf paths
+grow as ``width ** depth`` while the definitions grow as ``width * depth``.
+Resolution reads each definition once, so its cost follows the definitions
+and instance edges, not the paths.
+
+The pytest wrapper runs a small smoke set by default and only checks each
+definition was parsed once. The environment widens it:
+
+- ``DAU_BUILD_RESOLVE_BENCH=full``: depths and widths up to a hierarchy
+  whose unshared expansion would run to millions of instances;
+- ``DAU_BUILD_RESOLVE_RESULTS=<path>``: where the JSON timings land.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from dau_build.svparser import Module
+from dau_build.tests.sv_fixtures import write_layered_hierarchy
+
+# (depth, width)
+_SMOKE_SET = ((2, 2), (4, 3))
+_FULL_SET = ((4, 4), (8, 4), (16, 4), (8, 8), (16, 8), (32, 8))
+
+
+def test_resolve_bench(tmp_path: Path, monkeypatch) -> None:
+    shape_set = _FULL_SET if os.environ.get("DAU_BUILD_RESOLVE_BENCH") == "full" else _SMOKE_SET
+    parsed = []
+    from_file = Module.from_file.__func__
+
+    def counting_from_file(cls, path):
+        parsed.append(path)
+        return from_file(cls, path)
+
+    monkeypatch.setattr(Module, "from_file", classmethod(counting_from_file))
+    runs = []
+    for depth, width in shape_set:
+        root = write_layered_hierarchy(tmp_path / f"d{depth}w{width}", depth=depth, width=width)
+        top = Module.from_file(root / "top.sv")
+        parsed.clear()
+        started = time.perf_counter()
+        top.resolve(root)
+        resolve_s = time.perf_counter() - started
+        definitions = depth * width
+        assert len(parsed) == definitions
+        edges = width + (depth - 1) * width * width
+        runs.append(
+            {
+                "depth": depth,
+                "width": width,
+                "definitions": definitions,
+                "instance_edges": edges,
+                "unshared_instances": sum(width**level for level in range(1, depth + 1)),
+                "resolve_s": resolve_s,
+                "per_definition_us": resolve_s / definitions * 1e6,
+                "per_edge_us": resolve_s / edges * 1e6,
+            }
+        )
+    destination = os.environ.get("DAU_BUILD_RESOLVE_RESULTS")
+    if destination:
+        Path(destination).write_text(json.dumps({"runs": runs}, indent=2, sort_keys=True) + "\n")
@@ -6,10 +6,14 @@ import pytest
 from pydantic import ValidationError
 
 from dau_build.scan_composition import (
+    HANDLE_BATCH_CLEAR_BIT,
+    HANDLE_BATCH_COMMIT_BIT,
     HANDLE_FAULT_BAD_ID,
     HANDLE_FAULT_OUT_OF_BOUNDS,
     HANDLE_FAULT_STALE,
+    MAX_HANDLE_BATCH_DEPTH,
     MAX_HANDLE_TABLE_CAPACITY,
+    MAX_JOB_QUEUE_DEPTH,
     LaneTile,
     RegisterLayout,
     ScanComposition,
@@ -1471,3 +1475,205 @@ def test_the_sim_harness_surfaces_the_handle_table_as_ports() -> None:
     assert "module dau_shell_handle_table #(" in text
     # the table's own resolve_request still comes off the harness start
     assert ".resolve_request(start && length_ok)," in text
+
+
+def _handle_batch_composition(**update) -> ScanComposition:
+    return _handle_table_composition().model_copy(update={"handle_batch_depth": 8, **update})
+
+
+def test_no_batch_depth_leaves_the_handle_table_top_byte_identical() -> None:
+    """Batching is opt-in on top of the table: a table without a depth still
+    matches its golden and binds the single-slot registers straight to the
+    programming port."""
+    text = generate_scan_composition_top_sv(_handle_table_composition(), platform_id="DPV1")
+    assert text == (_FIXTURES / "handle_table_scan.v").read_text()
+    assert "batch" not in text
+    assert ".program_install(handle_install)," in text
+
+
+def test_a_batch_queue_sits_in_front_of_the_programming_port() -> None:
+    """Queued entries drain through the SAME port the single-slot registers
+    drive, so free-outranks-install and the generation check are the table's
+    own -- the queue only decides whose entry the port sees this cycle."""
+    text = generate_scan_composition_top_sv(_handle_batch_composition(), platform_id="DPV1")
+    assert "localparam [11:0] ADDR_HANDLE_BATCH_DATA = 12'h0F4;" in text
+    assert "localparam [11:0] ADDR_HANDLE_BATCH_CONTROL = 12'h0F8;" in text
+    assert "    reg [31:0] batch_queue_index [0:7];\n" in text
+    assert ".program_install(handle_program_install)," in text
+    assert ".program_generation(handle_program_generation)," in text
+    assert "wire handle_program_install = batch_pop ? batch_queue_install[batch_head] : handle_install;" in text
+    # a direct CONTROL write in the same cycle wins the port instead of being dropped
+    assert "wire batch_pop = batch_draining && (batch_count != 4'd0) && !handle_install && !handle_free;" in text
+
+
+def test_a_batch_entry_is_the_single_slot_word_sequence() -> None:
+    """One data register takes INDEX, BASE, LENGTH, GENERATION and the CONTROL
+    word, in that order; the CONTROL word pushes the entry with the same bit
+    positions HANDLE_CONTROL uses."""
+    text = generate_scan_composition_top_sv(_handle_batch_composition(), platform_id="DPV1")
+    assert "3'd0: batch_index <= s_axi_wdata;" in text
+    assert "3'd1: batch_base <= s_axi_wdata[31:0];" in text
+    assert "3'd4: begin\n                                batch_push_install <= s_axi_wdata[0];" in text
+    assert "batch_word <= (batch_word == 3'd4) ? 3'd0 : batch_word + 3'd1;" in text
+    assert f"batch_commit <= s_axi_wdata[{HANDLE_BATCH_COMMIT_BIT}];" in text
+    assert f"batch_clear <= s_axi_wdata[{HANDLE_BATCH_CLEAR_BIT}];" in text
+    wide = generate_scan_composition_top_sv(_handle_batch_composition(addr_width=64), platform_id="DPV1")
+    assert "3'd2: batch_base[63:32] <= s_axi_wdata[31:0];" in wide
+    assert "batch_word <= (batch_word == 3'd5) ? 3'd0 : batch_word + 3'd1;" in wide
+
+
+def test_a_job_started_mid_drain_waits_for_the_batch() -> None:
+    """Commit-then-start must not resolve against a half-programmed table, so
+    the start parks until the queue drains and the job reads busy meanwhile."""
+    text = generate_scan_composition_top_sv(_handle_batch_composition(), platform_id="DPV1")
+    assert "wire handle_start = (job_start || batch_start_held) && !batch_draining;" in text
+    assert ".resolve_request(handle_start && length_ok)," in text
+    assert "wire job_busy = reader_busy || handle_pending || batch_start_held || " in text
+    assert "(!handle_pending && !batch_start_held && reader_done && " in text
+    # an overflowing push is dropped and latched, never silently lost
+    assert "end else if (batch_push) begin\n                batch_overflow <= 1'b1;" in text
+
+
+def test_the_batch_depth_is_planned_and_needs_a_table() -> None:
+    with pytest.raises(ScanCompositionError, match="handle_batch_depth needs a handle table"):
+        generate_scan_composition_top_sv(_bar_noc_composition().model_copy(update={"handle_batch_depth": 4}), platform_id="DPV1")
+    with pytest.raises(ScanCompositionError, match="handle_batch_depth must be between 0"):
+        generate_scan_composition_top_sv(_handle_batch_composition(handle_batch_depth=MAX_HANDLE_BATCH_DEPTH + 1), platform_id="DPV1")
+    # a one-entry queue has a one-bit count, so the push/pop terms carry no pad
+    single = generate_scan_composition_top_sv(_handle_batch_composition(handle_batch_depth=1), platform_id="DPV1")
+    assert "batch_count <= batch_count + {batch_push && !batch_full} - {batch_pop};" in single
+
+
+def _job_queue_composition(**update) -> ScanComposition:
+    return _bar_noc_composition().model_copy(update={"name": "job-queue-scan", "job_queue_depth": 4, **update})
+
+
+def test_no_job_queue_is_the_default_and_leaves_the_top_untouched() -> None:
+    """JOB_CONTROL stays an immediate start unless a composition asks for a
+    queue; the pinned goldens prove the bytes, this proves the shape."""
+    text = generate_scan_composition_top_sv(_bar_noc_composition(), platform_id="DPV1")
+    assert "queue" not in text
+    assert "submit" not in text
+    assert "ADDR_JOB_CONTROL: job_start <= s_axi_wdata[0];" in text
+
+
+def test_a_job_queue_stages_the_job_registers_and_submits_on_job_control() -> None:
+    """The host writes the same registers it always did, but they are a
+    staging set: JOB_CONTROL snapshots them into the queue, and the units read
+    the ACTIVE job the dispatcher loaded."""
+    text = generate_scan_composition_top_sv(_job_queue_composition(), platform_id="DPV1")
+    assert "ADDR_JOB_CONTROL: job_submit <= s_axi_wdata[0];" in text
+    assert "ADDR_INPUT_ADDRESS_LOW: submit_input_address <= s_axi_wdata[31:0];" in text
+    assert "ADDR_INPUT_LENGTH_LOW: submit_input_length_bytes <= s_axi_wdata;" in text
+    assert "ADDR_LANE0_OUTPUT_ADDRESS: submit_lane_output_address_0 <= s_axi_wdata;" in text
+    assert "queue_lane_output_address[queue_tail] <= {submit_lane_output_address_3, submit_lane_output_address_2, " in text
+    assert (
+        "{lane_output_address_3, lane_output_address_2, lane_output_address_1, lane_output_address_0} <= queue_lane_output_address[queue_head];"
+        in text
+    )
+    # the units still read the names they always read
+    assert ".read_address(input_address)," in text
+    assert ".read_length_bytes(input_length_bytes)," in text
+
+
+def test_job_status_reads_busy_until_the_queue_drains() -> None:
+    """A host that polls JOB_STATUS after every job keeps working, and the
+    pipeline reset still keys off the running job's own close-out."""
+    text = generate_scan_composition_top_sv(_job_queue_composition(), platform_id="DPV1")
+    assert "    wire job_busy = run_busy || queue_pending;\n    wire job_done = run_done && !queue_pending;\n" in text
+    assert "pipeline_error_reset <= run_done && !prev_done && job_error;" in text
+    assert "wire queue_complete = queue_running && !job_start && !queue_settle && run_done;" in text
+
+
+def test_the_job_queue_block_sits_clear_of_the_contract_windows() -> None:
+    text = generate_scan_composition_top_sv(_job_queue_composition(), platform_id="DPV1")
+    assert "localparam [11:0] ADDR_JOB_QUEUE_STATUS = 12'hF00;" in text
+    assert "localparam [11:0] ADDR_JOB_QUEUE_RESULT = 12'hF04;" in text
+    assert "localparam [11:0] ADDR_JOB_QUEUE_COMPLETED = 12'hF08;" in text
+    assert "localparam [11:0] ADDR_LANE1_QUEUED_RESULT_LENGTH = 12'h138;" in text
+    assert "ADDR_LANE1_QUEUED_RESULT_LENGTH: s_axi_rdata <= job_queue_result_lengths_word[63:32];" in text
+    assert "ADDR_JOB_QUEUE_RESULT: queue_result_pop <= 1'b1;" in text
+    # the job and lane blocks are exactly where they were
+    assert "localparam [11:0] ADDR_INPUT_ADDRESS_LOW = 12'h058;" in text
+    assert "localparam [11:0] ADDR_LANE0_OUTPUT_ADDRESS = 12'h100;" in text
+
+
+def test_a_queued_handle_job_carries_its_handle_in_the_descriptor() -> None:
+    composition = _handle_table_composition().model_copy(update={"job_queue_depth": 2})
+    text = generate_scan_composition_top_sv(composition, platform_id="DPV1")
+    assert "ADDR_JOB_HANDLE_ID: submit_job_handle_id <= s_axi_wdata;" in text
+    assert "queue_job_handle_id[queue_tail] <= submit_job_handle_id;" in text
+    assert "job_handle_id <= queue_job_handle_id[queue_head];" in text
+    assert ".resolve_id(job_handle_id)," in text
+
+
+def test_the_sim_harness_carries_the_same_queue_behind_a_submit_port() -> None:
+    text = generate_scan_composition_sim_sv(_job_queue_composition())
+    assert "    input wire submit,\n" in text
+    assert "    input wire [31:0] submit_input_length_bytes,\n" in text
+    assert "    input wire [127:0] submit_lane_output_address,\n" in text
+    assert "    output wire [31:0] job_queue_result,\n" in text
+    assert "    reg [127:0] lane_output_address;\n" in text
+    assert "queue_lane_output_address[queue_tail] <= submit_lane_output_address;" in text
+    assert "    input wire start,\n" not in text
+    assert "assign done = run_done && !queue_pending;" in text
+
+
+def test_the_job_queue_depth_is_planned() -> None:
+    with pytest.raises(ScanCompositionError, match="job_queue_depth must be between 0"):
+        generate_scan_composition_top_sv(_job_queue_composition(job_queue_depth=MAX_JOB_QUEUE_DEPTH + 1), platform_id="DPV1")
+    # a lane block that would run into the queue registers is refused
+    crowded = _job_queue_composition(registers=RegisterLayout(lane_stride=0x100))
+    with pytest.raises(ScanCompositionError, match="past the high register block"):
+        generate_scan_composition_top_sv(crowded.model_copy(update={"lanes": crowded.lanes * 4}), platform_id="DPV1")
+
+
+def _ping_pong_composition(**update) -> ScanComposition:
+    return _bar_noc_composition().model_copy(update={"name": "ping-pong-scan", "ping_pong_windows": True, **update})
+
+
+def test_ping_pong_windows_are_off_by_default_and_leave_the_top_untouched() -> None:
+    text = generate_scan_composition_top_sv(_bar_noc_composition(), platform_id="DPV1")
+    assert "window" not in text.replace("window-relative", "")
+    assert "    reg [31:0] input_address;\n    reg [31:0] input_length_bytes;\n" in text
+
+
+def test_ping_pong_windows_stage_the_next_input_while_one_streams() -> None:
+    """Window 0 keeps the contract's INPUT_* offsets, window 1 and the toggle
+    sit in the high block, and the reader sees whichever window the running
+    job latched at its start."""
+    text = generate_scan_composition_top_sv(_ping_pong_composition(), platform_id="DPV1")
+    assert "localparam [11:0] ADDR_INPUT_ADDRESS_LOW = 12'h058;" in text
+    assert "localparam [11:0] ADDR_INPUT1_ADDRESS_LOW = 12'hF10;" in text
+    assert "localparam [11:0] ADDR_INPUT1_LENGTH_LOW = 12'hF18;" in text
+    assert "localparam [11:0] ADDR_WINDOW_SELECT = 12'hF1C;" in text
+    assert "ADDR_INPUT_ADDRESS_LOW: window0_input_address <= s_axi_wdata[31:0];" in text
+    assert "ADDR_INPUT1_LENGTH_LOW: window1_input_length_bytes <= s_axi_wdata;" in text
+    assert "ADDR_WINDOW_SELECT: s_axi_rdata <= {30'd0, window_active, window_select};" in text
+    assert "wire window_current = job_start ? window_select : window_active;" in text
+    assert "wire [31:0] input_address = window_current ? window1_input_address : window0_input_address;" in text
+    assert "length_fail <= !length_ok;\n                window_active <= window_select;\n                window_select <= !window_select;\n" in text
+    assert ".read_address(input_address)," in text
+    # the wide master gets the second window's high half too
+    wide = generate_scan_composition_top_sv(_ping_pong_composition(addr_width=64), platform_id="DPV1")
+    assert "ADDR_INPUT1_ADDRESS_HIGH: window1_input_address[63:32] <= s_axi_wdata[31:0];" in wide
+    assert "ADDR_INPUT1_ADDRESS_HIGH: s_axi_rdata <= window1_input_address[63:32];" in wide
+
+
+def test_the_sim_harness_carries_both_windows_as_ports() -> None:
+    text = generate_scan_composition_sim_sv(_ping_pong_composition())
+    assert "    input wire [31:0] window0_input_address,\n" in text
+    assert "    input wire [31:0] window1_input_length_bytes,\n" in text
+    assert "    output reg window_select,\n    output reg window_active,\n" in text
+    assert "    input wire [31:0] input_address,\n" not in text
+    assert "wire window_current = start ? window_select : window_active;" in text
+
+
+def test_ping_pong_windows_are_refused_beside_handles_and_queues() -> None:
+    with pytest.raises(ScanCompositionError, match="names its input by handle"):
+        generate_scan_composition_top_sv(_handle_table_composition().model_copy(update={"ping_pong_windows": True}), platform_id="DPV1")
+    with pytest.raises(ScanCompositionError, match="declare one"):
+        generate_scan_composition_top_sv(_ping_pong_composition(job_queue_depth=2), platform_id="DPV1")
+    crowded = _ping_pong_composition(registers=RegisterLayout(lane_stride=0x100))
+    with pytest.raises(ScanCompositionError, match="past the high register block"):
+        generate_scan_composition_top_sv(crowded.model_copy(update={"lanes": crowded.lanes * 4}), platform_id="DPV1")
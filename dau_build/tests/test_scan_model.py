@@ -0,0 +1,128 @@
+import time
+
+import numpy as np
+import pytest
+
+from dau_build.scan_composition import (
+    HANDLE_FAULT_BAD_ID,
+    HANDLE_FAULT_OUT_OF_BOUNDS,
+    HANDLE_FAULT_STALE,
+    LaneTile,
+    ScanComposition,
+    TileInstance,
+)
+from dau_build.scan_model import LENGTH_FAULT, HandleEntry, ScanModelError, TileOutput, config_int, run_scan_model
+
+
+def _offset(rows: np.ndarray, tile: TileInstance) -> TileOutput:
+    """The dau_test_offset_tile: adds cfg_offset to every 64-bit word and
+    counts the words it passed."""
+    return TileOutput(data=rows + np.uint64(config_int(tile, "cfg_offset")), count=rows.size)
+
+
+def _key_filter(rows: np.ndarray, tile: TileInstance) -> np.ndarray:
+    return (rows[:, 0] & np.uint64(config_int(tile, "cfg_key_mask"))) == np.uint64(config_int(tile, "cfg_key_match"))
+
+
+def _offset_lane(offset: int, **fields) -> LaneTile:
+    return LaneTile(module="dau_test_offset_tile", config={"cfg_offset": f"64'd{offset}"}, count_port="row_count", **fields)
+
+
+def test_broadcast_lanes_each_see_every_row():
+    composition = ScanComposition(name="model", module_name="dau_model_job", lanes=(_offset_lane(1), _offset_lane(1000)))
+    memory = np.arange(64, dtype=np.uint64)
+    result = run_scan_model(composition, memory, input_address=16 * 8, input_length_bytes=64, references={"dau_test_offset_tile": _offset})
+
+    assert result.error_code == 0
+    np.testing.assert_array_equal(result.lanes[0].words, np.arange(16, 24, dtype=np.uint64) + 1)
+    np.testing.assert_array_equal(result.lanes[1].words, np.arange(16, 24, dtype=np.uint64) + 1000)
+    assert [lane.result_length_bytes for lane in result.lanes] == [64, 64]
+    assert [lane.record_count for lane in result.lanes] == [8, 8]
+
+    image = result.write_into(memory, (40 * 8, 48 * 8))
+    np.testing.assert_array_equal(image[40:48], np.arange(16, 24) + 1)
+    np.testing.assert_array_equal(image[48:56], np.arange(16, 24) + 1000)
+    assert image[:40].tolist() == memory[:40].tolist()
+
+
+def test_partition_filters_and_a_shared_partitioner_split_rows_in_stream_order():
+    keys = np.arange(32, dtype=np.uint64)
+    memory = np.stack([keys, keys * 10], axis=1).reshape(-1)
+    references = {"dau_test_offset_tile": _offset, "dau_pair_key_filter": _key_filter}
+    filtered = ScanComposition(
+        name="model",
+        module_name="dau_model_job",
+        lanes=tuple(
+            _offset_lane(0, partition=TileInstance(module="dau_pair_key_filter", config={"cfg_key_mask": "32'd3", "cfg_key_match": f"32'd{lane}"}))
+            for lane in range(4)
+        ),
+    )
+    result = run_scan_model(filtered, memory, input_length_bytes=memory.size * 8, references=references)
+    for lane in range(4):
+        assert result.lanes[lane].words[::2].tolist() == list(range(lane, 32, 4))
+
+    routed = ScanComposition(
+        name="model",
+        module_name="dau_model_job",
+        lanes=tuple(_offset_lane(0) for _ in range(2)),
+        partitioner=TileInstance(module="dau_range_partitioner"),
+    )
+    references["dau_range_partitioner"] = lambda rows, _tile, lanes: (rows[:, 0] >= 20).astype(np.int64) % lanes
+    result = run_scan_model(routed, memory, input_length_bytes=memory.size * 8, references=references)
+    assert result.lanes[0].words[::2].tolist() == list(range(20))
+    assert result.lanes[1].words[::2].tolist() == list(range(20, 32))
+
+
+def test_faults_follow_the_shell_priority():
+    composition = ScanComposition(name="model", module_name="dau_model_job", lanes=(_offset_lane(1),), handle_table_capacity=4)
+    memory = np.arange(64, dtype=np.uint64)
+    references = {"dau_test_offset_tile": _offset}
+    table = {1: HandleEntry(base=8 * 8, length=64, generation=3)}
+
+    def run(length: int, handle: tuple[int, int]) -> int:
+        return run_scan_model(composition, memory, input_length_bytes=length, references=references, handle=handle, handle_table=table).error_code
+
+    # the length gate wins over every handle fault
+    assert run(24, (9, 0)) == LENGTH_FAULT
+    assert run(0, (1, 3)) == LENGTH_FAULT
+    assert run(32, (9, 0)) == HANDLE_FAULT_BAD_ID
+    assert run(32, (1, 2)) == HANDLE_FAULT_STALE
+    assert run(32, (2, 0)) == HANDLE_FAULT_STALE
+    assert run(96, (1, 3)) == HANDLE_FAULT_OUT_OF_BOUNDS
+    ok = run_scan_model(composition, memory, input_length_bytes=32, references=references, handle=(1, 3), handle_table=table)
+    assert ok.error_code == 0
+    assert ok.lanes[0].words.tolist() == [9, 10, 11, 12]
+
+    def failing(rows, _tile):
+        return TileOutput(data=rows, error_code=0x21)
+
+    # a failing chain stage closes its lane out, and nothing reaches the writer
+    two = ScanComposition(
+        name="model", module_name="dau_model_job", lanes=(_offset_lane(1), _offset_lane(2, chain=(TileInstance(module="dau_failing"),)))
+    )
+    result = run_scan_model(two, memory, input_length_bytes=32, references={**references, "dau_failing": failing})
+    assert result.error_code == 0x21
+    assert result.lanes[0].error_code == 0 and result.lanes[1].words.size == 0
+
+
+def test_missing_references_and_unknowable_configs_are_refused():
+    composition = ScanComposition(name="model", module_name="dau_model_job", lanes=(_offset_lane(1),))
+    with pytest.raises(ScanModelError, match="no reference for lane tile 'dau_test_offset_tile'"):
+        run_scan_model(composition, np.zeros(8, dtype=np.uint64), input_length_bytes=16, references={})
+    with pytest.raises(ScanModelError, match="runs past"):
+        run_scan_model(composition, np.zeros(8, dtype=np.uint64), input_length_bytes=128, references={"dau_test_offset_tile": _offset})
+    assert config_int(TileInstance(module="t", config={"a": "32'hFF", "b": "1_000", "c": "8'b101"}), "a") == 0xFF
+    assert config_int(TileInstance(module="t", config={"b": "1_000"}), "b") == 1000
+    with pytest.raises(ScanModelError, match="not a literal"):
+        config_int(TileInstance(module="t", config={"a": "cfg_base + 1"}), "a")
+
+
+def test_a_million_rows_model_in_well_under_a_second():
+    composition = ScanComposition(name="model", module_name="dau_model_job", lanes=(_offset_lane(1), _offset_lane(2)))
+    rng = np.random.default_rng(0)
+    memory = rng.integers(0, 1 << 62, size=2_000_000, dtype=np.uint64)
+    started = time.perf_counter()
+    result = run_scan_model(composition, memory, input_length_bytes=memory.size * 8, references={"dau_test_offset_tile": _offset})
+    elapsed = time.perf_counter() - started
+    assert result.lanes[1].words[-1] == memory[-1] + 2
+    assert elapsed < 1.0, f"{elapsed:.3f}s for 1M rows"
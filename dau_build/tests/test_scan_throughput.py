@@ -0,0 +1,53 @@
+import pytest
+
+from dau_build.scan_throughput import (
+    ThroughputMeasurement,
+    ThroughputPoint,
+    compare_throughput,
+    load_throughput_results,
+    main,
+    throughput_sweep,
+    write_throughput_results,
+)
+
+
+def _measurement(rows_per_cycle: float, *, burst_beats: int = 16) -> ThroughputMeasurement:
+    point = ThroughputPoint(burst_beats=burst_beats, read_latency=4, lanes=2, input_row_bytes=16, rows=1024)
+    return ThroughputMeasurement(
+        point=point, cycles=int(1024 / rows_per_cycle), rows_per_cycle=rows_per_cycle, reader_utilization=0.5, writer_contention=0.1
+    )
+
+
+def test_the_sweep_is_the_full_grid():
+    sweep = throughput_sweep(burst_beats=(1, 16), read_latency=(0, 8), lanes=(1, 2, 4), input_row_bytes=(16,), rows=64)
+    assert len(sweep) == 12
+    assert len({point.key for point in sweep}) == 12
+    assert sweep[0].key == "burst_beats=1 read_latency=0 lanes=1 input_row_bytes=16 rows=64"
+    with pytest.raises(ValueError):
+        ThroughputPoint(burst_beats=16, read_latency=0, lanes=1, input_row_bytes=12, rows=64)
+
+
+def test_results_round_trip_and_refuse_other_files(tmp_path):
+    measurements = (_measurement(0.2), _measurement(0.05, burst_beats=1))
+    path = write_throughput_results(tmp_path / "out" / "throughput.json", measurements, revision="abc1234")
+    assert load_throughput_results(path) == measurements
+    (tmp_path / "other.json").write_text('{"results": []}')
+    with pytest.raises(ValueError, match="not a dau-build-throughput/1"):
+        load_throughput_results(tmp_path / "other.json")
+
+
+def test_comparison_flags_only_drops_past_the_tolerance(tmp_path, capsys):
+    baseline = (_measurement(0.20), _measurement(0.05, burst_beats=1))
+    current = (_measurement(0.195), _measurement(0.04, burst_beats=1), _measurement(0.3, burst_beats=4))
+    (regression,) = compare_throughput(baseline, current, tolerance=0.05)
+    assert regression.point.burst_beats == 1
+    assert regression.change == pytest.approx(-0.2)
+    assert compare_throughput(baseline, current, tolerance=0.25) == ()
+
+    write_throughput_results(tmp_path / "base.json", baseline)
+    write_throughput_results(tmp_path / "head.json", current)
+    assert main([str(tmp_path / "base.json"), str(tmp_path / "head.json")]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2, "only points both runs measured are compared"
+    assert lines[1].endswith("status=regressed")
+    assert main([str(tmp_path / "base.json"), str(tmp_path / "head.json"), "--tolerance", "0.3"]) == 0
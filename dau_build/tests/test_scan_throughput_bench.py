@@ -0,0 +1,162 @@
+"""Throughput benchmark for generated scan-composition sim harnesses: the
+offset-tile pipeline the sim benches prove correct, driven with many rows
+and measured per clock instead of checked per row.
+
+Each sweep point is its own harness build (``burst_beats``, ``read_latency``,
+the lane count and ``input_row_bytes`` are all elaborated in), so the pytest
+wrapper runs a two-point smoke sweep by default. The environment widens it:
+
+- ``DAU_BUILD_THROUGHPUT_SWEEP=full``: the whole ``throughput_sweep()`` grid;
+- ``DAU_BUILD_THROUGHPUT_RESULTS=<path>``: where the JSON results land;
+- ``DAU_BUILD_THROUGHPUT_BASELINE=<path>``: a previous results file to
+  compare against -- the run fails on any point that regressed.
+
+The numbers are those of the behavioral doubles in ``tests/sv/scan_sim``:
+the reader bursts and the RAM honours its read latency, but the record
+writer lands one beat per write burst, so multi-lane runs are bound by the
+write mux long before the read side.
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from shutil import which
+
+import cocotb
+import numpy as np
+import pytest
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+from cocotb_tools.runner import get_runner
+
+from dau_build.scan_composition import LaneTile, ScanComposition, generate_scan_composition_sim_sv
+from dau_build.scan_throughput import (
+    ThroughputMeasurement,
+    ThroughputPoint,
+    compare_throughput,
+    load_throughput_results,
+    throughput_sweep,
+    write_throughput_results,
+)
+from dau_build.sim_memory import SimMemory
+
+_SCAN_SIM_SV = Path(__file__).resolve().parent / "sv" / "scan_sim"
+
+# burst_beats is the axis the smoke sweep exercises: at a realistic read
+# latency, one-beat bursts pay the latency per row and whole bursts do not
+_SMOKE_SWEEP = throughput_sweep(burst_beats=(1, 16), read_latency=(8,), lanes=(1,), input_row_bytes=(16,), rows=512)
+
+
+def _bench_composition(point: ThroughputPoint) -> ScanComposition:
+    return ScanComposition(
+        name="throughput-bench",
+        module_name="dau_throughput_bench_job",
+        burst_beats=point.burst_beats,
+        input_row_bytes=point.input_row_bytes,
+        lanes=tuple(
+            LaneTile(module="dau_test_offset_tile", config={"cfg_offset": f"64'd{lane + 1}"}, count_port="row_count") for lane in range(point.lanes)
+        ),
+    )
+
+
+def _mem_words(point: ThroughputPoint) -> int:
+    # the input window, then one output region per lane
+    return 1 << (point.rows * (point.lanes + 1) - 1).bit_length()
+
+
+@cocotb.test()
+async def measure_throughput(dut):
+    """Run one job over the rows the bulk backdoor preloaded, and count the
+    clocks, the read beats and the writers' waits."""
+    rows = int(os.environ["DAU_THROUGHPUT_ROWS"])
+    lanes = int(os.environ["DAU_THROUGHPUT_LANES"])
+    cocotb.start_soon(Clock(dut.clk, 10, unit="ns").start(start_high=False))
+    dut.rst.value = 1
+    dut.start.value = 0
+    dut.bd_write.value = 0
+    dut.bd_load.value = 0
+    dut.bd_dump.value = 0
+    for _ in range(5):
+        await RisingEdge(dut.clk)
+    dut.rst.value = 0
+    await RisingEdge(dut.clk)
+
+    dut.input_address.value = 0
+    dut.input_length_bytes.value = rows * 8
+    dut.lane_output_address.value = sum((rows * 8 * (lane + 1)) << (32 * lane) for lane in range(lanes))
+    dut.start.value = 1
+    await RisingEdge(dut.clk)
+    dut.start.value = 0
+
+    cycles = read_beats = writer_waits = 0
+    while not dut.done.value:
+        await RisingEdge(dut.clk)
+        cycles += 1
+        read_beats += int(dut.rd_rvalid.value) & int(dut.rd_rready.value)
+        waiting = int(dut.wr_awvalid_flat.value) & ~int(dut.wr_awready_flat.value)
+        writer_waits += waiting.bit_count()
+        assert cycles < rows * 64 * lanes + 10_000, "the job did not close out"
+    assert dut.error.value == 0, f"the job failed with {int(dut.error_code.value):#x}"
+    lengths = int(dut.lane_result_length_bytes.value)
+    assert [(lengths >> (32 * lane)) & 0xFFFFFFFF for lane in range(lanes)] == [rows * 8] * lanes
+
+    Path(os.environ["DAU_THROUGHPUT_OUT"]).write_text(
+        json.dumps(
+            {"cycles": cycles, "rows_per_cycle": rows / cycles, "reader_utilization": read_beats / cycles, "writer_contention": writer_waits / cycles}
+        )
+    )
+
+
+def _measure(point: ThroughputPoint, work_dir: Path) -> ThroughputMeasurement:
+    harness = generate_scan_composition_sim_sv(
+        _bench_composition(point),
+        module_name="dau_throughput_bench_sim",
+        mem_words=_mem_words(point),
+        read_latency=point.read_latency,
+        sources=(_SCAN_SIM_SV / "dau_test_offset_tile.sv",),
+        bulk_backdoor=True,
+    )
+    work_dir.mkdir(parents=True)
+    top = work_dir / "dau_throughput_bench_sim.v"
+    top.write_text(harness)
+    memory = SimMemory(load_path=work_dir / "load.hex", dump_path=work_dir / "dump.hex", mem_words=_mem_words(point))
+    memory.preload(np.arange(point.rows, dtype=np.uint64) * np.uint64(3) + np.uint64(1))
+
+    runner = get_runner("verilator")
+    build_dir = work_dir / "sim_build"
+    runner.build(sources=[top, *sorted(_SCAN_SIM_SV.glob("*.sv"))], hdl_toplevel="dau_throughput_bench_sim", always=True, build_dir=build_dir)
+    measured = work_dir / "measured.json"
+    runner.test(
+        hdl_toplevel="dau_throughput_bench_sim",
+        test_module="dau_build.tests.test_scan_throughput_bench",
+        build_dir=build_dir,
+        plusargs=memory.plusargs,
+        extra_env={"DAU_THROUGHPUT_ROWS": str(point.rows), "DAU_THROUGHPUT_LANES": str(point.lanes), "DAU_THROUGHPUT_OUT": str(measured)},
+    )
+    return ThroughputMeasurement(point=point, **json.loads(measured.read_text()))
+
+
+def _revision() -> str | None:
+    result = subprocess.run(("git", "rev-parse", "--short", "HEAD"), cwd=Path(__file__).parent, capture_output=True, text=True, check=False)
+    return result.stdout.strip() or None
+
+
+@pytest.mark.skipif(which("verilator") is None, reason="verilator not found")
+def test_scan_throughput_bench(tmp_path: Path):
+    sweep = throughput_sweep() if os.environ.get("DAU_BUILD_THROUGHPUT_SWEEP") == "full" else _SMOKE_SWEEP
+    measurements = tuple(_measure(point, tmp_path / f"point-{index}") for index, point in enumerate(sweep))
+    results = write_throughput_results(
+        os.environ.get("DAU_BUILD_THROUGHPUT_RESULTS") or tmp_path / "throughput.json", measurements, revision=_revision()
+    )
+    assert load_throughput_results(results) == measurements
+
+    if sweep is _SMOKE_SWEEP:
+        single, bursting = measurements
+        assert bursting.rows_per_cycle > single.rows_per_cycle
+        assert bursting.reader_utilization > single.reader_utilization
+
+    baseline = os.environ.get("DAU_BUILD_THROUGHPUT_BASELINE")
+    if baseline:
+        regressions = compare_throughput(load_throughput_results(baseline), measurements)
+        assert not regressions, "\n".join(f"{regression.point.key}: {regression.change:+.1%} rows/cycle" for regression in regressions)
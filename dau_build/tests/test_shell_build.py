@@ -7,12 +7,15 @@ from pathlib import Path
 
 import pytest
 
-from dau_build.build_steps import BuildShellProjectTask, BuildStepError, FlashTask
+from dau_build.build_steps import BuildShellProjectTask, BuildStepError, FlashTask, SweepShellImplementationTask
 from dau_build.packaging import load_artifact_manifest
 from dau_build.shell_build import (
+    DEFAULT_IMPLEMENTATION_VARIANTS,
     SHELL_BUILD_MANIFEST_NAME,
+    ImplementationVariant,
     ShellBuildError,
     ShellBuildStatus,
+    implementation_sweep_tcl,
     parse_shell_build_console,
     run_shell_project_build,
     shell_build_manifest,
@@ -43,6 +46,8 @@ def test_parse_console_markers() -> None:
     assert parse_shell_build_console("noise\nDAU_MM_JOB_BUILD_OK wns=0.321\n") == ShellBuildStatus(build_status="built", wns_ns=0.321)
     assert parse_shell_build_console("DAU_MM_JOB_BUILD_FAILED synthesis\n") == ShellBuildStatus(build_status="failed", failed_stage="synthesis")
     assert parse_shell_build_console("vivado died\n") == ShellBuildStatus(build_status="unknown")
+    incremental = parse_shell_build_console("DAU_MM_JOB_INCREMENTAL reference=/shell/dau_reference_routed.dcp\nDAU_MM_JOB_BUILD_OK wns=0.1\n")
+    assert incremental.incremental_reference == "/shell/dau_reference_routed.dcp"
 
 
 def test_manifest_packages_outputs_with_digests(tmp_path: Path) -> None:
@@ -117,6 +122,47 @@ def test_task_execute_builds_and_writes_manifest(tmp_path: Path) -> None:
     assert manifest.metadata["build_status"] == "built"
     assert manifest.metadata["shell"] == "bar-noc"
     assert manifest.metadata["wns_ns"] == 0.123
+    assert "incremental_reference" not in manifest.metadata
+
+
+def test_an_incremental_build_records_its_reference_in_the_manifest(tmp_path: Path) -> None:
+    output_root = tmp_path / "shell"
+    output_root.mkdir()
+    (output_root / "build_mm_job.tcl").write_text("# generated\n")
+    vivado = tmp_path / "incremental-vivado"
+    vivado.write_text("#!/bin/sh\necho 'DAU_MM_JOB_INCREMENTAL reference=none'\necho 'DAU_MM_JOB_BUILD_OK wns=0.2'\ntouch dau_mm_job.bit\n")
+    vivado.chmod(vivado.stat().st_mode | stat.S_IXUSR)
+    BuildShellProjectTask(output_root=output_root, vivado=str(vivado), execute=True)(None)
+    # "none": the first incremental build had nothing to reuse
+    assert load_artifact_manifest(output_root / SHELL_BUILD_MANIFEST_NAME).metadata["incremental_reference"] == "none"
+
+
+def test_a_digest_cache_carries_source_digests_across_builds(tmp_path: Path, monkeypatch) -> None:
+    from dau_build.config import compose_config
+    from dau_build.digests import default_digest_cache_path
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    output_root = tmp_path / "shell"
+    output_root.mkdir()
+    (output_root / "build_mm_job.tcl").write_text("# generated\n")
+    source = tmp_path / "top.sv"
+    source.write_text("module top; endmodule\n")
+    os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+    overlay = tmp_path / "user-configs"
+    (overlay / "host" / "hosts").mkdir(parents=True)
+    (overlay / "host" / "hosts" / "bench.yaml").write_text(
+        "# @package host\n_target_: dau_build.build_config.HostConfig\nname: bench\ndigest_cache: true\ndigest_cache_verify: 0.25\n"
+    )
+    cfg = compose_config(["task=tasks/build/build-shell-project", "host=hosts/bench"], config_dir=str(overlay)).cfg
+    assert (cfg.model.digest_cache, cfg.model.digest_cache_verify) == (True, 0.25)
+
+    task = BuildShellProjectTask(output_root=output_root, vivado=str(_fake_vivado(tmp_path)), source_paths=(source,), digest_cache=True, execute=True)
+    task(None)
+    assert default_digest_cache_path().is_file()
+    task(None)
+    manifest = load_artifact_manifest(output_root / SHELL_BUILD_MANIFEST_NAME)
+    (hdl,) = (artifact for artifact in manifest.artifacts if artifact.role == "hdl-source")
+    assert hdl.digest.value == hashlib.sha256(source.read_bytes()).hexdigest()
 
 
 def test_task_execute_refuses_a_placeholder_platform(tmp_path: Path) -> None:
@@ -203,3 +249,73 @@ def test_overlay_build_manifest_packages_built_runs_only(tmp_path: Path) -> None
     assert roles.count("bitstream") == 1 and "report" in roles and "build-log" in roles
     bitstream = next(a for a in manifest.artifacts if a.role == "bitstream")
     assert bitstream.digest is not None
+
+
+def _sweep_vivado(tmp_path: Path) -> Path:
+    # slack by placer directive: Explore closes timing, ExtraNetDelay_high
+    # dies in routing, everything else misses by 200 ps
+    vivado = tmp_path / "sweep-vivado"
+    vivado.write_text(
+        "#!/bin/sh\n"
+        'case "$(cat impl_sweep.tcl)" in\n'
+        "  *'place_design -directive Explore'*) echo 'DAU_MM_JOB_BUILD_OK wns=0.050' ;;\n"
+        "  *'place_design -directive ExtraNetDelay_high'*) echo 'DAU_MM_JOB_BUILD_FAILED route'; exit 1 ;;\n"
+        "  *) echo 'DAU_MM_JOB_BUILD_OK wns=-0.200' ;;\n"
+        "esac\n"
+        'printf %s "$PWD" > dau_mm_job.bit\n'
+        'echo "timing of $PWD" > timing_mm.rpt\n'
+    )
+    vivado.chmod(vivado.stat().st_mode | stat.S_IXUSR)
+    return vivado
+
+
+def test_implementation_sweep_tcl_runs_each_directive_from_the_synthesized_checkpoint() -> None:
+    default, explore = DEFAULT_IMPLEMENTATION_VARIANTS[:2]
+    text = implementation_sweep_tcl(default)
+    assert 'open_checkpoint "$shell_dir/project_mm/project_mm.runs/synth_1/Top_wrapper.dcp"' in text
+    assert "place_design -directive Default" in text and "phys_opt_design" not in text
+    assert "lane swizzle verified" not in text
+    checked = implementation_sweep_tcl(explore, lane_placements=((0, "GTXE2_CHANNEL_X0Y0"),))
+    assert "phys_opt_design -directive Explore" in checked
+    assert checked.index("lane swizzle verified") < checked.index("write_bitstream")
+    with pytest.raises(ValueError, match="plain directory name"):
+        ImplementationVariant(name="../escape")
+
+
+def test_sweep_keeps_the_best_run_and_records_every_one(tmp_path: Path) -> None:
+    output_root = _fake_shell_output(tmp_path)
+    task = SweepShellImplementationTask(output_root=output_root, vivado=str(_sweep_vivado(tmp_path)), max_parallel=2)
+    planned = task(None).message.splitlines()
+    assert planned[0].endswith("variants=5 parallel=2 status=planned")
+    assert planned[2] == "variant\tname=explore opt=Explore place=Explore phys_opt=Explore route=Explore"
+    with pytest.raises(BuildStepError, match="build the shell project first"):
+        task.model_copy(update={"execute": True})(None)
+
+    checkpoint = output_root / "project_mm" / "project_mm.runs" / "synth_1" / "Top_wrapper.dcp"
+    checkpoint.parent.mkdir(parents=True)
+    checkpoint.write_bytes(b"synthesized")
+    result = task.model_copy(update={"execute": True})(None)
+    assert "best=explore wns=0.05" in result.message
+    assert "variant\tname=extra-net-delay status=failed wns=None stage=route" in result.message
+
+    # the best run's bitstream and reports became the shell build's
+    explore_root = output_root / "sweep" / "explore"
+    assert (output_root / "dau_mm_job.bit").read_text() == str(explore_root)
+    assert (output_root / "timing_mm.rpt").read_text().strip() == f"timing of {explore_root}"
+    manifest = load_artifact_manifest(output_root / SHELL_BUILD_MANIFEST_NAME)
+    bitstream = next(artifact for artifact in manifest.artifacts if artifact.role == "bitstream")
+    assert bitstream.digest.value == hashlib.sha256(str(explore_root).encode()).hexdigest()
+    assert (manifest.metadata["implementation_variant"], manifest.metadata["wns_ns"]) == ("explore", 0.05)
+    sweep = {record["name"]: record for record in manifest.metadata["implementation_sweep"]}
+    assert sorted(sweep) == sorted(variant.name for variant in DEFAULT_IMPLEMENTATION_VARIANTS)
+    assert sweep["default"]["wns_ns"] == -0.2 and sweep["extra-net-delay"]["build_status"] == "failed"
+
+    # nothing built: nothing adopted
+    broken = SweepShellImplementationTask(
+        output_root=output_root,
+        vivado=str(_sweep_vivado(tmp_path)),
+        variants=({"name": "net", "place_directive": "ExtraNetDelay_high"},),
+        execute=True,
+    )
+    with pytest.raises(BuildStepError, match="no implementation variant built .net: exit 1, status failed, stage route"):
+        broken(None)
@@ -0,0 +1,58 @@
+import time
+
+import numpy as np
+import pytest
+
+from dau_build.scan_composition import LaneTile, ScanComposition, generate_scan_composition_sim_sv
+from dau_build.sim_memory import SimMemory, read_memh, write_memh
+
+
+def test_memh_round_trips_dense_and_sparse_images(tmp_path):
+    dense = np.array([0, 1, (1 << 64) - 1, 0xDEADBEEF], dtype=np.uint64)
+    path = write_memh(tmp_path / "dense.hex", dense)
+    assert path.read_text().splitlines()[:3] == ["@0", "0000000000000000", "0000000000000001"]
+    np.testing.assert_array_equal(read_memh(path), dense)
+
+    sparse = {16: np.array([7, 8], dtype=np.uint64), 4: np.array([3], dtype=np.uint64)}
+    memory = read_memh(write_memh(tmp_path / "sparse.hex", sparse), mem_words=32)
+    assert memory.size == 32
+    assert memory[[4, 16, 17]].tolist() == [3, 7, 8]
+    assert int(memory.sum()) == 18
+
+    with pytest.raises(ValueError, match="past the 8-word memory"):
+        read_memh(tmp_path / "sparse.hex", mem_words=8)
+
+
+def test_memh_reads_simulator_dumps(tmp_path):
+    # what $writememh produces: comments, address records, X words
+    (tmp_path / "dump.hex").write_text("// memory dump\n@2\nff_ff // two\nxxxxxxxxxxxxxxxx\n@8 10\n")
+    assert read_memh(tmp_path / "dump.hex").tolist() == [0, 0, 0xFFFF, 0, 0, 0, 0, 0, 0x10]
+
+
+def test_a_million_words_write_and_read_in_seconds(tmp_path):
+    words = np.random.default_rng(0).integers(0, 1 << 63, size=1 << 20, dtype=np.uint64)
+    started = time.perf_counter()
+    path = write_memh(tmp_path / "big.hex", words)
+    np.testing.assert_array_equal(read_memh(path), words)
+    assert time.perf_counter() - started < 10
+
+
+def test_sim_memory_names_its_images_by_plusarg(tmp_path):
+    memory = SimMemory(load_path=tmp_path / "load.hex", dump_path=tmp_path / "dump.hex", mem_words=64)
+    assert memory.plusargs == [f"+dau_mem_load={tmp_path / 'load.hex'}", f"+dau_mem_dump={tmp_path / 'dump.hex'}"]
+    memory.preload({8: np.arange(4, dtype=np.uint64)})
+    assert read_memh(memory.load_path, mem_words=64)[8:12].tolist() == [0, 1, 2, 3]
+
+
+def test_the_bulk_backdoor_is_opt_in():
+    composition = ScanComposition(
+        name="bulk",
+        module_name="dau_bulk_job",
+        lanes=(LaneTile(module="dau_test_offset_tile", config={"cfg_offset": "64'd1"}, count_port="row_count"),),
+    )
+    plain = generate_scan_composition_sim_sv(composition)
+    bulk = generate_scan_composition_sim_sv(composition, bulk_backdoor=True)
+    assert "bd_load" not in plain and "$readmemh" not in plain
+    assert "    input wire bd_load,\n    input wire bd_dump\n);" in bulk
+    assert '$value$plusargs("dau_mem_load=%s", bd_load_path)' in bulk
+    assert "$writememh(bd_dump_path, ram.mem)" in bulk
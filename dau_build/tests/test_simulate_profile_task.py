@@ -3,7 +3,7 @@ from shutil import which
 
 import pytest
 
-from dau_build.build_steps import BuildStepError
+from dau_build.build_steps import BuildStepError, VerilatorSimulator
 from dau_build.config import run_request_config
 from dau_build.tests.test_build_steps import _write_counter_testbench
 
@@ -67,3 +67,77 @@ def _write_self_contained_counter_manifest(tmp_path) -> Path:
         encoding="utf-8",
     )
     return manifest_path
+
+
+def _write_counter_profiles_manifest(tmp_path, *, broken: bool = False) -> Path:
+    """The self-contained counter profile, plus (``broken``) a second profile
+    over the same bench that waits for a marker the bench never prints."""
+    manifest_path = _write_self_contained_counter_manifest(tmp_path)
+    if broken:
+        profile_path = tmp_path / "counter-only-profiles.yaml"
+        profile_path.write_text(
+            profile_path.read_text(encoding="utf-8")
+            + "  - name: counter-broken\n    simulator: verilator\n    top_module: counter_tb\n    expect_stdout: NEVER_PRINTED\n    sources:\n      - artifact: counter-source\n      - artifact: counter-tb\n",
+            encoding="utf-8",
+        )
+    return manifest_path
+
+
+def test_multi_profile_selection_resolves_names_and_all(tmp_path):
+    manifest_path = _write_counter_profiles_manifest(tmp_path, broken=True)
+    simulator = VerilatorSimulator(profiles="counter-profile,counter-broken,counter-profile", profile_manifest=[manifest_path])
+    assert [profile.name for profile in simulator._selected_profiles()] == ["counter-profile", "counter-broken"]
+    every = VerilatorSimulator(profiles=["all"], profile_manifest=[manifest_path])._selected_profiles()
+    assert {"counter-profile", "counter-broken", "ready-valid-sum"} <= {profile.name for profile in every}
+    with pytest.raises(BuildStepError, match="unknown DAU Verilator profile 'missing'"):
+        VerilatorSimulator(profiles=["missing"], profile_manifest=[manifest_path])._selected_profiles()
+    with pytest.raises(BuildStepError, match="not both"):
+        run_request_config(
+            "task",
+            "tasks/sim/simulate",
+            overrides=["simulator=simulators/verilator", "simulator.profile=counter-profile", "simulator.profiles=[counter-profile]"],
+        )
+
+
+@pytest.mark.skipif(which("verilator") is None, reason="verilator not found")
+def test_multi_profile_simulate_runs_concurrently_in_isolated_work_dirs(tmp_path):
+    manifest_path = _write_counter_profiles_manifest(tmp_path)
+    result = run_request_config(
+        "task",
+        "tasks/sim/simulate",
+        overrides=[
+            "simulator=simulators/verilator",
+            "simulator.profiles=[counter-profile,ready-valid-sum]",
+            "simulator.jobs=2",
+            f"simulator.profile_manifest=[{manifest_path}]",
+        ],
+        model_values={"output_root": str(tmp_path / "sim")},
+    )
+    header, *rows = result.message.splitlines()
+    assert "profiles=2 passed=2 failed=0 jobs=2" in header
+    assert header.endswith("status=passed")
+    assert [row.split()[1] for row in rows] == ["name=counter-profile", "name=ready-valid-sum"]
+    assert all("status=passed" in row and "seconds=" in row for row in rows)
+    assert (tmp_path / "sim" / "counter-profile" / "obj_dir").is_dir()
+    assert (tmp_path / "sim" / "ready-valid-sum" / "obj_dir").is_dir()
+
+
+@pytest.mark.skipif(which("verilator") is None, reason="verilator not found")
+def test_a_failing_profile_fails_the_run_after_every_profile_has_run(tmp_path):
+    manifest_path = _write_counter_profiles_manifest(tmp_path, broken=True)
+    with pytest.raises(BuildStepError) as excinfo:
+        run_request_config(
+            "task",
+            "tasks/sim/simulate",
+            overrides=[
+                "simulator=simulators/verilator",
+                "simulator.profiles=[counter-broken,counter-profile]",
+                f"simulator.profile_manifest=[{manifest_path}]",
+            ],
+            model_values={"output_root": str(tmp_path / "sim")},
+        )
+    message = str(excinfo.value)
+    assert "passed=1 failed=1" in message
+    assert "name=counter-broken status=failed" in message
+    assert "did not report 'NEVER_PRINTED'" in message
+    assert "name=counter-profile status=passed" in message
@@ -5,8 +5,10 @@ import pytest
 from dau_build import Module
 from dau_build.svparser import (
     Design,
+    HierarchyCycleError,
     Interface,
 )
+from dau_build.tests.sv_fixtures import layer_module, write_layered_hierarchy
 
 _SV_DIR = (Path(__file__).parent / ".." / "sv").resolve()
 
@@ -349,3 +351,51 @@ endmodule
         done = next(o for o in mod.outputs if o.name == "done")
         assert done.dimensions.resolved
         assert done.dimensions.size() == 1
+
+
+class TestHierarchyResolution:
+    """Each definition is parsed once; instances are views of it."""
+
+    def test_a_diamond_hierarchy_parses_each_definition_once(self, tmp_path, monkeypatch):
+        root = write_layered_hierarchy(tmp_path / "rtl", depth=6, width=3)
+        parsed = []
+        from_file = Module.from_file.__func__
+
+        def counting_from_file(cls, path):
+            parsed.append(path.stem)
+            return from_file(cls, path)
+
+        monkeypatch.setattr(Module, "from_file", classmethod(counting_from_file))
+        top = Module.from_file(root / "top.sv").resolve(root)
+        # 3 ** 5 root-to-leaf paths, 18 definitions: each read once
+        assert sorted(parsed) == sorted(["top", *(layer_module(level, index) for level in range(6) for index in range(3))])
+        first, second = top.modules[0].modules[1], top.modules[1].modules[1]
+        assert first.name == second.name == layer_module(1, 1)
+        # two views of one definition: shared ports and submodules, their own instance
+        assert first.modules is second.modules and first.inputs is second.inputs
+        assert first.instance_name == second.instance_name == "u1"
+        assert [link.connection for link in first.links] == ["clk", "d", "q"]
+        leaf = top.modules[0]
+        for _ in range(5):
+            leaf = leaf.modules[-1]
+        assert leaf.name == layer_module(5, 2) and leaf.modules == [] and leaf.assigns
+
+    def test_design_resolve_shares_one_definition_per_module(self, tmp_path):
+        root = write_layered_hierarchy(tmp_path / "rtl", depth=4, width=2)
+        design = Design.from_directory(root).resolve()
+        leaf = design.modules[layer_module(3, 0)]
+        views = [sub for name in (layer_module(2, 0), layer_module(2, 1)) for sub in design.modules[name].modules if sub.name == leaf.name]
+        assert len(views) == 2 and all(view.inputs is leaf.inputs for view in views)
+        # resolving again is a no-op on the shape
+        assert [sub.name for sub in design.resolve().modules["top"].modules] == [layer_module(0, 0), layer_module(0, 1)]
+
+    def test_a_hierarchy_cycle_is_refused(self, tmp_path):
+        rtl = tmp_path / "rtl"
+        rtl.mkdir()
+        (rtl / "a.sv").write_text("module a (input logic clk);\n  b u_b (clk);\nendmodule\n")
+        (rtl / "b.sv").write_text("module b (input logic clk);\n  c u_c (clk);\nendmodule\n")
+        (rtl / "c.sv").write_text("module c (input logic clk);\n  b u_b (clk);\nendmodule\n")
+        with pytest.raises(HierarchyCycleError, match="module hierarchy cycle: b -> c -> b"):
+            Module.from_file(rtl / "a.sv").resolve(rtl)
+        with pytest.raises(HierarchyCycleError, match="b -> c -> b"):
+            Design.from_directory(rtl).resolve()
@@ -0,0 +1,113 @@
+import os
+from pathlib import Path
+from shutil import which
+
+import pytest
+
+from dau_build import verilator_cache
+from dau_build.build_steps import VerilatorSimulator
+from dau_build.verilator_cache import VerilatorBuildCache, VerilatorCacheError
+
+_COUNTER = Path(__file__).parent / "sv" / "counter.sv"
+
+
+@pytest.fixture
+def fake_verilator(monkeypatch):
+    """Key computation without a Verilator install: a resolvable executable
+    whose version the test controls."""
+    versions = {"verilator": "Verilator 5.030 2024-10-27"}
+    monkeypatch.setattr(verilator_cache, "which", lambda name: f"/opt/{name}" if name in versions or name == "ccache" else None)
+    monkeypatch.setattr(verilator_cache, "_verilator_version", lambda _path: versions["verilator"])
+    return versions
+
+
+def test_the_key_follows_sources_top_args_and_version(tmp_path, fake_verilator):
+    cache = VerilatorBuildCache(root=tmp_path / "cache")
+    bench = tmp_path / "bench.sv"
+    bench.write_text("module bench; endmodule\n")
+    base = cache.key(sources=(_COUNTER, bench), top_module="bench")
+    assert cache.key(sources=(_COUNTER, bench), top_module="bench") == base
+
+    assert cache.key(sources=(_COUNTER, bench), top_module="counter") != base
+    assert cache.key(sources=(_COUNTER, bench), top_module="bench", extra_args=("-DFAST",)) != base
+    assert cache.key(sources=(bench, _COUNTER), top_module="bench") != base
+    bench.write_text("module bench; initial $finish; endmodule\n")
+    edited = cache.key(sources=(_COUNTER, bench), top_module="bench")
+    assert edited != base
+    fake_verilator["verilator"] = "Verilator 5.032 2025-01-01"
+    assert cache.key(sources=(_COUNTER, bench), top_module="bench") != edited
+
+    with pytest.raises(VerilatorCacheError, match="not found"):
+        cache.key(sources=(_COUNTER,), top_module="counter", verilator="verilator-missing")
+
+
+def _entry(root: Path, name: str, *, size: int, last_used: float) -> Path:
+    entry = root / name
+    (entry / "obj_dir").mkdir(parents=True)
+    (entry / "obj_dir" / "Vmodel").write_bytes(b"\0" * size)
+    marker = entry / ".last-used"
+    marker.touch()
+    os.utime(marker, (last_used, last_used))
+    return entry
+
+
+def test_eviction_drops_the_least_recently_used_until_the_cache_fits(tmp_path):
+    root = tmp_path / "cache"
+    oldest = _entry(root, "a" * 32, size=400, last_used=1_000)
+    middle = _entry(root, "b" * 32, size=400, last_used=2_000)
+    newest = _entry(root, "c" * 32, size=400, last_used=3_000)
+    cache = VerilatorBuildCache(root=root, max_bytes=900)
+
+    assert cache.evict() == (oldest,)
+    assert not oldest.exists()
+    assert middle.exists() and newest.exists()
+    assert VerilatorBuildCache(root=root, max_bytes=10_000).evict() == ()
+    # the entry a run just used survives even when it is the oldest
+    assert VerilatorBuildCache(root=root, max_bytes=100).evict(keep=middle.name) == (newest,)
+    assert middle.exists()
+
+
+def test_an_entry_locked_by_a_running_build_is_not_evicted(tmp_path):
+    import fcntl
+
+    root = tmp_path / "cache"
+    busy = _entry(root, "a" * 32, size=400, last_used=1_000)
+    idle = _entry(root, "b" * 32, size=400, last_used=2_000)
+    fd = os.open(root / f"{busy.name}.lock", os.O_RDWR | os.O_CREAT)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        assert VerilatorBuildCache(root=root, max_bytes=500).evict() == (idle,)
+    finally:
+        os.close(fd)
+    assert busy.exists()
+
+
+def test_ccache_requires_the_executable(tmp_path, fake_verilator, monkeypatch):
+    monkeypatch.setattr(verilator_cache, "which", lambda name: "/opt/verilator" if name == "verilator" else None)
+    cache = VerilatorBuildCache(root=tmp_path / "cache", ccache=True)
+    with pytest.raises(VerilatorCacheError, match="no ccache executable"):
+        cache.run(sources=(_COUNTER,), top_module="counter")
+
+
+@pytest.mark.skipif(which("verilator") is None, reason="verilator not found")
+def test_an_unchanged_profile_reuses_its_cached_model(tmp_path):
+    from dau_build.tests.test_simulate_profile_task import _write_self_contained_counter_manifest
+
+    manifest_path = _write_self_contained_counter_manifest(tmp_path)
+    cache_dir = tmp_path / "verilator-cache"
+    simulator = VerilatorSimulator(profile="counter-profile", profile_manifest=[manifest_path], build_cache_dir=cache_dir)
+
+    class _Task:
+        @staticmethod
+        def _profile_work_dir(name: str) -> Path:
+            return tmp_path / "work" / name
+
+    first = simulator._run_registered_profile(_Task())
+    (entry,) = (path for path in cache_dir.iterdir() if path.is_dir())
+    model = entry / "obj_dir" / "Vcounter_tb"
+    built = model.stat().st_mtime_ns
+
+    second = simulator._run_registered_profile(_Task())
+    assert "status=passed" in first.message and "status=passed" in second.message
+    assert model.stat().st_mtime_ns == built, "the cached model was rebuilt"
+    assert [path for path in cache_dir.iterdir() if path.is_dir()] == [entry]
@@ -0,0 +1,26 @@
+import pytest
+
+from dau_build import vivado_runs
+from dau_build.vivado_runs import VivadoJobs, host_vivado_jobs, resolve_vivado_jobs, run_strategy_tcl
+
+
+def test_job_counts_are_bounded_by_cpus_and_by_memory(monkeypatch) -> None:
+    # plenty of memory: one run per CPU
+    assert host_vivado_jobs(cpu_count=8, memory_bytes=256 << 30) == VivadoJobs(synth=8, impl=8)
+    # a 16 GiB laptop: 14 GiB to spare holds four synthesis runs, two implementations
+    assert host_vivado_jobs(cpu_count=16, memory_bytes=16 << 30) == VivadoJobs(synth=4, impl=2)
+    # never below one, however small the host
+    assert host_vivado_jobs(cpu_count=2, memory_bytes=1 << 30) == VivadoJobs(synth=1, impl=1)
+    # memory the OS does not report bounds nothing
+    monkeypatch.setattr(vivado_runs, "host_memory_bytes", lambda: None)
+    assert host_vivado_jobs(cpu_count=6) == VivadoJobs(synth=6, impl=6)
+
+
+def test_explicit_counts_win_and_strategies_are_opt_in() -> None:
+    assert resolve_vivado_jobs(synth=3, impl=7) == VivadoJobs(synth=3, impl=7)
+    assert resolve_vivado_jobs(impl=7).impl == 7 and resolve_vivado_jobs(impl=7).synth >= 1
+    with pytest.raises(ValueError, match="at least 1"):
+        resolve_vivado_jobs(synth=0, impl=1)
+
+    assert run_strategy_tcl() == ""
+    assert run_strategy_tcl(impl_strategy="Performance_Explore") == "set_property strategy {Performance_Explore} [get_runs impl_1]\n"
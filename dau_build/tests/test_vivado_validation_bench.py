@@ -0,0 +1,98 @@
+"""Project artifact validation over generated plans with wide DAU bundles:
+the overlay Tcl names every bundle source twice and the backend manifest
+lists them all, so the contract rules run once per source.
+
+The pytest wrapper runs a small smoke set by default and only checks the
+generated project validates and that the overlay rule finds every source
+the plain substring scan does. The environment widens it:
+
+- ``DAU_BUILD_VALIDATION_BENCH=full``: bundles of a few hundred to several
+  thousand sources;
+- ``DAU_BUILD_VALIDATION_RESULTS=<path>``: where the JSON timings land.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from dau_build.vivado_backend import (
+    VivadoProjectGenerationRequest,
+    _ScannedTcl,
+    _split_manifest_list,
+    generate_vivado_project_generation_artifacts,
+    validate_vivado_project_artifact_bundle,
+)
+
+_SMOKE_SET = (16, 128)
+_FULL_SET = (250, 1000, 4000, 8000)
+
+
+def _write_project(root: Path, sources: int) -> Path:
+    bundle_root = root / "dau-bundle"
+    (bundle_root / "rtl").mkdir(parents=True)
+    lines = ["schema: artlink.manifest/v0", "name: dau-wide", "artifacts:"]
+    for index in range(sources + 1):
+        name, role = ("dau_wide_top", "generated-top") if index == sources else (f"lane_{index}", "hdl-source")
+        (bundle_root / "rtl" / f"{name}.sv").write_text(f"module {name}; endmodule\n", encoding="utf-8")
+        lines.extend((f"  - path: rtl/{name}.sv", "    kind: source", f"    role: {role}", "    language: systemverilog"))
+    (bundle_root / "dau-wide.artifacts.yaml").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    artifacts = generate_vivado_project_generation_artifacts(
+        VivadoProjectGenerationRequest(
+            source_shell_root=Path("/repo/projects/vivado-shell"),
+            work_root=root / "vivado",
+            dau_core_root=Path("/repo/dau-core"),
+            dau_driver_root=Path("/repo/dau-driver"),
+            artifact_stem="dau-ci",
+            dau_artifact_bundle_path=bundle_root / "dau-wide.artifacts.yaml",
+        )
+    )
+    backend = artifacts.backend_artifacts
+    for path, text in (
+        (artifacts.project_manifest_path, artifacts.project_manifest_text),
+        (backend.overlay_tcl_path, backend.overlay_tcl_text),
+        (backend.build_tcl_path, backend.build_tcl_text),
+        (backend.manifest_path, backend.manifest_text),
+        (backend.command_plan_path, backend.command_plan_text),
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return root / "vivado"
+
+
+def test_vivado_validation_bench(tmp_path: Path) -> None:
+    source_set = _FULL_SET if os.environ.get("DAU_BUILD_VALIDATION_BENCH") == "full" else _SMOKE_SET
+    runs = []
+    for sources in source_set:
+        work_root = _write_project(tmp_path / str(sources), sources)
+        started = time.perf_counter()
+        validation = validate_vivado_project_artifact_bundle(
+            work_root, project_manifest_path=Path("dau-ci.project"), manifest_path=Path("dau-ci.manifest"), command_plan_path=Path("dau-ci.plan")
+        )
+        validate_s = time.perf_counter() - started
+        assert validation.errors == ()
+
+        overlay_tcl_text = (work_root / "scripts" / "dau_overlay.tcl").read_text(encoding="utf-8")
+        bundle_sources = _split_manifest_list(dict(validation.backend_validation.manifest_items)["dau_bundle_hdl_sources"])
+        started = time.perf_counter()
+        substring = [source in overlay_tcl_text for source in bundle_sources]
+        substring_s = time.perf_counter() - started
+        started = time.perf_counter()
+        overlay_tcl = _ScannedTcl(overlay_tcl_text)
+        scanned = [source in overlay_tcl for source in bundle_sources]
+        scanned_s = time.perf_counter() - started
+        assert scanned == substring
+
+        runs.append(
+            {
+                "sources": sources,
+                "overlay_tcl_bytes": len(overlay_tcl_text),
+                "validate_s": validate_s,
+                "validate_per_source_us": validate_s / sources * 1e6,
+                "overlay_rule_substring_s": substring_s,
+                "overlay_rule_scanned_s": scanned_s,
+            }
+        )
+    destination = os.environ.get("DAU_BUILD_VALIDATION_RESULTS")
+    if destination:
+        Path(destination).write_text(json.dumps({"runs": runs}, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from ccflow import NullContext
+
+from dau_build.build_spec import BuildSpec
+from dau_build.build_steps import BuildStepResult, WatchTask
+from dau_build.watch import InotifyWatcher, PollingWatcher, SpecWatchSession, collect_changes, open_file_watcher, watch_spec
+
+_SV_DIR = (Path(__file__).parent / ".." / "sv").resolve()
+
+
+def _write_spec(tmp_path: Path, *, modules: str = "ff") -> Path:
+    source = tmp_path / "rtl" / "ff.sv"
+    if not source.exists():
+        source.parent.mkdir()
+        source.write_text((_SV_DIR / "ff.sv").read_text(encoding="utf-8"), encoding="utf-8")
+    spec_path = tmp_path / "dau-build.yaml"
+    spec_path.write_text(
+        "\n".join(
+            (
+                "name: watch-pipeline",
+                "top_name: dau_watch_top",
+                "platform: vivado-xdma",
+                "shell: xdma-ddr",
+                "artifact_stem: dau-watch",
+                'register_map_version: "0.1"',
+                'stream_protocol_version: "0.1"',
+                "clock: clk",
+                "reset: reset",
+                "operators:",
+                "  - identity",
+                "sources:",
+                "  - rtl/ff.sv",
+                "modules:",
+                f"  - {modules}",
+                "backend: none",
+                "",
+            )
+        ),
+        encoding="utf-8",
+    )
+    return spec_path
+
+
+def _session(spec_path: Path, output_root: Path) -> SpecWatchSession:
+    return SpecWatchSession(lambda: BuildSpec.from_file(spec_path).resolve(), output_root=output_root, spec_path=spec_path)
+
+
+def _edit(path: Path) -> None:
+    path.write_text(path.read_text(encoding="utf-8") + "\n// edited\n", encoding="utf-8")
+
+
+def test_polling_watcher_reports_changed_files_and_debounces_a_burst(tmp_path: Path) -> None:
+    watched, other = tmp_path / "a.sv", tmp_path / "b.sv"
+    watched.write_text("module a; endmodule\n", encoding="utf-8")
+    other.write_text("module b; endmodule\n", encoding="utf-8")
+    watcher = open_file_watcher((watched,), mode="poll", poll_interval_s=0.01)
+    assert isinstance(watcher, PollingWatcher)
+
+    assert watcher.changes(0.05) == set()
+    _edit(other)
+    assert watcher.changes(0.05) == set()
+
+    # an editor's save: write, then replace by rename; one change for both
+    _edit(watched)
+    replacement = tmp_path / "a.sv.tmp"
+    replacement.write_text("module a; wire w; endmodule\n", encoding="utf-8")
+    os.replace(replacement, watched)
+    assert collect_changes(watcher, timeout_s=1.0, debounce_s=0.05) == frozenset({watched})
+    assert collect_changes(watcher, timeout_s=0.05, debounce_s=0.05) == frozenset()
+
+    # a deleted file is a change too
+    watched.unlink()
+    assert watcher.changes(1.0) == {watched}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_sees_in_place_and_rename_over_saves(tmp_path: Path) -> None:
+    watched, other = tmp_path / "a.sv", tmp_path / "b.sv"
+    watched.write_text("module a; endmodule\n", encoding="utf-8")
+    other.write_text("module b; endmodule\n", encoding="utf-8")
+    watcher = open_file_watcher((watched,), mode="inotify")
+    assert isinstance(watcher, InotifyWatcher)
+    try:
+        assert watcher.changes(0.05) == set()
+        _edit(other)
+        assert watcher.changes(0.1) == set()
+
+        _edit(watched)
+        assert collect_changes(watcher, timeout_s=1.0, debounce_s=0.05) == frozenset({watched})
+
+        replacement = tmp_path / "a.sv.tmp"
+        replacement.write_text("module a; wire w; endmodule\n", encoding="utf-8")
+        os.replace(replacement, watched)
+        assert collect_changes(watcher, timeout_s=1.0, debounce_s=0.05) == frozenset({watched})
+
+        # re-pointed at another file, the first one is no longer reported
+        watcher.watch((other,))
+        _edit(watched)
+        _edit(other)
+        assert collect_changes(watcher, timeout_s=1.0, debounce_s=0.05) == frozenset({other})
+    finally:
+        watcher.close()
+
+
+def test_watch_session_reruns_only_the_stages_a_change_reaches(tmp_path: Path) -> None:
+    spec_path = _write_spec(tmp_path)
+    source = tmp_path / "rtl" / "ff.sv"
+    output_root = tmp_path / "out"
+    session = _session(spec_path, output_root)
+
+    first = session.rebuild()
+    assert first.ok
+    assert [stage.stage for stage in first.stages] == ["spec", "parse", "generate", "elaborate"]
+    assert first.stages[1].detail == "reparsed=1 sources=1"
+    assert first.stages[3].detail == "engine=svparser modules=2 unresolved=- unconnected_ports=0"
+    top_sv = output_root / "generated" / "dau_watch_top.sv"
+    assert top_sv.is_file()
+    assert (output_root / "dau-watch.manifest").is_file()
+    assert set(session.watched_paths) == {spec_path, source.resolve()}
+
+    # an event that changed nothing the spec reads: nothing is rebuilt
+    top_sv.unlink()
+    idle = session.rebuild({source.resolve()})
+    assert idle.ok
+    assert [(stage.stage, stage.detail) for stage in idle.stages] == [("parse", "reparsed=0 sources=1")]
+    assert not top_sv.exists()
+
+    # a source edit: reparse it, regenerate, re-elaborate; the spec stays
+    _edit(source)
+    edited = session.rebuild({source.resolve()})
+    assert edited.ok
+    assert edited.changed == (source.resolve(),)
+    assert [stage.stage for stage in edited.stages] == ["parse", "generate", "elaborate"]
+    assert edited.stages[0].detail == "reparsed=1 sources=1"
+    assert top_sv.is_file()
+
+    # a broken spec fails its cycle without ending the session
+    _write_spec(tmp_path, modules="missing")
+    broken = session.rebuild({spec_path})
+    assert not broken.ok
+    assert broken.failed_stage == "generate"
+    assert "unknown module(s): missing" in broken.error
+
+    # the fix is a spec change: re-resolved, with the parsed source reused
+    _write_spec(tmp_path)
+    fixed = session.rebuild({spec_path})
+    assert fixed.ok
+    assert [(stage.stage, stage.detail) for stage in fixed.stages[:2]] == [("spec", "sources=1"), ("parse", "reparsed=0 sources=1")]
+    assert [stage.stage for stage in fixed.stages[2:]] == ["generate", "elaborate"]
+    assert session.cycles == [first, idle, edited, broken, fixed]
+
+
+def test_watch_spec_streams_stage_timings_and_stops_after_max_rebuilds(tmp_path: Path) -> None:
+    spec_path = _write_spec(tmp_path)
+    source = tmp_path / "rtl" / "ff.sv"
+    session = _session(spec_path, tmp_path / "out")
+    lines: list[str] = []
+
+    def edit_once_watching() -> None:
+        deadline = time.monotonic() + 10
+        while not any(line.startswith("dau-build-watch\twatcher=") for line in lines) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        _edit(source)
+
+    editor = threading.Thread(target=edit_once_watching)
+    editor.start()
+    cycles = watch_spec(session, mode="poll", poll_interval_s=0.01, debounce_s=0.05, max_rebuilds=1, stop_after_s=10, emit=lines.append)
+    editor.join()
+
+    assert [cycle.ok for cycle in cycles] == [True, True]
+    assert lines[4].startswith("dau-build-watch\tstatus=ok elapsed_s=")
+    assert lines[5] == "dau-build-watch\twatcher=PollingWatcher files=2"
+    assert lines[6] == f"dau-build-watch\tchanged={source.resolve().as_posix()}"
+    assert [line.split(" ")[0] for line in lines[7:]] == [
+        "dau-build-watch\tstage=parse",
+        "dau-build-watch\tstage=generate",
+        "dau-build-watch\tstage=elaborate",
+        "dau-build-watch\tstatus=ok",
+    ]
+
+
+def test_watch_task_builds_and_reports_rebuilds(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    spec_path = _write_spec(tmp_path)
+    output_root = tmp_path / "out"
+
+    result = WatchTask(spec_path=spec_path, output_root=output_root, watcher="poll", stop_after_s=0.2)(NullContext())
+
+    assert result == BuildStepResult(step="watch", message=f"dau-build-watch\tspec={spec_path} rebuilds=0 failures=0")
+    assert (output_root / "generated" / "dau_watch_top.sv").is_file()
+    assert "dau-build-watch\tstage=elaborate" in capsys.readouterr().out
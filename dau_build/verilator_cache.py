@@ -0,0 +1,154 @@
+"""A Verilator model build cache shared across simulate runs.
+
+Every Verilator simulate run compiles its model in its own ``work_dir``, and
+for a large scan-composition harness that compile is nearly all of the run.
+The cache keys a model directory by what the model is a function of -- the
+sources (path and content), the top module, the extra arguments and the
+Verilator version -- and runs the testbench there. An unchanged bench finds
+its model already built: Verilator's own skip-identical check passes (it also
+covers files the sources include, which the key does not see), make has
+nothing to rebuild, and the run goes straight to the executable.
+
+Entries are evicted least-recently-used first once the cache outgrows its
+byte budget. ``ccache`` hands the C++ compile to ccache as well, so even a
+missed entry reuses the object files of a near-identical model.
+
+The compile flags stay dau-sim's: the cache only chooses the directory
+``run_verilator_testbench`` compiles in, so a cached model can never be built
+differently from an uncached one.
+"""
+
+import hashlib
+import os
+import subprocess
+from collections.abc import Sequence
+from functools import cache
+from pathlib import Path
+from shutil import rmtree, which
+
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = ("DEFAULT_VERILATOR_CACHE_MAX_BYTES", "VerilatorBuildCache", "VerilatorCacheError")
+
+DEFAULT_VERILATOR_CACHE_MAX_BYTES = 8 << 30
+
+# a file in each entry whose mtime is the entry's last use; the directory's
+# own mtime moves whenever the model writes into it, which is not a use
+_LAST_USED = ".last-used"
+
+
+class VerilatorCacheError(ValueError):
+    pass
+
+
+@cache
+def _verilator_version(verilator_path: str) -> str:
+    result = subprocess.run((verilator_path, "--version"), capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        raise VerilatorCacheError(f"{verilator_path} --version failed with exit code {result.returncode}: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def _entry_bytes(entry: Path) -> int:
+    return sum(path.stat().st_size for path in entry.rglob("*") if path.is_file() and not path.is_symlink())
+
+
+class VerilatorBuildCache(BaseModel):
+    """A cache directory of Verilator model builds, keyed by their inputs."""
+
+    model_config = ConfigDict(frozen=True)
+
+    root: Path
+    max_bytes: int = Field(default=DEFAULT_VERILATOR_CACHE_MAX_BYTES, gt=0)
+    ccache: bool = False
+
+    def key(self, *, sources: Sequence[Path | str], top_module: str, extra_args: Sequence[str] = (), verilator: str = "verilator") -> str:
+        """The entry a model with these inputs is built in. A source's path is
+        part of the key alongside its content: Verilator records the paths it
+        read, so the same content at another path would rebuild anyway."""
+        verilator_path = which(verilator)
+        if verilator_path is None:
+            raise VerilatorCacheError(f"verilator executable not found: {verilator}")
+        digest = hashlib.sha256()
+        for part in (_verilator_version(verilator_path), top_module, *extra_args):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        for source in sources:
+            path = Path(source).resolve()
+            digest.update(str(path).encode())
+            digest.update(b"\0")
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        return digest.hexdigest()[:32]
+
+    def run(self, *, sources: Sequence[Path | str], top_module: str, verilator: str = "verilator", extra_args: Sequence[str] = ()):
+        """``run_verilator_testbench`` in the cache entry for these inputs.
+
+        The entry is held under an exclusive lock for the build and the run,
+        so two concurrent runs of one model share a single build instead of
+        racing in one directory; runs of different models never wait on each
+        other."""
+        import fcntl
+
+        from dau_sim.integrations.verilator import run_verilator_testbench
+
+        key = self.key(sources=sources, top_module=top_module, extra_args=extra_args, verilator=verilator)
+        compile_args = tuple(extra_args)
+        if self.ccache:
+            if which("ccache") is None:
+                raise VerilatorCacheError("ccache=True but no ccache executable is on PATH")
+            # ccache reuses object files, never output: it stays out of the key
+            compile_args = (*compile_args, "-MAKEFLAGS", "OBJCACHE=ccache")
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry = self.root / key
+        fd = os.open(self.root / f"{key}.lock", os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                result = run_verilator_testbench(sources=sources, top_module=top_module, work_dir=entry, verilator=verilator, extra_args=compile_args)
+                (entry / _LAST_USED).touch()
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+        self.evict(keep=key)
+        return result
+
+    def evict(self, *, keep: str | None = None) -> tuple[Path, ...]:
+        """Remove least-recently-used entries until the cache fits in
+        ``max_bytes``. ``keep`` (the entry just used) and any entry another
+        run holds locked are never removed. Returns the removed entries."""
+        import fcntl
+
+        if not self.root.is_dir():
+            return ()
+        entries = [entry for entry in self.root.iterdir() if entry.is_dir()]
+        sizes = {entry: _entry_bytes(entry) for entry in entries}
+        total = sum(sizes.values())
+        removed: list[Path] = []
+
+        def last_used(entry: Path) -> float:
+            marker = entry / _LAST_USED
+            return marker.stat().st_mtime if marker.exists() else entry.stat().st_mtime
+
+        for entry in sorted(entries, key=last_used):
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            # the lock file outlives its entry: unlinking it would let a run
+            # that already opened it lock an inode nobody else can see
+            fd = os.open(self.root / f"{entry.name}.lock", os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+            try:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue  # in use by a concurrent run
+                try:
+                    rmtree(entry)
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+            total -= sizes[entry]
+            removed.append(entry)
+        return tuple(removed)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+import re
 import shlex
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Literal
 
@@ -9,6 +11,7 @@ from ccflow import BaseModel
 from pydantic import ConfigDict, field_validator
 
 from dau_build.artifact_bundle import ArtifactBundle, ArtifactBundleError, load_artifact_bundle
+from dau_build.vivado_runs import resolve_vivado_jobs, run_strategy_tcl
 
 
 class VivadoOverlayDefinition(BaseModel):
@@ -63,6 +66,15 @@ class VivadoBackendRequest(BaseModel):
     vivado_invocation: Literal["standard", "source-only"] = "standard"
     vivado_mount_root: Path | None = None
     overlay_definition: VivadoOverlayDefinition | None = None
+    # synthesize and implement against the previous successful build's
+    # checkpoints (see vivado_build_tcl); off keeps the build script unchanged
+    incremental: bool = False
+    # launch_runs -jobs; None sizes them from the host (vivado_runs)
+    synth_jobs: int | None = None
+    impl_jobs: int | None = None
+    # run strategies, normally the platform's; None keeps Vivado's default
+    synth_strategy: str | None = None
+    impl_strategy: str | None = None
 
     @property
     def resolved_manifest_path(self) -> Path:
@@ -121,6 +133,11 @@ class VivadoProjectGenerationRequest(BaseModel):
     vivado_mount_root: Path | None = None
     plan_executable: str = "dau-build"
     overlay_definition: VivadoOverlayDefinition | None = None
+    incremental: bool = False
+    synth_jobs: int | None = None
+    impl_jobs: int | None = None
+    synth_strategy: str | None = None
+    impl_strategy: str | None = None
     # the task name recorded in the replayable stage_command. Callers that
     # inject an overlay definition through their own task overlay (e.g. a
     # private dpv1-stage-vivado-overlay) pass that task's name so replaying
@@ -169,6 +186,11 @@ class VivadoProjectGenerationRequest(BaseModel):
             vivado_invocation=self.vivado_invocation,
             vivado_mount_root=self.vivado_mount_root,
             overlay_definition=self.overlay_definition,
+            incremental=self.incremental,
+            synth_jobs=self.synth_jobs,
+            impl_jobs=self.impl_jobs,
+            synth_strategy=self.synth_strategy,
+            impl_strategy=self.impl_strategy,
         )
 
 
@@ -297,6 +319,11 @@ def generate_vivado_backend_artifacts(request: VivadoBackendRequest) -> VivadoBa
             timing_summary_path=request.timing_summary_path,
             vivado_log_path=request.vivado_log_path,
             lane_placements=None if request.overlay_definition is None else request.overlay_definition.lane_placements,
+            incremental=request.incremental,
+            synth_jobs=request.synth_jobs,
+            impl_jobs=request.impl_jobs,
+            synth_strategy=request.synth_strategy,
+            impl_strategy=request.impl_strategy,
         ),
         overlay_driver_tcl_text=None
         if overlay_driver_tcl is None
@@ -570,6 +597,11 @@ def vivado_project_stage_command(request: VivadoProjectGenerationRequest) -> str
         # mark the field hydra-missing so replaying the recorded command
         # refuses to silently re-stage the packaged default overlay instead
         overrides.append(("overlay_definition", "???"))
+    if request.incremental:
+        overrides.append(("incremental", "true"))
+    for key in ("synth_jobs", "impl_jobs", "synth_strategy", "impl_strategy"):
+        if getattr(request, key) is not None:
+            overrides.append((key, getattr(request, key)))
     overrides.append(("operator", ",".join(request.operator_set)))
     return _task_command(request.plan_executable, request.stage_task_name, tuple(overrides))
 
@@ -692,7 +724,7 @@ def _validate_dau_artifact_bundle_reference(*, build_root: Path, manifest: dict[
         return (f"invalid DAU artifact bundle: {exc}",)
     expected_sources = tuple(_split_manifest_list(manifest.get("dau_bundle_hdl_sources", "")))
     actual_sources = tuple(path.as_posix() for path in _bundle_hdl_source_paths(artifact_bundle))
-    resolved_expected_sources = tuple(_build_artifact_path(build_root, Path(path)).resolve(strict=False).as_posix() for path in expected_sources)
+    resolved_expected_sources = tuple(_resolve_posix_paths(_build_artifact_path(build_root, Path(path)) for path in expected_sources))
     if expected_sources and resolved_expected_sources != actual_sources:
         return (f"DAU artifact bundle source mismatch: {','.join(expected_sources)} != {','.join(actual_sources)}",)
     generated_top = _bundle_generated_top_path(artifact_bundle)
@@ -920,20 +952,15 @@ def _validate_project_command(
     if not command:
         return ()
     try:
-        tokens = shlex.split(command)
+        scanned = _ScannedCommand(command)
     except ValueError as exc:
         return (f"project {label} cannot be parsed: {exc}",)
 
     errors: list[str] = []
-    hydra_overrides = _command_hydra_overrides(tokens)
-    if hydra_overrides:
-        actual_plan = hydra_overrides.get("plan", "") if hydra_overrides.get("task") == "hardware-plan" else hydra_overrides.get("task", "")
-    else:
-        actual_plan = tokens[1] if len(tokens) > 1 else ""
-    if actual_plan != expected_plan:
-        errors.append(f"project {label} plan mismatch: {actual_plan} != {expected_plan}")
+    if scanned.plan != expected_plan:
+        errors.append(f"project {label} plan mismatch: {scanned.plan} != {expected_plan}")
     for option, expected_value in required_options:
-        actual_value = hydra_overrides.get(_hydra_option_key(option)) if hydra_overrides else _command_option_value(tokens, option)
+        actual_value = scanned.option(option)
         if actual_value is None:
             errors.append(f"project {label} missing option: {option}")
         elif expected_value and actual_value != expected_value:
@@ -941,28 +968,32 @@ def _validate_project_command(
     return tuple(errors)
 
 
-def _command_hydra_overrides(tokens: list[str]) -> dict[str, str]:
-    if len(tokens) < 2:
-        return {}
-    overrides = dict(token.split("=", 1) for token in tokens[1:] if "=" in token)
-    if "task" not in overrides:
-        return {}
-    return overrides
+class _ScannedCommand:
+    """A recorded task command, tokenized once: its plan and the value of
+    every option, whether it is written as hydra overrides
+    (``dau-build task=... key=value``) or as the flags older plans recorded
+    (``dau-build-plan <plan> --key value``)."""
 
+    def __init__(self, command: str) -> None:
+        tokens = shlex.split(command)
+        overrides = dict(token.split("=", 1) for token in tokens[1:] if "=" in token)
+        self.hydra_overrides = overrides if "task" in overrides else {}
+        if self.hydra_overrides:
+            self.plan = overrides.get("plan", "") if overrides.get("task") == "hardware-plan" else overrides.get("task", "")
+        else:
+            self.plan = tokens[1] if len(tokens) > 1 else ""
+        # each flag's first occurrence and the token after it; a flag that
+        # ends the command has an empty value
+        self._flags: dict[str, str] = {}
+        for index, token in enumerate(tokens):
+            self._flags.setdefault(token, tokens[index + 1] if index + 1 < len(tokens) else "")
 
-def _hydra_option_key(option: str) -> str:
-    return option.removeprefix("--").replace("-", "_")
-
-
-def _command_option_value(tokens: list[str], option: str) -> str | None:
-    try:
-        option_index = tokens.index(option)
-    except ValueError:
-        return None
-    value_index = option_index + 1
-    if value_index >= len(tokens):
-        return ""
-    return tokens[value_index]
+    def option(self, option: str) -> str | None:
+        """``--work-root``'s value (``work_root=`` in hydra form); None when
+        the command does not set it."""
+        if self.hydra_overrides:
+            return self.hydra_overrides.get(option.removeprefix("--").replace("-", "_"))
+        return self._flags.get(option)
 
 
 def _validate_command_plan_contract(*, build_root: Path, manifest: dict[str, str], command_plan_text: str) -> tuple[str, ...]:
@@ -1003,17 +1034,39 @@ def _command_plan_sources_tcl(*, command_plan_text: str, vivado_executable: str,
     return f"-source {shlex.quote(str(tcl_path))}" in command_plan_text
 
 
+# the words of a Tcl script (split at whitespace, quotes, braces, brackets
+# and semicolons) and its double-quoted strings, quotes included
+_TCL_WORD = re.compile(r'[^\s"{}\[\];]+')
+_TCL_QUOTED = re.compile(r'"[^"\n]*"')
+
+
+class _ScannedTcl:
+    """An overlay Tcl, tokenized once into its words and its double-quoted
+    strings. A shell build's overlay names hundreds of sources; each
+    contract rule is then a set lookup rather than a scan of the text."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.fragments = frozenset((*_TCL_WORD.findall(text), *_TCL_QUOTED.findall(text)))
+
+    def __contains__(self, fragment: str) -> bool:
+        # a fragment that is no whole word or string (one with spaces, or
+        # inside a longer word) falls back to the substring the rule states
+        return fragment in self.fragments or fragment in self.text
+
+
 def _validate_overlay_tcl_contract(*, manifest: dict[str, str], overlay_tcl_text: str) -> tuple[str, ...]:
     errors: list[str] = []
+    overlay_tcl = _ScannedTcl(overlay_tcl_text)
     for key in ("overlay", "bitstream", "resource_summary", "timing_summary", "vivado_log"):
         value = manifest.get(key)
         if value is None:
             continue
         expected = f'"{key}={value}"'
-        if expected not in overlay_tcl_text:
+        if expected not in overlay_tcl:
             errors.append(f"overlay Tcl does not write manifest field: {key}={value}")
     for source in _split_manifest_list(manifest.get("dau_bundle_hdl_sources", "")):
-        if source not in overlay_tcl_text:
+        if source not in overlay_tcl:
             errors.append(f"overlay Tcl does not consume DAU bundle source: {source}")
     return tuple(errors)
 
@@ -1024,6 +1077,26 @@ def _build_artifact_path(build_root: Path, artifact_path: Path) -> Path:
     return build_root / artifact_path
 
 
+def _resolve_posix_paths(paths: Iterable[Path]) -> list[str]:
+    """``path.resolve(strict=False).as_posix()`` of each of ``paths``,
+    resolving each directory once: a bundle's sources share a handful of
+    directories, and a name that is not itself a symlink resolves to its
+    resolved directory joined with the name."""
+    directories: dict[str, str] = {}
+    resolved = []
+    for path in paths:
+        text = os.fspath(path)
+        directory, name = os.path.split(text)
+        if name in ("", ".", "..") or os.path.islink(text):
+            resolved.append(Path(path).resolve(strict=False).as_posix())
+            continue
+        real_directory = directories.get(directory)
+        if real_directory is None:
+            real_directory = directories[directory] = os.path.realpath(directory or ".")
+        resolved.append(os.path.join(real_directory, name))
+    return resolved
+
+
 def _request_vivado_path_base(request: VivadoBackendRequest) -> Path | None:
     if not request.uses_mounted_source_only_vivado:
         return None
@@ -1331,6 +1404,35 @@ def _lane_placement_tcl(lane_placements: tuple[tuple[str, str], ...]) -> str:
     )
 
 
+# the previous successful build's checkpoints, kept in the work root beside
+# project.xpr: reset_run clears project.runs (and staging never copies it),
+# so a reference inside the run directories would not survive to be used
+INCREMENTAL_REFERENCE_SYNTH_DCP = "dau_reference_synth.dcp"
+INCREMENTAL_REFERENCE_ROUTED_DCP = "dau_reference_routed.dcp"
+
+
+def _incremental_setup_tcl() -> str:
+    return f"""set reference_synth [file normalize "{INCREMENTAL_REFERENCE_SYNTH_DCP}"]
+set reference_routed [file normalize "{INCREMENTAL_REFERENCE_ROUTED_DCP}"]
+if {{[file exists $reference_synth] && [file exists $reference_routed]}} {{
+    set_property INCREMENTAL_CHECKPOINT $reference_synth [get_runs synth_1]
+    set_property INCREMENTAL_CHECKPOINT $reference_routed [get_runs impl_1]
+    set incremental_reference $reference_routed
+}} else {{
+    reset_property INCREMENTAL_CHECKPOINT [get_runs synth_1]
+    reset_property INCREMENTAL_CHECKPOINT [get_runs impl_1]
+    set incremental_reference none
+}}
+puts "dau-build: incremental reference $incremental_reference"
+"""
+
+
+def _incremental_save_tcl() -> str:
+    return """file copy -force [file normalize "project.runs/synth_1/Top_wrapper.dcp"] $reference_synth
+file copy -force [file normalize "project.runs/impl_1/Top_wrapper_routed.dcp"] $reference_routed
+"""
+
+
 def vivado_build_tcl(
     *,
     manifest_path: Path = Path("dau-vivado.manifest"),
@@ -1339,17 +1441,31 @@ def vivado_build_tcl(
     timing_summary_path: Path = Path("reports/dau_timing_summary.rpt"),
     vivado_log_path: Path = Path("vivado.log"),
     lane_placements: tuple[tuple[str, str], ...] | None = None,
+    incremental: bool = False,
+    synth_jobs: int | None = None,
+    impl_jobs: int | None = None,
+    synth_strategy: str | None = None,
+    impl_strategy: str | None = None,
 ) -> str:
+    """The overlay build script. ``incremental`` reuses the checkpoints the
+    last successful build left in the work root: synthesis and
+    implementation run against them when both exist, from scratch otherwise,
+    and the reference used (or ``none``) lands in the manifest as
+    ``incremental_reference``. Unset job counts are sized from this host
+    (``vivado_runs.host_vivado_jobs``)."""
     placements = lane_placements if lane_placements is not None else ()
+    jobs = resolve_vivado_jobs(synth=synth_jobs, impl=impl_jobs)
     script = """# Generated by dau-build; source after scripts/dau_overlay.tcl.
 open_project project.xpr
+__INCREMENTAL_SETUP_TCL__
+__RUN_STRATEGY_TCL__
 reset_run synth_1
-launch_runs synth_1 -jobs 2
+launch_runs synth_1 -jobs __SYNTH_JOBS__
 wait_on_run synth_1
 open_run synth_1
 
 __LANE_PLACEMENT_TCL__
-launch_runs impl_1 -jobs 6 -to_step write_bitstream
+launch_runs impl_1 -jobs __IMPL_JOBS__ -to_step write_bitstream
 wait_on_run impl_1
 open_run impl_1
 set default_bitstream_path [file normalize "project.runs/impl_1/Top_wrapper.bit"]
@@ -1372,11 +1488,13 @@ file mkdir mcs
 write_cfgmem -format mcs -size 16 -interface SPIx4 -force -loadbit "up 0 $expected_bitstream_path" -file "./mcs/top.mcs"
 write_cfgmem -format bin -size 16 -interface SPIx4 -force -loadbit "up 0 $expected_bitstream_path" -file "./mcs/top.bin"
 write_verilog -mode funcsim -force Top.v
+__INCREMENTAL_SAVE_TCL__
 set manifest_file [open "__MANIFEST_PATH__" a]
 puts $manifest_file "bitstream=__BITSTREAM_PATH__"
 puts $manifest_file "resource_summary=__RESOURCE_SUMMARY_PATH__"
 puts $manifest_file "timing_summary=__TIMING_SUMMARY_PATH__"
 puts $manifest_file "vivado_log=__VIVADO_LOG_PATH__"
+__INCREMENTAL_MANIFEST_TCL__
 puts $manifest_file "build_status=built"
 close $manifest_file
 close_design
@@ -1384,6 +1502,12 @@ puts "Implementation done!"
 """
     return (
         script.replace("__LANE_PLACEMENT_TCL__\n", _lane_placement_tcl(placements))
+        .replace("__INCREMENTAL_SETUP_TCL__\n", _incremental_setup_tcl() if incremental else "")
+        .replace("__RUN_STRATEGY_TCL__\n", run_strategy_tcl(synth_strategy=synth_strategy, impl_strategy=impl_strategy))
+        .replace("__SYNTH_JOBS__", str(jobs.synth))
+        .replace("__IMPL_JOBS__", str(jobs.impl))
+        .replace("__INCREMENTAL_SAVE_TCL__\n", _incremental_save_tcl() if incremental else "")
+        .replace("__INCREMENTAL_MANIFEST_TCL__\n", 'puts $manifest_file "incremental_reference=$incremental_reference"\n' if incremental else "")
         .replace("__MANIFEST_PATH__", manifest_path.as_posix())
         .replace("__BITSTREAM_PATH__", bitstream_path.as_posix())
         .replace("__RESOURCE_SUMMARY_PATH__", resource_summary_path.as_posix())
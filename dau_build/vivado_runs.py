@@ -0,0 +1,105 @@
+"""How the generated build scripts launch Vivado's ``synth_1``/``impl_1`` runs.
+
+``launch_runs -jobs N`` lets Vivado run up to N runs at once (the block
+design's out-of-context IP runs beside ``synth_1``), and every run holds its
+own copy of the design in memory. A fixed count is wrong in both directions:
+a large build host sits idle, and a small one swaps until the build takes
+longer than running the runs one at a time. ``host_vivado_jobs`` sizes the
+counts from the host's CPUs and physical memory; an explicit count (a task
+field, or the composed ``host`` group's ``vivado_synth_jobs`` /
+``vivado_impl_jobs``) always wins.
+
+Run strategies are board facts -- the strategy a design closes timing with
+on a part -- so they come from ``PlatformDefinition.synth_strategy`` /
+``impl_strategy``; unset keeps Vivado's default strategy.
+"""
+
+from __future__ import annotations
+
+import os
+
+from ccflow import BaseModel
+from pydantic import ConfigDict, field_validator
+
+__all__ = (
+    "IMPL_RUN_MEMORY_BYTES",
+    "SYNTH_RUN_MEMORY_BYTES",
+    "VivadoJobs",
+    "host_cpu_count",
+    "host_memory_bytes",
+    "host_vivado_jobs",
+    "resolve_vivado_jobs",
+    "run_strategy_tcl",
+)
+
+# peak resident memory of one run of a shell-sized design on a 7-series
+# part; an implementation run carries the placed and routed database, so it
+# is the heavier of the two
+SYNTH_RUN_MEMORY_BYTES = 3 << 30
+IMPL_RUN_MEMORY_BYTES = 6 << 30
+# left for the launching Vivado process, the OS and the page cache
+_RESERVED_MEMORY_BYTES = 2 << 30
+
+
+class VivadoJobs(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    synth: int
+    impl: int
+
+    @field_validator("synth", "impl")
+    @classmethod
+    def _positive(cls, value: int, info) -> int:
+        if value < 1:
+            raise ValueError(f"{info.field_name} jobs must be at least 1")
+        return value
+
+
+def host_cpu_count() -> int:
+    """The CPUs this process may run on (its affinity mask where the OS
+    reports one, so a pinned container does not claim the whole machine)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
+def host_memory_bytes() -> int | None:
+    """Physical memory, or None where the OS does not say."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def host_vivado_jobs(*, cpu_count: int | None = None, memory_bytes: int | None = None) -> VivadoJobs:
+    """Job counts for this host: one run per CPU, as many as fit in memory
+    beside each other. Unknown memory bounds the counts by CPUs alone."""
+    cpus = max(cpu_count if cpu_count is not None else host_cpu_count(), 1)
+    memory = memory_bytes if memory_bytes is not None else host_memory_bytes()
+
+    def fit(run_bytes: int) -> int:
+        if memory is None:
+            return cpus
+        return max(min(cpus, (memory - _RESERVED_MEMORY_BYTES) // run_bytes), 1)
+
+    return VivadoJobs(synth=fit(SYNTH_RUN_MEMORY_BYTES), impl=fit(IMPL_RUN_MEMORY_BYTES))
+
+
+def resolve_vivado_jobs(*, synth: int | None = None, impl: int | None = None) -> VivadoJobs:
+    """The explicit counts where given, the host-derived ones otherwise."""
+    if synth is not None and impl is not None:
+        return VivadoJobs(synth=synth, impl=impl)
+    host = host_vivado_jobs()
+    return VivadoJobs(synth=synth if synth is not None else host.synth, impl=impl if impl is not None else host.impl)
+
+
+def run_strategy_tcl(*, synth_strategy: str | None = None, impl_strategy: str | None = None) -> str:
+    """``set_property strategy`` for each run whose strategy is set; empty
+    when neither is, so a script without strategies is unchanged."""
+    lines = [
+        f"set_property strategy {{{strategy}}} [get_runs {run}]\n"
+        for run, strategy in (("synth_1", synth_strategy), ("impl_1", impl_strategy))
+        if strategy is not None
+    ]
+    return "".join(lines)
@@ -0,0 +1,389 @@
+"""Rebuild a spec's generated artifacts as its inputs change.
+
+During RTL iteration every save means rerunning ``tasks/spec/build`` and an
+elaboration check by hand. ``SpecWatchSession`` keeps the state between
+rebuilds -- the resolved spec and each source's parsed modules, keyed by the
+file's stat signature -- so a rebuild reruns only what the change reaches:
+
+- ``spec``: re-resolves the spec, only when the spec file or one of its
+  artifact manifests changed;
+- ``parse``: reparses only the sources whose signature changed;
+- ``generate``: rewrites the generated top, DAU manifest and artifact bundle;
+- ``elaborate``: the fast check -- the generated top against the parsed
+  sources through the elaboration graph (``svparser``), or yosys's
+  read-and-check without synthesis (``yosys``).
+
+A save that changes no signature (an editor touching a file) reruns nothing
+past ``parse``. ``watch_spec`` waits on the watched files through inotify
+where the platform has it, polling their signatures otherwise, and gathers
+the burst of events one save makes (write, rename, attribute change) into a
+single rebuild once the files have been quiet for ``debounce_s``.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Callable, Collection, Sequence
+from pathlib import Path
+from typing import Literal
+
+from ccflow import BaseModel
+from pydantic import ConfigDict
+
+from dau_build.build_spec import DauBuildSpec, write_dau_build_artifacts
+from dau_build.elaboration import elaborate_design
+from dau_build.svparser import Design, Module
+from dau_build.yosys_backend import YosysBackendRequest, run_yosys_synthesis
+
+__all__ = (
+    "InotifyWatcher",
+    "PollingWatcher",
+    "SpecWatchSession",
+    "StageTiming",
+    "WatchCycle",
+    "WatchError",
+    "collect_changes",
+    "open_file_watcher",
+    "watch_spec",
+)
+
+# inotify(7): a file saved in place closes after writing; one saved by
+# rename-over arrives as a move or create in its directory
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_WATCH_MASK = _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+# struct inotify_event: wd, mask, cookie, len, then len bytes of name
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class WatchError(ValueError):
+    pass
+
+
+def _signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+class PollingWatcher:
+    """Watches files by comparing their stat signatures every
+    ``poll_interval_s``."""
+
+    def __init__(self, paths: Collection[Path], *, poll_interval_s: float = 0.5) -> None:
+        self.poll_interval_s = poll_interval_s
+        self.watch(paths)
+
+    def watch(self, paths: Collection[Path]) -> None:
+        """Watch ``paths`` (replacing the previous set) from their current
+        state."""
+        self._signatures = {Path(path): _signature(Path(path)) for path in paths}
+
+    def changes(self, timeout_s: float) -> set[Path]:
+        """The watched files changed since the last call, waiting up to
+        ``timeout_s`` for the first."""
+        deadline = time.monotonic() + timeout_s
+        while True:
+            changed = set()
+            for path, signature in self._signatures.items():
+                current = _signature(path)
+                if current != signature:
+                    self._signatures[path] = current
+                    changed.add(path)
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.poll_interval_s, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Watches files through Linux inotify, on their directories (so a file
+    an editor replaces by rename is still seen)."""
+
+    def __init__(self, paths: Collection[Path]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        try:
+            self._add_watch = libc.inotify_add_watch
+            self._rm_watch = libc.inotify_rm_watch
+            init = libc.inotify_init1
+        except AttributeError as exc:
+            raise WatchError("inotify is not available on this platform") from exc
+        self._fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise WatchError(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+        self._directories: dict[int, Path] = {}
+        self._paths: dict[Path, Path] = {}
+        self.watch(paths)
+
+    def watch(self, paths: Collection[Path]) -> None:
+        """Watch ``paths``, replacing the previous set."""
+        for descriptor in self._directories:
+            self._rm_watch(self._fd, descriptor)
+        self._directories = {}
+        # each watched file by where its events name it, to the path given
+        self._paths = {Path(os.path.abspath(path)): Path(path) for path in paths}
+        for directory in dict.fromkeys(path.parent for path in self._paths):
+            descriptor = self._add_watch(self._fd, os.fsencode(directory), _IN_WATCH_MASK)
+            if descriptor < 0:
+                raise WatchError(f"cannot watch {directory.as_posix()}: {os.strerror(ctypes.get_errno())}")
+            self._directories[descriptor] = directory
+
+    def changes(self, timeout_s: float) -> set[Path]:
+        """The watched files with events since the last call, waiting up to
+        ``timeout_s`` for the first."""
+        readable, _, _ = select.select([self._fd], [], [], max(timeout_s, 0))
+        changed: set[Path] = set()
+        while readable:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                descriptor, _, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+                name = data[offset + _INOTIFY_EVENT.size : offset + _INOTIFY_EVENT.size + length].rstrip(b"\0")
+                offset += _INOTIFY_EVENT.size + length
+                directory = self._directories.get(descriptor)
+                if directory is not None and name:
+                    path = self._paths.get(directory / os.fsdecode(name))
+                    if path is not None:
+                        changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def open_file_watcher(
+    paths: Collection[Path], *, mode: Literal["auto", "inotify", "poll"] = "auto", poll_interval_s: float = 0.5
+) -> InotifyWatcher | PollingWatcher:
+    """An inotify watcher where the platform has one (``auto``), polling
+    otherwise. ``inotify`` refuses to fall back."""
+    if mode == "poll":
+        return PollingWatcher(paths, poll_interval_s=poll_interval_s)
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, WatchError):
+            if mode == "inotify":
+                raise
+    elif mode == "inotify":
+        raise WatchError(f"inotify is not available on {sys.platform}")
+    return PollingWatcher(paths, poll_interval_s=poll_interval_s)
+
+
+def collect_changes(watcher: InotifyWatcher | PollingWatcher, *, timeout_s: float, debounce_s: float) -> frozenset[Path]:
+    """The files changed within ``timeout_s``, gathered until none has
+    changed for ``debounce_s``; empty when nothing changed."""
+    changed = watcher.changes(timeout_s)
+    if not changed:
+        return frozenset()
+    while more := watcher.changes(debounce_s):
+        changed |= more
+    return frozenset(changed)
+
+
+class StageTiming(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    stage: Literal["spec", "parse", "generate", "elaborate"]
+    elapsed_s: float
+    # the stage's ``key=value`` summary
+    detail: str = ""
+
+
+class WatchCycle(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # what set it off; empty for the first build
+    changed: tuple[Path, ...] = ()
+    stages: tuple[StageTiming, ...] = ()
+    # the stage that failed and why
+    failed_stage: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class SpecWatchSession:
+    """The state one watch keeps between rebuilds of a spec."""
+
+    def __init__(
+        self,
+        load_spec: Callable[[], DauBuildSpec],
+        *,
+        output_root: Path,
+        spec_path: Path | None = None,
+        elaborate: Literal["svparser", "yosys", "none"] = "svparser",
+        yosys: str = "yosys",
+    ) -> None:
+        self._load_spec = load_spec
+        self.output_root = output_root
+        self.spec_path = spec_path
+        self.elaborate = elaborate
+        self.yosys = yosys
+        self.spec: DauBuildSpec | None = None
+        # each source's signature when it was parsed, and its module
+        self._parsed: dict[Path, tuple[tuple[int, int, int] | None, Module]] = {}
+        # every cycle run, the first build included
+        self.cycles: list[WatchCycle] = []
+
+    @property
+    def config_paths(self) -> tuple[Path, ...]:
+        """The files that shape the spec itself: the spec file (a spec
+        composed through Hydra has none) and its artifact manifests."""
+        manifests = self.spec.artifact_manifests if self.spec is not None else ()
+        return (*((self.spec_path,) if self.spec_path is not None else ()), *manifests)
+
+    @property
+    def watched_paths(self) -> tuple[Path, ...]:
+        sources = self.spec.sources if self.spec is not None else ()
+        return tuple(dict.fromkeys((*self.config_paths, *sources)))
+
+    def rebuild(self, changed: Collection[Path] | None = None, *, on_stage: Callable[[StageTiming], None] | None = None) -> WatchCycle:
+        """Rerun the stages ``changed`` reaches (every stage when None, the
+        first build), passing each stage's timing to ``on_stage`` as it
+        finishes. A failing stage ends the cycle; the session keeps its state
+        for the next one."""
+        stages: list[StageTiming] = []
+
+        def finished(stage: str, started: float, detail: str) -> None:
+            timing = StageTiming(stage=stage, elapsed_s=time.perf_counter() - started, detail=detail)
+            stages.append(timing)
+            if on_stage is not None:
+                on_stage(timing)
+
+        stage = "spec"
+        try:
+            reload = self.spec is None or changed is None or not set(map(Path, changed)).isdisjoint(self.config_paths)
+            if reload:
+                started = time.perf_counter()
+                self.spec = self._load_spec()
+                # a source the spec no longer lists is forgotten
+                listed = set(self.spec.sources)
+                self._parsed = {path: parsed for path, parsed in self._parsed.items() if path in listed}
+                finished(stage, started, f"sources={len(self.spec.sources)}")
+
+            stage = "parse"
+            started = time.perf_counter()
+            reparsed = 0
+            for source in self.spec.sources:
+                signature = _signature(source)
+                cached = self._parsed.get(source)
+                if cached is None or cached[0] != signature:
+                    self._parsed[source] = (signature, Module.from_file(source))
+                    reparsed += 1
+            finished(stage, started, f"reparsed={reparsed} sources={len(self.spec.sources)}")
+            if reparsed or reload:
+                # as Design.from_files: a later source's module of the same
+                # name wins
+                design = Design(modules={module.name: module for _, module in (self._parsed[source] for source in self.spec.sources)})
+
+                stage = "generate"
+                started = time.perf_counter()
+                artifacts = write_dau_build_artifacts(self.spec, output_root=self.output_root, design=design)
+                finished(stage, started, f"top_sv={artifacts.top_sv_path}")
+
+                if self.elaborate != "none":
+                    stage = "elaborate"
+                    started = time.perf_counter()
+                    finished(stage, started, self._elaborate(design, artifacts.top_sv_path))
+            cycle = WatchCycle(changed=tuple(sorted(changed or ())), stages=tuple(stages))
+        except Exception as exc:  # noqa: BLE001  # a broken save must not end the watch; the next save retries
+            cycle = WatchCycle(changed=tuple(sorted(changed or ())), stages=tuple(stages), failed_stage=stage, error=f"{type(exc).__name__}: {exc}")
+        self.cycles.append(cycle)
+        return cycle
+
+    def _elaborate(self, design: Design, top_sv_path: Path) -> str:
+        if self.elaborate == "yosys":
+            result = run_yosys_synthesis(
+                YosysBackendRequest(
+                    top_module=self.spec.top_name,
+                    sources=(top_sv_path, *self.spec.sources),
+                    output_root=self.output_root / "watch-yosys",
+                    synth=False,
+                    yosys=self.yosys,
+                )
+            )
+            if not result.passed:
+                raise WatchError(f"yosys check failed (exit {result.returncode}); see {result.log_path}")
+            return f"engine=yosys log={result.log_path}"
+        top = Module.from_file(top_sv_path)
+        graph = elaborate_design(Design(modules={**design.modules, top.name: top}))
+        closure = graph.module_closure(top.name)
+        # modules instantiated but not defined by the spec's sources: vendor
+        # primitives, or a missing source
+        unresolved = sorted({edge.module for name in closure for edge in graph.children(name) if edge.module not in graph.definitions})
+        unconnected = sum(len(graph.unconnected_ports(name)) for name in closure)
+        return f"engine=svparser modules={len(closure)} unresolved={','.join(unresolved) or '-'} unconnected_ports={unconnected}"
+
+
+def _stage_line(timing: StageTiming) -> str:
+    return f"dau-build-watch\tstage={timing.stage} elapsed_s={timing.elapsed_s:.3f} {timing.detail}".rstrip()
+
+
+def _cycle_line(cycle: WatchCycle) -> str:
+    if not cycle.ok:
+        return f"dau-build-watch\tstage={cycle.failed_stage} status=failed error={cycle.error}"
+    return f"dau-build-watch\tstatus=ok elapsed_s={sum(timing.elapsed_s for timing in cycle.stages):.3f}"
+
+
+def watch_spec(
+    session: SpecWatchSession,
+    *,
+    mode: Literal["auto", "inotify", "poll"] = "auto",
+    debounce_s: float = 0.2,
+    poll_interval_s: float = 0.5,
+    max_rebuilds: int | None = None,
+    stop_after_s: float | None = None,
+    emit: Callable[[str], None] = lambda line: print(line, flush=True),
+) -> Sequence[WatchCycle]:
+    """Build once, then rebuild on every debounced change until
+    ``max_rebuilds`` rebuilds or ``stop_after_s`` seconds (None: until
+    interrupted), emitting each stage's timing as it finishes. Returns the
+    session's cycles, the first build included."""
+
+    def on_stage(timing: StageTiming) -> None:
+        emit(_stage_line(timing))
+
+    emit(_cycle_line(session.rebuild(on_stage=on_stage)))
+    deadline = None if stop_after_s is None else time.monotonic() + stop_after_s
+    watcher = open_file_watcher(session.watched_paths, mode=mode, poll_interval_s=poll_interval_s)
+    emit(f"dau-build-watch\twatcher={type(watcher).__name__} files={len(session.watched_paths)}")
+    rebuilds = 0
+    try:
+        while max_rebuilds is None or rebuilds < max_rebuilds:
+            # wake at least once a second, so a deadline is kept while idle
+            timeout_s = 1.0 if deadline is None else min(deadline - time.monotonic(), 1.0)
+            if timeout_s <= 0:
+                break
+            changed = collect_changes(watcher, timeout_s=timeout_s, debounce_s=debounce_s)
+            if not changed:
+                continue
+            emit("dau-build-watch\tchanged=" + ",".join(sorted(path.as_posix() for path in changed)))
+            watched = session.watched_paths
+            rebuilds += 1
+            emit(_cycle_line(session.rebuild(changed, on_stage=on_stage)))
+            # the spec may now list other sources or manifests
+            if session.watched_paths != watched:
+                watcher.watch(session.watched_paths)
+    finally:
+        watcher.close()
+    return tuple(session.cycles)